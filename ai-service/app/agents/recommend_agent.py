@@ -1,20 +1,30 @@
-from humanfriendly.usage import render_usage
 from langchain_core.prompts import PromptTemplate
 from langchain_core.documents import Document
 from dotenv import load_dotenv
 import os
-from config.llm import recommendation_llm, vectorstore
-from prompts.recommend_prompt import recommend_prompt
-from tools.emotion_tool import run_emotion_tool
-from tools.genre_tool import run_genre_tool
-from tools.author_tool import run_author_tool
-from tools.hybrid_tool import run_hybrid_tool
+from app.prompts.recommend_prompt import recommend_prompt
+from app.tools.emotion_tool import run_emotion_tool, arun_emotion_tool
+from app.tools.genre_tool import run_genre_tool, arun_genre_tool
+from app.tools.author_tool import run_author_tool, arun_author_tool
+from app.tools.hybrid_tool import run_hybrid_tool, arun_hybrid_tool
 # 환경 변수 불러오기
 load_dotenv()
 
 
-# 추천 실행 함수
-def run_recommend_agent(query_data: dict) -> str:
+# 조건이 하나도 없을 때 안내 메시지
+NO_CONDITION_MESSAGE = "❗추천을 위해 감정, 장르, 작가, 키워드 중 하나 이상이 필요합니다."
+
+# 도구 이름 → (동기 함수, 비동기 함수)
+_TOOLS = {
+    "author": (run_author_tool, arun_author_tool),
+    "emotion": (run_emotion_tool, arun_emotion_tool),
+    "genre": (run_genre_tool, arun_genre_tool),
+    "hybrid": (run_hybrid_tool, arun_hybrid_tool),
+}
+
+
+# 추천 도구 선택 함수 (동기/비동기 경로 공용)
+def _select_tool(query_data: dict):
     emotion = query_data.get("emotion", "")
     genre = query_data.get("genre", "")
     author = query_data.get("author", "")
@@ -27,17 +37,17 @@ def run_recommend_agent(query_data: dict) -> str:
     # author 조건이 있을 경우 가장 먼저 처리
     if author:
         print("author_tool 사용")
-        return run_author_tool(author=author, user_input=user_input)
+        return "author", {"author": author, "user_input": user_input}
 
     # emotion 조건만 있을 경우
     if emotion and not genre and not keywords:
         print("emotion_tool 사용")
-        return run_emotion_tool(emotion=emotion, user_input=user_input)
+        return "emotion", {"emotion": emotion, "user_input": user_input}
 
     # genre 조건만 있을 경우
     if genre and not emotion and not keywords:
         print("genre_tool 사용")
-        return run_genre_tool(genre=genre, user_input=user_input)
+        return "genre", {"genre": genre, "user_input": user_input}
 
     # 그 외 emotion + genre 등 복합 조건 → hybrid_tool
     has_multiple = sum([
@@ -55,10 +65,26 @@ def run_recommend_agent(query_data: dict) -> str:
             "keywords": keywords,
             "user_input": user_input
         }
-        return run_hybrid_tool(info)
+        return "hybrid", {"info": info}
 
     # ❌ 아무 조건도 없을 때
-    return "❗추천을 위해 감정, 장르, 작가, 키워드 중 하나 이상이 필요합니다."
+    return None, None
+
+
+# 추천 실행 함수
+def run_recommend_agent(query_data: dict) -> str:
+    tool_name, kwargs = _select_tool(query_data)
+    if tool_name is None:
+        return NO_CONDITION_MESSAGE
+    return _TOOLS[tool_name][0](**kwargs)
+
+
+# 비동기 추천 실행 함수 (FastAPI 이벤트 루프에서 사용)
+async def arun_recommend_agent(query_data: dict, on_token=None) -> str:
+    tool_name, kwargs = _select_tool(query_data)
+    if tool_name is None:
+        return NO_CONDITION_MESSAGE
+    return await _TOOLS[tool_name][1](**kwargs, on_token=on_token)
 if __name__ == "__main__":
     # sample_query = {
     #     "emotion": "우울",
@@ -6,18 +6,11 @@
 세션 관리와 다른 에이전트와의 협업을 담당
 """
 
-from typing import Dict, Any
-import sys
+from typing import Dict, Any, Optional, Callable
 import os
 import json
-
-# OpenAI 모듈 안전하게 import
-try:
-    import openai
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    openai = None
+import asyncio
+import threading
 
 # .env 파일 로드
 try:
@@ -26,43 +19,43 @@ try:
 except ImportError:
     pass
 
-# 명시적 경로 설정
-current_dir = os.path.dirname(os.path.abspath(__file__))
-chains_dir = os.path.join(os.path.dirname(current_dir), 'chains')
-
-sys.path.insert(0, chains_dir)
-
-from wiki_search_chain import WikiSearchChain
-
-# 모델 import를 위한 경로 설정
-models_dir = os.path.join(os.path.dirname(current_dir), 'models')
-sys.path.insert(0, models_dir)
-
-from wiki_agent_response import WikiAgentResponse
+from app.chains.wiki_search_chain import WikiSearchChain
+from app.utils import wiki_keywords
+from app.models.wiki_agent_response import WikiAgentResponse
 
 
 class WikiSearchAgent:
-    """위키피디아 검색 에이전트 클래스."""
+    """위키피디아 검색 에이전트 클래스.
+
+    대화별 상태를 보관하지 않으며, 컨텍스트는 호출할 때마다 명시적으로 전달받는다.
+    따라서 프로세스 전체에서 하나의 인스턴스(get_wiki_agent)를 모든 세션이 공유한다.
+    """
 
     def __init__(self):
-        """에이전트를 초기화하고 체인과 세션 상태를 설정."""
+        """에이전트를 초기화하고 체인을 설정."""
         # OpenAI 클라이언트 초기화 (Agent에서 리소스 관리)
+        # openai SDK는 import 비용이 커서 에이전트를 처음 만들 때 불러옴 (없으면 LLM 없이 동작)
         self.llm_client = None
-        if OPENAI_AVAILABLE:
-            try:
-                self.llm_client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-            except Exception:
-                pass
+        try:
+            import openai
+            self.llm_client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        except Exception:
+            pass
         
         # Chain에 LLM 클라이언트 전달 (의존성 주입)
         self.chain = WikiSearchChain(llm_client=self.llm_client)
-        self.context = {}
 
-    def process_with_context(self, query: str, context: Dict[str, Any]) -> Dict[str, Any]:
-        """사용자 쿼리를 컨텍스트와 함께 처리."""
+    def process_with_context(self, query: str, context: Dict[str, Any],
+                             precomputed_intent: Optional[Dict[str, Any]] = None,
+                             on_token: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """사용자 쿼리를 컨텍스트와 함께 처리.
+
+        precomputed_intent가 주어지면 체인의 LLM 의도 분석을 대신한다.
+        on_token이 주어지면 LLM 답변 생성 시 토큰을 스트리밍한다.
+        """
         try:
             # 체인에서 처리 (컨텍스트 전달)
-            result = self.chain.execute(query, context)
+            result = self.chain.execute(query, context, precomputed_intent=precomputed_intent, on_token=on_token)
             
             # WikiAgentResponse 모델 사용
             if result['action'] == 'error':
@@ -81,10 +74,9 @@ class WikiSearchAgent:
                     context_updated=True
                 )
             
-            # 에이전트의 내부 상태 업데이트 및 반환값에 컨텍스트 추가
+            # 컨텍스트 변경분은 반환값으로만 전달 (저장은 호출자의 세션이 담당)
             response_dict = response.to_dict()
             if 'update_context' in result:
-                self.context.update(result['update_context'])
                 response_dict['update_context'] = result['update_context']
 
             return response_dict
@@ -97,6 +89,16 @@ class WikiSearchAgent:
             return response.to_dict()
 
 
+    async def aprocess_with_context(self, query: str, context: Dict[str, Any],
+                                    precomputed_intent: Optional[Dict[str, Any]] = None,
+                                    on_token: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """process_with_context의 비동기 버전.
+
+        체인은 동기 OpenAI/위키피디아 호출로 이루어져 있으므로 작업 스레드에서 실행하여
+        이벤트 루프가 다른 요청을 계속 처리할 수 있도록 한다.
+        """
+        return await asyncio.to_thread(self.process_with_context, query, context, precomputed_intent, on_token)
+
     def can_handle_query(self, query: str) -> bool:
         """이 에이전트가 주어진 쿼리를 처리할 수 있는지 판단 (키워드 기반)."""
         # 키워드 기반 판단만 사용
@@ -104,40 +106,50 @@ class WikiSearchAgent:
     
     def _fallback_can_handle_query(self, query: str) -> bool:
         """기존 키워드 기반 처리 가능 여부 판단 (폴백용)."""
-        author_keywords = ['작가', '소설가', '시인', '저자', '작품', '알려줘', '정보', '누구']
+        hits = wiki_keywords.scan(query)
         
         # 기본 키워드 체크
-        if any(keyword in query.lower() for keyword in author_keywords):
+        if wiki_keywords.AGENT_AUTHOR in hits:
             return True
         
         # 인물명 + 질문 패턴 체크 (예: "제인오스틴은 언제 죽었어")
-        person_question_patterns = ['언제', '어디', '태어', '죽었', '사망', '대학', '학교', '출생']
-        query_lower = query.lower()
-        
-        # 인물명이 포함되어 있고 + 질문 패턴이 있으면 처리 가능
-        if any(pattern in query_lower for pattern in person_question_patterns):
+        if wiki_keywords.AGENT_PERSON_QUESTION in hits:
             # 간단한 휴리스틱: 대문자나 외국 이름 패턴이 있으면 인물명일 가능성
-            if (any(char.isupper() for char in query) or 
-                any(name in query for name in ['스틴', '러키', '영하', '오웰', '하루키', '카미']) or
-                len([char for char in query if char.isupper()]) >= 2):  # 대문자가 2개 이상
+            if any(char.isupper() for char in query) or wiki_keywords.AGENT_FOREIGN_NAME in hits:
                 return True
         
         return False
 
-    def get_status_info(self) -> Dict[str, Any]:
-        """에이전트 상태 정보를 반환."""
+    def get_status_info(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """주어진 대화 컨텍스트 기준의 에이전트 상태 정보를 반환."""
         return {
             'agent_name': 'wiki_search',
-            'is_active': self.context.get('waiting_for_clarification', False),
-            'current_author': self.context.get('current_author'),
-            'conversation_turns': len(self.context.get('conversation_history', [])),
-            'waiting_for_input': self.context.get('waiting_for_clarification', False)
+            'is_active': context.get('waiting_for_clarification', False),
+            'current_author': context.get('current_author'),
+            'conversation_turns': len(context.get('conversation_history', [])),
+            'waiting_for_input': context.get('waiting_for_clarification', False)
         }
 
 
+# 프로세스 전역 공유 인스턴스 (OpenAI 커넥션 풀, 위키피디아 세션을 모든 대화가 재사용)
+_shared_agent = None
+_shared_agent_lock = threading.Lock()
+
+
+def get_wiki_agent() -> WikiSearchAgent:
+    """공유 WikiSearchAgent 인스턴스를 반환 (최초 호출 시 생성)."""
+    global _shared_agent
+    if _shared_agent is None:
+        with _shared_agent_lock:
+            if _shared_agent is None:
+                _shared_agent = WikiSearchAgent()
+    return _shared_agent
+
+
 def interactive_chat():
     """대화형 위키서치 에이전트"""
     agent = WikiSearchAgent()
+    context = {}
 
     print("=" * 60)
     print("위키서치 에이전트 대화 시작")
@@ -162,7 +174,8 @@ def interactive_chat():
                 continue
 
             # 에이전트 처리
-            result = agent.process_with_context(user_input, agent.context)
+            result = agent.process_with_context(user_input, context)
+            context.update(result.get('update_context', {}))
 
             # 응답 출력
             print(f"\n에이전트: {result['message']}")
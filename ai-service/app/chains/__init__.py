@@ -1,7 +1,11 @@
 from .query_analysis_chain import query_analysis_chain
 from .intent_classify_chain import intent_classify_chain
+from .pre_routing_chain import pre_routing_chain
+from .turn_analysis_chain import turn_analysis_chain
 
 __all__ = [
     "query_analysis_chain",
-    "intent_classify_chain"
+    "intent_classify_chain",
+    "pre_routing_chain",
+    "turn_analysis_chain"
 ]
@@ -1,6 +1,24 @@
 from langchain_core.runnables import RunnableLambda
-from utils.parse_intent import parse_intent
-from prompts.intent_classify_prompt import  intent_classify_prompt
-from config.llm import intent_classify_llm
+from app.utils.parse_intent import parse_intent
+from app.utils.intent_classifier import classify_intent_locally, log_intent_turn
+from app.prompts.intent_classify_prompt import  intent_classify_prompt
+from app.config.llm import lazy_llm
+from app.config.settings import INTENT_TURN_LOG_PATH
 
-intent_classify_chain = intent_classify_prompt | intent_classify_llm | RunnableLambda(parse_intent)
+llm_intent_classify_chain = intent_classify_prompt | lazy_llm("intent_classify_llm") | RunnableLambda(parse_intent)
+
+
+def _classify_intent(inputs):
+    # 로컬 분류기가 확신하면 LLM 호출 없이 바로 반환, 아니면 LLM 체인에 같은 입력으로 넘김
+    intent = classify_intent_locally(inputs["user_input"], inputs.get("conversation_history", ""))
+    if intent is not None:
+        return intent
+    if INTENT_TURN_LOG_PATH:
+        user_input = inputs["user_input"]
+        return llm_intent_classify_chain | RunnableLambda(
+            lambda llm_intent: log_intent_turn(user_input, llm_intent, INTENT_TURN_LOG_PATH) or llm_intent
+        )
+    return llm_intent_classify_chain
+
+
+intent_classify_chain = RunnableLambda(_classify_intent)
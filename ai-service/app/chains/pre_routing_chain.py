@@ -0,0 +1,9 @@
+from langchain_core.runnables import RunnableParallel
+from .query_analysis_chain import query_analysis_chain
+from .intent_classify_chain import intent_classify_chain
+
+# 질의 분석과 의도 분류는 서로의 결과를 사용하지 않으므로 동시에 실행
+pre_routing_chain = RunnableParallel(
+    query=query_analysis_chain,
+    intent=intent_classify_chain
+)
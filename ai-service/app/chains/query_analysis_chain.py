@@ -1,6 +1,6 @@
 from langchain_core.runnables import RunnableLambda
-from utils.parse_keywords import parse_keywords
-from prompts.query_analysis_prompt import query_analysis_prompt
-from config.llm import query_analysis_llm
+from app.utils.parse_keywords import parse_keywords
+from app.prompts.query_analysis_prompt import query_analysis_prompt
+from app.config.llm import lazy_llm
 
-query_analysis_chain = query_analysis_prompt | query_analysis_llm | RunnableLambda(parse_keywords)
+query_analysis_chain = query_analysis_prompt | lazy_llm("query_analysis_llm") | RunnableLambda(parse_keywords)
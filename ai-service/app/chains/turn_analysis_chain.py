@@ -0,0 +1,11 @@
+from langchain_core.runnables import RunnableLambda
+from app.utils.parse_turn_analysis import parse_turn_analysis
+from app.prompts.turn_analysis_prompt import turn_analysis_prompt, turn_analysis_schema
+from app.config.llm import lazy_llm
+
+# 질의 분석 + 의도 분류 + 위키 세부 의도를 JSON 스키마로 제한된 단일 호출로 처리
+turn_analysis_chain = (
+    turn_analysis_prompt
+    | lazy_llm("turn_analysis_llm", response_format={"type": "json_schema", "json_schema": turn_analysis_schema})
+    | RunnableLambda(parse_turn_analysis)
+)
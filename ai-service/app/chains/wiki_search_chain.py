@@ -6,30 +6,20 @@
 비즈니스 로직과 워크플로우 제어, 엣지케이스 매니징을 담당
 """
 
-from typing import Dict, Any
-import sys
-import os
+from typing import Dict, Any, Optional, Callable
 import json
-
-# 모델 및 유틸 import를 위한 경로 설정
-current_dir = os.path.dirname(os.path.abspath(__file__))
-models_dir = os.path.join(os.path.dirname(current_dir), 'models')
-utils_dir = os.path.join(os.path.dirname(current_dir), 'utils')
-sys.path.insert(0, models_dir)
-sys.path.insert(0, utils_dir)
-
-from wiki_query_intent import WikiQueryIntent, IntentType, InfoType
-from wiki_text_processing import WikiTextProcessor
-from wiki_information_extractor import WikiInformationExtractor
-from wiki_pattern_matcher import WikiPatternMatcher
-
-# OpenAI 모듈 안전하게 import
-try:
-    import openai
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    openai = None
+import threading
+
+from app.models.wiki_query_intent import WikiQueryIntent, IntentType, InfoType
+from app.models.wiki_fact_sheet import WikiFactSheet
+from app.utils.wiki_text_processing import WikiTextProcessor
+from app.utils.wiki_information_extractor import WikiInformationExtractor
+from app.utils.wiki_pattern_matcher import WikiPatternMatcher
+from app.utils import wiki_patterns as patterns
+from app.utils import wiki_keywords
+from app.tools.wiki_search_tool import WikipediaSearchTool, get_page_cache
+from app.config.settings import WIKI_FETCH_MODE, WIKI_SECTIONS
+from app.prompts.wiki_search_prompt import WikiSearchPrompt
 
 # .env 파일 로드
 try:
@@ -39,34 +29,38 @@ except ImportError:
     # python-dotenv가 설치되지 않은 경우 패스
     pass
 
-# 명시적 경로 설정
-current_dir = os.path.dirname(os.path.abspath(__file__))
-tools_dir = os.path.join(os.path.dirname(current_dir), 'tools')
-prompts_dir = os.path.join(os.path.dirname(current_dir), 'prompts')
-
-sys.path.insert(0, tools_dir)
-sys.path.insert(0, prompts_dir)
-
-from wiki_search_tool import WikipediaSearchTool
-from wiki_search_prompt import WikiSearchPrompt
-
 
 class WikiSearchChain:
     """위키피디아 검색 워크플로우 체인 클래스."""
 
     def __init__(self, llm_client=None):
         """체인을 초기화하고 필요한 컴포넌트들을 설정."""
-        self.tool = WikipediaSearchTool()
+        # 페이지 캐시는 프로세스 전체에서 공유 (세션이 달라도 같은 작가 페이지는 다시 받지 않음)
+        self.tool = WikipediaSearchTool(cache=get_page_cache(), fetch_mode=WIKI_FETCH_MODE, sections=WIKI_SECTIONS)
         self.prompt = WikiSearchPrompt()
         
         # LLM 클라이언트는 Agent에서 전달받음 (의존성 주입)
         self.llm_client = llm_client
-        
-        # 정보 추출기 import
-        from wiki_information_extractor import WikiInformationExtractor
 
-    def execute(self, query: str, context: Dict[str, Any]) -> Dict[str, Any]:
-        """메인 질의 처리 함수: clarification/context/fresh 검색 분기 명확화"""
+        # 호출(스레드)별 스트리밍 콜백. 체인 인스턴스는 여러 세션이 공유하므로 스레드 로컬에 보관
+        self._stream = threading.local()
+
+    def execute(self, query: str, context: Dict[str, Any],
+                precomputed_intent: Optional[Dict[str, Any]] = None,
+                on_token: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """메인 질의 처리 함수: clarification/context/fresh 검색 분기 명확화
+
+        precomputed_intent: 상위 통합 분석에서 이미 구한 위키 세부 의도 (있으면 LLM 의도 분석 생략)
+        on_token: LLM 답변 토큰을 받을 콜백 (있으면 _generate_llm_answer가 스트리밍)
+        """
+        self._stream.on_token = on_token
+        try:
+            return self._execute(query, context, precomputed_intent)
+        finally:
+            self._stream.on_token = None
+
+    def _execute(self, query: str, context: Dict[str, Any],
+                 precomputed_intent: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         # print(f"[DEBUG] execute() 시작 - query: {query}")
         # print(f"[DEBUG] context: {context}")
         
@@ -95,13 +89,14 @@ class WikiSearchChain:
         # print(f"[DEBUG] contains_author_name: {contains_author}")
         if contains_author:
             # print("[DEBUG] fresh search (작가명 있음)")
-            return self._fresh_search_flow(query, context)
+            return self._fresh_search_flow(query, context, precomputed_intent)
             
         # 5. 나머지는 fresh 검색
         # print("[DEBUG] fresh search (기본)")
-        return self._fresh_search_flow(query, context)
+        return self._fresh_search_flow(query, context, precomputed_intent)
 
-    def _fresh_search_flow(self, query: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _fresh_search_flow(self, query: str, context: Dict[str, Any],
+                           precomputed_intent: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """[수정됨] LLM intent 분석 결과를 기반으로 명확하게 워크플로우를 분기."""
         # print(f"[DEBUG] _fresh_search_flow() 시작 - query: {query}")
         
@@ -114,7 +109,7 @@ class WikiSearchChain:
             }
         
         # 1. LLM으로 사용자 의도 분석 (이 결과를 유일한 진실로 간주)
-        query_intent = self._analyze_query_intent(query, context)
+        query_intent = self._analyze_query_intent(query, context, precomputed_intent)
         intent_type = query_intent.get('type')
 
         # 2. 의도에 따라 명확히 다른 핸들러 호출
@@ -163,8 +158,10 @@ class WikiSearchChain:
         search_result = None
         final_author_name = None
 
+        # 후보 제목을 한 번에 확인하고 존재하는 페이지만 병렬로 받아옴
+        candidates = self.tool.search_pages(search_patterns)
         for pattern in search_patterns:
-            temp_result = self.tool.search_page(pattern)
+            temp_result = candidates[pattern]
             if temp_result['success']:
                 if self._is_title_similar(author_name, temp_result.get('title', '')):
                     if self._is_author_result(temp_result):
@@ -173,7 +170,7 @@ class WikiSearchChain:
                         break
         
         if not search_result:
-            temp_result = self.tool.search_page(author_name)
+            temp_result = candidates[author_name]
             if temp_result['success']:
                 if self._is_author_result(temp_result):
                     if self._is_title_similar(author_name, temp_result.get('title', '')):
@@ -205,7 +202,8 @@ class WikiSearchChain:
             
             if specific_info_type:
                 # print(f"[DEBUG] 구체적 정보 추출 시작 - {specific_info_type}")
-                response = self._extract_specific_answer(search_result, specific_info_type, final_author_name)
+                fact_sheet = self._get_fact_sheet(search_result, context)
+                response = self._extract_specific_answer(search_result, specific_info_type, final_author_name, fact_sheet)
                 # print(f"[DEBUG] 구체적 정보 추출 완료")
                 return {
                     'action': 'show_result',
@@ -213,7 +211,8 @@ class WikiSearchChain:
                     'update_context': {
                         'waiting_for_clarification': False,
                         'current_author': final_author_name,
-                        'last_search_result': search_result
+                        'last_search_result': search_result,
+                        'last_fact_sheet': fact_sheet.to_dict()
                     }
                 }
             else:
@@ -259,8 +258,9 @@ class WikiSearchChain:
 
         search_patterns = self._generate_search_patterns(author_name, book_title)
         best_result = None
+        candidates = self.tool.search_pages(search_patterns)
         for pattern in search_patterns:
-            search_result = self.tool.search_page(pattern)
+            search_result = candidates[pattern]
             if search_result['success'] and self._is_author_result(search_result):
                 best_result = search_result
                 break
@@ -324,9 +324,12 @@ class WikiSearchChain:
         except Exception:
             return {'book_title': query.strip()} # 예외 발생 시 폴백
 
-    def _analyze_query_intent(self, query: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
+    def _analyze_query_intent(self, query: str, context: Dict[str, Any] = None,
+                              precomputed_intent: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """쿼리 의도를 분석하여 적절한 처리 방식 결정 (LLM 기반)."""
         # print(f"[DEBUG] LLM client available: {self.llm_client is not None}")
+        if precomputed_intent and precomputed_intent.get('intent_type'):
+            return self._build_intent_from_analysis(query, precomputed_intent)
         if self.llm_client:
             try:
                 result = self._llm_analyze_intent(query, context)
@@ -356,35 +359,37 @@ class WikiSearchChain:
             )
             
             result = json.loads(response.choices[0].message.content)
-            
-            if result.get('intent_type') == 'book_to_author':
-                intent = WikiQueryIntent.create_book_to_author(
-                    query, result.get('extracted_keywords', [query])[0]
-                )
-            elif result.get('intent_type') == 'context_question':
-                info_type = InfoType.GENERAL
-                if result.get('specific_info_request'):
-                    info_map = {
-                        'university': InfoType.UNIVERSITY, 'birth': InfoType.BIRTH,
-                        'death': InfoType.DEATH, 'school': InfoType.SCHOOL,
-                        'works': InfoType.WORKS, 'awards': InfoType.AWARDS
-                    }
-                    info_type = info_map.get(result.get('specific_info_request'), InfoType.GENERAL)
-                intent = WikiQueryIntent.create_context_question(query, info_type)
-            else:
-                intent = WikiQueryIntent.create_author_search(
-                    query, result.get('extracted_keywords', [])
-                )
-            
-            return intent.to_dict()
+            return self._build_intent_from_analysis(query, result)
                 
         except Exception as e:
             return self._fallback_analyze_intent(query)
+
+    def _build_intent_from_analysis(self, query: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """LLM 의도 분석 결과(JSON)를 WikiQueryIntent 딕셔너리로 변환."""
+        if result.get('intent_type') == 'book_to_author':
+            intent = WikiQueryIntent.create_book_to_author(
+                query, (result.get('extracted_keywords') or [query])[0]
+            )
+        elif result.get('intent_type') == 'context_question':
+            info_type = InfoType.GENERAL
+            if result.get('specific_info_request'):
+                info_map = {
+                    'university': InfoType.UNIVERSITY, 'birth': InfoType.BIRTH,
+                    'death': InfoType.DEATH, 'school': InfoType.SCHOOL,
+                    'works': InfoType.WORKS, 'awards': InfoType.AWARDS
+                }
+                info_type = info_map.get(result.get('specific_info_request'), InfoType.GENERAL)
+            intent = WikiQueryIntent.create_context_question(query, info_type)
+        else:
+            intent = WikiQueryIntent.create_author_search(
+                query, result.get('extracted_keywords', [])
+            )
+
+        return intent.to_dict()
     
     def _fallback_analyze_intent(self, query: str) -> Dict[str, Any]:
         """간단한 키워드 기반 의도 분석."""
         query_lower = query.lower()
-        import re
         
         if any(word in query_lower for word in ['저자', '작가', '지은이', '쓴 사람']):
             book_title = query_lower
@@ -392,16 +397,11 @@ class WikiSearchChain:
                 book_title = book_title.replace(word, '').strip()
             return WikiQueryIntent.create_book_to_author(query, book_title).to_dict()
         
-        author_patterns = [
-            r'([가-힣]{2,5}(?:\s[가-힣]{2,5})*)',
-        ]
-        
-        for pattern in author_patterns:
-            matches = re.findall(pattern, query)
-            if matches:
-                author_name = max(matches, key=len).strip()
-                if author_name not in ['출생일', '사망일', '알려줘', '정보', '대해', '나이']:
-                    return WikiQueryIntent.create_author_search(query, author_name).to_dict()
+        matches = patterns.KOREAN_NAME_PHRASE.findall(query)
+        if matches:
+            author_name = max(matches, key=len).strip()
+            if author_name not in ['출생일', '사망일', '알려줘', '정보', '대해', '나이']:
+                return WikiQueryIntent.create_author_search(query, author_name).to_dict()
         
         return WikiQueryIntent.create_author_search(query, query).to_dict()
 
@@ -441,8 +441,9 @@ class WikiSearchChain:
                 search_patterns.insert(1, spaced_title)
         search_result = None
         author_name = None
+        candidates = self.tool.search_pages(search_patterns)
         for pattern in search_patterns:
-            temp_result = self.tool.search_page(pattern)
+            temp_result = candidates[pattern]
             if temp_result['success']:
                 if self._is_title_similar(book_title, temp_result.get('title', '')):
                     search_result = temp_result
@@ -482,21 +483,23 @@ class WikiSearchChain:
         result_norm = result_title.lower().replace(' ', '')
         if not query_norm or not result_norm:
             return False
-        import re
-        result_core = re.sub(r'\(.*?\)', '', result_norm).strip()
+        result_core = patterns.PARENTHESIZED_LAZY.sub('', result_norm).strip()
         if query_norm in result_core or result_core in query_norm:
             return True
         return False
 
     def _handle_context_question(self, query: str, query_intent: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
-        """[재설계 5.0] 맥락 기반 질문 처리. 안정성 강화 및 컨텍스트 누락 대응."""
+        """[재설계 5.0] 맥락 기반 질문 처리. 안정성 강화 및 컨텍스트 누락 대응.
+
+        전달받은 context는 바꾸지 않고, 갱신할 컨텍스트는 새 dict로 만들어 update_context로 반환.
+        """
         
         # 0. 관련 없는 질문 필터링
         if self._is_irrelevant_query(query):
             return {
                 'action': 'error',
                 'message': "죄송합니다. 도서, 작가, 출판사에 대한 질문만 답변드릴 수 있습니다.",
-                'update_context': context
+                'update_context': dict(context)
             }
         
         # 1. 컨텍스트에서 정보 추출 (필수)
@@ -512,13 +515,14 @@ class WikiSearchChain:
         query_lower = query.lower()
         specific_request = self._extract_specific_info_request(query_lower)
 
-        # 4. 매칭된 키워드가 있으면, 정보 추출 시도
+        # 4. 매칭된 키워드가 있으면, 정보 카드에서 답변 (같은 페이지면 컨텍스트의 카드를 재사용)
         if specific_request:
-            message = self._extract_specific_answer(last_search_result, specific_request, author_name)
+            fact_sheet = self._get_fact_sheet(last_search_result, context)
+            message = self._extract_specific_answer(last_search_result, specific_request, author_name, fact_sheet)
             return {
                 'action': 'show_result',
                 'message': message,
-                'update_context': context  # 컨텍스트 유지
+                'update_context': {**context, 'last_fact_sheet': fact_sheet.to_dict()}  # 컨텍스트 유지 + 정보 카드
             }
 
         # 5. 구체적인 키워드가 없으면, LLM을 통해 일반적인 답변 생성
@@ -531,7 +535,7 @@ class WikiSearchChain:
         return {
             'action': 'show_result',
             'message': llm_answer,
-            'update_context': context
+            'update_context': dict(context)
         }
 
     def _parse_clarification_response(self, query: str) -> Dict[str, str]:
@@ -548,12 +552,13 @@ class WikiSearchChain:
             author_name
         ]
         
+        candidates = self.tool.search_pages(search_patterns)
         for pattern in search_patterns:
-            search_result = self.tool.search_page(pattern)
+            search_result = candidates[pattern]
             if search_result['success'] and self._is_author_result(search_result):
                 return search_result
         
-        return self.tool.search_page(author_name)
+        return candidates[author_name]
 
     def _extract_context_specific_answer(self, query: str, search_result: Dict[str, Any]) -> str:
         query_lower = query.lower()
@@ -562,12 +567,11 @@ class WikiSearchChain:
         url = search_result.get('url', '').replace('(', '%28').replace(')', '%29')
         
         if any(word in query_lower for word in ['대표작', '작품', '소설', '책']):
-            works_info = WikiInformationExtractor.find_works_info(content, self.llm_client)
+            works_info = self._get_fact_sheet(search_result).works
             if works_info:
                 return f"**{title}의 주요 작품:**\n{works_info}\n\n**상세 정보**: {url}"
             else:
-                import re
-                work_mentions = re.findall(r'《([^》]+)》', content)
+                work_mentions = patterns.WORK_TITLE.findall(content)
                 if work_mentions:
                     unique_works = []
                     for work in work_mentions:
@@ -631,8 +635,7 @@ class WikiSearchChain:
     def _is_new_author_query(self, query: str) -> bool:
         author_query_keywords = ['작가', '소설가', '시인', '에 대해', '알려줘', '정보', '누구', '누군데', '뭔데', '어떤 사람', '무엇', '어디서']
         
-        import re
-        if re.search(r'[가-힣A-Za-z\s]+[이은는]\s*(누구|뭔데|누군데|어떤|무엇)', query):
+        if patterns.WHO_IS_QUESTION.search(query):
             return True
             
         if len(query.strip().split()) == 1 and not any(keyword in query for keyword in author_query_keywords):
@@ -641,7 +644,7 @@ class WikiSearchChain:
         return any(keyword in query for keyword in author_query_keywords)
 
     def _generate_search_patterns(self, author_name: str, book_title: str) -> list:
-        patterns = [
+        search_patterns = [
             f"{author_name} (작가)",
             f"{author_name} (소설가)",
             f"{author_name} (만화가)",
@@ -653,42 +656,56 @@ class WikiSearchChain:
             f"{author_name} 만화가",
             author_name
         ]
-        return patterns
+        return search_patterns
 
     def _extract_specific_info_request(self, query: str) -> str:
-        query_lower = query.lower()
-        import re
-        if any(word in query_lower for word in ['고등학교', '중학교', '초등학교']):
+        hits = wiki_keywords.scan(query)
+        if wiki_keywords.INFO_SCHOOL in hits:
             return 'school'
-        if any(word in query_lower for word in ['대학', '대학교', '학교', '출신']):
+        if wiki_keywords.INFO_UNIVERSITY in hits:
             return 'university'
-        if '아버지' in query_lower or '부친' in query_lower:
+        if wiki_keywords.INFO_FATHER in hits:
             return 'father'
-        if '어머니' in query_lower or '모친' in query_lower:
+        if wiki_keywords.INFO_MOTHER in hits:
             return 'mother'
-        if '가족' in query_lower or '부모' in query_lower:
+        if wiki_keywords.INFO_FAMILY in hits:
             return 'family'
-        if '대표작품' in query_lower or '대표작' in query_lower or '작품' in query_lower:
+        if wiki_keywords.INFO_WORKS in hits:
             return 'works'
-        if re.search(r'(태어|출생)', query_lower) and re.search(r'(죽|사망)', query_lower):
+        if wiki_keywords.BIRTH_WORD in hits and wiki_keywords.DEATH_WORD in hits:
             return 'birth_death'
-        if '출생일' in query_lower and '사망일' in query_lower:
+        if wiki_keywords.BIRTH_DAY in hits and wiki_keywords.DEATH_DAY in hits:
             return 'birth_death'
-        if any(word in query_lower for word in ['죽었', '사망', '사혼', '언제 죽', '몇년에 죽', '언제 죽', '죽은', '사망일']):
+        if wiki_keywords.INFO_DEATH in hits:
             return 'death'
-        if any(word in query_lower for word in ['출생', '태어', '나이', '출생일']) or ('언제' in query_lower and not any(death_word in query_lower for death_word in ['죽', '사망'])):
+        if wiki_keywords.INFO_BIRTH in hits or (wiki_keywords.WHEN in hits and wiki_keywords.DEATH_WORD not in hits):
             return 'birth'
-        if any(word in query_lower for word in ['수상', '상', '받은']):
+        if wiki_keywords.INFO_AWARDS in hits:
             return 'awards'
         return None
 
-    def _extract_specific_answer(self, search_result: Dict[str, Any], info_type: str, author_name: str) -> str:
+    def _get_fact_sheet(self, search_result: Dict[str, Any], context: Dict[str, Any] = None) -> WikiFactSheet:
+        """검색 결과 페이지의 인물 정보 카드. 컨텍스트에 같은 페이지의 카드가 있으면 다시 추출하지 않음."""
+        cached = (context or {}).get('last_fact_sheet')
+        if cached:
+            fact_sheet = WikiFactSheet.from_dict(cached)
+            if fact_sheet.is_for(search_result):
+                return fact_sheet
+        content = search_result.get('content', '') + ' ' + search_result.get('summary', '')
+        return WikiInformationExtractor.extract_fact_sheet(
+            content, self.llm_client, title=search_result.get('title'), url=search_result.get('url')
+        )
+
+    def _extract_specific_answer(self, search_result: Dict[str, Any], info_type: str, author_name: str,
+                                 fact_sheet: Optional[WikiFactSheet] = None) -> str:
+        if fact_sheet is None:
+            fact_sheet = self._get_fact_sheet(search_result)
         content = search_result.get('content', '') + ' ' + search_result.get('summary', '')
         title = author_name
         url = search_result.get('url', '').replace('(', '%28').replace(')', '%29')
         
         if info_type == 'school':
-            school_info = WikiInformationExtractor.find_school_info(content, self.llm_client)
+            school_info = fact_sheet.school
             if school_info:
                 particle = "을" if school_info[-1] in "라마바사아자차카타파하" else "를"
                 if "졸업" in content:
@@ -702,20 +719,20 @@ class WikiSearchChain:
                 return f"{title}의 고등학교 정보는 위키피디아에서 확인할 수 없습니다.\n\n혹시 다른 학력 정보가 궁금하시면 '대학교'나 '학력' 등으로 질문해보세요.\n\n**전체 정보**: {url}"
         
         elif info_type == 'university':
-            university_info = WikiInformationExtractor.find_university_info(content, self.llm_client)
+            university_info = fact_sheet.university
             if university_info:
                 if "졸업" in content and university_info in content:
                     particle = "을" if university_info[-1] in "라마바사아자차카타파하" else "를"
                     return f"{title}은(는) {university_info}{particle} 졸업했습니다.\n\n**상세 정보**: {url}"
                 else:
-                    school_info = WikiInformationExtractor.find_school_info(content, self.llm_client)
+                    school_info = fact_sheet.school
                     if school_info:
                         particle = "을" if school_info[-1] in "라마바사아자차카타파하" else "를"
                         return f"{title}은(는) {school_info}{particle} 졸업했습니다 (최종학력).\n\n**상세 정보**: {url}"
                     else:
                         return f"{title}의 학력 정보를 찾을 수 없습니다.\n\n**전체 정보**: {url}"
             else:
-                school_info = self._find_school_info(content)
+                school_info = fact_sheet.school
                 if school_info:
                     particle = "을" if school_info[-1] in "라마바사아자차카타파하" else "를"
                     return f"{title}은(는) {school_info}{particle} 졸업했습니다 (최종학력).\n\n**상세 정보**: {url}"
@@ -723,22 +740,22 @@ class WikiSearchChain:
                     return f"{title}의 대학교 정보는 위키피디아에서 확인할 수 없습니다.\n\n혹시 다른 학력 정보가 궁금하시면 '고등학교' 등으로 질문해보세요.\n\n**전체 정보**: {url}"
         
         elif info_type == 'birth':
-            birth_info = WikiInformationExtractor.find_birth_info(content, self.llm_client)
+            birth_info = fact_sheet.birth
             if birth_info:
                 return f"{title}은(는) {birth_info}에 태어났습니다.\n\n**상세 정보**: {url}"
             else:
                 return f"{title}의 출생 정보를 찾을 수 없습니다.\n\n**상세 정보**: {url}"
                 
         elif info_type == 'death':
-            death_info = WikiInformationExtractor.find_death_info(content, self.llm_client)
+            death_info = fact_sheet.death
             if death_info:
                 return f"{title}은(는) {death_info}에 사망했습니다.\n\n**상세 정보**: {url}"
             else:
                 return f"{title}의 사망 정보를 찾을 수 없습니다.\n\n**상세 정보**: {url}"
         
         elif info_type == 'birth_death':
-            birth_info = WikiInformationExtractor.find_birth_info(content, self.llm_client)
-            death_info = WikiInformationExtractor.find_death_info(content, self.llm_client)
+            birth_info = fact_sheet.birth
+            death_info = fact_sheet.death
             response = f"{title}은(는) "
             if birth_info:
                 response += f"{birth_info}에 태어나 "
@@ -752,7 +769,7 @@ class WikiSearchChain:
             return response
         
         elif info_type == 'works':
-            works_list = WikiInformationExtractor.find_works_info(content, self.llm_client)
+            works_list = fact_sheet.works
             if works_list:
                 works_info = '\n'.join([f"- {work}" for work in works_list])
                 return f"{title}의 주요 작품:\n{works_info}\n\n**상세 정보**: {url}"
@@ -760,7 +777,7 @@ class WikiSearchChain:
                 return f"{title}의 작품 정보를 찾을 수 없습니다.\n\n**상세 정보**: {url}"
         
         elif info_type == 'awards':
-            awards_list = WikiInformationExtractor.find_awards_info(content, self.llm_client)
+            awards_list = fact_sheet.awards
             if awards_list:
                 awards_info = '\n'.join([f"- {award}" for award in awards_list])
                 return f"{title}의 주요 수상 내역:\n{awards_info}\n\n**상세 정보**: {url}"
@@ -768,26 +785,26 @@ class WikiSearchChain:
                 return f"{title}의 수상 정보를 찾을 수 없습니다.\n\n**상세 정보**: {url}"
         
         elif info_type == 'father':
-            father_info = WikiInformationExtractor.find_father_info(content)
+            father_info = fact_sheet.father
             if father_info:
                 return f"{title}의 아버지 이름은 {father_info}입니다.\n\n**상세 정보**: {url}"
             else:
                 return f"{title}의 아버지 정보를 찾을 수 없습니다.\n\n**상세 정보**: {url}"
         elif info_type == 'mother':
-            mother_info = WikiInformationExtractor.find_mother_info(content)
+            mother_info = fact_sheet.mother
             if mother_info:
                 return f"{title}의 어머니 이름은 {mother_info}입니다.\n\n**상세 정보**: {url}"
             else:
                 return f"{title}의 어머니 정보를 찾을 수 없습니다.\n\n**상세 정보**: {url}"
         elif info_type == 'spouse':
-            spouse_info = WikiInformationExtractor.find_spouse_info(content)
+            spouse_info = fact_sheet.spouse
             if spouse_info:
                 return f"{title}의 배우자는 {spouse_info}입니다.\n\n**상세 정보**: {url}"
             else:
                 return f"{title}의 배우자 정보를 찾을 수 없습니다.\n\n**상세 정보**: {url}"
         elif info_type == 'family':
             try:
-                family_info = WikiInformationExtractor.find_enhanced_family_info(content, self.llm_client)
+                family_info = fact_sheet.family
                 # print(f"[DEBUG] family_info 결과: {family_info}")
                 result_parts = []
                 has_family_info = False
@@ -858,19 +875,12 @@ class WikiSearchChain:
         return self._fallback_find_university(content)
     
     def _fallback_find_university(self, content: str) -> str:
-        import re
-        patterns = [
-            r'([가-힣]+대학교?)\s*(?:졸업|진학|입학)',
-            r'(?:졸업|진학|입학).*?([가-힣]+대학교?)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, content)
-            if matches:
-                university = matches[0]
-                if not university.endswith(('대학교', '대학')):
-                    university += '대학교'
-                return university
+        matches = patterns.UNIVERSITY_FALLBACK.first_findall(content)
+        if matches:
+            university = matches[0]
+            if not university.endswith(('대학교', '대학')):
+                university += '대학교'
+            return university
         
         return None
 
@@ -898,19 +908,8 @@ class WikiSearchChain:
             except Exception as e:
                 pass
         
-        import re
-        patterns = [
-            r'(\d{4}년\s*\d{1,2}월\s*\d{1,2}일)',
-            r'(\d{4}\.\s*\d{1,2}\.\s*\d{1,2})',
-            r'(\d{4}년)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, content)
-            if matches:
-                return matches[0]
-        
-        return None
+        matches = patterns.BIRTH_DATE_OR_YEAR.first_findall(content)
+        return matches[0] if matches else None
 
     def _find_death_info(self, content: str) -> str:
         if self.llm_client:
@@ -939,21 +938,8 @@ class WikiSearchChain:
         return self._fallback_find_death(content)
 
     def _fallback_find_death(self, content: str) -> str:
-        import re
-        death_patterns = [
-            r'~\s*(\d{4}년)',
-            r'(\d{4}년 \d{1,2}월 \d{1,2}일)에 사망',
-            r'사망일은 (\d{4}년 \d{1,2}월 \d{1,2}일)',
-            r'(\d{4}년 \d{1,2}월 \d{1,2}일) 세상을 떠났다',
-            r'(\d{4}년)에 사망',
-        ]
-        
-        for pattern in death_patterns:
-            matches = re.findall(pattern, content)
-            if matches:
-                return matches[0]
-        
-        return None
+        matches = patterns.DEATH_PHRASES.first_findall(content)
+        return matches[0] if matches else None
 
     def _find_school_info(self, content: str) -> str:
         if self.llm_client:
@@ -982,18 +968,8 @@ class WikiSearchChain:
         return self._fallback_find_school(content)
     
     def _fallback_find_school(self, content: str) -> str:
-        import re
-        patterns = [
-            r'([가-힣]+고등학교)\s*(?:졸업|진학|입학)',
-            r'(?:졸업|진학|입학).*?([가-힣]+고등학교)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, content)
-            if matches:
-                return matches[0]
-        
-        return None
+        matches = patterns.HIGH_SCHOOL.first_findall(content)
+        return matches[0] if matches else None
 
     def _find_works_info(self, content: str) -> str:
         if self.llm_client:
@@ -1020,8 +996,7 @@ class WikiSearchChain:
         return self._fallback_find_works(content)
     
     def _fallback_find_works(self, content: str) -> str:
-        import re
-        works = re.findall(r'《([^》]+)》', content)
+        works = patterns.WORK_TITLE.findall(content)
         if works:
             unique_works = []
             for work in works:
@@ -1056,15 +1031,9 @@ class WikiSearchChain:
         return self._fallback_find_awards(content)
     
     def _fallback_find_awards(self, content: str) -> str:
-        import re
-        award_patterns = [
-            r'([가-힣\s]+(?:상|문학상|예술상|대상))[을를]?\s*(?:수상|받았)',
-            r'(\d{4}년)\s*([가-힣\s]+(?:상|문학상|예술상|대상))',
-        ]
-        
         awards = []
-        for pattern in award_patterns:
-            matches = re.findall(pattern, content)
+        for pattern in patterns.AWARD_PHRASES:
+            matches = pattern.findall(content)
             for match in matches:
                 if isinstance(match, tuple):
                     award = ' '.join(match).strip()
@@ -1117,12 +1086,7 @@ class WikiSearchChain:
                 }
 
         # 2. 맥락을 이어가는 질문인지 키워드로 확인
-        context_keywords = [
-            '나이', '대학', '학교', '작품', '대표작', '수상', '언제', '어디',
-            '학력', '졸업', '아버지', '어머니', '가족', '부모', '사망', '죽었',
-            '태어', '그', '그의', '그녀', '아내', '남편', '배우자'
-        ]
-        has_context_keyword = any(keyword in query.lower() for keyword in context_keywords)
+        has_context_keyword = wiki_keywords.CONTEXT_FOLLOW_UP in wiki_keywords.scan(query)
 
         # 3. 작가명 없이 맥락 키워드만 있거나, 이전 답변에 나온 인물에 대한 질문이면 -> 컨텍스트 사용
         if (has_context_keyword and not query_author) or self._is_entity_in_last_response(query, context):
@@ -1136,31 +1100,16 @@ class WikiSearchChain:
     
     def _contains_author_name(self, query: str) -> bool:
         """질문에 작가명(한글 2글자 이상, 띄어쓰기 포함, 영어 이름 등)이 포함되어 있는지 완화된 정규식으로 판별"""
-        import re
-        return bool(re.search(r'([가-힣]{2,}(\s[가-힣]{2,})*|[A-Za-z]{2,}(\s[A-Za-z\.]{1,})*)', query))
+        return bool(patterns.CONTAINS_NAME.search(query))
     
     def _extract_author_from_query(self, query: str) -> str:
         """질문에서 작가명을 추출."""
-        import re
-        
-        explicit_patterns = [
-            r'([가-힣]{2,5}(?:\s[가-힣]{2,5})*)\s*(?:의|이|가|은|는)?\s*(?:출생|사망|태어|죽었|나이|대학|학교|아버지|어머니|부모|가족)',
-            r'([가-힣]{2,5}(?:\s[가-힣]{2,5})*)\s*작가',  
-            r'([가-힣]{2,5}(?:\s[가-힣]{2,5})*)\s*소설가',
-        ]
+        match = patterns.AUTHOR_IN_QUERY.first_search(query)
+        if match:
+            return match.group(1).strip()
         
-        japanese_patterns = [
-            r'(다자이\s*오사무|무라카미\s*하루키|요시모토\s*바나나)',
-            r'([가-힣]{2,3}\s+[가-힣]{2,3})',
-        ]
-        
-        for pattern in explicit_patterns + japanese_patterns:
-            match = re.search(pattern, query)
-            if match:
-                return match.group(1).strip()
-        
-        korean_matches = re.findall(r'[가-힣]{2,5}(?:\s[가-힣]{2,5})*', query)
-        english_matches = re.findall(r'[A-Za-z]{2,}(?:\s[A-Za-z\.]{1,})*', query)
+        korean_matches = patterns.KOREAN_NAME_PHRASE.findall(query)
+        english_matches = patterns.ENGLISH_NAME_PHRASE.findall(query)
         
         all_matches = korean_matches + english_matches
         if all_matches:
@@ -1186,21 +1135,10 @@ class WikiSearchChain:
         """작품 페이지에서 작가명 추출."""
         content = search_result.get('content', '') + ' ' + search_result.get('summary', '')
         
-        import re
-        author_patterns = [
-            r'저자[:\s]*([가-힣A-Za-z\s]+)',
-            r'작가[:\s]*([가-힣A-Za-z\s]+)',
-            r'([가-힣A-Za-z\s]+)의\s*\d+년\s*[가-힣]*\s*소설',
-            r'([가-힣A-Za-z\s]+)이\s*집필한',
-            r'([가-힣A-Za-z\s]+)이\s*쓴',
-        ]
-        
-        for pattern in author_patterns:
-            match = re.search(pattern, content)
-            if match:
-                author_name = match.group(1).strip()
-                if len(author_name) >= 2 and len(author_name) <= 10:
-                    return author_name
+        for match in patterns.WORK_PAGE_AUTHOR.searches(content):
+            author_name = match.group(1).strip()
+            if len(author_name) >= 2 and len(author_name) <= 10:
+                return author_name
         
         return None
 
@@ -1237,44 +1175,19 @@ class WikiSearchChain:
 
     def _is_book_to_author_pattern(self, query: str) -> bool:
         """쿼리가 작품명→작가명 패턴인지 확인."""
-        import re
-        
-        book_to_author_patterns = [
-            r'.+\s+작가\s*(?:가|는|을|를)?\s*(?:누구|뭐)',
-            r'.+(?:을|를|은)?\s*(?:누가|누구가)\s*(?:쓴|썼)',
-            r'.+(?:을|를)?\s*쓴\s+(?:작가|사람)\s*(?:은|는|가|를)?\s*(?:누구|뭐)',
-            r'.+\s+쓴\s+(?:작가|사람)\s*(?:누구|뭐)',
-            r'.+\s+(?:저자|지은이)\s*(?:가|는|을|를)?\s*(?:누구|뭐)',
-        ]
-        
-        for pattern in book_to_author_patterns:
-            if re.search(pattern, query, re.IGNORECASE):
-                return True
-        
-        return False
+        return patterns.BOOK_TO_AUTHOR_QUERY.search(query)
     
     def _extract_book_title_from_query(self, query: str) -> str:
         """쿼리에서 작품명을 추출."""
-        import re
-        
-        extract_patterns = [
-            r'(.+?)(?:을|를|은)?\s*(?:누가|누구가)\s*(?:쓴|썼)',
-            r'(.+?)(?:을|를)?\s*쓴\s+(?:작가|사람)\s*(?:은|는|가|를)?\s*(?:누구|뭐)',
-            r'(.+?)\s+쓴\s+(?:작가|사람)\s*(?:가|는|을|를)?\s*(?:누구|뭐)',
-            r'(.+?)\s+(?:저자|지은이)\s*(?:가|는|을|를)?\s*(?:누구|뭐)',
-            r'(.+?)\s+작가\s*(?:가|는|을|를)?\s*(?:누구|뭐)',
-        ]
-        
-        for pattern in extract_patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
-            if match:
-                extracted = match.group(1).strip()
-                extracted = re.sub(r'[은는이가을를의]$', '', extracted).strip()
-                
-                if "그리고" in extracted:
-                    extracted = self._handle_conjunction_in_title(extracted, query)
-                
-                return extracted
+        match = patterns.BOOK_TITLE_IN_QUERY.first_search(query)
+        if match:
+            extracted = match.group(1).strip()
+            extracted = patterns.TRAILING_PARTICLE.sub('', extracted).strip()
+            
+            if "그리고" in extracted:
+                extracted = self._handle_conjunction_in_title(extracted, query)
+            
+            return extracted
         
         return None
 
@@ -1319,36 +1232,68 @@ class WikiSearchChain:
                 question_type = self._determine_question_type(query)
                 user_prompt = f"""사용자 질문: {query}\n작가명: {author_name}\n질문 유형: {question_type}\n\n위키피디아 정보:\n{content[:3000]}\n\n위의 정보를 바탕으로 질문 유형에 맞게 적절한 범위의 답변을 제공해주세요."""
 
-            response = self.llm_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.3,
-                max_tokens=600
-            )
-            
-            llm_answer = response.choices[0].message.content.strip()
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ]
+            on_token = getattr(self._stream, 'on_token', None)
+            if on_token:
+                llm_answer = self._stream_llm_answer(messages, on_token)
+            else:
+                response = self.llm_client.chat.completions.create(
+                    model="gpt-3.5-turbo",
+                    messages=messages,
+                    temperature=0.3,
+                    max_tokens=600
+                )
+                llm_answer = response.choices[0].message.content.strip()
             
             if "**상세 정보**" not in llm_answer:
-                llm_answer += f"\n\n**상세 정보**: {url}"
+                detail = f"\n\n**상세 정보**: {url}"
+                llm_answer += detail
+                if on_token:
+                    on_token(detail)
             
             return llm_answer
             
         except Exception as e:
             return self.prompt.format_author_response(search_result)
 
+    def _stream_llm_answer(self, messages: list, on_token: Callable[[str], None]) -> str:
+        """답변을 스트리밍으로 생성하여 조각마다 on_token을 호출하고 전체 답변을 반환."""
+        stream = self.llm_client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=messages,
+            temperature=0.3,
+            max_tokens=600,
+            stream=True
+        )
+        parts = []
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            piece = chunk.choices[0].delta.content
+            if not piece:
+                continue
+            # 앞쪽 공백은 non-stream 경로의 strip()과 맞추기 위해 건너뜀
+            if not parts:
+                piece = piece.lstrip()
+                if not piece:
+                    continue
+            parts.append(piece)
+            on_token(piece)
+        return "".join(parts).strip()
+
     def _determine_question_type(self, query: str) -> str:
         """질문의 유형을 판단하는 헬퍼 함수."""
-        query_lower = query.lower()
-        if any(word in query_lower for word in ['부모', '아버지', '어머니', '가족', '형제', '자매', '자녀', '딸', '아들', '친척']):
+        hits = wiki_keywords.scan(query)
+        if wiki_keywords.QT_FAMILY in hits:
             return "구체적 정보 질문 - 가족"
-        elif any(word in query_lower for word in ['대표작', '작품', '소설', '책']):
+        elif wiki_keywords.QT_WORKS in hits:
             return "구체적 정보 질문 - 작품"
-        elif any(word in query_lower for word in ['출생', '태어', '언제', '나이']):
+        elif wiki_keywords.QT_BIRTH in hits:
             return "구체적 정보 질문 - 출생"
-        elif any(word in query_lower for word in ['학력', '대학', '고등학교', '학교']):
+        elif wiki_keywords.QT_EDUCATION in hits:
             return "구체적 정보 질문 - 학력"
         else:
             return "기본 소개 질문"
@@ -1367,29 +1312,13 @@ class WikiSearchChain:
     
     def _is_irrelevant_query(self, query: str) -> bool:
         """질문이 도서/작가/출판사와 관련이 없는지 판단."""
-        query_lower = query.lower().strip()
-
-        irrelevant_patterns = [
-            '웃긴다', '웃기네', '웃겨', '재밌다', '재밌네', '재미있다',
-            '안녕', '반가워', '고마워', '감사', '미안', '죄송',
-            'ㅋㅋ', 'ㅎㅎ', '하하', '헤헤',
-            '날씨', '뭐해', '어디', '어떻게',
-            '좋다', '나쁘다', '싫다', '좋아해', '싫어해',
-            '밥', '먹어', '마셔', '자자', '졸려',
-            '몰라', '모르겠다', '뭐야', '왜',
-            '너는', '당신은', '넌', '너'
-        ]
-        
-        if len(query_lower) <= 3 and not any(word in query_lower for word in ['작가', '책', '소설', '시', '작품']):
+        hits = wiki_keywords.scan(query)
+
+        if len(query.lower().strip()) <= 3 and wiki_keywords.SHORT_BOOK_TOPIC not in hits:
             return True
         
-        for pattern in irrelevant_patterns:
-            if pattern in query_lower:
-                if any(word in query_lower for word in ['쓴', '지은', '작가', '저자', '소설', '작품', '책', '정보']):
-                    continue
-                return True
-        
-        return False
+        # 잡담 키워드가 있어도 책/작가 관련 단어가 함께 있으면 관련 질문으로 봄
+        return wiki_keywords.IRRELEVANT in hits and wiki_keywords.BOOK_TOPIC not in hits
     
     def _is_work_context(self, search_result: Dict[str, Any]) -> bool:
         """현재 컨텍스트가 작품인지 판단."""
@@ -1416,21 +1345,10 @@ class WikiSearchChain:
         """작품 페이지에서 작가명 추출."""
         content = search_result.get('content', '') + ' ' + search_result.get('summary', '')
         
-        import re
-        author_patterns = [
-            r'저자[:\s]*([가-힣A-Za-z\s]+)',
-            r'작가[:\s]*([가-힣A-Za-z\s]+)',
-            r'([가-힣A-Za-z\s]+)의\s*\d+년\s*[가-힣]*\s*소설',
-            r'([가-힣A-Za-z\s]+)이\s*집필한',
-            r'([가-힣A-Za-z\s]+)이\s*쓴',
-        ]
-        
-        for pattern in author_patterns:
-            match = re.search(pattern, content)
-            if match:
-                author_name = match.group(1).strip()
-                if len(author_name) >= 2 and len(author_name) <= 10:
-                    return author_name
+        for match in patterns.WORK_PAGE_AUTHOR.searches(content):
+            author_name = match.group(1).strip()
+            if len(author_name) >= 2 and len(author_name) <= 10:
+                return author_name
         
         return None
     
@@ -1447,6 +1365,9 @@ class WikiSearchChain:
     def _process_compound_authors(self, author1: str, author2: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """두 작가 정보를 각각 검색하여 합성된 답변 생성"""
         results = []
+
+        # 두 답변을 합쳐 한 번에 보여주므로 개별 답변은 스트리밍하지 않음
+        on_token, self._stream.on_token = getattr(self._stream, 'on_token', None), None
         
         for author in [author1, author2]:
             author_result = self._handle_author_search_query(
@@ -1461,6 +1382,7 @@ class WikiSearchChain:
             else:
                 results.append(f"**{author}**\n{author}에 대한 정보를 찾을 수 없습니다.")
         
+        self._stream.on_token = on_token
         combined_message = "\n\n".join(results)
         
         return {
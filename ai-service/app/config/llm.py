@@ -1,23 +1,68 @@
 """
 llm.py
 한 파일에 목적별로 필요한 LLM 객체 모두 정의
+
+객체는 import 시점이 아니라 처음 사용할 때 만듦 (모듈 속성에 처음 접근할 때 생성 후 재사용).
+- 도구/에이전트는 `from config import llm` 후 호출 시점에 `llm.recommendation_llm`처럼 접근
+- 체인은 조립 시점에 LLM이 필요 없도록 lazy_llm()으로 감쌈
+- 서버는 시작 시 warm_up()을 백그라운드에서 실행해 첫 요청 전에 미리 만들어 둠 (/ready로 확인)
 """
 import os
-from langchain_chroma import Chroma
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from app.config.settings import (
+    LLM_REQUEST_TIMEOUT, FUSED_ANALYSIS_MODEL,
+    RECOMMEND_CACHE_ENABLED, RECOMMEND_CACHE_TTL_SECONDS, RECOMMEND_CACHE_MAX_ENTRIES, RECOMMEND_CACHE_SIMILARITY,
+    EMBEDDING_MODEL, EMBEDDING_CACHE_MAX_ENTRIES, EMBEDDING_CACHE_PATH,
+    EMBEDDING_PROVIDER, LOCAL_EMBEDDING_MODEL, LOCAL_EMBEDDING_BACKEND, LOCAL_EMBEDDING_DEVICE,
+    LOCAL_EMBEDDING_BATCH_SIZE, LOCAL_EMBEDDING_WORKERS
+)
+from app.utils.embedding_provider import create_embeddings, collection_name_for, DEFAULT_COLLECTION_NAME
+from app.indexing.manifest import read_revision
 
 load_dotenv()
-api_key = os.getenv("OPENAI_API_KEY")
-if not api_key:
-    raise ValueError("OPENAI_API_KEY is not set.")
 
-#임베딩 모델 생성
-embedding_model = OpenAIEmbeddings(model="text-embedding-ada-002")
+# 임베딩 모델별 컬렉션 (기존 OpenAI 모델은 bookstore_collection)
+_embedding_model_name = LOCAL_EMBEDDING_MODEL if EMBEDDING_PROVIDER == "local" else EMBEDDING_MODEL
+collection_name = collection_name_for(EMBEDDING_PROVIDER, _embedding_model_name)
+
+
+def _api_key() -> str:
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY is not set.")
+    return api_key
+
+
+# ---------- 임베딩 / 벡터스토어 ----------
+
+def _create_embedding_model():
+    """임베딩 모델 생성 (같은 질의 문자열은 캐시된 벡터를 재사용)"""
+    from app.utils.embedding_cache import CachedEmbeddings
+    if EMBEDDING_PROVIDER == "openai":
+        _api_key()
+    return CachedEmbeddings(
+        create_embeddings(
+            EMBEDDING_PROVIDER,
+            _embedding_model_name,
+            device=LOCAL_EMBEDDING_DEVICE,
+            batch_size=LOCAL_EMBEDDING_BATCH_SIZE,
+            backend=LOCAL_EMBEDDING_BACKEND,
+            max_workers=LOCAL_EMBEDDING_WORKERS
+        ),
+        model_name=_embedding_model_name,
+        maxsize=EMBEDDING_CACHE_MAX_ENTRIES,
+        disk_path=EMBEDDING_CACHE_PATH or None
+    )
+
 
 # 환경 자동 감지 및 ChromaDB 설정
-def create_vectorstore():
-    collection_name = "bookstore_collection"
+def create_vectorstore(embedding_function=None):
+    from langchain_chroma import Chroma
+    embedding_function = embedding_function or get("embedding_model")
 
     # Docker 환경 감지
     is_docker = (
@@ -41,7 +86,7 @@ def create_vectorstore():
         try:
             return Chroma(
                 collection_name=collection_name,
-                embedding_function=embedding_model,
+                embedding_function=embedding_function,
                 persist_directory=persist_dir
             )
         except Exception as e:
@@ -50,7 +95,7 @@ def create_vectorstore():
             print("🔄 임시 인메모리 ChromaDB 사용")
             return Chroma(
                 collection_name=collection_name,
-                embedding_function=embedding_model
+                embedding_function=embedding_function
             )
     else:
         print("💻 로컬 환경 감지")
@@ -64,27 +109,205 @@ def create_vectorstore():
 
         return Chroma(
             collection_name=collection_name,
-            embedding_function=embedding_model,
+            embedding_function=embedding_function,
             persist_directory=persist_dir
         )
 
-# 벡터스토어 객체 생성
-try:
-    vectorstore = create_vectorstore()
-    print("✅ ChromaDB 연결 완료")
-except Exception as e:
-    print(f"❌ ChromaDB 연결 실패: {e}")
-    # 임시 방편으로 인메모리 DB 사용
-    vectorstore = Chroma(
-        collection_name="bookstore_collection",
-        embedding_function=embedding_model
+
+def _create_vectorstore():
+    """벡터스토어 객체 생성"""
+    try:
+        store = create_vectorstore(get("embedding_model"))
+        print("✅ ChromaDB 연결 완료")
+        return store
+    except Exception as e:
+        from langchain_chroma import Chroma
+        print(f"❌ ChromaDB 연결 실패: {e}")
+        # 임시 방편으로 인메모리 DB 사용
+        store = Chroma(
+            collection_name=collection_name,
+            embedding_function=get("embedding_model")
+        )
+        print("⚠️ 임시 인메모리 ChromaDB 사용 중")
+        return store
+
+
+def _create_index_root() -> Optional[str]:
+    """검색 보조 색인은 Chroma 디렉터리 옆에 저장 (인메모리 Chroma면 저장하지 않음)
+
+    기본 컬렉션이 아니면 컬렉션 이름의 하위 디렉터리에 따로 둠
+    """
+    chroma_dir = getattr(get("vectorstore"), "_persist_directory", None)
+    index_root = os.path.dirname(os.path.normpath(chroma_dir)) if chroma_dir else None
+    if index_root and collection_name != DEFAULT_COLLECTION_NAME:
+        index_root = os.path.join(index_root, collection_name)
+    return index_root
+
+
+def _create_index_manifest_path() -> Optional[str]:
+    """색인 빌더가 문서별 내용 해시를 기록하는 매니페스트 (index_manifest.sqlite3)"""
+    index_root = get("index_root")
+    return os.path.join(index_root, "index_manifest.sqlite3") if index_root else None
+
+
+def collection_version():
+    """문서 수 + 매니페스트 revision (증분 동기화로 문서 내용만 바뀌어도 값이 달라짐)."""
+    return f"{get('vectorstore')._collection.count()}:{read_revision(get('index_manifest_path'))}"
+
+
+# ---------- 검색 ----------
+
+def _create_retriever_registry():
+    """검색 전략별 retriever (한 번만 만들어 모든 도구가 재사용)"""
+    from app.retrieval.retriever_registry import RetrieverRegistry
+    return RetrieverRegistry(get("vectorstore"))
+
+
+def _create_author_index():
+    """작가 → 도서 역색인 (컬렉션 메타데이터로 만들어 둔 뒤 반환하므로 /ready는 색인 생성 후에 통과)"""
+    from app.retrieval.author_index import AuthorIndex
+    index = AuthorIndex(get("vectorstore"), version_fn=collection_version)
+    index.ensure_built()
+    return index
+
+
+def _create_hybrid_searcher():
+    """하이브리드 도구용 BM25 + 벡터 검색 (어휘 색인은 lexical_index/, 불러오거나 만든 뒤 반환)
+
+    어휘 색인 생성에 실패해도 검색기는 반환하며, 색인이 준비될 때까지 MMR 결과만으로 응답함.
+    """
+    from app.retrieval.hybrid_search import HybridSearcher
+    index_root = get("index_root")
+    searcher = HybridSearcher(
+        get("vectorstore"),
+        get("retriever_registry"),
+        index_dir=os.path.join(index_root, "lexical_index") if index_root else None,
+        version_fn=collection_version
+    )
+    searcher.ensure_built()
+    return searcher
+
+
+def _create_emotion_index():
+    """감정 → 도서 역색인 (emotion_index.json, 불러오거나 만든 뒤 반환)"""
+    from app.retrieval.emotion_index import EmotionIndex
+    index_root = get("index_root")
+    index = EmotionIndex(
+        get("vectorstore"),
+        path=os.path.join(index_root, "emotion_index.json") if index_root else None,
+        version_fn=collection_version
+    )
+    index.ensure_built()
+    return index
+
+
+def _create_recommendation_cache():
+    """추천 응답 캐시 (컬렉션 버전이 바뀌면 자동으로 비움)"""
+    from app.utils.recommendation_cache import RecommendationCache
+    return RecommendationCache(
+        maxsize=RECOMMEND_CACHE_MAX_ENTRIES,
+        ttl=RECOMMEND_CACHE_TTL_SECONDS,
+        embeddings=get("embedding_model"),
+        similarity_threshold=RECOMMEND_CACHE_SIMILARITY or None,
+        version_fn=collection_version,
+        enabled=RECOMMEND_CACHE_ENABLED
     )
-    print("⚠️ 임시 인메모리 ChromaDB 사용 중")
 
+
+# ---------- LLM ----------
 # 목적별로 필요한 LLM 객체 정의
-query_analysis_llm = ChatOpenAI(api_key=api_key, temperature=0.0)
-intent_classify_llm = ChatOpenAI(api_key=api_key, temperature=0.0)
-clarification_llm = ChatOpenAI(api_key=api_key, temperature=0.5)
-recommendation_llm = ChatOpenAI(api_key=api_key, temperature=0.7)
+# 사전 라우팅용 LLM은 요청 제한 시간을 두어 한쪽이 지연되어도 턴 전체가 묶이지 않도록 함
+
+def _chat_llm(**kwargs):
+    from langchain_openai import ChatOpenAI
+    return ChatOpenAI(api_key=_api_key(), **kwargs)
+
+
+_FACTORIES = {
+    "embedding_model": _create_embedding_model,
+    "vectorstore": _create_vectorstore,
+    "index_root": _create_index_root,
+    "index_manifest_path": _create_index_manifest_path,
+    "retriever_registry": _create_retriever_registry,
+    "author_index": _create_author_index,
+    "hybrid_searcher": _create_hybrid_searcher,
+    "emotion_index": _create_emotion_index,
+    "recommendation_cache": _create_recommendation_cache,
+    "query_analysis_llm": lambda: _chat_llm(temperature=0.0, timeout=LLM_REQUEST_TIMEOUT),
+    "intent_classify_llm": lambda: _chat_llm(temperature=0.0, timeout=LLM_REQUEST_TIMEOUT),
+    "turn_analysis_llm": lambda: _chat_llm(model=FUSED_ANALYSIS_MODEL, temperature=0.0, timeout=LLM_REQUEST_TIMEOUT),
+    "clarification_llm": lambda: _chat_llm(temperature=0.5),
+    "recommendation_llm": lambda: _chat_llm(temperature=0.7),
+}
+
+# 생성 중인 객체가 다른 객체를 필요로 할 수 있으므로 재진입 가능한 lock 사용
+_lock = threading.RLock()
+_MISSING = object()
+_errors: Dict[str, str] = {}
+_timings: Dict[str, float] = {}
+
+
+def get(name: str):
+    """name의 공유 객체를 반환 (없으면 만들어 모듈 속성으로 저장)."""
+    value = globals().get(name, _MISSING)
+    if value is not _MISSING:
+        return value
+    if name not in _FACTORIES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _lock:
+        value = globals().get(name, _MISSING)
+        if value is _MISSING:
+            started = time.perf_counter()
+            try:
+                value = _FACTORIES[name]()
+            except Exception as e:
+                _errors[name] = str(e)
+                raise
+            _timings[name] = time.perf_counter() - started
+            _errors.pop(name, None)
+            globals()[name] = value
+        return value
+
+
+
+def __getattr__(name: str):
+    # `llm.vectorstore`, `from config.llm import vectorstore` 모두 처음 접근할 때 생성
+    return get(name)
+
+
+def lazy_llm(name: str, **bind_kwargs):
+    """체인 조립용 Runnable: 실행될 때 name의 LLM을 꺼내(필요하면 생성) 같은 입력으로 호출."""
+    from langchain_core.runnables import RunnableLambda
+
+    def resolve(_input):
+        model = get(name)
+        return model.bind(**bind_kwargs) if bind_kwargs else model
+
+    return RunnableLambda(resolve, name=name)
+
+
+def warm_up(names: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """공유 객체를 미리 만들고 이름별 상태를 반환 (하나가 실패해도 나머지는 계속 생성)."""
+    for name in names or _FACTORIES:
+        try:
+            get(name)
+        except Exception as e:
+            print(f"[WARN] {name} 초기화 실패: {e}")
+    return readiness()["resources"]
 
 
+def readiness() -> dict:
+    """공유 객체별 상태 ("ready" / "pending" / "error: ...")와 전체 준비 여부."""
+    resources = {}
+    for name in _FACTORIES:
+        if name in globals():
+            resources[name] = "ready"
+        elif name in _errors:
+            resources[name] = f"error: {_errors[name]}"
+        else:
+            resources[name] = "pending"
+    return {
+        "ready": all(state == "ready" for state in resources.values()),
+        "resources": resources,
+        "timings_ms": {name: round(seconds * 1000, 1) for name, seconds in _timings.items()},
+    }
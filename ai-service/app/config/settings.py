@@ -0,0 +1,108 @@
+"""
+settings.py
+환경변수 기반 실행 옵션 정의 (무거운 의존성 없이 import 가능)
+"""
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+# 사전 라우팅(질의 분석 + 의도 분류) 실행 방식
+# - parallel: 두 체인을 동시에 실행 (기본값)
+# - sequential: 기존처럼 순차 실행
+PRE_ROUTING_MODE = os.getenv("PRE_ROUTING_MODE", "parallel").lower()
+
+# 사전 라우팅 단계 전체 제한 시간(초). 초과하면 진행 중인 요청을 취소하고 다시 질문해 달라는 안내로 응답
+PRE_ROUTING_TIMEOUT = _env_float("PRE_ROUTING_TIMEOUT", 20.0)
+
+# 개별 OpenAI 호출 제한 시간(초)
+LLM_REQUEST_TIMEOUT = _env_float("LLM_REQUEST_TIMEOUT", 15.0)
+
+# 질의 분석 + 의도 분류(+ 위키 세부 의도)를 하나의 LLM 호출로 합칠지 여부
+USE_FUSED_ANALYSIS = os.getenv("USE_FUSED_ANALYSIS", "false").lower() == "true"
+
+# 통합 분석에 사용할 모델 (JSON 스키마 structured output 지원 모델이어야 함)
+FUSED_ANALYSIS_MODEL = os.getenv("FUSED_ANALYSIS_MODEL", "gpt-4o-mini")
+
+# 로컬 의도 분류기 (문자 n-gram 로지스틱 회귀, 분리 실행 방식의 intent_classify_chain에서 사용)
+# - 기본값은 꺼짐. 실제 턴으로 재학습한 모델의 교차 검증 정확도를 확인한 뒤 켬 (기본 모델은 시드 턴으로만 학습됨)
+# - 확신도가 LOCAL_INTENT_THRESHOLD 이상이면 LLM 의도 분류 호출을 건너뜀
+# - LOCAL_INTENT_MODEL_PATH: python -m scripts.train_intent_classifier로 만든 모델 파일 (비우면 기본 모델)
+# - INTENT_TURN_LOG_PATH: LLM이 분류한 턴을 JSONL로 남겨 재학습 데이터로 사용 (비우면 기록 안 함)
+USE_LOCAL_INTENT = os.getenv("USE_LOCAL_INTENT", "false").lower() == "true"
+LOCAL_INTENT_THRESHOLD = _env_float("LOCAL_INTENT_THRESHOLD", 0.9)
+LOCAL_INTENT_MODEL_PATH = os.getenv("LOCAL_INTENT_MODEL_PATH", "")
+INTENT_TURN_LOG_PATH = os.getenv("INTENT_TURN_LOG_PATH", "")
+
+# 채팅 세션 저장소
+# - memory: 프로세스 내부 LRU+TTL 저장소 (기본값, 단일 워커용)
+# - redis: 여러 워커가 공유하는 Redis 저장소 (redis 패키지 필요)
+SESSION_STORE_BACKEND = os.getenv("SESSION_STORE_BACKEND", "memory").lower()
+SESSION_TTL_SECONDS = _env_float("SESSION_TTL_SECONDS", 3600.0)
+SESSION_MAX_SESSIONS = int(_env_float("SESSION_MAX_SESSIONS", 1000))
+SESSION_MAX_HISTORY = int(_env_float("SESSION_MAX_HISTORY", 20))
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+# 추천 도구 응답 캐시
+# - RECOMMEND_CACHE_SIMILARITY: 0보다 크면 키가 달라도 질의 임베딩 코사인 유사도가 이 값 이상인 응답을 재사용
+RECOMMEND_CACHE_ENABLED = os.getenv("RECOMMEND_CACHE_ENABLED", "true").lower() == "true"
+RECOMMEND_CACHE_TTL_SECONDS = _env_float("RECOMMEND_CACHE_TTL_SECONDS", 3600.0)
+RECOMMEND_CACHE_MAX_ENTRIES = int(_env_float("RECOMMEND_CACHE_MAX_ENTRIES", 512))
+RECOMMEND_CACHE_SIMILARITY = _env_float("RECOMMEND_CACHE_SIMILARITY", 0.0)
+
+# 질의 임베딩 캐시
+# - EMBEDDING_CACHE_PATH: sqlite 파일 경로를 주면 프로세스 재시작 후에도 임베딩을 재사용 (비우면 인메모리만 사용)
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "text-embedding-ada-002")
+EMBEDDING_CACHE_MAX_ENTRIES = int(_env_float("EMBEDDING_CACHE_MAX_ENTRIES", 2048))
+EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH", "")
+
+# 임베딩 백엔드
+# - openai: OpenAI 임베딩 API (기본값, EMBEDDING_MODEL 사용)
+# - local: sentence-transformers로 CPU에서 직접 계산 (sentence-transformers 패키지 필요, 외부망 없이 동작)
+# 모델마다 별도 컬렉션(bookstore_collection_<백엔드>_<모델>)을 쓰므로 바꾼 뒤에는 색인을 새로 만들어야 함
+# 검색 점수 임계값(RetrieverRegistry score_threshold)은 OpenAI 모델 기준으로 맞춰져 있음
+EMBEDDING_PROVIDER = os.getenv("EMBEDDING_PROVIDER", "openai").lower()
+LOCAL_EMBEDDING_MODEL = os.getenv("LOCAL_EMBEDDING_MODEL", "jhgan/ko-sroberta-multitask")
+LOCAL_EMBEDDING_BACKEND = os.getenv("LOCAL_EMBEDDING_BACKEND", "torch").lower()  # torch | onnx
+LOCAL_EMBEDDING_DEVICE = os.getenv("LOCAL_EMBEDDING_DEVICE", "cpu")
+LOCAL_EMBEDDING_BATCH_SIZE = int(_env_float("LOCAL_EMBEDDING_BATCH_SIZE", 32))
+LOCAL_EMBEDDING_WORKERS = int(_env_float("LOCAL_EMBEDDING_WORKERS", 2))
+
+# 위키피디아 페이지 캐시
+# - WIKI_CACHE_PATH: sqlite 파일 경로를 주면 재시작/여러 워커 사이에서도 페이지를 재사용 (비우면 인메모리만 사용)
+# - WIKI_CACHE_NEGATIVE_TTL_SECONDS: "없는 페이지" 결과를 재사용하는 시간
+WIKI_CACHE_ENABLED = os.getenv("WIKI_CACHE_ENABLED", "true").lower() == "true"
+WIKI_CACHE_TTL_SECONDS = _env_float("WIKI_CACHE_TTL_SECONDS", 7 * 24 * 3600.0)
+WIKI_CACHE_NEGATIVE_TTL_SECONDS = _env_float("WIKI_CACHE_NEGATIVE_TTL_SECONDS", 24 * 3600.0)
+WIKI_CACHE_MAX_ENTRIES = int(_env_float("WIKI_CACHE_MAX_ENTRIES", 256))
+WIKI_CACHE_PATH = os.getenv("WIKI_CACHE_PATH", "")
+
+# 위키피디아 페이지 수집 방식
+# - full: 전체 본문을 받아 중요 섹션을 골라냄 (기본값)
+# - sections: 도입부 + WIKI_SECTIONS에 해당하는 섹션만 섹션 단위로 받음 (전송량/파싱 시간 감소)
+#   페이지당 요청은 2+N회 (섹션 목록 1회 + 도입부 1회 + 고른 섹션 N회)이며, 섹션 목록 뒤 1+N회는 동시에 보내
+#   대기 시간은 왕복 2번 정도. 요청 수가 full 모드(1회)보다 많으므로 전송량보다 요청 수가 부담이면 full을 씀
+WIKI_FETCH_MODE = os.getenv("WIKI_FETCH_MODE", "full").lower()
+WIKI_SECTIONS = tuple(s.strip() for s in os.getenv("WIKI_SECTIONS", "학력,생애,작품,수상").split(",") if s.strip())
+
+# 위키 인물 정보 추출 (페이지당 LLM 1회, JSON 스키마 structured output)
+# - WIKI_FACT_MODEL: JSON 스키마 structured output 지원 모델이어야 함
+# - WIKI_FACT_CACHE_*: 같은 페이지 본문에 대한 추출 결과를 재사용하는 캐시
+WIKI_FACT_MODEL = os.getenv("WIKI_FACT_MODEL", "gpt-4o-mini")
+WIKI_FACT_CACHE_TTL_SECONDS = _env_float("WIKI_FACT_CACHE_TTL_SECONDS", 7 * 24 * 3600.0)
+WIKI_FACT_CACHE_MAX_ENTRIES = int(_env_float("WIKI_FACT_CACHE_MAX_ENTRIES", 256))
+
+# 벡터 색인 생성(indexing.index_builder)에 쓰는 MySQL 접속 정보
+MYSQL_HOST = os.getenv("MYSQL_HOST", "localhost")
+MYSQL_PORT = int(_env_float("MYSQL_PORT", 3306))
+MYSQL_USER = os.getenv("MYSQL_USER", "root")
+MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD", "")
+MYSQL_DATABASE = os.getenv("MYSQL_DATABASE", "bookstore")
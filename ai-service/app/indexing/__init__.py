@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""
+벡터 색인 생성 패키지
+MySQL 상품/리뷰 테이블로 bookstore_collection을 만드는 오프라인 파이프라인
+"""
+
+from .documents import IndexDocument, content_hash, product_document, review_document
+from .index_builder import IndexBuilder, IndexBuildConfig
+from .manifest import IndexManifest, read_revision
+
+__all__ = [
+    "IndexDocument",
+    "content_hash",
+    "product_document",
+    "review_document",
+    "IndexBuilder",
+    "IndexBuildConfig",
+    "IndexManifest",
+    "read_revision"
+]
@@ -0,0 +1,123 @@
+"""
+documents.py
+MySQL product / product_review 행을 벡터 컬렉션 문서(id, 본문, 메타데이터)로 변환
+
+메타데이터 키는 check_vector_db.py와 추천 도구가 읽는 이름(product_keywords,
+product_emotion_keywords, review_emotion_keywords 등)을 그대로 따름.
+"""
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+# 상품 행을 읽는 SELECT (카테고리 이름까지 조인). 키셋 페이지네이션을 위해 isbn 순서로 읽음
+PRODUCT_QUERY = """
+    SELECT p.isbn, p.product_name, p.author, p.publisher, p.price, p.rate,
+           p.brief_description, p.detail_description, p.product_keyword, p.emotion_keyword,
+           lc.low_category_name, mc.mid_category_name, tc.top_category_name
+    FROM product p
+    LEFT JOIN low_category lc ON p.low_category = lc.low_category
+    LEFT JOIN middle_category mc ON lc.mid_category = mc.mid_category
+    LEFT JOIN top_category tc ON mc.top_category = tc.top_category
+    WHERE p.isbn > %s
+    ORDER BY p.isbn
+"""
+
+# 리뷰 행을 읽는 SELECT (책 메타데이터 포함, 삭제된 리뷰 제외)
+REVIEW_QUERY = """
+    SELECT pr.product_review_id, pr.isbn, pr.review_title, pr.review_content, pr.emotion_keyword AS review_emotion_keyword,
+           p.product_name, p.author, p.publisher, p.price, p.rate, p.product_keyword, p.emotion_keyword,
+           lc.low_category_name, mc.mid_category_name, tc.top_category_name
+    FROM product_review pr
+    JOIN product p ON pr.isbn = p.isbn
+    LEFT JOIN low_category lc ON p.low_category = lc.low_category
+    LEFT JOIN middle_category mc ON lc.mid_category = mc.mid_category
+    LEFT JOIN top_category tc ON mc.top_category = tc.top_category
+    WHERE pr.delete_date IS NULL AND pr.product_review_id > %s
+    ORDER BY pr.product_review_id
+"""
+
+# 설명이 길어도 임베딩 토큰 한도를 넘지 않도록 자르는 길이
+MAX_DESCRIPTION_CHARS = 2000
+
+
+@dataclass
+class IndexDocument:
+    """벡터 컬렉션에 넣을 문서 한 건"""
+    id: str
+    text: str
+    metadata: Dict[str, Any]
+
+
+def content_hash(document: IndexDocument) -> str:
+    """본문 + 메타데이터의 SHA-256 (키 순서와 무관하게 같은 내용이면 같은 값)."""
+    payload = json.dumps([document.text, document.metadata], ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _clean_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Chroma가 받는 타입(str/int/float/bool)만 남기고 None/빈 값은 제거."""
+    cleaned = {}
+    for key, value in metadata.items():
+        if value is None or value == "":
+            continue
+        if isinstance(value, (str, bool, int, float)):
+            cleaned[key] = value
+        else:
+            # Decimal(rate) 등은 float로, 그 외는 문자열로
+            try:
+                cleaned[key] = float(value)
+            except (TypeError, ValueError):
+                cleaned[key] = str(value)
+    return cleaned
+
+
+def _book_metadata(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "isbn": str(row.get("isbn") or ""),
+        "product_name": row.get("product_name"),
+        "author": row.get("author"),
+        "publisher": row.get("publisher"),
+        "price": row.get("price"),
+        "rate": row.get("rate"),
+        "top_category_name": row.get("top_category_name"),
+        "mid_category_name": row.get("mid_category_name"),
+        "low_category_name": row.get("low_category_name"),
+        "product_keywords": row.get("product_keyword"),
+        "product_emotion_keywords": row.get("emotion_keyword"),
+    }
+
+
+def product_document(row: Dict[str, Any]) -> Optional[IndexDocument]:
+    """product 행 → 상품 문서 (제목/작가/카테고리/설명)."""
+    if not row.get("isbn"):
+        return None
+    description = " ".join(filter(None, [row.get("brief_description"), row.get("detail_description")]))
+    text = "\n".join(filter(None, [
+        f"제목: {row.get('product_name') or ''}",
+        f"작가: {row.get('author') or ''}",
+        f"분류: {' > '.join(filter(None, [row.get('top_category_name'), row.get('mid_category_name'), row.get('low_category_name')]))}",
+        description[:MAX_DESCRIPTION_CHARS],
+    ]))
+    metadata = _book_metadata(row)
+    metadata["type"] = "product"
+    return IndexDocument(id=f"product:{row['isbn']}", text=text, metadata=_clean_metadata(metadata))
+
+
+def review_document(row: Dict[str, Any]) -> Optional[IndexDocument]:
+    """product_review 행 → 리뷰 문서 (책 제목 + 리뷰 제목/내용)."""
+    if not row.get("product_review_id") or not (row.get("review_title") or row.get("review_content")):
+        return None
+    text = "\n".join(filter(None, [
+        f"제목: {row.get('product_name') or ''}",
+        row.get("review_title"),
+        (row.get("review_content") or "")[:MAX_DESCRIPTION_CHARS],
+    ]))
+    metadata = _book_metadata(row)
+    metadata.update({
+        "type": "review",
+        "review_title": row.get("review_title"),
+        "review_content": row.get("review_content"),
+        "review_emotion_keywords": row.get("review_emotion_keyword"),
+    })
+    return IndexDocument(id=f"review:{row['product_review_id']}", text=text, metadata=_clean_metadata(metadata))
@@ -0,0 +1,286 @@
+"""
+index_builder.py
+MySQL product / product_review 테이블로 bookstore_collection 벡터 색인을 만드는 오프라인 파이프라인
+
+- 서버 측(unbuffered) 커서로 행을 fetch_size개씩 스트리밍 (전체 테이블을 메모리에 올리지 않음)
+- 임베딩은 embed_batch_size개 단위로 묶어 최대 max_concurrency개를 동시에 요청, 429는 지수 백오프로 재시도
+- Chroma에는 청크 단위로 upsert하고, 청크마다 마지막 키를 체크포인트에 기록해 중단 지점부터 재개
+- 증분 동기화(--sync)는 문서별 내용 해시를 매니페스트와 비교해 새로 생기거나 바뀐 문서만 다시 임베딩하고,
+  MySQL에서 사라진 상품/리뷰 문서는 컬렉션에서 삭제
+
+실행 방법:
+    cd ai-service
+    python -m app.indexing.index_builder            # 체크포인트가 있으면 이어서
+    python -m app.indexing.index_builder --fresh    # 처음부터 다시
+    python -m app.indexing.index_builder --sync     # 바뀐 문서만 반영 (야간 카탈로그 갱신용)
+"""
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional
+
+from .documents import PRODUCT_QUERY, REVIEW_QUERY, IndexDocument, content_hash, product_document, review_document
+from .manifest import IndexManifest
+
+# (단계 이름, SELECT, 키 컬럼, 시작 키, 행 → 문서 변환 함수)
+PHASES = (
+    ("product", PRODUCT_QUERY, "isbn", "", product_document),
+    ("review", REVIEW_QUERY, "product_review_id", 0, review_document),
+)
+
+
+@dataclass
+class IndexBuildConfig:
+    """색인 생성 옵션"""
+    fetch_size: int = 1000          # 커서에서 한 번에 읽고 한 번에 upsert할 행 수
+    embed_batch_size: int = 256     # 임베딩 API 요청 한 번에 넣을 문서 수
+    max_concurrency: int = 4        # 동시에 보낼 임베딩 요청 수
+    max_retries: int = 6            # 429 재시도 횟수
+    max_backoff: float = 60.0       # 재시도 대기 상한(초)
+    checkpoint_path: Optional[str] = None
+    manifest_path: Optional[str] = None  # 문서별 내용 해시 매니페스트 (증분 동기화에 필요)
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """OpenAI 429(RateLimitError) 여부."""
+    return (
+        type(error).__name__ == "RateLimitError"
+        or getattr(error, "status_code", None) == 429
+        or getattr(getattr(error, "response", None), "status_code", None) == 429
+    )
+
+
+class IndexBuilder:
+    """MySQL → 임베딩 → Chroma 색인 파이프라인.
+
+    Args:
+        connect (Callable): MySQL 연결을 반환하는 함수 (mysql.connector.connect 등)
+        embeddings: embed_documents를 가진 임베딩 모델
+        collection: upsert / delete / get을 가진 Chroma 컬렉션
+        config (IndexBuildConfig): 색인 생성 옵션
+    """
+
+    def __init__(self, connect: Callable, embeddings, collection, config: Optional[IndexBuildConfig] = None,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.connect = connect
+        self.embeddings = embeddings
+        self.collection = collection
+        self.config = config or IndexBuildConfig()
+        self._sleep = sleep
+        self._manifest: Optional[IndexManifest] = None
+
+    def run(self, resume: bool = True) -> Dict[str, int]:
+        """전체 단계를 실행하고 단계별 upsert 문서 수를 반환."""
+        checkpoint = self._load_checkpoint() if resume else {}
+        stats = {}
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.config.max_concurrency) as executor:
+            for phase, query, key_column, start_key, to_document in PHASES:
+                if phase in checkpoint.get("completed", []):
+                    print(f"⏭️ {phase} 단계는 이미 완료됨 (체크포인트)")
+                    continue
+                last_key = checkpoint.get(phase, start_key)
+                if last_key != start_key:
+                    print(f"🔁 {phase} 단계 재개: {key_column} > {last_key}")
+
+                count = 0
+                for rows in self._stream(query, last_key):
+                    documents = [doc for doc in map(to_document, rows) if doc is not None]
+                    self._embed_and_upsert(documents, executor)
+                    self._record(documents)
+                    count += len(documents)
+                    checkpoint[phase] = rows[-1][key_column]
+                    self._save_checkpoint(checkpoint)
+                    print(f"  📦 {phase}: {count}건 색인 ({time.perf_counter() - started:.1f}s)")
+
+                checkpoint.setdefault("completed", []).append(phase)
+                self._save_checkpoint(checkpoint)
+                stats[phase] = count
+
+        # 모든 단계가 끝나면 다음 실행은 처음부터
+        self._clear_checkpoint()
+        manifest = self._open_manifest()
+        if manifest is not None:
+            manifest.bump_revision()
+        print(f"✅ 색인 생성 완료: {stats} ({time.perf_counter() - started:.1f}s)")
+        return stats
+
+    def sync(self) -> Dict[str, int]:
+        """MySQL 전체를 읽어 새로 생기거나 바뀐 문서만 upsert하고, 사라진 문서는 컬렉션에서 삭제.
+
+        행을 읽는 비용만 들고 임베딩은 바뀐 문서만 요청함. 삭제는 전체를 다 읽은 뒤에만 수행하므로
+        중간에 실패해도 문서가 잘못 지워지지 않고, 다시 실행하면 이미 반영된 문서는 건너뜀.
+
+        Returns:
+            dict: {"scanned": 읽은 문서 수, "upserted": 다시 임베딩한 문서 수, "deleted": 삭제한 문서 수}
+        """
+        manifest = self._open_manifest()
+        if manifest is None:
+            raise ValueError("증분 동기화에는 IndexBuildConfig.manifest_path가 필요합니다.")
+        if not len(manifest):
+            self._bootstrap_manifest(manifest)
+
+        stats = {"scanned": 0, "upserted": 0, "deleted": 0}
+        seen = set()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.config.max_concurrency) as executor:
+            for phase, query, _key_column, start_key, to_document in PHASES:
+                for rows in self._stream(query, start_key):
+                    documents = [doc for doc in map(to_document, rows) if doc is not None]
+                    hashes = {doc.id: content_hash(doc) for doc in documents}
+                    known = manifest.get_many(list(hashes))
+                    changed = [doc for doc in documents if known.get(doc.id) != hashes[doc.id]]
+                    self._embed_and_upsert(changed, executor)
+                    manifest.update({doc.id: hashes[doc.id] for doc in changed})
+                    seen.update(hashes)
+                    stats["scanned"] += len(documents)
+                    stats["upserted"] += len(changed)
+                print(f"  🔍 {phase}: 누적 {stats['scanned']}건 확인, {stats['upserted']}건 반영 "
+                      f"({time.perf_counter() - started:.1f}s)")
+
+        removed = [doc_id for doc_id in manifest.ids() if doc_id not in seen]
+        for i in range(0, len(removed), self.config.fetch_size):
+            chunk = removed[i:i + self.config.fetch_size]
+            self.collection.delete(ids=chunk)
+            manifest.remove(chunk)
+        stats["deleted"] = len(removed)
+
+        if stats["upserted"] or stats["deleted"]:
+            manifest.bump_revision()
+        print(f"✅ 증분 동기화 완료: {stats} ({time.perf_counter() - started:.1f}s)")
+        return stats
+
+    # ---------- 읽기 ----------
+
+    def _stream(self, query: str, start_key) -> Iterator[List[dict]]:
+        """서버 측 커서로 fetch_size개씩 행을 읽음."""
+        conn = self.connect()
+        try:
+            cursor = conn.cursor(dictionary=True, buffered=False)
+            # 임베딩 요청 중에는 커서를 읽지 않으므로 서버 쓰기 대기 시간을 늘려 둠
+            cursor.execute("SET SESSION net_write_timeout = 600")
+            cursor.execute(query, (start_key,))
+            try:
+                while True:
+                    rows = cursor.fetchmany(self.config.fetch_size)
+                    if not rows:
+                        break
+                    yield rows
+            finally:
+                cursor.close()
+        finally:
+            conn.close()
+
+    # ---------- 임베딩 / 저장 ----------
+
+    def _embed_and_upsert(self, documents: List[IndexDocument], executor: ThreadPoolExecutor):
+        if not documents:
+            return
+        size = self.config.embed_batch_size
+        batches = [documents[i:i + size] for i in range(0, len(documents), size)]
+        vectors = []
+        for batch_vectors in executor.map(self._embed_with_retry, [[d.text for d in b] for b in batches]):
+            vectors.extend(batch_vectors)
+        self.collection.upsert(
+            ids=[d.id for d in documents],
+            embeddings=vectors,
+            documents=[d.text for d in documents],
+            metadatas=[d.metadata for d in documents],
+        )
+
+    def _embed_with_retry(self, texts: List[str]) -> List[List[float]]:
+        for attempt in range(self.config.max_retries + 1):
+            try:
+                return self.embeddings.embed_documents(texts)
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt == self.config.max_retries:
+                    raise
+                delay = min(self.config.max_backoff, 2 ** attempt) + random.uniform(0, 1)
+                print(f"  ⏳ 임베딩 요청 제한(429) - {delay:.1f}초 후 재시도 ({attempt + 1}/{self.config.max_retries})")
+                self._sleep(delay)
+
+    # ---------- 매니페스트 ----------
+
+    def _open_manifest(self) -> Optional[IndexManifest]:
+        if self._manifest is None and self.config.manifest_path:
+            self._manifest = IndexManifest(self.config.manifest_path)
+        return self._manifest
+
+    def _record(self, documents: List[IndexDocument]):
+        manifest = self._open_manifest()
+        if manifest is not None:
+            manifest.update({doc.id: content_hash(doc) for doc in documents})
+
+    def _bootstrap_manifest(self, manifest: IndexManifest):
+        """매니페스트 없이 만들어진 컬렉션이면 저장된 본문/메타데이터로 해시를 채움 (임베딩 없이)."""
+        offset, size = 0, self.config.fetch_size
+        while True:
+            batch = self.collection.get(include=["documents", "metadatas"], limit=size, offset=offset)
+            ids = batch.get("ids") or []
+            manifest.update({
+                doc_id: content_hash(IndexDocument(id=doc_id, text=text or "", metadata=metadata or {}))
+                for doc_id, text, metadata in zip(ids, batch.get("documents") or [], batch.get("metadatas") or [])
+            })
+            if len(ids) < size:
+                break
+            offset += size
+        print(f"  🧾 기존 컬렉션으로 매니페스트 생성: {len(manifest)}건")
+
+    # ---------- 체크포인트 ----------
+
+    def _load_checkpoint(self) -> dict:
+        path = self.config.checkpoint_path
+        if not (path and os.path.exists(path)):
+            return {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[WARN] 체크포인트 읽기 실패, 처음부터 시작: {e}")
+            return {}
+
+    def _save_checkpoint(self, checkpoint: dict):
+        path = self.config.checkpoint_path
+        if not path:
+            return
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f, ensure_ascii=False, default=str)
+        os.replace(path + ".tmp", path)
+
+    def _clear_checkpoint(self):
+        path = self.config.checkpoint_path
+        if path and os.path.exists(path):
+            os.remove(path)
+
+
+def _connect_mysql():
+    import mysql.connector
+    from app.config.settings import MYSQL_HOST, MYSQL_PORT, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DATABASE
+    return mysql.connector.connect(
+        host=MYSQL_HOST, port=MYSQL_PORT, user=MYSQL_USER, password=MYSQL_PASSWORD,
+        database=MYSQL_DATABASE, charset="utf8mb4", use_unicode=True
+    )
+
+
+if __name__ == "__main__":
+    from app.config.llm import vectorstore, embedding_model, index_root, index_manifest_path
+
+    checkpoint_dir = index_root or os.getcwd()
+    builder = IndexBuilder(
+        _connect_mysql,
+        # 문서 임베딩은 한 번씩만 쓰이므로 질의 캐시를 거치지 않고 원래 모델로 요청
+        getattr(embedding_model, "embeddings", embedding_model),
+        vectorstore._collection,
+        IndexBuildConfig(
+            checkpoint_path=os.path.join(checkpoint_dir, "index_build_checkpoint.json"),
+            manifest_path=index_manifest_path or os.path.join(checkpoint_dir, "index_manifest.sqlite3"),
+        ),
+    )
+    if "--sync" in sys.argv:
+        builder.sync()
+    else:
+        builder.run(resume="--fresh" not in sys.argv)
@@ -0,0 +1,101 @@
+"""
+manifest.py
+벡터 컬렉션에 들어 있는 문서별 내용 해시를 기록하는 매니페스트 (sqlite)
+
+증분 동기화는 MySQL에서 만든 문서의 해시를 여기 기록된 값과 비교해 바뀐 문서만 다시 임베딩함.
+revision은 컬렉션 내용이 바뀔 때마다 1씩 올라가므로, 문서 수만으로는 알 수 없는
+"같은 수의 문서가 수정된" 변경도 검색 보조 색인이 알아챌 수 있음.
+"""
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+class IndexManifest:
+    """문서 id → 내용 해시 매니페스트.
+
+    Args:
+        path (str): sqlite 파일 경로
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS documents (id TEXT PRIMARY KEY, hash TEXT NOT NULL)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def get_many(self, ids: List[str]) -> Dict[str, str]:
+        """ids 중 매니페스트에 있는 문서의 해시."""
+        if not ids:
+            return {}
+        found = {}
+        with self._lock:
+            # sqlite 변수 개수 제한(999)을 넘지 않도록 나눠서 조회
+            for i in range(0, len(ids), 900):
+                chunk = ids[i:i + 900]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(self._conn.execute(
+                    f"SELECT id, hash FROM documents WHERE id IN ({placeholders})", chunk
+                ).fetchall())
+        return found
+
+    def ids(self) -> Iterator[str]:
+        """기록된 모든 문서 id."""
+        with self._lock:
+            rows = self._conn.execute("SELECT id FROM documents").fetchall()
+        return (row[0] for row in rows)
+
+    def update(self, hashes: Dict[str, str]):
+        if not hashes:
+            return
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO documents (id, hash) VALUES (?, ?)", hashes.items())
+            self._conn.commit()
+
+    def remove(self, ids: Iterable[str]):
+        ids = list(ids)
+        if not ids:
+            return
+        with self._lock:
+            self._conn.executemany("DELETE FROM documents WHERE id = ?", [(doc_id,) for doc_id in ids])
+            self._conn.commit()
+
+    def revision(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'revision'").fetchone()
+        return int(row[0]) if row else 0
+
+    def bump_revision(self) -> int:
+        """컬렉션 내용이 바뀌었음을 기록하고 새 revision을 반환."""
+        revision = self.revision() + 1
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('revision', ?)", (str(revision),))
+            self._conn.commit()
+        return revision
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def read_revision(path: Optional[str]) -> int:
+    """매니페스트 파일의 revision만 읽음 (파일이 없거나 읽을 수 없으면 0)."""
+    if not (path and os.path.exists(path)):
+        return 0
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'revision'").fetchone()
+        finally:
+            conn.close()
+        return int(row[0]) if row else 0
+    except (sqlite3.Error, ValueError):
+        return 0
@@ -1,11 +1,13 @@
-from agents.recommend_agent import run_recommend_agent
-from agents.wiki_search_agent import WikiSearchAgent
+from app.agents.recommend_agent import run_recommend_agent, arun_recommend_agent
+from app.agents.wiki_search_agent import get_wiki_agent
 
-def route_intent(intent: str, query_data: dict, current_agent: str = None, session: dict = None, agent_instances: dict = None) -> str:
-    """현재 세션의 에이전트 정보를 고려하여 라우팅"""
+def route_intent(intent: str, query_data: dict, current_agent: str = None, session: dict = None,
+                 wiki_intent: dict = None) -> str:
+    """현재 세션의 에이전트 정보를 고려하여 라우팅
+
+    wiki_intent: 통합 분석 체인이 구한 위키 세부 의도 (없으면 위키 체인이 직접 분석)
+    """
     
-    if agent_instances is None:
-        agent_instances = {}
     if intent == "recommendation":
         print(f"라우팅: recommendation 에이전트 호출 (현재 에이전트: {current_agent})")
 
@@ -16,30 +18,61 @@ def route_intent(intent: str, query_data: dict, current_agent: str = None, sessi
         return run_recommend_agent(query_data)
 
     elif intent == "info":
-        print(f"라우팅: wiki 에이전트 호출 (현재 에이전트: {current_agent})")
-        
-        # 위키 에이전트 인스턴스 가져오기 또는 생성
-        if 'wiki' not in agent_instances:
-            print("새로운 위키 에이전트 인스턴스 생성")
-            agent_instances['wiki'] = WikiSearchAgent()
-        wiki_agent = agent_instances['wiki']
-
-        # 세션 컨텍스트 준비
-        context = {}
-        if session:
-            # 중요: 에이전트의 내부 컨텍스트를 직접 수정하지 않도록 복사본을 사용
-            context = wiki_agent.context.copy()
-            context['conversation_history'] = session.get("conversation_history", [])
-
-        # 원문 질문 (user_input)을 그대로 사용
-        search_query = (
-                query_data.get("user_input")
-                or query_data.get("original_input")
-                or "정보를 입력해주세요."
+        wiki_agent, search_query, context = _prepare_wiki_call(query_data, current_agent, session)
+
+        # 통합 분석 체인이 위키 세부 의도까지 구했다면 전달하여 체인 내부 LLM 호출 생략
+        result = wiki_agent.process_with_context(
+            search_query, context, precomputed_intent=wiki_intent
         )
-        print(f"[DEBUG] 원본 쿼리 전달: {search_query}")
-            
-        result = wiki_agent.process_with_context(search_query, context)
         return result
     else:
         return "죄송합니다. 해당 요청은 아직 지원하지 않습니다."
+
+
+def _prepare_wiki_call(query_data: dict, current_agent: str, session: dict):
+    """공유 위키 에이전트와 호출 인자(search_query, context) 준비"""
+    print(f"라우팅: wiki 에이전트 호출 (현재 에이전트: {current_agent})")
+    
+    # 모든 세션이 공유하는 위키 에이전트 (대화 상태는 context로 전달)
+    wiki_agent = get_wiki_agent()
+
+    # 세션 컨텍스트 준비
+    context = {}
+    if session:
+        # 중요: 세션에 저장된 위키 컨텍스트를 직접 수정하지 않도록 복사본을 사용
+        context = dict(session.get("wiki_context") or {})
+        context['conversation_history'] = session.get("conversation_history", [])
+
+    # 원문 질문 (user_input)을 그대로 사용
+    search_query = (
+            query_data.get("user_input")
+            or query_data.get("original_input")
+            or "정보를 입력해주세요."
+    )
+    print(f"[DEBUG] 원본 쿼리 전달: {search_query}")
+    return wiki_agent, search_query, context
+
+
+async def aroute_intent(intent: str, query_data: dict, current_agent: str = None, session: dict = None, on_token=None,
+                        wiki_intent: dict = None) -> str:
+    """route_intent의 비동기 버전 (FastAPI 이벤트 루프에서 사용)
+
+    on_token: 응답 토큰을 받을 콜백 (스트리밍 엔드포인트용, 작업 스레드에서도 호출될 수 있음)
+    """
+    
+    if intent == "recommendation":
+        print(f"라우팅: recommendation 에이전트 호출 (현재 에이전트: {current_agent})")
+
+        # ✅ 세션 상태에 recommend로 설정
+        if session is not None:
+            session["current_agent"] = "recommend"
+
+        return await arun_recommend_agent(query_data, on_token=on_token)
+
+    elif intent == "info":
+        wiki_agent, search_query, context = _prepare_wiki_call(query_data, current_agent, session)
+        return await wiki_agent.aprocess_with_context(
+            search_query, context, precomputed_intent=wiki_intent, on_token=on_token
+        )
+    else:
+        return "죄송합니다. 해당 요청은 아직 지원하지 않습니다."
@@ -4,17 +4,23 @@ main_agent.py
 main_agent 메인 에이전트-쿼리 라우팅
 """
 
-from main_agent.intent_router import route_intent
-from chains import query_analysis_chain, intent_classify_chain
-from chains.clarification_chain import get_clarification_chain
-from utils.clarification_checker import needs_clarification
-from prompts.clarification_prompt import get_clarification_prompt
-from config.llm import clarification_llm
+from app.main_agent.intent_router import route_intent, aroute_intent
+from app.chains import query_analysis_chain, intent_classify_chain, pre_routing_chain, turn_analysis_chain
+from app.chains.clarification_chain import get_clarification_chain
+from app.utils.clarification_checker import needs_clarification
+from app.prompts.clarification_prompt import get_clarification_prompt
+from app.config import llm
+from app.config.settings import PRE_ROUTING_MODE, PRE_ROUTING_TIMEOUT, USE_FUSED_ANALYSIS
 from dotenv import load_dotenv
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+import time
 
 load_dotenv()
 
+# 사전 라우팅이 제한 시간을 넘겼을 때 사용자에게 보낼 안내
+PRE_ROUTING_TIMEOUT_MESSAGE = "질문을 분석하는 데 시간이 너무 오래 걸렸어요. 잠시 후 다시 한 번 말씀해 주시겠어요?"
+
 # 세션 관리 헬퍼 함수들
 def init_session(session: Dict[str, Any]):
     """세션 초기화"""
@@ -22,6 +28,8 @@ def init_session(session: Dict[str, Any]):
         session["conversation_history"] = []
     if "current_agent" not in session:
         session["current_agent"] = None
+    if "wiki_context" not in session:
+        session["wiki_context"] = {}
 
 def add_message_to_session(session: Dict[str, Any], role: str, content: str):
     """대화 히스토리에 메시지 추가"""
@@ -49,8 +57,61 @@ def should_switch_agent(session: Dict[str, Any], current_intent: str) -> bool:
     # 타겟 에이전트가 현재 에이전트와 다르면 전환
     return target_agent != current_agent
 
-# FastAPI 연결용
-def run_main_agent(user_input: str, session: Dict[str, Any], agent_instances: Dict[str, Any]):
+def _openai_usage():
+    """토큰 사용량 집계 콜백 (langchain_community는 import 비용이 커서 처음 쓸 때 불러옴)"""
+    from langchain_community.callbacks import get_openai_callback
+    return get_openai_callback()
+
+async def _apre_route(inputs: Dict[str, Any]) -> Tuple[Dict[str, Any], str, Optional[Dict[str, Any]]]:
+    """설정된 방식으로 질의 분석과 의도 분류를 실행하여 (query, intent, wiki_intent)를 반환"""
+    if USE_FUSED_ANALYSIS:
+        result = await turn_analysis_chain.ainvoke(inputs)
+        return result["query"], result["intent"], result.get("wiki_intent")
+    if PRE_ROUTING_MODE == "sequential":
+        query = await query_analysis_chain.ainvoke(inputs)
+        intent = await intent_classify_chain.ainvoke(inputs)
+        return query, intent, None
+    result = await pre_routing_chain.ainvoke(inputs)
+    return result["query"], result["intent"], None
+
+async def aanalyze_turn(user_input: str, conversation_context: str = "") -> Tuple[Dict[str, Any], str, Optional[Dict[str, Any]]]:
+    """질의 분석과 의도 분류를 수행하여 (query, intent, wiki_intent)를 반환.
+
+    - USE_FUSED_ANALYSIS: 통합 체인 한 번의 호출로 처리 (위키 세부 의도까지 구함, 그 밖의 방식은 wiki_intent=None)
+    - PRE_ROUTING_MODE=parallel: 두 체인을 동시에 실행 (지연 시간 = 느린 쪽 호출)
+    - PRE_ROUTING_MODE=sequential: 기존처럼 순차 실행
+
+    PRE_ROUTING_TIMEOUT 안에 끝나지 않으면 진행 중인 요청을 취소하고 TimeoutError 발생.
+    """
+    inputs = _pre_routing_inputs(user_input, conversation_context)
+    mode = "fused" if USE_FUSED_ANALYSIS else PRE_ROUTING_MODE
+    started = time.perf_counter()
+
+    with _openai_usage() as usage:
+        try:
+            query, intent, wiki_intent = await asyncio.wait_for(_apre_route(inputs), PRE_ROUTING_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"질의 분석이 {PRE_ROUTING_TIMEOUT:g}초 안에 끝나지 않았습니다.")
+
+    print(f"[TIMING] pre-routing({mode}): {time.perf_counter() - started:.3f}s, tokens={usage.total_tokens}")
+    return query, intent, wiki_intent
+
+def analyze_turn(user_input: str, conversation_context: str = "") -> Tuple[Dict[str, Any], str, Optional[Dict[str, Any]]]:
+    """aanalyze_turn의 동기 버전.
+
+    별도 이벤트 루프에서 실행하므로 제한 시간이 지나면 작업 스레드가 남지 않고 요청까지 취소됨.
+    (이미 실행 중인 이벤트 루프 안에서는 aanalyze_turn을 사용)
+    """
+    return asyncio.run(aanalyze_turn(user_input, conversation_context))
+
+def _pre_routing_inputs(user_input: str, conversation_context: str) -> Dict[str, Any]:
+    return {
+        "user_input": user_input,
+        "conversation_history": conversation_context if conversation_context else "이전 대화가 없습니다."
+    }
+
+def _begin_turn(user_input: str, session: Dict[str, Any]) -> str:
+    """세션에 사용자 메시지를 기록하고 최근 대화 컨텍스트 문자열을 반환"""
     # 세션 초기화
     init_session(session)
     
@@ -63,17 +124,9 @@ def run_main_agent(user_input: str, session: Dict[str, Any], agent_instances: Di
         recent_history = session["conversation_history"][-6:]
         for msg in recent_history:
             conversation_context += f"{msg['role']}: {msg['content']}\n"
-    
-    # 쿼리 및 의도 분석
-    query = query_analysis_chain.invoke({
-        "user_input": user_input,
-        "conversation_history": conversation_context if conversation_context else "이전 대화가 없습니다."
-    })
-    intent = intent_classify_chain.invoke({
-        "user_input": user_input,
-        "conversation_history": conversation_context if conversation_context else "이전 대화가 없습니다."
-    })
+    return conversation_context
 
+def _log_turn(user_input: str, conversation_context: str, query: Dict[str, Any], intent: str, session: Dict[str, Any]):
     print("user_input", user_input)
     print("conversation_context:", conversation_context)
     print("query", query)
@@ -82,15 +135,71 @@ def run_main_agent(user_input: str, session: Dict[str, Any], agent_instances: Di
     print("conversation_history:", session.get("conversation_history", []))
     print("current_agent:", session.get("current_agent"))
 
+def _invalid_intent_result(session: Dict[str, Any], query: Dict[str, Any]) -> Dict[str, Any]:
+    clarification_msg = "도서 추천을 원하시나요, 아니면 작가 정보를 원하시나요?"
+    add_message_to_session(session, "assistant", clarification_msg)
+    return {
+        "clarification_needed": True, "message": clarification_msg,
+        "query": query, "intent": "unclear",
+    }
+
+def _timeout_result(session: Dict[str, Any], error: TimeoutError) -> Dict[str, Any]:
+    """사전 라우팅 제한 시간 초과 시 오류 대신 다시 질문해 달라는 안내로 응답"""
+    print(f"[TIMEOUT] {error}")
+    add_message_to_session(session, "assistant", PRE_ROUTING_TIMEOUT_MESSAGE)
+    return {
+        "clarification_needed": True, "message": PRE_ROUTING_TIMEOUT_MESSAGE,
+        "query": {}, "intent": "timeout",
+    }
+
+def _clarification_result(session: Dict[str, Any], message: str, query: Dict[str, Any], intent: str) -> Dict[str, Any]:
+    add_message_to_session(session, "assistant", message)
+    return {
+        "clarification_needed": True, "message": message,
+        "query": query, "intent": intent,
+    }
+
+def _switch_agent(session: Dict[str, Any], intent: str):
+    # 새 에이전트로 전환
+    target_agent = {"info": "wiki", "recommendation": "recommend"}[intent]
+    session["current_agent"] = target_agent
+    print(f"에이전트 전환: {target_agent}")
+
+def _finish_turn(session: Dict[str, Any], response_result, query: Dict[str, Any], intent: str) -> Dict[str, Any]:
+    """에이전트 응답으로 세션을 갱신하고 API 응답 형태로 변환"""
+    # 위키 컨텍스트 업데이트 (세션 저장소에 함께 저장됨)
+    if isinstance(response_result, dict) and "update_context" in response_result:
+        wiki_updates = {k: v for k, v in response_result["update_context"].items() if k != "conversation_history"}
+        session.setdefault("wiki_context", {}).update(wiki_updates)
+
+    # 응답 메시지 추출
+    response_message = response_result.get("message", "오류가 발생했습니다.") if isinstance(response_result, dict) else response_result
+
+    # 봇 응답을 세션 히스토리에 추가
+    add_message_to_session(session, "assistant", response_message)
+    
+    return {
+        "clarification_needed": isinstance(response_result, dict) and response_result.get("action") == "ask_clarification",
+        "response": response_message,
+        "query": query,
+        "intent": intent,
+    }
+
+# FastAPI 연결용
+def run_main_agent(user_input: str, session: Dict[str, Any]):
+    conversation_context = _begin_turn(user_input, session)
+    
+    # 쿼리 및 의도 분석
+    try:
+        query, intent, wiki_intent = analyze_turn(user_input, conversation_context)
+    except TimeoutError as e:
+        return _timeout_result(session, e)
+    _log_turn(user_input, conversation_context, query, intent, session)
+
     # intent 유효성 검사
     valid_intents = ["info", "recommendation"]
     if intent not in valid_intents:
-        clarification_msg = "도서 추천을 원하시나요, 아니면 작가 정보를 원하시나요?"
-        add_message_to_session(session, "assistant", clarification_msg)
-        return {
-            "clarification_needed": True, "message": clarification_msg,
-            "query": query, "intent": "unclear",
-        }
+        return _invalid_intent_result(session, query)
 
     # 에이전트 전환 여부 판단
     if should_switch_agent(session, intent):
@@ -98,39 +207,49 @@ def run_main_agent(user_input: str, session: Dict[str, Any], agent_instances: Di
         # 새 에이전트이므로 정보가 부족한지 확인
         if needs_clarification(intent, query):
             prompt = get_clarification_prompt(intent).format(**query)
-            llm_response = clarification_llm.invoke(prompt)
-            add_message_to_session(session, "assistant", llm_response.content)
-            return {
-                "clarification_needed": True, "message": llm_response.content,
-                "query": query, "intent": intent,
-            }
-        
-        # 새 에이전트로 전환
-        target_agent = {"info": "wiki", "recommendation": "recommend"}[intent]
-        session["current_agent"] = target_agent
-        print(f"에이전트 전환: {target_agent}")
+            llm_response = llm.clarification_llm.invoke(prompt)
+            return _clarification_result(session, llm_response.content, query, intent)
+        _switch_agent(session, intent)
     
     # 에이전트에게 라우팅
     current_agent_name = session.get("current_agent")
     query["user_input"] = user_input
-    response_result = route_intent(intent, query, current_agent_name, session, agent_instances)
+    response_result = route_intent(intent, query, current_agent_name, session, wiki_intent=wiki_intent)
+    return _finish_turn(session, response_result, query, intent)
+
+# FastAPI 비동기 연결용 (이벤트 루프를 막지 않도록 모든 I/O를 await)
+async def arun_main_agent(user_input: str, session: Dict[str, Any], on_token=None):
+    conversation_context = _begin_turn(user_input, session)
     
-    # 컨텍스트 업데이트
-    if isinstance(response_result, dict) and "update_context" in response_result:
-        session.update(response_result["update_context"])
+    # 쿼리 및 의도 분석
+    try:
+        query, intent, wiki_intent = await aanalyze_turn(user_input, conversation_context)
+    except TimeoutError as e:
+        return _timeout_result(session, e)
+    _log_turn(user_input, conversation_context, query, intent, session)
 
-    # 응답 메시지 추출
-    response_message = response_result.get("message", "오류가 발생했습니다.") if isinstance(response_result, dict) else response_result
+    # intent 유효성 검사
+    valid_intents = ["info", "recommendation"]
+    if intent not in valid_intents:
+        return _invalid_intent_result(session, query)
 
-    # 봇 응답을 세션 히스토리에 추가
-    add_message_to_session(session, "assistant", response_message)
+    # 에이전트 전환 여부 판단
+    if should_switch_agent(session, intent):
+        print(f"[DEBUG] 에이전트 전환 필요. Clarification 확인.")
+        # 새 에이전트이므로 정보가 부족한지 확인
+        if needs_clarification(intent, query):
+            prompt = get_clarification_prompt(intent).format(**query)
+            llm_response = await llm.clarification_llm.ainvoke(prompt)
+            return _clarification_result(session, llm_response.content, query, intent)
+        _switch_agent(session, intent)
     
-    return {
-        "clarification_needed": isinstance(response_result, dict) and response_result.get("action") == "ask_clarification",
-        "response": response_message,
-        "query": query,
-        "intent": intent,
-    }
+    # 에이전트에게 라우팅
+    current_agent_name = session.get("current_agent")
+    query["user_input"] = user_input
+    response_result = await aroute_intent(
+        intent, query, current_agent_name, session, on_token=on_token, wiki_intent=wiki_intent
+    )
+    return _finish_turn(session, response_result, query, intent)
 
 
 #콘솔 테스트용
@@ -138,12 +257,9 @@ def run_pipeline():
     while True:
         user_input = input("💬 사용자 질문: ")
 
-        # 1. 질의 분석
-        query = query_analysis_chain.invoke({"user_input": user_input})
+        # 1~2. 질의 분석 + 화행 분류
+        query, intent, wiki_intent = analyze_turn(user_input)
         print(f"📌 분석 결과: {query}")
-
-        # 2. 화행 분류
-        intent = intent_classify_chain.invoke({"user_input": user_input})
         print(f"📌 분류된 의도: {intent}")
 
         # 3. 필수 정보 누락 시 clarification loop
@@ -153,7 +269,7 @@ def run_pipeline():
             prompt_string = prompt.format(**query)
 
             # [2] LLM 실행 → 자연어 메시지
-            llm_response = clarification_llm.invoke(prompt_string)
+            llm_response = llm.clarification_llm.invoke(prompt_string)
             print(f"❓ 추가 질문: {llm_response.content}")  # 여긴 자연어 출력
 
             user_input = input("↩️ 사용자 응답: ")
@@ -162,7 +278,7 @@ def run_pipeline():
 
         # 4. 최종 intent 처리
         query["user_input"] = user_input
-        response = route_intent(intent, query)
+        response = route_intent(intent, query, wiki_intent=wiki_intent)
         print(f"\n🤖 챗봇 응답:\n{response}")
         break
 
@@ -8,6 +8,7 @@
 
 from .wiki_query_intent import WikiQueryIntent, IntentType, InfoType
 from .wiki_search_result import WikiSearchResult
+from .wiki_fact_sheet import WikiFactSheet
 from .wiki_agent_response import WikiAgentResponse, ActionType
 
 __all__ = [
@@ -15,6 +16,7 @@ __all__ = [
     'IntentType',
     'InfoType',
     'WikiSearchResult',
+    'WikiFactSheet',
     'WikiAgentResponse',
     'ActionType'
 ]
\ No newline at end of file
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+위키피디아 검색 에이전트 - 인물 정보 카드 모델
+위키 페이지 하나에서 뽑은 출생/사망/학력/작품/수상/가족 정보를 한 번에 담는 데이터 모델
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
+
+
+def _empty_family() -> Dict[str, Any]:
+    return {'father': None, 'mother': None, 'siblings': [], 'family': []}
+
+
+@dataclass
+class WikiFactSheet:
+    """위키 페이지 하나의 인물 정보 카드
+
+    페이지마다 한 번만 추출하고 컨텍스트에 last_search_result와 함께 저장해 두므로,
+    같은 작가에 대한 후속 질문은 본문을 다시 훑지 않고 필드만 읽으면 됨.
+    """
+    title: Optional[str] = None
+    url: Optional[str] = None
+    birth: str = ""
+    death: str = ""
+    university: str = ""
+    school: str = ""
+    works: List[str] = field(default_factory=list)
+    awards: List[str] = field(default_factory=list)
+    father: str = ""
+    mother: str = ""
+    spouse: str = ""
+    family: Dict[str, Any] = field(default_factory=_empty_family)  # find_enhanced_family_info 형식
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환 (세션 컨텍스트에 JSON으로 저장)"""
+        return {
+            'title': self.title,
+            'url': self.url,
+            'birth': self.birth,
+            'death': self.death,
+            'university': self.university,
+            'school': self.school,
+            'works': list(self.works),
+            'awards': list(self.awards),
+            'father': self.father,
+            'mother': self.mother,
+            'spouse': self.spouse,
+            'family': self.family
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'WikiFactSheet':
+        """딕셔너리에서 객체 생성"""
+        return cls(
+            title=data.get('title'),
+            url=data.get('url'),
+            birth=data.get('birth') or "",
+            death=data.get('death') or "",
+            university=data.get('university') or "",
+            school=data.get('school') or "",
+            works=list(data.get('works') or []),
+            awards=list(data.get('awards') or []),
+            father=data.get('father') or "",
+            mother=data.get('mother') or "",
+            spouse=data.get('spouse') or "",
+            family=data.get('family') or _empty_family()
+        )
+
+    def is_for(self, search_result: Dict[str, Any]) -> bool:
+        """이 카드가 주어진 검색 결과(페이지)에서 만든 것인지 확인"""
+        return (self.title == search_result.get('title')
+                and self.url == search_result.get('url'))
@@ -19,6 +19,7 @@ class WikiSearchResult:
     content: Optional[str] = None
     url: Optional[str] = None
     error: Optional[str] = None
+    sections: Optional[Dict[str, str]] = None  # 섹션 이름 → 본문 (섹션 단위로 받은 경우만)
 
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환 (기존 코드 호환성을 위해)"""
@@ -31,6 +32,8 @@ class WikiSearchResult:
                 'content': self.content,
                 'url': self.url
             })
+            if self.sections is not None:
+                result['sections'] = self.sections
         else:
             result['error'] = self.error
             
@@ -45,18 +48,21 @@ class WikiSearchResult:
             summary=data.get('summary'),
             content=data.get('content'),
             url=data.get('url'),
-            error=data.get('error')
+            error=data.get('error'),
+            sections=data.get('sections')
         )
 
     @classmethod
-    def create_success(cls, title: str, summary: str, content: str, url: str) -> 'WikiSearchResult':
+    def create_success(cls, title: str, summary: str, content: str, url: str,
+                       sections: Optional[Dict[str, str]] = None) -> 'WikiSearchResult':
         """성공 결과 생성"""
         return cls(
             success=True,
             title=title,
             summary=summary,
             content=content,
-            url=url
+            url=url,
+            sections=sections
         )
 
     @classmethod
@@ -1,7 +1,3 @@
-from .query_analysis_prompt import query_analysis_prompt
-from .intent_classify_prompt import intent_classify_prompt
-
-__all__ = [
-    "query_analysis_prompt",
-    "intent_classify_prompt",
-]
+# 프롬프트는 모듈 단위로 import (예: from app.prompts.query_analysis_prompt import query_analysis_prompt)
+# PromptTemplate을 만드는 모듈은 langchain_core를 불러와 import 비용이 크므로, 패키지 import만으로
+# (wiki_fact_prompt처럼 langchain_core가 필요 없는 모듈을 가져올 때) 같이 불러오지 않도록 여기서 re-export하지 않음
@@ -0,0 +1,92 @@
+"""
+turn_analysis_prompt.py
+turn_analysis_prompt 질의 분석 + 의도 분류 + 위키 세부 의도를 한 번에 수행하는 통합 프롬프트
+"""
+
+from langchain_core.prompts import PromptTemplate
+
+# 응답 JSON 스키마 (OpenAI structured output, strict 모드)
+_nullable_string = {"type": ["string", "null"]}
+
+turn_analysis_schema = {
+    "name": "turn_analysis",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "additionalProperties": False,
+        "required": [
+            "emotion", "genre", "author", "title", "publisher", "order_id",
+            "keywords", "intent", "wiki_intent"
+        ],
+        "properties": {
+            "emotion": _nullable_string,
+            "genre": _nullable_string,
+            "author": _nullable_string,
+            "title": _nullable_string,
+            "publisher": _nullable_string,
+            "order_id": _nullable_string,
+            "keywords": {"type": "array", "items": {"type": "string"}},
+            "intent": {
+                "type": "string",
+                "enum": ["recommendation", "info", "order_check", "stock_check", "clarification"]
+            },
+            "wiki_intent": {
+                "type": ["object", "null"],
+                "additionalProperties": False,
+                "required": ["intent_type", "extracted_keywords", "specific_info_request"],
+                "properties": {
+                    "intent_type": {
+                        "type": "string",
+                        "enum": ["author_search", "context_question", "book_to_author"]
+                    },
+                    "extracted_keywords": {"type": "array", "items": {"type": "string"}},
+                    "specific_info_request": {
+                        "type": ["string", "null"],
+                        "enum": ["author", "university", "birth", "death", "works", "school", "awards", None]
+                    }
+                }
+            }
+        }
+    }
+}
+
+# 프롬프트 템플릿 정의
+turn_analysis_prompt = PromptTemplate(
+    input_variables=["user_input", "conversation_history"],
+    template="""당신은 감정 기반 도서 추천 서비스의 질의 분석 AI입니다.
+**이전 대화 맥락을 반드시 참고하여** 현재 사용자 입력을 한 번에 분석하세요.
+
+[1. 정보 추출] 해당 정보가 없으면 null
+- emotion(감정): 예) 우울, 행복, 사랑
+- genre(장르): 예) 에세이, 판타지, 스릴러
+- author(작가명): 예) 김영하, 김초엽, 천선란
+- title(도서명): 예) 천 개의 파랑, 채식주의자
+- publisher(출판사): 예) 허블, 창비
+- order_id(주문 번호): 실제 주문 번호처럼 보이는 숫자 또는 코드만
+- keywords(중요 단어): 사용자 요구의 중심이 되는 핵심 단어들
+- '주문 조회', '책 추천' 등 일반적인 행위는 order_id나 title로 추출하지 마세요.
+
+[2. 의도(intent)]
+- recommendation: 책 추천 요청 ("책 추천해줘", "뭐 읽지?" 처럼 모호해도 추천 의도가 명확하면 포함)
+- info: 특정 도서, 작가, 출판사에 대한 사실적 정보 요청
+- order_check: 주문 상태나 내역 확인
+- stock_check: 특정 도서의 재고 확인
+- clarification: 인사, 감탄사, 농담 등 의도가 불분명한 입력
+- 이전 대화가 info 또는 recommendation이었고 현재 입력이 같은 주제의 후속 질문이면 이전 의도를 유지하세요.
+
+[3. 위키 세부 의도(wiki_intent)] intent가 info일 때만 채우고, 아니면 null
+- intent_type:
+  - book_to_author: 책 제목만 있는 입력(예: "개미", "토지") 또는 '작가', '저자', '누가 썼어'로 저자를 묻는 입력
+  - author_search: 작가명이 직접 언급된 모든 질문 (예: "한강 부모님 이름", "무라카미 하루키의 대표작은?")
+  - context_question: 새로운 고유명사 없이 이전 대화에 의존하는 질문 (예: "나이는?", "대학은 어디야?")
+- extracted_keywords: 작가명 또는 책 제목 (가장 중요한 것을 첫 번째로)
+- specific_info_request: author, university, birth, death, works, school, awards 중 하나 또는 null
+
+이전 대화:
+{conversation_history}
+
+현재 사용자 입력: {user_input}
+
+JSON으로만 응답하세요.
+"""
+)
@@ -0,0 +1,51 @@
+"""
+wiki_fact_prompt.py
+위키 페이지 하나에서 인물 정보(출생/사망/학력/작품/수상/부모)를 한 번에 뽑는 추출 프롬프트와 응답 JSON 스키마
+"""
+
+# 응답 JSON 스키마 (OpenAI structured output, strict 모드)
+_nullable_string = {"type": ["string", "null"]}
+_string_list = {"type": "array", "items": {"type": "string"}}
+
+wiki_fact_fields = (
+    "birth_date", "birth_place", "death_date", "university", "school",
+    "works", "awards", "father", "mother"
+)
+
+wiki_fact_schema = {
+    "name": "wiki_fact_sheet",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "additionalProperties": False,
+        "required": list(wiki_fact_fields),
+        "properties": {
+            "birth_date": _nullable_string,
+            "birth_place": _nullable_string,
+            "death_date": _nullable_string,
+            "university": _nullable_string,
+            "school": _nullable_string,
+            "works": _string_list,
+            "awards": _string_list,
+            "father": _nullable_string,
+            "mother": _nullable_string
+        }
+    }
+}
+
+wiki_fact_system_prompt = """주어진 텍스트에서 인물의 정보를 한 번에 추출하세요.
+텍스트에 없는 정보는 null(목록은 [])로 두고, 추측하지 마세요.
+
+추출 규칙:
+- birth_date/death_date: 정확한 날짜 형식 (예: 1970년 11월 27일), birth_place: 출생 장소
+- university: 졸업, 진학, 입학한 대학교만 (교수로 재직하는 대학은 제외), 정확한 대학교 이름 사용
+- school: 졸업, 진학, 입학한 고등학교(없으면 중학교/초등학교)
+- works: 소설, 시집, 에세이 등 주요 작품 최대 6개, 《》 따옴표 없이 작품명만, 대표작 우선
+- awards: 수상 내역 최대 7개, 연도 정보가 있으면 포함 (예: "2016년 맨부커 인터내셔널상")
+
+부모 추출 규칙 (father/mother):
+- "아버지", "어머니", "부친", "모친" 등 성별이 명시된 표현이 있을 때만 추출
+- "한승원의 딸", "김OO의 아들"처럼 성별을 알 수 없는 관계는 추출하지 않음
+- 형제자매(동생, 형, 누나, 언니, 오빠)와 애인은 부모가 아님
+  예) "요시모토 다카아키의 차녀이자 만화가인 하루노 요이코의 동생이다" → 하루노 요이코는 어머니가 아님
+- 정확한 이름만 추출하고, 직업이나 설명은 제외"""
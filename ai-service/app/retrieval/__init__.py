@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+"""
+도서 추천 검색 패키지
+벡터스토어 검색 전략(retriever)을 한 곳에서 관리
+"""
+
+from .retriever_registry import RetrieverRegistry, RetrievalStrategy
+from .author_index import AuthorIndex
+from .hybrid_search import HybridSearcher
+from .emotion_index import EmotionIndex
+
+__all__ = [
+    "RetrieverRegistry",
+    "RetrievalStrategy",
+    "AuthorIndex",
+    "HybridSearcher",
+    "EmotionIndex"
+]
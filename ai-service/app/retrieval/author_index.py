@@ -0,0 +1,159 @@
+"""
+author_index.py
+컬렉션 메타데이터로 만든 작가 → 도서 역색인
+
+작가 추천은 정확 일치 조회이므로 벡터 검색(임베딩 호출 + fetch_k 유사도 계산) 대신 이 색인에서 바로 찾음.
+작가 이름은 공백, "지음"/"옮김"/"(지은이)" 같은 역할 표기, 로마자 표기(Han Kang)를 정규화해 비교.
+"""
+import re
+import time
+from typing import Callable, Dict, Hashable, List, Optional
+
+from langchain_core.documents import Document
+
+from .lexical_index import book_key, read_collection
+from .retriever_registry import any_of_filter
+from .versioned_index import VersionedIndex
+
+# 작가 표기에서 제거할 역할 표기 ("한강 (지은이)", "김초엽 지음", "안도현 외" 등)
+# 한 글자 표기(글/저/역/편/외)는 이름 끝 글자와 구분하기 위해 앞에 공백이 있을 때만 제거
+_ROLE_PATTERN = re.compile(r"\([^)]*\)|\[[^\]]*\]|(지음|지은이|옮김|옮긴이|엮음|엮은이|작가)$|\s(글|저|역|편|외)$")
+# 번역가/그림 작가처럼 작가 본인이 아닌 기여자 표기
+_NON_AUTHOR_ROLE = re.compile(r"(옮김|옮긴이|역자|번역|그림|일러스트)")
+_SEPARATORS = re.compile(r"[,;/·|]")
+
+# 한글 음절 → 로마자 (국어의 로마자 표기법 기준, 이름 비교용이라 음운 변화는 무시)
+_INITIALS = ["g", "kk", "n", "d", "tt", "r", "m", "b", "pp", "s", "ss", "", "j", "jj", "ch", "k", "t", "p", "h"]
+_MEDIALS = ["a", "ae", "ya", "yae", "eo", "e", "yeo", "ye", "o", "wa", "wae", "oe", "yo", "u", "wo", "we", "wi",
+            "yu", "eu", "ui", "i"]
+_FINALS = ["", "k", "k", "k", "n", "n", "n", "t", "l", "l", "l", "l", "l", "l", "l", "l", "m", "p", "p", "t", "t",
+           "ng", "t", "t", "k", "t", "p", "t"]
+
+# 로마자 성씨 관용 표기 (Lee, Park, Choi ...)
+_SURNAME_ALIASES = {
+    "이": ["lee", "yi", "rhee"], "박": ["park", "pak"], "김": ["kim"], "최": ["choi"], "정": ["jung", "chung"],
+    "조": ["cho", "jo"], "강": ["kang"], "윤": ["yoon", "yun"], "장": ["jang", "chang"], "임": ["lim", "im"],
+    "한": ["han"], "오": ["oh"], "신": ["shin"], "서": ["seo", "suh"], "권": ["kwon"], "황": ["hwang"],
+    "안": ["ahn"], "송": ["song"], "유": ["yoo", "yu"], "홍": ["hong"], "전": ["jeon", "chun"], "고": ["ko", "koh"],
+    "문": ["moon"], "배": ["bae"], "백": ["baek", "paik"], "허": ["heo", "huh"], "노": ["noh", "roh"],
+}
+
+# 로마자 표기 차이를 흡수하기 위한 접기 규칙 (g/k, d/t, b/p, r/l, j/ch, oo/u, ee/i)
+_LOOSE_RULES = [("oo", "u"), ("ee", "i"), ("ch", "j"), ("g", "k"), ("d", "t"), ("b", "p"), ("r", "l")]
+
+
+def _is_hangul_syllable(ch: str) -> bool:
+    return "가" <= ch <= "힣"
+
+
+def romanize(hangul: str) -> str:
+    """한글 문자열을 로마자로 변환 (한글이 아닌 문자는 그대로 둠)."""
+    out = []
+    for ch in hangul:
+        if not _is_hangul_syllable(ch):
+            out.append(ch)
+            continue
+        code = ord(ch) - 0xAC00
+        out.append(_INITIALS[code // 588] + _MEDIALS[(code % 588) // 28] + _FINALS[code % 28])
+    return "".join(out)
+
+
+def _loose_latin(text: str) -> str:
+    key = re.sub(r"[^a-z]", "", text.lower())
+    for src, dst in _LOOSE_RULES:
+        key = key.replace(src, dst)
+    return key
+
+
+def normalize_author(name: str) -> str:
+    """작가 이름 정규화: 역할 표기와 공백 제거, 영문은 소문자."""
+    name = str(name or "").strip()
+    previous = None
+    while previous != name:
+        previous = name
+        name = _ROLE_PATTERN.sub("", name).strip()
+    return re.sub(r"\s+", "", name).lower()
+
+
+def split_authors(raw: str) -> List[str]:
+    """메타데이터 작가 필드를 작가별로 나누고 번역가/그림 작가는 제외."""
+    names = []
+    for part in _SEPARATORS.split(str(raw or "")):
+        if not part.strip() or _NON_AUTHOR_ROLE.search(part):
+            continue
+        name = normalize_author(part)
+        if name:
+            names.append(name)
+    return names
+
+
+def author_keys(name: str) -> List[str]:
+    """정규화된 이름으로 조회 키 목록 생성 (원문 + 로마자 접기 키 + 성씨 관용 표기 키)."""
+    keys = [name]
+    if any(_is_hangul_syllable(ch) for ch in name):
+        keys.append("rom:" + _loose_latin(romanize(name)))
+        for alias in _SURNAME_ALIASES.get(name[0], []):
+            keys.append("rom:" + _loose_latin(alias + romanize(name[1:])))
+    elif re.fullmatch(r"[a-z\-'.]+", name):
+        keys.append("rom:" + _loose_latin(name))
+    return list(dict.fromkeys(keys))
+
+
+class AuthorIndex(VersionedIndex):
+    """작가 → 도서 역색인.
+
+    준비/재생성 시점은 VersionedIndex를 따름 (warm_up에서 미리 만들고 컬렉션이 바뀌면 백그라운드에서 다시 만듦).
+    색인을 만들지 못했으면 빈 결과를 반환하고, 호출 측은 기존 벡터 검색으로 대체함.
+
+    Args:
+        vectorstore: get(include=..., limit=..., offset=...)을 지원하는 벡터스토어 (Chroma)
+        version_check_interval (float): 컬렉션 변경 여부를 다시 확인하기까지의 최소 간격(초)
+        batch_size (int): 메타데이터를 읽어올 때 한 번에 가져올 문서 수
+        version_fn (Callable | None): 컬렉션 버전을 반환하는 함수. None이면 문서 수
+    """
+
+    index_name = "작가 색인"
+    thread_name = "author-index-rebuild"
+
+    def __init__(self, vectorstore, version_check_interval: float = 60.0, batch_size: int = 1000,
+                 version_fn: Optional[Callable[[], Hashable]] = None):
+        super().__init__(vectorstore, version_check_interval=version_check_interval, version_fn=version_fn)
+        self.batch_size = batch_size
+
+    def lookup(self, author: str) -> List[Document]:
+        """작가의 도서 목록 (ISBN 기준 중복 제거). 없으면 빈 리스트."""
+        index = self._ensure_index() or {}
+        for key in author_keys(normalize_author(author)):
+            docs = index.get(key)
+            if docs:
+                return list(docs)
+        return []
+
+    # ---------- 내부 ----------
+
+    def _build(self, version) -> Dict[str, List[Document]]:
+        """컬렉션 메타데이터를 배치로 읽어 색인 생성."""
+        started = time.perf_counter()
+        index = self._read_collection()
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"[DEBUG] 작가 색인 생성: 키 {len(index)}개 ({elapsed:.0f}ms)")
+        return index
+
+    def _read_collection(self) -> Dict[str, List[Document]]:
+        index: Dict[str, List[Document]] = {}
+        seen: Dict[str, set] = {}
+        for doc_id, metadata, content in read_collection(self.vectorstore, self.batch_size):
+            metadata = metadata or {}
+            key_of_book = book_key(metadata, doc_id)
+            doc = Document(page_content=content or "", metadata=metadata)
+            for name in split_authors(metadata.get("author", "")):
+                for key in author_keys(name):
+                    if key_of_book in seen.setdefault(key, set()):
+                        continue
+                    seen[key].add(key_of_book)
+                    index.setdefault(key, []).append(doc)
+        return index
+
+def author_filter(docs: List[Document]) -> dict:
+    """색인에서 찾은 문서들의 원문 작가 표기로 벡터스토어 메타데이터 필터 생성."""
+    return any_of_filter("author", sorted({doc.metadata.get("author") for doc in docs if doc.metadata.get("author")}))
@@ -0,0 +1,170 @@
+"""
+emotion_index.py
+전처리에서 추출한 감정 키워드로 만든 감정 → 도서 역색인
+
+emotion_extract.py가 상품/리뷰마다 저장한 감정 키워드(Chroma 메타데이터의
+product_emotion_keywords / review_emotion_keywords)를 책 단위로 합산해 점수를 매김.
+감정 도구는 이 색인으로 후보 책을 먼저 고르고, 벡터 유사도는 후보 안에서 순위를 매길 때만 씀.
+
+오프라인 생성:
+    cd ai-service
+    python -m app.retrieval.emotion_index
+"""
+import json
+import os
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+from .lexical_index import read_collection
+from .versioned_index import VersionedIndex
+
+# 책 점수 가중치: 상품 설명에서 나온 감정이 리뷰 하나에서 나온 감정보다 대표성이 큼
+PRODUCT_KEYWORD_WEIGHT = 2.0
+REVIEW_KEYWORD_WEIGHT = 1.0
+SYNONYM_WEIGHT = 0.5
+
+# 감정 동의어/연관어 확장표 (질의 감정 → 함께 찾을 감정 키워드)
+EMOTION_SYNONYMS = {
+    "우울": ["슬픔", "외로움", "공허", "위로"],
+    "슬픔": ["우울", "눈물", "상실", "위로"],
+    "외로움": ["고독", "쓸쓸", "우울"],
+    "불안": ["걱정", "두려움", "초조", "스트레스"],
+    "스트레스": ["불안", "피로", "지침", "힐링"],
+    "피곤": ["피로", "지침", "휴식", "힐링"],
+    "분노": ["화", "짜증", "억울"],
+    "행복": ["기쁨", "즐거움", "따뜻", "희망"],
+    "기쁨": ["행복", "즐거움"],
+    "설렘": ["사랑", "두근", "기대"],
+    "사랑": ["설렘", "로맨스", "따뜻"],
+    "희망": ["용기", "위로", "긍정"],
+    "지루": ["권태", "무료"],
+}
+
+# 감정 키워드 어미 (긴 것부터 제거: "사랑스러운" → "사랑", "우울함" → "우울")
+_SUFFIXES = ("스러움", "스러운", "스럽다", "로움", "로운", "함", "한", "감", "적", "움", "운")
+
+
+def normalize_emotion(keyword: str) -> str:
+    """감정 키워드를 어간 형태로 정규화 (공백 제거, 어미 제거 후 두 글자 이상만 남김)."""
+    word = "".join(str(keyword or "").split())
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 2:
+            return word[:-len(suffix)]
+    return word
+
+
+# 정규화된 감정 → 정규화된 동의어 목록
+_SYNONYMS = {
+    normalize_emotion(emotion): [normalize_emotion(s) for s in synonyms]
+    for emotion, synonyms in EMOTION_SYNONYMS.items()
+}
+
+
+def _parse_keywords(value) -> List[str]:
+    if not value:
+        return []
+    if isinstance(value, list):
+        return [str(v) for v in value]
+    try:
+        parsed = json.loads(value)
+    except (TypeError, ValueError):
+        return [v.strip() for v in str(value).split(",") if v.strip()]
+    return [str(v) for v in parsed] if isinstance(parsed, list) else [str(parsed)]
+
+
+def build_emotion_index(rows) -> dict:
+    """(문서 id, 메타데이터, 본문) 목록으로 감정 색인 생성.
+
+    Returns:
+        dict: {"emotions": {감정: {isbn: 점수}}}
+    """
+    emotions: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    for _doc_id, metadata, _content in rows:
+        metadata = metadata or {}
+        isbn = metadata.get("isbn")
+        if not isbn:
+            continue
+        for field, weight in (("product_emotion_keywords", PRODUCT_KEYWORD_WEIGHT),
+                              ("review_emotion_keywords", REVIEW_KEYWORD_WEIGHT)):
+            for keyword in _parse_keywords(metadata.get(field)):
+                emotion = normalize_emotion(keyword)
+                if emotion:
+                    emotions[emotion][str(isbn)] += weight
+    return {"emotions": {emotion: dict(books) for emotion, books in emotions.items()}}
+
+
+class EmotionIndex(VersionedIndex):
+    """감정 → 도서 점수 역색인.
+
+    저장된 파일이 있으면 불러오고, 없거나 컬렉션 버전(기본은 문서 수)이 달라졌으면 컬렉션에서 다시 만들어 저장.
+    준비/재생성 시점은 VersionedIndex를 따르며, 색인을 준비하지 못했으면 빈 후보를 반환하고
+    감정 도구는 벡터 검색으로 대체함.
+
+    Args:
+        vectorstore: Chroma 벡터스토어
+        path (str | None): 색인 JSON 파일 경로. None이면 메모리에만 둠
+        version_check_interval (float): 컬렉션 변경 여부를 다시 확인하기까지의 최소 간격(초)
+        version_fn (Callable | None): 컬렉션 버전을 반환하는 함수. None이면 문서 수
+    """
+
+    index_name = "감정 색인"
+    thread_name = "emotion-index-rebuild"
+
+    def __init__(self, vectorstore, path: Optional[str] = None, version_check_interval: float = 60.0,
+                 version_fn: Optional[Callable] = None):
+        super().__init__(vectorstore, version_check_interval=version_check_interval, version_fn=version_fn)
+        self.path = path
+
+    def shortlist(self, emotion: str, limit: int = 20) -> List[str]:
+        """감정(+동의어)에 해당하는 책 ISBN을 점수 내림차순으로 최대 limit개."""
+        emotions = self._ensure_index() or {}
+        target = normalize_emotion(emotion)
+        terms = [(target, 1.0)] + [(synonym, SYNONYM_WEIGHT) for synonym in _SYNONYMS.get(target, [])]
+
+        scores: Dict[str, float] = defaultdict(float)
+        for term, weight in terms:
+            for isbn, score in emotions.get(term, {}).items():
+                scores[isbn] += score * weight
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return [isbn for isbn, _ in ranked[:limit]]
+
+    # ---------- 내부 ----------
+
+    def _build(self, version) -> Dict[str, Dict[str, float]]:
+        """저장 파일이 현재 컬렉션 버전과 같으면 불러오고, 아니면 컬렉션에서 만들어 파일에 저장."""
+        saved = self._load()
+        if saved is not None and saved.get("version") == version:
+            return saved["emotions"]
+
+        started = time.perf_counter()
+        data = build_emotion_index(read_collection(self.vectorstore))
+        data["version"] = version
+        print(f"[DEBUG] 감정 색인 생성: 감정 {len(data['emotions'])}개 "
+              f"({(time.perf_counter() - started) * 1000:.0f}ms)")
+        if self.path:
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                with open(self.path + ".tmp", "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(self.path + ".tmp", self.path)
+            except OSError as e:
+                print(f"[WARN] 감정 색인 저장 실패: {e}")
+        return data["emotions"]
+
+    def _load(self) -> Optional[dict]:
+        if not (self.path and os.path.exists(self.path)):
+            return None
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return {"emotions": data["emotions"], "version": data.get("version")}
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[WARN] 감정 색인 불러오기 실패: {e}")
+            return None
+
+
+if __name__ == "__main__":
+    from app.config.llm import emotion_index
+    emotion_index.build()
+    print(f"✅ 감정 색인 저장 완료: {emotion_index.path}")
@@ -0,0 +1,100 @@
+"""
+hybrid_search.py
+어휘(BM25) 검색과 벡터 검색 결과를 Reciprocal Rank Fusion으로 합치는 하이브리드 검색
+
+벡터 검색은 기존과 같은 MMR(fetch_k 그대로)을 쓰고, 정확한 키워드/장르 일치는 BM25 순위로 보강함.
+"""
+import asyncio
+from typing import Callable, List, Optional
+
+from langchain_core.documents import Document
+
+from .lexical_index import BM25Index, book_key, load_or_build, reciprocal_rank_fusion
+from .retriever_registry import RetrievalStrategy
+from .versioned_index import VersionedIndex
+
+
+class HybridSearcher(VersionedIndex):
+    """BM25 + 벡터 하이브리드 검색기.
+
+    어휘 색인의 준비/재생성 시점은 VersionedIndex를 따르며, 저장된 색인이 현재 컬렉션 버전과 같으면 불러옴.
+
+    Args:
+        vectorstore: Chroma 벡터스토어 (어휘 색인 생성과 문서 조회에 사용)
+        registry (RetrieverRegistry): 벡터 검색에 쓰는 retriever 레지스트리
+        index_dir (str | None): 어휘 색인 저장 디렉터리. None이면 메모리에만 둠
+        lexical_k (int): 융합에 넣을 BM25 상위 책 수
+        rrf_k (int): RRF 상수 (클수록 순위 간 점수 차이가 작아짐)
+        version_check_interval (float): 컬렉션 변경 여부를 다시 확인하기까지의 최소 간격(초)
+        version_fn (Callable | None): 컬렉션 버전을 반환하는 함수. None이면 문서 수
+    """
+
+    index_name = "어휘 색인"
+    thread_name = "lexical-index-rebuild"
+
+    def __init__(self, vectorstore, registry, index_dir: Optional[str] = None, lexical_k: int = 10,
+                 rrf_k: int = 60, version_check_interval: float = 60.0, version_fn: Optional[Callable] = None):
+        super().__init__(vectorstore, version_check_interval=version_check_interval, version_fn=version_fn)
+        self.registry = registry
+        self.index_dir = index_dir
+        self.lexical_k = lexical_k
+        self.rrf_k = rrf_k
+
+    def search(self, query: str, lexical_query: str = "", k: Optional[int] = None) -> List[Document]:
+        """query로 벡터 검색, lexical_query(없으면 query)로 BM25 검색 후 융합한 상위 k개 문서."""
+        vector_docs = self.registry.search(RetrievalStrategy.MMR, query)
+        lexical_hits = self._lexical_search(lexical_query or query)
+        return self._fuse(vector_docs, lexical_hits, k or self.registry.k)
+
+    async def asearch(self, query: str, lexical_query: str = "", k: Optional[int] = None) -> List[Document]:
+        """search의 비동기 버전 (벡터 검색과 BM25 검색을 동시에 실행)."""
+        vector_docs, lexical_hits = await asyncio.gather(
+            self.registry.asearch(RetrievalStrategy.MMR, query),
+            asyncio.to_thread(self._lexical_search, lexical_query or query),
+        )
+        return await asyncio.to_thread(self._fuse, vector_docs, lexical_hits, k or self.registry.k)
+
+    # ---------- 내부 ----------
+
+    def _lexical_search(self, query: str):
+        index = self._ensure_index()
+        if index is None:
+            # 어휘 색인 생성에 실패했으면 (백그라운드 재시도 전까지) 벡터 검색 결과만으로 응답
+            return []
+        try:
+            return index.search_books(query, self.lexical_k)
+        except Exception as e:
+            # 어휘 색인에 문제가 있어도 벡터 검색 결과만으로 응답
+            print(f"[WARN] 어휘 검색 실패: {e}")
+            return []
+
+    def _fuse(self, vector_docs: List[Document], lexical_hits, k: int) -> List[Document]:
+        docs_by_key = {}
+        vector_ranking = []
+        for doc in vector_docs:
+            key = book_key(doc.metadata, getattr(doc, "id", None) or doc.page_content)
+            if key not in docs_by_key:
+                docs_by_key[key] = doc
+                vector_ranking.append(key)
+        lexical_ranking = [key for key, _ in lexical_hits]
+
+        top_keys = [key for key, _ in reciprocal_rank_fusion([vector_ranking, lexical_ranking], self.rrf_k)][:k]
+
+        # 벡터 검색에 없던 책은 Chroma에서 id로 가져옴
+        lexical_ids = dict(lexical_hits)
+        missing_ids = [lexical_ids[key] for key in top_keys if key not in docs_by_key]
+        if missing_ids:
+            fetched = self.vectorstore.get(ids=missing_ids, include=["metadatas", "documents"])
+            for doc_id, metadata, content in zip(fetched.get("ids") or [], fetched.get("metadatas") or [],
+                                                 fetched.get("documents") or []):
+                metadata = metadata or {}
+                docs_by_key.setdefault(book_key(metadata, doc_id), Document(page_content=content or "", metadata=metadata))
+        return [docs_by_key[key] for key in top_keys if key in docs_by_key]
+
+    def _build(self, version) -> BM25Index:
+        """현재 컬렉션 버전의 색인을 불러오거나 만듦."""
+        return load_or_build(self.vectorstore, self.index_dir, version=version)
+
+    def _discard(self, index: BM25Index):
+        """교체된 색인의 mmap을 닫음. 교체 직전에 시작한 검색이 닫힌 색인을 쓰면 _lexical_search가 빈 결과로 처리."""
+        index.close()
@@ -0,0 +1,237 @@
+"""
+lexical_index.py
+page_content와 키워드 메타데이터에 대한 BM25 역색인
+
+한국어는 형태소 분석기 없이 어절 + 한글 음절 bigram으로 토큰화해 "우울한"과 "우울"이 서로 맞도록 함.
+색인은 Chroma 디렉터리 옆에 저장하고 posting 파일은 mmap으로 읽어 프로세스 메모리를 거의 쓰지 않음.
+"""
+import json
+import math
+import mmap
+import os
+import re
+import time
+from array import array
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+META_FILE = "lexical_meta.json"
+POSTINGS_FILE = "lexical_postings.bin"
+
+# 색인에 함께 넣는 메타데이터 필드 (키워드 필드는 JSON 리스트 문자열)
+INDEXED_METADATA_FIELDS = (
+    "product_name", "top_category_name", "mid_category_name", "low_category_name",
+    "product_keywords", "product_emotion_keywords", "review_emotion_keywords",
+)
+
+_WORD = re.compile(r"[0-9a-z가-힣]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """어절 단위 토큰 + 3음절 이상 한글 어절의 bigram."""
+    tokens = []
+    for word in _WORD.findall(str(text or "").lower()):
+        tokens.append(word)
+        if len(word) > 2 and "가" <= word[0] <= "힣":
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def _metadata_text(metadata: dict) -> str:
+    parts = []
+    for field in INDEXED_METADATA_FIELDS:
+        value = metadata.get(field)
+        if not value:
+            continue
+        if isinstance(value, str) and value.startswith("["):
+            try:
+                value = " ".join(str(v) for v in json.loads(value))
+            except ValueError:
+                pass
+        parts.append(str(value))
+    return " ".join(parts)
+
+
+def book_key(metadata: dict, fallback: str = "") -> str:
+    """같은 책의 여러 문서를 하나로 묶는 키 (ISBN → 제목 → fallback)."""
+    return str(metadata.get("isbn") or metadata.get("product_name") or fallback)
+
+
+def reciprocal_rank_fusion(rankings: Iterable[List[str]], k: int = 60) -> List[Tuple[str, float]]:
+    """여러 순위 목록을 RRF 점수(sum 1/(k + rank))로 합쳐 점수 내림차순으로 반환."""
+    scores: Dict[str, float] = defaultdict(float)
+    for ranking in rankings:
+        for rank, key in enumerate(ranking, start=1):
+            scores[key] += 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+class BM25Index:
+    """BM25 역색인.
+
+    posting은 (문서 번호, 출현 횟수) uint32 쌍을 이어 붙인 하나의 버퍼에 두고,
+    용어별로 (시작 위치, 개수)만 기억함. 저장된 색인은 이 버퍼를 mmap으로 연결.
+    """
+
+    def __init__(self, doc_ids: List[str], book_keys: List[str], doc_lengths: List[int],
+                 terms: Dict[str, Tuple[int, int]], postings, version=None,
+                 k1: float = 1.5, b: float = 0.75):
+        self.doc_ids = doc_ids
+        self.book_keys = book_keys
+        self.doc_lengths = doc_lengths
+        self.terms = terms
+        self.version = version
+        self.k1 = k1
+        self.b = b
+        self.avgdl = (sum(doc_lengths) / len(doc_lengths)) if doc_lengths else 0.0
+        self._postings = memoryview(postings).cast("B").cast("I") if len(postings) else memoryview(array("I"))
+        self._mmap = postings if isinstance(postings, mmap.mmap) else None
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def close(self):
+        """mmap으로 연결한 posting 파일을 닫음 (메모리에서 만든 색인은 할 일 없음). 닫은 뒤에는 검색할 수 없음."""
+        if self._mmap is None:
+            return
+        self._postings.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # 진행 중인 검색이 posting 조각을 잡고 있으면 그 조각이 해제될 때 GC가 닫음
+            pass
+        self._mmap = None
+
+    # ---------- 생성 / 저장 / 불러오기 ----------
+
+    @classmethod
+    def build(cls, rows: Iterable[Tuple[str, dict, str]], version=None) -> "BM25Index":
+        """(문서 id, 메타데이터, 본문) 목록으로 색인 생성."""
+        doc_ids, book_keys, doc_lengths = [], [], []
+        term_postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        for doc_id, metadata, content in rows:
+            metadata = metadata or {}
+            tokens = tokenize(f"{content or ''} {_metadata_text(metadata)}")
+            doc_index = len(doc_ids)
+            doc_ids.append(doc_id)
+            book_keys.append(book_key(metadata, doc_id))
+            doc_lengths.append(len(tokens))
+            for term, tf in Counter(tokens).items():
+                term_postings[term].append((doc_index, tf))
+
+        postings = array("I")
+        terms = {}
+        for term, entries in term_postings.items():
+            terms[term] = (len(postings) // 2, len(entries))
+            for doc_index, tf in entries:
+                postings.append(doc_index)
+                postings.append(tf)
+        return cls(doc_ids, book_keys, doc_lengths, terms, postings, version=version)
+
+    def save(self, directory: str):
+        """메타 정보(JSON)와 posting(바이너리)을 directory에 저장 (임시 파일 후 교체)."""
+        os.makedirs(directory, exist_ok=True)
+        postings_path = os.path.join(directory, POSTINGS_FILE)
+        meta_path = os.path.join(directory, META_FILE)
+        with open(postings_path + ".tmp", "wb") as f:
+            f.write(self._postings.tobytes())
+        with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({
+                "version": self.version,
+                "doc_ids": self.doc_ids,
+                "book_keys": self.book_keys,
+                "doc_lengths": self.doc_lengths,
+                "terms": self.terms,
+            }, f, ensure_ascii=False)
+        os.replace(postings_path + ".tmp", postings_path)
+        os.replace(meta_path + ".tmp", meta_path)
+
+    @classmethod
+    def load(cls, directory: str) -> Optional["BM25Index"]:
+        """저장된 색인을 불러옴 (posting은 mmap). 없거나 읽을 수 없으면 None."""
+        meta_path = os.path.join(directory, META_FILE)
+        postings_path = os.path.join(directory, POSTINGS_FILE)
+        if not (os.path.exists(meta_path) and os.path.exists(postings_path)):
+            return None
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            postings = array("I")
+            if os.path.getsize(postings_path):
+                with open(postings_path, "rb") as f:
+                    postings = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            terms = {term: tuple(span) for term, span in meta["terms"].items()}
+            return cls(meta["doc_ids"], meta["book_keys"], meta["doc_lengths"], terms, postings,
+                       version=meta.get("version"))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[WARN] 어휘 색인 불러오기 실패: {e}")
+            return None
+
+    # ---------- 검색 ----------
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[int, float]]:
+        """BM25 점수 상위 k개 (문서 번호, 점수)."""
+        n_docs = len(self.doc_ids)
+        if not n_docs:
+            return []
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            span = self.terms.get(term)
+            if span is None:
+                continue
+            start, count = span
+            idf = math.log(1 + (n_docs - count + 0.5) / (count + 0.5))
+            entries = self._postings[start * 2:(start + count) * 2]
+            for i in range(0, len(entries), 2):
+                doc_index, tf = entries[i], entries[i + 1]
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_index] / (self.avgdl or 1.0))
+                scores[doc_index] += idf * tf * (self.k1 + 1) / (tf + norm)
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]
+
+    def search_books(self, query: str, k: int = 10) -> List[Tuple[str, str]]:
+        """책 단위로 중복을 제거한 상위 k개 (book_key, 문서 id)."""
+        results, seen = [], set()
+        for doc_index, _ in self.search(query, k * 3):
+            key = self.book_keys[doc_index]
+            if key in seen:
+                continue
+            seen.add(key)
+            results.append((key, self.doc_ids[doc_index]))
+            if len(results) >= k:
+                break
+        return results
+
+
+def read_collection(vectorstore, batch_size: int = 1000):
+    """Chroma 컬렉션의 (id, 메타데이터, 본문)을 배치로 읽음."""
+    offset = 0
+    while True:
+        batch = vectorstore.get(include=["metadatas", "documents"], limit=batch_size, offset=offset)
+        ids = batch.get("ids") or []
+        yield from zip(ids, batch.get("metadatas") or [], batch.get("documents") or [])
+        if len(ids) < batch_size:
+            break
+        offset += batch_size
+
+
+def load_or_build(vectorstore, directory: Optional[str], version=None) -> BM25Index:
+    """저장된 색인이 현재 컬렉션 버전과 같으면 불러오고, 아니면 새로 만들어 저장."""
+    if directory:
+        index = BM25Index.load(directory)
+        if index is not None and index.version == version:
+            return index
+        if index is not None:
+            # 저장 전에 이전 posting 파일의 mmap을 닫음 (열린 채로는 교체할 수 없는 플랫폼이 있음)
+            index.close()
+
+    started = time.perf_counter()
+    index = BM25Index.build(read_collection(vectorstore), version=version)
+    print(f"[DEBUG] 어휘 색인 생성: 문서 {len(index)}개, 용어 {len(index.terms)}개 "
+          f"({(time.perf_counter() - started) * 1000:.0f}ms)")
+    if directory:
+        try:
+            index.save(directory)
+            return BM25Index.load(directory) or index
+        except OSError as e:
+            print(f"[WARN] 어휘 색인 저장 실패: {e}")
+    return index
@@ -0,0 +1,108 @@
+"""
+retriever_registry.py
+검색 전략별 retriever를 한 번만 만들어 재사용하는 레지스트리
+
+도구마다 요청 때마다 vectorstore.as_retriever(...)를 새로 만들던 것을 대신함.
+작가 필터처럼 호출마다 바뀌는 값은 미리 만든 retriever에 호출 인자로 넘김.
+"""
+import threading
+import time
+from enum import Enum
+from typing import Dict, Iterable, List, Optional
+
+from langchain_core.documents import Document
+
+
+def any_of_filter(field: str, values: Iterable) -> dict:
+    """메타데이터 field가 values 중 하나인 문서만 고르는 Chroma where 필터."""
+    values = list(dict.fromkeys(values))
+    if len(values) == 1:
+        return {field: values[0]}
+    return {"$or": [{field: value} for value in values]}
+
+
+class RetrievalStrategy(str, Enum):
+    """검색 전략"""
+    SIMILARITY_THRESHOLD = "similarity_score_threshold"  # 유사도 점수 하한 이상만 반환
+    MMR = "mmr"                                          # 관련도 + 다양성 (Maximal Marginal Relevance)
+
+
+class RetrieverRegistry:
+    """전략별 retriever를 미리 만들어 두고 검색 시간을 기록하는 레지스트리.
+
+    Args:
+        vectorstore: LangChain VectorStore
+        k (int): 기본 반환 문서 수
+        score_threshold (float): SIMILARITY_THRESHOLD 전략의 점수 하한
+        fetch_k (int): MMR 전략에서 다양성 계산 전에 가져올 후보 수
+        lambda_mult (float): MMR 전략의 관련도/다양성 가중치 (1에 가까울수록 관련도 우선)
+    """
+
+    def __init__(self, vectorstore, k: int = 3, score_threshold: float = 0.75,
+                 fetch_k: int = 10, lambda_mult: float = 0.7):
+        self.vectorstore = vectorstore
+        self.k = k
+        self._retrievers = {
+            RetrievalStrategy.SIMILARITY_THRESHOLD: vectorstore.as_retriever(
+                search_type=RetrievalStrategy.SIMILARITY_THRESHOLD.value,
+                search_kwargs={"score_threshold": score_threshold, "k": k}
+            ),
+            RetrievalStrategy.MMR: vectorstore.as_retriever(
+                search_type=RetrievalStrategy.MMR.value,
+                search_kwargs={"k": k, "fetch_k": fetch_k, "lambda_mult": lambda_mult}
+            ),
+        }
+        self._timings = {strategy: {"count": 0, "total": 0.0, "max": 0.0} for strategy in RetrievalStrategy}
+        self._lock = threading.Lock()
+
+    def get_retriever(self, strategy: RetrievalStrategy):
+        """미리 만든 retriever 반환 (LangChain 체인에 직접 연결할 때 사용)."""
+        return self._retrievers[RetrievalStrategy(strategy)]
+
+    def search(self, strategy: RetrievalStrategy, query: str, filter: Optional[dict] = None,
+               k: Optional[int] = None) -> List[Document]:
+        """전략에 맞는 retriever로 검색. filter/k는 이번 호출에만 적용."""
+        strategy = RetrievalStrategy(strategy)
+        started = time.perf_counter()
+        try:
+            return self._retrievers[strategy].invoke(query, **self._call_kwargs(filter, k))
+        finally:
+            self._record(strategy, time.perf_counter() - started)
+
+    async def asearch(self, strategy: RetrievalStrategy, query: str, filter: Optional[dict] = None,
+                      k: Optional[int] = None) -> List[Document]:
+        """search의 비동기 버전."""
+        strategy = RetrievalStrategy(strategy)
+        started = time.perf_counter()
+        try:
+            return await self._retrievers[strategy].ainvoke(query, **self._call_kwargs(filter, k))
+        finally:
+            self._record(strategy, time.perf_counter() - started)
+
+    def timings(self) -> Dict[str, dict]:
+        """전략별 검색 횟수와 소요 시간(ms) 통계."""
+        with self._lock:
+            return {
+                strategy.value: {
+                    "count": t["count"],
+                    "avg_ms": round(t["total"] / t["count"] * 1000, 2) if t["count"] else 0.0,
+                    "max_ms": round(t["max"] * 1000, 2),
+                }
+                for strategy, t in self._timings.items()
+            }
+
+    @staticmethod
+    def _call_kwargs(filter: Optional[dict], k: Optional[int]) -> dict:
+        kwargs = {}
+        if filter:
+            kwargs["filter"] = filter
+        if k is not None:
+            kwargs["k"] = k
+        return kwargs
+
+    def _record(self, strategy: RetrievalStrategy, elapsed: float):
+        with self._lock:
+            t = self._timings[strategy]
+            t["count"] += 1
+            t["total"] += elapsed
+            t["max"] = max(t["max"], elapsed)
@@ -0,0 +1,124 @@
+"""
+versioned_index.py
+컬렉션 버전에 맞춰 다시 만드는 메모리 색인(작가/어휘/감정 색인)의 공통 동작
+
+- 서버 시작 시 warm_up에서 ensure_built()로 첫 색인을 준비 (llm.py 팩토리가 호출하므로 /ready는 준비 후 통과)
+- 조회 때 version_check_interval마다 컬렉션 버전(기본은 문서 수)을 확인하고, 바뀌었으면 이전 색인으로 계속
+  응답하면서 백그라운드 스레드에서 다시 만듦
+- 생성에 실패하면 경고만 남기고 색인 없이(None) 응답하며, 다음 확인 주기에 백그라운드에서 다시 시도함
+"""
+import threading
+import time
+from typing import Callable, Hashable, Optional
+
+
+class VersionedIndex:
+    """컬렉션 버전이 바뀌면 백그라운드에서 다시 만드는 색인의 기반 클래스.
+
+    하위 클래스는 _build(version)에서 색인을 만들어 반환하고, 조회 시 _ensure_index()가 돌려주는
+    색인(아직 없거나 생성에 실패했으면 None)을 사용함.
+
+    Args:
+        vectorstore: Chroma 벡터스토어
+        version_check_interval (float): 컬렉션 변경 여부를 다시 확인하기까지의 최소 간격(초)
+        version_fn (Callable | None): 컬렉션 버전을 반환하는 함수. None이면 문서 수
+    """
+
+    # 로그/스레드 이름에 쓰는 색인 이름
+    index_name = "색인"
+    thread_name = "index-rebuild"
+
+    def __init__(self, vectorstore, version_check_interval: float = 60.0,
+                 version_fn: Optional[Callable[[], Hashable]] = None):
+        self.vectorstore = vectorstore
+        self.version_fn = version_fn
+        self.version_check_interval = version_check_interval
+        self._index = None
+        self._version: Optional[Hashable] = None
+        self._version_checked_at: Optional[float] = None
+        self._build_error: Optional[Exception] = None
+        self._lock = threading.Lock()
+        # 색인 생성은 한 번에 하나만 (백그라운드 재생성 중에는 다른 재생성을 시작하지 않음)
+        self._build_lock = threading.Lock()
+        self._rebuild_thread: Optional[threading.Thread] = None
+
+    def ensure_built(self):
+        """색인이 아직 없으면 만듦. 실패하면 경고만 남기고 색인 없이 둠."""
+        with self._build_lock:
+            if self._index is None:
+                self._build_safely()
+
+    def build(self):
+        """색인을 즉시 다시 만듦 (실패하면 예외를 그대로 올림)."""
+        with self._build_lock:
+            self._replace()
+
+    # ---------- 하위 클래스 구현 ----------
+
+    def _build(self, version: Optional[Hashable]):
+        """현재 컬렉션 버전(version)의 색인을 만들어 반환 (_build_lock 보유 상태에서 호출)."""
+        raise NotImplementedError
+
+    def _discard(self, index):
+        """새 색인으로 교체된 이전 색인을 정리 (기본은 아무것도 하지 않음)."""
+
+    # ---------- 내부 ----------
+
+    def _collection_version(self) -> Optional[Hashable]:
+        try:
+            if self.version_fn is not None:
+                return self.version_fn()
+            return self.vectorstore._collection.count()
+        except Exception:
+            return None
+
+    def _replace(self):
+        version = self._collection_version()
+        index = self._build(version)
+        with self._lock:
+            previous = self._index
+            self._index, self._version = index, version
+        self._build_error = None
+        if previous is not None and previous is not index:
+            self._discard(previous)
+
+    def _build_safely(self):
+        try:
+            self._replace()
+        except Exception as e:
+            self._build_error = e
+            print(f"[WARN] {self.index_name} 생성 실패: {e}")
+
+    def _ensure_index(self):
+        """조회에 쓸 색인 (없으면 None). 확인 주기가 되면 컬렉션 버전을 비교해 재생성을 시작함."""
+        now = time.monotonic()
+        with self._lock:
+            index, version = self._index, self._version
+            due = self._version_checked_at is None or now - self._version_checked_at >= self.version_check_interval
+            if due:
+                self._version_checked_at = now
+        if index is None:
+            if self._build_error is None:
+                # 아직 만든 적이 없으면(warm_up 전) 첫 색인이 만들어질 때까지 기다림
+                self.ensure_built()
+                return self._index
+            if due:
+                self._rebuild_in_background()
+            return None
+        if due and self._collection_version() != version:
+            self._rebuild_in_background()
+        return index
+
+    def _rebuild_in_background(self):
+        """이전 색인으로 계속 응답하면서 별도 스레드에서 색인을 다시 만듦 (이미 만드는 중이면 건너뜀)."""
+        if not self._build_lock.acquire(blocking=False):
+            return
+
+        def run():
+            try:
+                self._build_safely()
+            finally:
+                self._build_lock.release()
+
+        self._rebuild_thread = threading.Thread(target=run, name=self.thread_name, daemon=True)
+        self._rebuild_thread.start()
@@ -1,48 +1,50 @@
 #작가 기반 추천 Tool
 
-from langchain.tools import StructuredTool
-from config.llm import  recommendation_llm, vectorstore
-from prompts.recommend_prompt import recommend_prompt
-from utils.formatters import format_recommendation_result_with_isbn, format_links_only, combine_response_with_links
-from utils.fallback_data import fallback_books
+import asyncio
+from langchain_core.tools import StructuredTool
+from app.config import llm
+from app.prompts.recommend_prompt import recommend_prompt
+from app.utils.formatters import format_recommendation_result_with_isbn, format_links_only, combine_response_with_links, agenerate_with_links
+from app.utils.fallback_data import fallback_books
+from app.utils.recommendation_cache import RecommendationCache
+from app.retrieval.retriever_registry import RetrievalStrategy
+from app.retrieval.author_index import author_filter
 
-def run_author_tool(author: str, user_input: str="")-> str:
-    if not author:
-        return "❗ 작가 정보를 입력해주세요. (예: 천선란, 김초엽 등)"
+# 작가 도서는 작가 색인에서 바로 찾고, 책이 k권보다 많을 때만 mmr type 검색으로 순위를 매김
+# 색인에 없는 작가는 기존처럼 작가 필터를 건 mmr 검색 (k=3, fetch_k=10, lambda_mult=0.7)
+RETRIEVAL_STRATEGY = RetrievalStrategy.MMR
 
-    # Retriever 구성
-    # retriever = vectorstore.as_retriever(
-    #     search_type="similarity_score_threshold",
-    #     search_kwargs={
-    #         "score_threshold": 0.75,
-    #         "k": 3,
-    #         "filter": {"author": author}
-    #     }
-    # )
-    # mmr type
-    retriever = vectorstore.as_retriever(
-        search_type="mmr",
-        search_kwargs={
-            "k": 3,
-            "fetch_k": 10,
-            "filter": {"author": author},
-            "lambda_mult": 0.7
-        }
-    )
+def _indexed_books(author: str):
+    """색인 조회 결과와 벡터 검색 필요 여부를 반환 (필요하면 검색 필터도 함께)."""
+    docs = llm.author_index.lookup(author)
+    if not docs:
+        return None, {"author": author}
+    if len(docs) <= llm.retriever_registry.k:
+        return docs, None
+    return None, author_filter(docs)
 
-    search_query = f"{author} 작가의 책"
-    docs = retriever.invoke(search_query)
+def _find_books(author: str, search_query: str):
+    docs, search_filter = _indexed_books(author)
+    if docs is not None:
+        return docs
+    return llm.retriever_registry.search(RETRIEVAL_STRATEGY, search_query, filter=search_filter)
 
-    if not docs:
-        fallback = fallback_books.get("author", {}).get(author)
-        if fallback:
-            return f"❗검색 결과가 없어 작가 '{author}'의 기본 추천 도서를 드립니다:\n" + "\n".join(fallback)
-        return "❌ 관련 도서를 찾지 못했어요. 다른 키워드로 시도해보세요."
+async def _afind_books(author: str, search_query: str):
+    docs, search_filter = await asyncio.to_thread(_indexed_books, author)
+    if docs is not None:
+        return docs
+    return await llm.retriever_registry.asearch(RETRIEVAL_STRATEGY, search_query, filter=search_filter)
 
-    retrieved_docs = format_recommendation_result_with_isbn(docs)
+def _no_result_message(author: str) -> str:
+    fallback = fallback_books.get("author", {}).get(author)
+    if fallback:
+        return f"❗검색 결과가 없어 작가 '{author}'의 기본 추천 도서를 드립니다:\n" + "\n".join(fallback)
+    return "❌ 관련 도서를 찾지 못했어요. 다른 키워드로 시도해보세요."
 
+def _build_prompt(author: str, docs) -> str:
+    retrieved_docs = format_recommendation_result_with_isbn(docs)
 
-    prompt = recommend_prompt.format(
+    return recommend_prompt.format(
         emotion="",
         genre="",
         author=author,
@@ -50,11 +52,54 @@ def run_author_tool(author: str, user_input: str="")-> str:
         retrieved_docs=retrieved_docs
     )
 
-    llm_result = recommendation_llm.invoke(prompt).content
-    return combine_response_with_links(llm_result, docs)
+def run_author_tool(author: str, user_input: str="")-> str:
+    if not author:
+        return "❗ 작가 정보를 입력해주세요. (예: 천선란, 김초엽 등)"
+
+    search_query = f"{author} 작가의 책"
+
+    # 같은 작가의 추천이 캐시에 있으면 검색/LLM 호출 생략
+    cache_key = RecommendationCache.make_key("author", author=author)
+    cached = llm.recommendation_cache.get(cache_key, search_query)
+    if cached is not None:
+        return cached
+
+    docs = _find_books(author, search_query)
+
+    if not docs:
+        return _no_result_message(author)
+
+    llm_result = llm.recommendation_llm.invoke(_build_prompt(author, docs)).content
+    result = combine_response_with_links(llm_result, docs)
+    llm.recommendation_cache.set(cache_key, result, search_query)
+    return result
+
+async def arun_author_tool(author: str, user_input: str="", on_token=None) -> str:
+    """run_author_tool의 비동기 버전 (이벤트 루프를 막지 않음). on_token이 있으면 응답을 스트리밍"""
+    if not author:
+        return "❗ 작가 정보를 입력해주세요. (예: 천선란, 김초엽 등)"
+
+    search_query = f"{author} 작가의 책"
+
+    cache_key = RecommendationCache.make_key("author", author=author)
+    cached = await llm.recommendation_cache.aget(cache_key, search_query)
+    if cached is not None:
+        if on_token:
+            on_token(cached)
+        return cached
+
+    docs = await _afind_books(author, search_query)
+
+    if not docs:
+        return _no_result_message(author)
+
+    result = await agenerate_with_links(llm.recommendation_llm, _build_prompt(author, docs), docs, on_token)
+    await llm.recommendation_cache.aset(cache_key, result, search_query)
+    return result
 
 author_tool = StructuredTool.from_function(
     name="AuthorRecommendationTool",
     func=run_author_tool,
+    coroutine=arun_author_tool,
     description="작가를 기반으로 추천하는 Tool 입니다."
 )
\ No newline at end of file
@@ -1,50 +1,54 @@
-from langchain.tools import StructuredTool
-from config.llm import recommendation_llm, vectorstore
-from prompts.recommend_prompt import recommend_prompt
+import asyncio
+from langchain_core.tools import StructuredTool
+from app.config import llm
+from app.prompts.recommend_prompt import recommend_prompt
 #from prompts.emotion_prompt import emotion_prompt
-from utils.formatters import format_recommendation_result_with_isbn, format_links_only, combine_response_with_links
-from utils.fallback_data import fallback_books
+from app.utils.formatters import format_recommendation_result_with_isbn, format_links_only, combine_response_with_links, agenerate_with_links
+from app.utils.fallback_data import fallback_books
+from app.utils.recommendation_cache import RecommendationCache
+from app.retrieval.retriever_registry import RetrievalStrategy, any_of_filter
 
-def run_emotion_tool(emotion: str, user_input: str = "") -> str:
-    if not emotion:
-        return "❗ 감정 정보를 입력해주세요. (예: 우울, 행복 등)"
-    # 감정 기반 retriever 구성
-    # mmr type
-    # retriever = vectorstore.as_retriever(
-    #     search_type="mmr",
-    #     search_kwargs={
-    #         "k": 3,
-    #         "fetch_k": 10,
-    #         "lambda_mult": 0.7
-    #     }
-    # )
-    # search_query = f"{emotion} {user_input}"  # 또는 그냥 user_input만 사용
-    # docs = retriever.invoke(search_query)
-
-    # similarity score threshold type
-    retriever = vectorstore.as_retriever(
-        search_type="similarity_score_threshold",
-        search_kwargs={
-            "score_threshold": 0.75,
-            "k": 3
-        }
-    )
-    search_query = f"'{user_input}'라는 요청에서 '{emotion}' 감정에 어울리는 책"
-    docs = retriever.invoke(search_query)
-    # for doc in docs:
-    #     print(doc.metadata)
+# 감정 기반 검색은 similarity score threshold type (score_threshold=0.75, k=3)
+RETRIEVAL_STRATEGY = RetrievalStrategy.SIMILARITY_THRESHOLD
 
-    if not docs:
-        fallback = fallback_books.get("emotion", {}).get(emotion)
-        if fallback:
-            return f"❗'{emotion}' 감정에 어울리는 기본 도서를 추천합니다:\n" + "\n".join(fallback)
-        return f"❌ '{emotion}' 감정에 맞는 책을 찾지 못했어요. 다른 감정을 입력해보세요."
+# 감정 색인에서 고를 후보 책 수 (벡터 유사도는 이 후보 안에서만 순위를 매김)
+SHORTLIST_SIZE = 20
+
+def _find_books(emotion: str, search_query: str):
+    shortlist = llm.emotion_index.shortlist(emotion, SHORTLIST_SIZE)
+    if shortlist:
+        docs = llm.retriever_registry.search(RETRIEVAL_STRATEGY, search_query, filter=any_of_filter("isbn", shortlist))
+        if docs:
+            return docs
+    # 색인에 없는 감정이거나 후보가 점수 기준을 넘지 못하면 전체 컬렉션 검색
+    return llm.retriever_registry.search(RETRIEVAL_STRATEGY, search_query)
+
+async def _afind_books(emotion: str, search_query: str):
+    shortlist = await asyncio.to_thread(llm.emotion_index.shortlist, emotion, SHORTLIST_SIZE)
+    if shortlist:
+        docs = await llm.retriever_registry.asearch(RETRIEVAL_STRATEGY, search_query, filter=any_of_filter("isbn", shortlist))
+        if docs:
+            return docs
+    return await llm.retriever_registry.asearch(RETRIEVAL_STRATEGY, search_query)
+
+def _no_result_message(emotion: str) -> str:
+    fallback = fallback_books.get("emotion", {}).get(emotion)
+    if fallback:
+        return f"❗'{emotion}' 감정에 어울리는 기본 도서를 추천합니다:\n" + "\n".join(fallback)
+    return f"❌ '{emotion}' 감정에 맞는 책을 찾지 못했어요. 다른 감정을 입력해보세요."
+
+def _build_prompt(emotion: str, docs) -> str:
     # 검색 결과 문서 구성
     #retrieved_docs = "\n\n".join([f"{i+1}. {doc.page_content}" for i, doc in enumerate(docs)])
     #url 형식에 맞춘 결과 반환 - 우선 감정 툴에만 추가
     retrieved_docs = format_recommendation_result_with_isbn(docs)
 
-    prompt = recommend_prompt.format(
+    # prompt = emotion_prompt.format(
+    #     emotion=emotion,
+    #     user_input=user_input,
+    #     retrieved_docs=retrieved_docs
+    # )
+    return recommend_prompt.format(
         emotion=emotion,
         genre="",  # 비워도 됨
         author="",
@@ -52,19 +56,57 @@ def run_emotion_tool(emotion: str, user_input: str = "") -> str:
         retrieved_docs=retrieved_docs
     )
 
-# prompt = emotion_prompt.format(
-    #     emotion=emotion,
-    #     user_input=user_input,
-    #     retrieved_docs=retrieved_docs
-    # )
+def run_emotion_tool(emotion: str, user_input: str = "") -> str:
+    if not emotion:
+        return "❗ 감정 정보를 입력해주세요. (예: 우울, 행복 등)"
+    search_query = f"'{user_input}'라는 요청에서 '{emotion}' 감정에 어울리는 책"
+
+    # 같은 감정의 추천이 캐시에 있으면 검색/LLM 호출 생략
+    cache_key = RecommendationCache.make_key("emotion", emotion=emotion)
+    cached = llm.recommendation_cache.get(cache_key, search_query)
+    if cached is not None:
+        return cached
+
+    docs = _find_books(emotion, search_query)
+    # for doc in docs:
+    #     print(doc.metadata)
+
+    if not docs:
+        return _no_result_message(emotion)
+
     # LLM  호출 및 응답 반환
-    llm_result = recommendation_llm.invoke(prompt).content
-    return combine_response_with_links(llm_result, docs)
+    llm_result = llm.recommendation_llm.invoke(_build_prompt(emotion, docs)).content
+    result = combine_response_with_links(llm_result, docs)
+    llm.recommendation_cache.set(cache_key, result, search_query)
+    return result
+
+async def arun_emotion_tool(emotion: str, user_input: str = "", on_token=None) -> str:
+    """run_emotion_tool의 비동기 버전 (이벤트 루프를 막지 않음). on_token이 있으면 응답을 스트리밍"""
+    if not emotion:
+        return "❗ 감정 정보를 입력해주세요. (예: 우울, 행복 등)"
+    search_query = f"'{user_input}'라는 요청에서 '{emotion}' 감정에 어울리는 책"
+
+    cache_key = RecommendationCache.make_key("emotion", emotion=emotion)
+    cached = await llm.recommendation_cache.aget(cache_key, search_query)
+    if cached is not None:
+        if on_token:
+            on_token(cached)
+        return cached
+
+    docs = await _afind_books(emotion, search_query)
+
+    if not docs:
+        return _no_result_message(emotion)
+
+    result = await agenerate_with_links(llm.recommendation_llm, _build_prompt(emotion, docs), docs, on_token)
+    await llm.recommendation_cache.aset(cache_key, result, search_query)
+    return result
 
 
 # LangChain Tool 객체로 등록
 emotion_tool = StructuredTool.from_function(
     name="EmotionRecommendationTool",
     func=run_emotion_tool,
+    coroutine=arun_emotion_tool,
     description="감정을 기반으로 도서를 추천하는 Tool 입니다."
 )
\ No newline at end of file
@@ -1,52 +1,33 @@
-from langchain.tools import StructuredTool
-from config.llm import recommendation_llm, vectorstore
+from langchain_core.tools import StructuredTool
+from app.config import llm
 # from prompts.genre_prompt import genre_prompt
-from prompts.recommend_prompt import recommend_prompt
-from utils.formatters import format_recommendation_result_with_isbn, format_links_only, combine_response_with_links
-from utils.fallback_data import fallback_books
+from app.prompts.recommend_prompt import recommend_prompt
+from app.utils.formatters import format_recommendation_result_with_isbn, format_links_only, combine_response_with_links, agenerate_with_links
+from app.utils.fallback_data import fallback_books
+from app.utils.recommendation_cache import RecommendationCache
+from app.retrieval.retriever_registry import RetrievalStrategy
 
-def run_genre_tool(genre: str, user_input: str = "") -> str:
-    if not genre:
-        return "❗ 장르 정보를 입력해주세요. (예: 소설, 에세이 등)"
-
-    # Retriever 구성 - similarity score threshold type
-    retriever = vectorstore.as_retriever(
-        search_type="similarity_score_threshold",
-        search_kwargs={
-            "score_threshold": 0.75,
-            "k": 3
-        }
-    )
-    # retriever = vectorstore.as_retriever(
-    #     search_type="mmr",
-    #     search_kwargs={
-    #         "k": 3,
-    #         "fetch_k": 10,
-    #         "lambda_mult": 0.7
-    #     }
-    # )
+# 장르 기반 검색은 similarity score threshold type (score_threshold=0.75, k=3)
+RETRIEVAL_STRATEGY = RetrievalStrategy.SIMILARITY_THRESHOLD
 
-    search_query = f"{user_input} 요청에 따른 {genre} 장르의 책"
-    docs = retriever.invoke(search_query)
-
-    if not docs:
-        fallback = fallback_books.get("genre", {}).get(genre)
-        if fallback:
-            return f"❗'{genre}' 장르에 대한 기본 추천 도서를 드립니다:\n" + "\n".join(fallback)
-        return "❌ 관련 도서를 찾지 못했어요. 다른 키워드로 시도해보세요."
+def _no_result_message(genre: str) -> str:
+    fallback = fallback_books.get("genre", {}).get(genre)
+    if fallback:
+        return f"❗'{genre}' 장르에 대한 기본 추천 도서를 드립니다:\n" + "\n".join(fallback)
+    return "❌ 관련 도서를 찾지 못했어요. 다른 키워드로 시도해보세요."
 
+def _build_prompt(genre: str, docs) -> str:
     # 검색 결과 구성
     #retrieved_docs = "\n\n".join([f"{i+1}. {doc.page_content}" for i, doc in enumerate(docs)])
     retrieved_docs = format_recommendation_result_with_isbn(docs)
 
-
     # 프롬프트 구성
     # prompt = genre_prompt.format(
     #     genre=genre,
     #     user_input=user_input,
     #     retrieved_docs=retrieved_docs
     # )
-    prompt = recommend_prompt.format(
+    return recommend_prompt.format(
         emotion="",
         genre=genre,
         author="",
@@ -54,13 +35,56 @@ def run_genre_tool(genre: str, user_input: str = "") -> str:
         retrieved_docs=retrieved_docs
     )
 
+def run_genre_tool(genre: str, user_input: str = "") -> str:
+    if not genre:
+        return "❗ 장르 정보를 입력해주세요. (예: 소설, 에세이 등)"
+
+    search_query = f"{user_input} 요청에 따른 {genre} 장르의 책"
+
+    # 같은 장르의 추천이 캐시에 있으면 검색/LLM 호출 생략
+    cache_key = RecommendationCache.make_key("genre", genre=genre)
+    cached = llm.recommendation_cache.get(cache_key, search_query)
+    if cached is not None:
+        return cached
+
+    docs = llm.retriever_registry.search(RETRIEVAL_STRATEGY, search_query)
+
+    if not docs:
+        return _no_result_message(genre)
+
     # LLM 호출 및 응답 반환
-    llm_result = recommendation_llm.invoke(prompt).content
-    return combine_response_with_links(llm_result, docs)
+    llm_result = llm.recommendation_llm.invoke(_build_prompt(genre, docs)).content
+    result = combine_response_with_links(llm_result, docs)
+    llm.recommendation_cache.set(cache_key, result, search_query)
+    return result
+
+async def arun_genre_tool(genre: str, user_input: str = "", on_token=None) -> str:
+    """run_genre_tool의 비동기 버전 (이벤트 루프를 막지 않음). on_token이 있으면 응답을 스트리밍"""
+    if not genre:
+        return "❗ 장르 정보를 입력해주세요. (예: 소설, 에세이 등)"
+
+    search_query = f"{user_input} 요청에 따른 {genre} 장르의 책"
+
+    cache_key = RecommendationCache.make_key("genre", genre=genre)
+    cached = await llm.recommendation_cache.aget(cache_key, search_query)
+    if cached is not None:
+        if on_token:
+            on_token(cached)
+        return cached
+
+    docs = await llm.retriever_registry.asearch(RETRIEVAL_STRATEGY, search_query)
+
+    if not docs:
+        return _no_result_message(genre)
+
+    result = await agenerate_with_links(llm.recommendation_llm, _build_prompt(genre, docs), docs, on_token)
+    await llm.recommendation_cache.aset(cache_key, result, search_query)
+    return result
 
 # LangChain Tool 객체로 등록
 genre_tool = StructuredTool.from_function(
     name="GenreRecommendationTool",
     func=run_genre_tool,
+    coroutine=arun_genre_tool,
     description="장르를 기반으로 도서를 추천하는 Tool 입니다."
 )
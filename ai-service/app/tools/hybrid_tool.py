@@ -1,12 +1,13 @@
 #감정,장르,작가,키워드를 조합해서 추천하는 Tool
 
-from langchain.tools import StructuredTool
-from config.llm import recommendation_llm, vectorstore
-from prompts.recommend_prompt import recommend_prompt
-from utils.formatters import format_recommendation_result_with_isbn, format_links_only, combine_response_with_links
-from utils.fallback_data import fallback_books
+from langchain_core.tools import StructuredTool
+from app.config import llm
+from app.prompts.recommend_prompt import recommend_prompt
+from app.utils.formatters import format_recommendation_result_with_isbn, format_links_only, combine_response_with_links, agenerate_with_links
+from app.utils.fallback_data import fallback_books
+from app.utils.recommendation_cache import RecommendationCache
 
-def run_hybrid_tool(info: dict) -> str:
+def _build_query(info: dict) -> dict:
     emotion = str(info.get("emotion") or "")
     genre = str(info.get("genre") or "")
     author = str(info.get("author") or "")
@@ -23,41 +24,77 @@ def run_hybrid_tool(info: dict) -> str:
         keyword_str = " ".join([str(k) for k in keywords if k])
         query_parts.append(f"키워드: {keyword_str}")
 
-    query_summary = ", ".join(query_parts)
-
-# vectorstore로 복합 쿼리 검색
-    retriever = vectorstore.as_retriever(
-        search_type="mmr",
-        search_kwargs={
-            "k": 3,
-            "fetch_k": 10,
-            "lambda_mult": 0.7
-        }
-    )
-    docs = retriever.invoke(query_summary)
+    return {
+        "emotion": emotion,
+        "genre": genre,
+        "author": author,
+        "query_summary": ", ".join(query_parts),
+        # BM25 검색용 질의는 "감정:" 같은 라벨 없이 조건 단어만 사용
+        "lexical_query": " ".join([emotion, genre, author] + [str(k) for k in keywords if k]).strip(),
+        "cache_key": RecommendationCache.make_key(
+            "hybrid", emotion=emotion, genre=genre, author=author, keywords=keywords
+        )
+    }
 
-    if not docs:
-        fallback = fallback_books.get("hybrid")
-        if fallback:
-            return f"❗조건({query_summary})에 맞는 책이 없어 기본 도서를 추천합니다:\n" + "\n".join(fallback)
-        return f"❌ 관련 도서를 찾지 못했어요. (조건: {query_summary})"
+def _no_result_message(query_summary: str) -> str:
+    fallback = fallback_books.get("hybrid")
+    if fallback:
+        return f"❗조건({query_summary})에 맞는 책이 없어 기본 도서를 추천합니다:\n" + "\n".join(fallback)
+    return f"❌ 관련 도서를 찾지 못했어요. (조건: {query_summary})"
 
+def _build_prompt(query: dict, docs) -> str:
     #검색 결과 구성
     retrieved_docs = format_recommendation_result_with_isbn(docs)
 
-    prompt = recommend_prompt.format(
-        emotion=emotion,
-        genre=genre,
-        author=author,
-        keywords=query_summary,
+    return recommend_prompt.format(
+        emotion=query["emotion"],
+        genre=query["genre"],
+        author=query["author"],
+        keywords=query["query_summary"],
         retrieved_docs=retrieved_docs
     )
 
-    llm_result = recommendation_llm.invoke(prompt).content
-    return combine_response_with_links(llm_result, docs)
+def run_hybrid_tool(info: dict) -> str:
+    query = _build_query(info)
+
+    # 같은 조건 조합의 추천이 캐시에 있으면 검색/LLM 호출 생략
+    cached = llm.recommendation_cache.get(query["cache_key"], query["query_summary"])
+    if cached is not None:
+        return cached
+
+    # 복합 쿼리 검색: mmr type 벡터 검색 (k=3, fetch_k=10, lambda_mult=0.7)과 BM25 검색을 RRF로 합침
+    docs = llm.hybrid_searcher.search(query["query_summary"], query["lexical_query"])
+
+    if not docs:
+        return _no_result_message(query["query_summary"])
+
+    llm_result = llm.recommendation_llm.invoke(_build_prompt(query, docs)).content
+    result = combine_response_with_links(llm_result, docs)
+    llm.recommendation_cache.set(query["cache_key"], result, query["query_summary"])
+    return result
+
+async def arun_hybrid_tool(info: dict, on_token=None) -> str:
+    """run_hybrid_tool의 비동기 버전 (이벤트 루프를 막지 않음). on_token이 있으면 응답을 스트리밍"""
+    query = _build_query(info)
+
+    cached = await llm.recommendation_cache.aget(query["cache_key"], query["query_summary"])
+    if cached is not None:
+        if on_token:
+            on_token(cached)
+        return cached
+
+    docs = await llm.hybrid_searcher.asearch(query["query_summary"], query["lexical_query"])
+
+    if not docs:
+        return _no_result_message(query["query_summary"])
+
+    result = await agenerate_with_links(llm.recommendation_llm, _build_prompt(query, docs), docs, on_token)
+    await llm.recommendation_cache.aset(query["cache_key"], result, query["query_summary"])
+    return result
 
 hybrid_tool = StructuredTool.from_function(
     name="HybridRecommendationTool",
     func=run_hybrid_tool,
+    coroutine=arun_hybrid_tool,
     description="감정이나 장르, 작가, 키워드 등을 조합해서 추천하는 Tool 입니다."
 )
\ No newline at end of file
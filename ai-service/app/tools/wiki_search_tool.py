@@ -5,29 +5,225 @@
 """
 
 import wikipediaapi
-import sys
-import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import httpx
 
-# 모델 import를 위한 경로 설정
-current_dir = os.path.dirname(os.path.abspath(__file__))
-models_dir = os.path.join(os.path.dirname(current_dir), 'models')
-sys.path.insert(0, models_dir)
+from app.models.wiki_search_result import WikiSearchResult
+from app.utils.wiki_page_cache import WikiPageCache
+
+USER_AGENT = 'BookstoreAI/1.0 (https://example.com/contact)'
+
+# MediaWiki query API가 한 번에 받는 최대 제목 수
+MAX_TITLES_PER_QUERY = 50
+
+# 페이지 수집 방식
+# - full: 전체 본문을 받아 중요 섹션을 골라냄 (기존 방식)
+# - sections: 도입부 + 필요한 섹션만 섹션 단위로 받아 섹션 맵으로 반환
+FETCH_MODES = ('full', 'sections')
+
+# sections 모드에서 받을 섹션 (섹션 제목에 이 단어가 들어가면 해당 섹션으로 봄)
+DEFAULT_SECTIONS = ('학력', '생애', '작품', '수상')
+
+# 동기 일괄 검색용 공유 HTTP 클라이언트 (httpx.Client는 스레드 간 공유 가능)
+_sync_client = None
+_sync_client_lock = threading.Lock()
+
+
+def _get_sync_client() -> httpx.Client:
+    """공유 httpx.Client를 반환 (없으면 생성)."""
+    global _sync_client
+    with _sync_client_lock:
+        if _sync_client is None or _sync_client.is_closed:
+            _sync_client = httpx.Client(
+                headers={'User-Agent': USER_AGENT},
+                timeout=httpx.Timeout(10.0),
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
+            )
+        return _sync_client
+
+# sections 모드에서 도입부/섹션 요청을 동시에 보내는 공유 스레드 풀 (페이지마다 풀을 새로 만들지 않음)
+SECTION_FETCH_WORKERS = 8
+_section_pool = None
+_section_pool_lock = threading.Lock()
+
+
+def _get_section_pool() -> ThreadPoolExecutor:
+    """공유 섹션 요청 스레드 풀을 반환 (없으면 생성)."""
+    global _section_pool
+    with _section_pool_lock:
+        if _section_pool is None:
+            _section_pool = ThreadPoolExecutor(max_workers=SECTION_FETCH_WORKERS, thread_name_prefix="wiki-section")
+        return _section_pool
+
+# 프로세스 공유 페이지 캐시 (설정값으로 처음 요청될 때 생성)
+_page_cache = None
+_page_cache_lock = threading.Lock()
+
+
+def get_page_cache():
+    """설정(WIKI_CACHE_*)으로 만든 공유 WikiPageCache. 비활성화되어 있으면 None."""
+    global _page_cache
+    from app.config.settings import (
+        WIKI_CACHE_ENABLED, WIKI_CACHE_TTL_SECONDS, WIKI_CACHE_NEGATIVE_TTL_SECONDS,
+        WIKI_CACHE_MAX_ENTRIES, WIKI_CACHE_PATH
+    )
+    if not WIKI_CACHE_ENABLED:
+        return None
+    with _page_cache_lock:
+        if _page_cache is None:
+            _page_cache = WikiPageCache(
+                maxsize=WIKI_CACHE_MAX_ENTRIES,
+                ttl=WIKI_CACHE_TTL_SECONDS,
+                negative_ttl=WIKI_CACHE_NEGATIVE_TTL_SECONDS,
+                disk_path=WIKI_CACHE_PATH or None
+            )
+        return _page_cache
+
+
+# 위키텍스트 → 평문 변환용 패턴
+_REF = re.compile(r'<ref[^>/]*/>|<ref[^>]*>.*?</ref>', re.DOTALL)
+_TEMPLATE = re.compile(r'\{\{[^{}]*\}\}')
+_TABLE = re.compile(r'\{\|.*?\|\}', re.DOTALL)
+_FILE_LINK = re.compile(r'\[\[(?:파일|File|그림|Image):[^\[\]]*(?:\[\[[^\]]*\]\][^\[\]]*)*\]\]', re.IGNORECASE)
+_LINK = re.compile(r'\[\[(?:[^|\]]*\|)?([^\]]*)\]\]')
+_EXTERNAL_LINK = re.compile(r'\[https?://[^\s\]]+\s*([^\]]*)\]')
+_HTML_TAG = re.compile(r'<[^>]+>')
+_EMPHASIS = re.compile(r"'{2,}")
+_BLANK_LINES = re.compile(r'\n{3,}')
+
+
+def strip_wikitext(wikitext: str) -> str:
+    """섹션 위키텍스트를 평문으로 변환 (각주/틀/표/파일 제거, 링크는 표시 텍스트만 남김)."""
+    text = _REF.sub('', wikitext or '')
+    text = _TABLE.sub('', text)
+    # 틀은 중첩될 수 있으므로 안쪽부터 더 지울 것이 없을 때까지 반복
+    previous = None
+    while previous != text:
+        previous, text = text, _TEMPLATE.sub('', text)
+    text = _FILE_LINK.sub('', text)
+    text = _LINK.sub(r'\1', text)
+    text = _EXTERNAL_LINK.sub(r'\1', text)
+    text = _HTML_TAG.sub('', text)
+    text = _EMPHASIS.sub('', text)
+    return _BLANK_LINES.sub('\n\n', text).strip()
+
+
+def pick_sections(sections: List[dict], wanted: Sequence[str]) -> Dict[str, List[Tuple[str, str]]]:
+    """parse API의 섹션 목록에서 받을 섹션 고르기 → {섹션 이름: [(섹션 index, 섹션 제목), ...]}.
+
+    상위 섹션을 받으면 하위 섹션 본문도 함께 오므로 이미 고른 섹션의 하위 섹션은 건너뜀.
+    """
+    picked = {name: [] for name in wanted}
+    picked_numbers = []
+    for section in sections:
+        heading = _HTML_TAG.sub('', section.get('line', ''))
+        number = section.get('number', '')
+        if any(number.startswith(parent + '.') for parent in picked_numbers):
+            continue
+        for name in wanted:
+            if name in heading:
+                picked[name].append((str(section['index']), heading))
+                picked_numbers.append(number)
+                break
+    return picked
+
+
+def close_http_client():
+    """공유 HTTP 클라이언트와 섹션 요청 스레드 풀 종료 (애플리케이션 종료 시 호출)."""
+    global _sync_client, _section_pool
+    with _sync_client_lock:
+        if _sync_client is not None:
+            _sync_client.close()
+        _sync_client = None
+    with _section_pool_lock:
+        if _section_pool is not None:
+            _section_pool.shutdown(wait=False)
+        _section_pool = None
+
+
+def _normalize_term(search_term: str) -> str:
+    """검색어 공백 정리 (캐시 키와 같은 규칙)."""
+    return ' '.join(str(search_term or '').split())
+
+
+def _resolve_existing(terms: List[str], data: dict) -> Dict[str, Optional[str]]:
+    """여러 제목 query 응답 → {검색어: 실제 페이지 제목 (없는 페이지면 None)}.
+
+    MediaWiki는 제목 정규화(normalized)와 넘겨주기(redirects)를 적용한 최종 제목으로 pages를 돌려주므로
+    검색어마다 같은 순서로 따라가 최종 페이지를 찾음.
+    """
+    query = data.get('query', {})
+    normalized = {item['from']: item['to'] for item in query.get('normalized', [])}
+    redirects = {item['from']: item['to'] for item in query.get('redirects', [])}
+    existing = {
+        page['title'] for page in query.get('pages', [])
+        if 'title' in page and not page.get('missing') and not page.get('invalid')
+    }
+    resolved = {}
+    for term in terms:
+        title = normalized.get(term, term)
+        title = redirects.get(title, title)
+        resolved[term] = title if title in existing else None
+    return resolved
+
+
+class _CandidateResults(Mapping):
+    """search_pages 결과 {검색어: 결과}. 존재하는 후보 페이지는 처음 꺼낼 때 받아옴.
+
+    호출자는 우선순위 순서로 후보를 꺼내다가 원하는 문서를 찾으면 멈추므로 뒤 후보의 본문은 받지 않음
+    (앞 후보를 받지 못했거나 원하는 문서가 아닐 때만 다음 후보를 받음).
+    """
+
+    def __init__(self, search_terms: List[str], load: Callable[[str], dict]):
+        self._terms = list(dict.fromkeys(search_terms))
+        self._load = load
+        self._results: Dict[str, dict] = {}
+
+    def __getitem__(self, term: str) -> dict:
+        if term not in self._terms:
+            raise KeyError(term)
+        key = _normalize_term(term)
+        if key not in self._results:
+            self._results[key] = self._load(key)
+        return self._results[key]
+
+    def __iter__(self):
+        return iter(self._terms)
+
+    def __len__(self) -> int:
+        return len(self._terms)
 
-from wiki_search_result import WikiSearchResult
 
 class WikipediaSearchTool:
     """위키피디아 검색 도구 클래스."""
 
-    def __init__(self, language='ko'):
+    def __init__(self, language='ko', cache: WikiPageCache = None,
+                 fetch_mode: str = 'full', sections: Sequence[str] = DEFAULT_SECTIONS):
         """
         위키피디아 검색 도구를 초기화.
 
         Args:
             language (str): 검색할 언어 코드 (기본값: 'ko')
+            cache (WikiPageCache): 페이지 캐시 (None이면 매번 위키피디아에 요청)
+            fetch_mode (str): 'full'(전체 본문) 또는 'sections'(도입부 + 필요한 섹션만)
+            sections (Sequence[str]): sections 모드에서 받을 섹션 이름
         """
+        if fetch_mode not in FETCH_MODES:
+            raise ValueError(f"알 수 없는 위키 수집 방식: {fetch_mode}")
+        self.language = language
+        self.cache = cache
+        self.fetch_mode = fetch_mode
+        self.sections = tuple(sections)
+        # 수집 방식마다 레코드 형태가 다르므로 캐시 키 공간을 나눔
+        self._cache_namespace = language if fetch_mode == 'full' else f"{language}#{','.join(self.sections)}"
+        self.api_url = f'https://{language}.wikipedia.org/w/api.php'
         self.wiki = wikipediaapi.Wikipedia(
             language=language,
-            user_agent='BookstoreAI/1.0 (https://example.com/contact)'
+            user_agent=USER_AGENT
         )
 
     def search_page(self, search_term: str) -> dict:
@@ -51,33 +247,211 @@ class WikipediaSearchTool:
         Raises:
             None: 모든 예외는 내부적으로 처리되어 결과 딕셔너리로 반환
         """
-        try:
-            page = self.wiki.page(search_term)
+        cache_key = WikiPageCache.make_key(self._cache_namespace, search_term)
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return self._result_from_record(search_term, cached)
 
-            if page.exists():
-                # 학력 정보가 있을 수 있는 섹션들을 우선적으로 포함
-                full_text = page.text
-                important_sections = self._extract_important_sections(full_text)
-                
-                # 중요 섹션 + 처음 부분 조합 (최대 4000자)
-                content = (full_text[:2000] + "\n\n" + important_sections)[:4000]
-                
-                return WikiSearchResult.create_success(
-                    title=page.title,
-                    summary=page.summary,
-                    content=content,
-                    url=page.fullurl
-                ).to_dict()
-            else:
-                return WikiSearchResult.create_error(
-                    f'위키피디아에서 "{search_term}"를 찾을 수 없습니다.'
-                ).to_dict()
+        try:
+            record = self._fetch_record(search_term)
+            if self.cache is not None:
+                self.cache.set(cache_key, record)
+            return self._result_from_record(search_term, record)
 
         except Exception as e:
             return WikiSearchResult.create_error(
                 f'검색 중 오류 발생: {str(e)}'
             ).to_dict()
 
+    def search_pages(self, search_terms: Iterable[str]) -> Mapping:
+        """
+        여러 후보 제목을 한 번에 검색 (예: "한강 (작가)", "한강 (소설가)", "한강").
+
+        1. 중복 검색어(공백만 다른 경우 포함)는 한 번만 확인
+        2. 캐시에 없는 제목은 MediaWiki 여러 제목 query(titles=a|b|c) 한 번으로 존재 여부/넘겨주기를 확인
+        3. 본문은 결과에서 후보를 꺼낼 때 받아옴. 우선순위가 가장 높은 후보에서 원하는 문서를 찾으면
+           나머지 후보 페이지는 받지 않고, 넘겨주기 대상이 같은 후보는 한 번만 받음
+
+        존재 확인 요청이 실패하면(또는 확인할 후보가 하나뿐이면) 후보를 꺼낼 때 search_page로 받음.
+
+        Args:
+            search_terms (Iterable[str]): 검색할 후보 제목들 (우선순위 순서)
+
+        Returns:
+            Mapping[str, dict]: {검색어: search_page와 같은 형식의 결과}
+        """
+        search_terms = list(search_terms)
+        records = {}
+        pending = []
+        for term in dict.fromkeys(_normalize_term(t) for t in search_terms):
+            cached = self.cache.get(WikiPageCache.make_key(self._cache_namespace, term)) if self.cache is not None else None
+            if cached is not None:
+                records[term] = cached
+            else:
+                pending.append(term)
+
+        resolved = None
+        if len(pending) > 1:
+            try:
+                resolved = self._resolve_titles(pending)
+            except Exception:
+                resolved = None
+        if resolved is not None:
+            for term, title in resolved.items():
+                if title is None:
+                    records[term] = {'missing': True}
+                    self._store(term, records[term])
+
+        # 넘겨주기 대상 제목 → 받은 레코드 (또는 예외)
+        fetched = {}
+
+        def load(term: str) -> dict:
+            if term not in records:
+                if resolved is None:
+                    return self.search_page(term)
+                title = resolved[term]
+                if title not in fetched:
+                    try:
+                        fetched[title] = self._fetch_record(title)
+                    except Exception as e:
+                        fetched[title] = e
+                if isinstance(fetched[title], Exception):
+                    return WikiSearchResult.create_error(f'검색 중 오류 발생: {str(fetched[title])}').to_dict()
+                records[term] = fetched[title]
+                self._store(term, records[term])
+            return self._result_from_record(term, records[term])
+
+        return _CandidateResults(search_terms, load)
+
+    def _resolve_titles(self, terms: List[str]) -> Dict[str, Optional[str]]:
+        """여러 제목의 존재 여부/넘겨주기 대상을 MediaWiki query 한 번(50개 단위)으로 확인."""
+        resolved = {}
+        client = _get_sync_client()
+        for start in range(0, len(terms), MAX_TITLES_PER_QUERY):
+            chunk = terms[start:start + MAX_TITLES_PER_QUERY]
+            response = client.get(self.api_url, params={
+                'action': 'query',
+                'format': 'json',
+                'formatversion': 2,
+                'prop': 'info',
+                'redirects': 1,
+                'titles': '|'.join(chunk)
+            })
+            response.raise_for_status()
+            resolved.update(_resolve_existing(chunk, response.json()))
+        return resolved
+
+    def _fetch_record(self, search_term: str) -> dict:
+        """위키피디아에서 페이지를 받아 캐시 레코드 형태로 반환 (없으면 MISSING 레코드)."""
+        if self.fetch_mode == 'sections':
+            return self._fetch_section_record(search_term)
+        page = self.wiki.page(search_term)
+        if page.exists():
+            return {'title': page.title, 'summary': page.summary, 'text': page.text, 'url': page.fullurl}
+        return {'missing': True}
+
+    def _section_list_params(self, search_term: str) -> dict:
+        return {'action': 'parse', 'format': 'json', 'formatversion': 2, 'prop': 'sections',
+                'redirects': 1, 'page': search_term}
+
+    def _intro_params(self, title: str) -> dict:
+        return {'action': 'query', 'format': 'json', 'formatversion': 2, 'prop': 'extracts|info',
+                'exintro': 1, 'explaintext': 1, 'inprop': 'url', 'redirects': 1, 'titles': title}
+
+    def _section_params(self, title: str, index: str) -> dict:
+        return {'action': 'parse', 'format': 'json', 'formatversion': 2, 'prop': 'wikitext',
+                'page': title, 'section': index}
+
+    def _fetch_section_record(self, search_term: str) -> dict:
+        """도입부 + 필요한 섹션만 섹션 단위 API 호출로 받아 레코드 생성.
+
+        요청 수는 2+N회 (섹션 목록 1회 + 도입부 1회 + 고른 섹션 N회). 섹션 목록을 받은 뒤
+        도입부와 섹션 요청은 공유 스레드 풀에서 동시에 보내므로 대기 시간은 왕복 2번 정도이고 전체 본문은 받지 않음.
+        """
+        client = _get_sync_client()
+
+        def get(params):
+            response = client.get(self.api_url, params=params)
+            response.raise_for_status()
+            return response.json()
+
+        listing = get(self._section_list_params(search_term))
+        if 'error' in listing:
+            return self._missing_or_raise(listing)
+        title = listing['parse']['title']
+        picked = pick_sections(listing['parse'].get('sections', []), self.sections)
+        indices = list(dict.fromkeys(index for matches in picked.values() for index, _ in matches))
+
+        # 도입부 요청은 섹션 요청과 함께 공유 풀에서 실행 (풀 작업은 다시 풀에 작업을 넣지 않음)
+        pool = _get_section_pool()
+        intro_future = pool.submit(get, self._intro_params(title))
+        wikitexts = dict(zip(indices, pool.map(
+            lambda index: get(self._section_params(title, index))['parse']['wikitext'], indices
+        )))
+        intro = intro_future.result()
+        return self._build_section_record(title, intro, picked, wikitexts)
+
+    @staticmethod
+    def _missing_or_raise(data: dict) -> dict:
+        # 없는 문서(missingtitle)/잘못된 제목만 "없는 페이지"로 캐시하고 나머지 API 오류는 예외로 올림
+        error = data['error']
+        if error.get('code') in ('missingtitle', 'invalidtitle'):
+            return {'missing': True}
+        raise RuntimeError(error.get('info') or error.get('code'))
+
+    @staticmethod
+    def _build_section_record(title: str, intro: dict, picked: Dict[str, List[Tuple[str, str]]],
+                              wikitexts: Dict[str, str]) -> dict:
+        pages = intro.get('query', {}).get('pages', [])
+        page = pages[0] if pages else {}
+        summary = page.get('extract', '').strip()
+        section_map = {}
+        for name, matches in picked.items():
+            parts = [strip_wikitext(wikitexts[index]) for index, _ in matches]
+            section_map[name] = '\n\n'.join(part for part in parts if part)
+        text = summary + ''.join(
+            f"\n\n== {name} ==\n{body}" for name, body in section_map.items() if body
+        )
+        return {'title': title, 'summary': summary, 'text': text, 'url': page.get('fullurl', ''),
+                'sections': section_map}
+
+    def _store(self, search_term: str, record: dict):
+        if self.cache is not None:
+            self.cache.set(WikiPageCache.make_key(self._cache_namespace, search_term), record)
+
+
+    def _result_from_record(self, search_term: str, record: dict) -> dict:
+        """페이지 레코드(캐시 값과 같은 형태) → 검색 결과 딕셔너리."""
+        if record.get('missing'):
+            return WikiSearchResult.create_error(
+                f'위키피디아에서 "{search_term}"를 찾을 수 없습니다.'
+            ).to_dict()
+        if 'sections' in record:
+            # 섹션 모드 레코드는 이미 필요한 부분만 담고 있으므로 자르지 않고 그대로 사용
+            return WikiSearchResult.create_success(
+                title=record['title'],
+                summary=record['summary'],
+                content=record['text'],
+                url=record['url'],
+                sections=record['sections']
+            ).to_dict()
+        return self._build_success_result(record['title'], record['summary'], record['text'], record['url'])
+
+    def _build_success_result(self, title: str, summary: str, full_text: str, url: str) -> dict:
+        """페이지 본문에서 중요 섹션을 뽑아 성공 결과 딕셔너리를 구성."""
+        # 학력 정보가 있을 수 있는 섹션들을 우선적으로 포함
+        important_sections = self._extract_important_sections(full_text)
+
+        # 중요 섹션 + 처음 부분 조합 (최대 4000자)
+        content = (full_text[:2000] + "\n\n" + important_sections)[:4000]
+
+        return WikiSearchResult.create_success(
+            title=title,
+            summary=summary,
+            content=content,
+            url=url
+        ).to_dict()
 
     def _extract_important_sections(self, full_text: str) -> str:
         """위키피디아 텍스트에서 학력/이력 관련 중요 섹션 추출."""
@@ -0,0 +1,143 @@
+"""
+embedding_cache.py
+임베딩 모델 앞단의 캐시 래퍼 (인메모리 LRU + 선택적 sqlite 디스크 계층)
+
+키는 (모델 이름, 텍스트 SHA-256)으로 만들어 모델을 바꿔도 이전 벡터가 섞이지 않음.
+"{author} 작가의 책"처럼 템플릿으로 만든 질의가 반복되면 두 번째부터는 API를 호출하지 않음.
+"""
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from array import array
+from typing import Dict, List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+from .ttl_cache import TTLCache
+
+
+class SqliteEmbeddingStore:
+    """임베딩 벡터를 sqlite 파일에 저장하는 디스크 계층."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        if not keys:
+            return {}
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", keys
+            ).fetchall()
+        return {key: array("d", blob).tolist() for key, blob in rows}
+
+    def set_many(self, items: Dict[str, List[float]]):
+        if not items:
+            return
+        rows = [(key, array("d", vector).tobytes()) for key, vector in items.items()]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows)
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class CachedEmbeddings(Embeddings):
+    """임베딩 모델을 감싸 이미 계산한 벡터를 재사용하는 Embeddings 구현.
+
+    Args:
+        embeddings (Embeddings): 실제 임베딩 모델
+        model_name (str): 캐시 키에 들어갈 모델 이름
+        maxsize (int): 인메모리 계층의 최대 항목 수 (LRU)
+        disk_path (str | None): sqlite 파일 경로. None이면 디스크 계층을 쓰지 않음
+    """
+
+    def __init__(self, embeddings: Embeddings, model_name: str, maxsize: int = 2048,
+                 disk_path: Optional[str] = None):
+        self.embeddings = embeddings
+        self.model_name = model_name
+        self._memory = TTLCache(maxsize=maxsize)
+        self._disk = SqliteEmbeddingStore(disk_path) if disk_path else None
+
+    def _key(self, text: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.model_name}:{digest}"
+
+    def _lookup(self, texts: List[str]):
+        """캐시에서 찾은 벡터 목록과, 새로 계산해야 하는 텍스트(중복 제거)를 반환."""
+        keys = [self._key(text) for text in texts]
+        vectors = [self._memory.get(key) for key in keys]
+
+        missing = [key for key, vector in zip(keys, vectors) if vector is None]
+        if missing and self._disk is not None:
+            found = self._disk.get_many(list(dict.fromkeys(missing)))
+            for key, vector in found.items():
+                self._memory.set(key, vector)
+            vectors = [found.get(key, vector) if vector is None else vector for key, vector in zip(keys, vectors)]
+
+        pending = {}
+        for text, key, vector in zip(texts, keys, vectors):
+            if vector is None:
+                pending.setdefault(key, text)
+        return keys, vectors, pending
+
+    def _store(self, pending: Dict[str, str], computed: List[List[float]]) -> Dict[str, List[float]]:
+        new_vectors = dict(zip(pending.keys(), computed))
+        for key, vector in new_vectors.items():
+            self._memory.set(key, vector)
+        if self._disk is not None:
+            self._disk.set_many(new_vectors)
+        return new_vectors
+
+    @staticmethod
+    def _merge(keys, vectors, new_vectors) -> List[List[float]]:
+        return [vector if vector is not None else new_vectors[key] for key, vector in zip(keys, vectors)]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, vectors, pending = self._lookup(texts)
+        new_vectors = {}
+        if pending:
+            new_vectors = self._store(pending, self.embeddings.embed_documents(list(pending.values())))
+        return self._merge(keys, vectors, new_vectors)
+
+    def embed_query(self, text: str) -> List[float]:
+        keys, vectors, pending = self._lookup([text])
+        if vectors[0] is not None:
+            return vectors[0]
+        return self._store(pending, [self.embeddings.embed_query(text)])[keys[0]]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, vectors, pending = await self._alookup(texts)
+        new_vectors = {}
+        if pending:
+            computed = await self.embeddings.aembed_documents(list(pending.values()))
+            new_vectors = await self._astore(pending, computed)
+        return self._merge(keys, vectors, new_vectors)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        keys, vectors, pending = await self._alookup([text])
+        if vectors[0] is not None:
+            return vectors[0]
+        computed = await self.embeddings.aembed_query(text)
+        return (await self._astore(pending, [computed]))[keys[0]]
+
+    async def _alookup(self, texts: List[str]):
+        # 디스크 계층이 있으면 sqlite 조회가 이벤트 루프를 막지 않도록 스레드에서 실행
+        if self._disk is None:
+            return self._lookup(texts)
+        return await asyncio.to_thread(self._lookup, texts)
+
+    async def _astore(self, pending: Dict[str, str], computed: List[List[float]]):
+        if self._disk is None:
+            return self._store(pending, computed)
+        return await asyncio.to_thread(self._store, pending, computed)
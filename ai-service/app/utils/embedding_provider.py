@@ -0,0 +1,117 @@
+"""
+embedding_provider.py
+임베딩 백엔드 선택 (OpenAI API / 로컬 sentence-transformers)
+
+로컬 백엔드는 CPU에서 한국어 문장 임베딩 모델을 직접 실행하므로 질의 임베딩에 네트워크 왕복이 없고,
+외부망이 막힌 테스트 환경에서도 벡터 검색이 동작함.
+모델마다 벡터 공간이 다르므로 컬렉션도 모델별로 나눠 씀 (collection_name_for).
+"""
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+
+def _load_sentence_transformer():
+    """sentence-transformers는 선택 의존성 (EMBEDDING_PROVIDER=local일 때만 필요).
+
+    torch까지 함께 불러오는 무거운 패키지라 모듈 import 시점이 아니라 실제로 모델을 만들 때 import함.
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        raise ImportError(
+            "로컬 임베딩을 사용하려면 sentence-transformers 패키지를 설치하세요. (pip install sentence-transformers)"
+        )
+    return SentenceTransformer
+
+
+# 기존 bookstore_collection을 만든 임베딩 (이 조합은 컬렉션 이름을 그대로 씀)
+DEFAULT_COLLECTION_NAME = "bookstore_collection"
+DEFAULT_PROVIDER = "openai"
+DEFAULT_OPENAI_MODEL = "text-embedding-ada-002"
+
+
+class LocalEmbeddings(Embeddings):
+    """sentence-transformers 모델로 로컬에서 임베딩을 계산하는 Embeddings 구현.
+
+    여러 문서는 batch_size개씩 묶어 한 번에 추론하고, 비동기 호출은 전용 스레드 풀에서 실행해
+    이벤트 루프를 막지 않음.
+
+    Args:
+        model_name (str): Hugging Face 모델 이름 또는 로컬 경로
+        device (str): 추론 장치 ('cpu', 'cuda' 등)
+        batch_size (int): 한 번에 추론할 문장 수
+        backend (str): 'torch' 또는 'onnx' (onnx는 optimum/onnxruntime 필요)
+        max_workers (int): 비동기 호출을 처리할 스레드 수
+        normalize (bool): 벡터를 단위 길이로 정규화할지 여부
+        model: 이미 로드한 모델 (encode를 가진 객체). 주면 model_name으로 다시 로드하지 않음
+    """
+
+    def __init__(self, model_name: str, device: str = "cpu", batch_size: int = 32, backend: str = "torch",
+                 max_workers: int = 2, normalize: bool = True, model=None):
+        if model is None:
+            kwargs = {"device": device}
+            if backend and backend != "torch":
+                kwargs["backend"] = backend
+            model = _load_sentence_transformer()(model_name, **kwargs)
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.normalize = normalize
+        self._model = model
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="local-embed")
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        vectors = self._model.encode(
+            list(texts),
+            batch_size=self.batch_size,
+            normalize_embeddings=self.normalize,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return [list(map(float, vector)) for vector in vectors]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.embed_documents, texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.embed_query, text)
+
+
+def create_embeddings(provider: str = DEFAULT_PROVIDER, model_name: Optional[str] = None,
+                      device: str = "cpu", batch_size: int = 32, backend: str = "torch",
+                      max_workers: int = 2) -> Embeddings:
+    """설정값으로 임베딩 모델 생성.
+
+    Args:
+        provider (str): 'openai' 또는 'local'
+        model_name (str | None): 모델 이름 (None이면 OpenAI 기본 모델)
+        device, batch_size, backend, max_workers: 로컬 백엔드 옵션 (LocalEmbeddings 참고)
+    """
+    if provider == "local":
+        if not model_name:
+            raise ValueError("로컬 임베딩에는 모델 이름이 필요합니다. (LOCAL_EMBEDDING_MODEL)")
+        return LocalEmbeddings(model_name, device=device, batch_size=batch_size, backend=backend,
+                               max_workers=max_workers)
+    if provider != "openai":
+        raise ValueError(f"알 수 없는 임베딩 백엔드: {provider}")
+    from langchain_openai import OpenAIEmbeddings
+    return OpenAIEmbeddings(model=model_name or DEFAULT_OPENAI_MODEL)
+
+
+def collection_name_for(provider: str, model_name: str) -> str:
+    """임베딩 모델별 컬렉션 이름 (기존 OpenAI 기본 모델은 bookstore_collection 그대로)."""
+    if provider == DEFAULT_PROVIDER and model_name == DEFAULT_OPENAI_MODEL:
+        return DEFAULT_COLLECTION_NAME
+    slug = re.sub(r"[^0-9A-Za-z]+", "_", f"{provider}_{model_name}").strip("_").lower()
+    # Chroma 컬렉션 이름은 63자 이하
+    return f"{DEFAULT_COLLECTION_NAME}_{slug}"[:63].rstrip("_")
@@ -20,7 +20,7 @@
 #     return "\n\n".join(formatted)
 #
 import re
-from typing import List
+from typing import Callable, List, Optional
 from langchain_core.documents import Document
 
 def format_links_only(docs: List[Document]) -> List[str]:  # 🔄 반환값을 리스트로
@@ -32,21 +32,89 @@ def format_links_only(docs: List[Document]) -> List[str]:  # 🔄 반환값을 
             links.append(f"🔗 {url}")
     return links
 
-def combine_response_with_links(llm_response: str, docs: List[Document]) -> str:
-    links = format_links_only(docs)  # 🔄 이제는 리스트
-    llm_lines = llm_response.strip().split("\n")
-    combined_output = []
+class LinkInjector:
+    """LLM 응답을 줄 단위로 받아, 번호 줄(1., 2., ...)이 완성될 때마다 ISBN 링크를 붙이는 변환기.
+
+    스트리밍 조각을 feed()로 넣으면 완성된 줄까지의 출력만 돌려주고,
+    마지막에 flush()로 남은 줄을 내보낸다.
+    (스트리밍 시에는 마지막 줄의 끝 공백이 남을 수 있다는 점만 combine_response_with_links와 다름)
+    """
+
+    def __init__(self, links: List[str]):
+        self.links = links
+        self.doc_index = 0
+        self._buffer = ""
+        self._started = False   # 앞쪽 공백을 건너뛰었는지 여부
+        self._emitted = False   # 한 줄이라도 내보냈는지 여부 (줄 구분자 처리용)
+        self._pending_blank = []  # 응답 끝인지 아직 알 수 없는 공백 줄
+
+    def feed(self, text: str) -> str:
+        self._buffer += text or ""
+        if not self._started:
+            self._buffer = self._buffer.lstrip()
+            if not self._buffer:
+                return ""
+            self._started = True
+
+        output = []
+        while "\n" in self._buffer:
+            line, self._buffer = self._buffer.split("\n", 1)
+            output.append(self._take_line(line))
+        return "".join(output)
+
+    def flush(self) -> str:
+        line, self._buffer = self._buffer.rstrip(), ""
+        if not line:
+            # 응답 끝의 공백 줄은 버림 (strip과 동일)
+            self._pending_blank = []
+            return ""
+        return self._take_line(line)
+
+    def _take_line(self, line: str) -> str:
+        if not line.strip():
+            self._pending_blank.append(line)
+            return ""
+        lines, self._pending_blank = self._pending_blank + [line], []
 
-    doc_index = 0
-    for line in llm_lines:
-        combined_output.append(line)
         # 번호로 시작하는 줄일 때 링크 삽입
-        if re.match(rf"^{doc_index+1}\.", line.strip()):
-            if doc_index < len(links):
-                combined_output.append(links[doc_index])  # 번호 없는 🔗 링크
-            doc_index += 1
+        if re.match(rf"^{self.doc_index+1}\.", line.strip()):
+            if self.doc_index < len(self.links):
+                lines.append(self.links[self.doc_index])  # 번호 없는 🔗 링크
+            self.doc_index += 1
+
+        output = "\n".join(lines)
+        if self._emitted:
+            output = "\n" + output
+        self._emitted = True
+        return output
+
+
+def combine_response_with_links(llm_response: str, docs: List[Document]) -> str:
+    injector = LinkInjector(format_links_only(docs))  # 🔄 이제는 리스트
+    return injector.feed(llm_response.strip()) + injector.flush()
+
+
+async def agenerate_with_links(llm, prompt: str, docs: List[Document],
+                               on_token: Optional[Callable[[str], None]] = None) -> str:
+    """LLM 응답을 생성하고 ISBN 링크를 붙여 반환.
+
+    on_token이 주어지면 응답을 스트리밍하면서 링크가 붙은 조각을 줄 단위로 전달.
+    """
+    if on_token is None:
+        return combine_response_with_links((await llm.ainvoke(prompt)).content, docs)
 
-    return "\n".join(combined_output)
+    injector = LinkInjector(format_links_only(docs))
+    parts = []
+    async for chunk in llm.astream(prompt):
+        piece = injector.feed(chunk.content)
+        if piece:
+            on_token(piece)
+            parts.append(piece)
+    tail = injector.flush()
+    if tail:
+        on_token(tail)
+        parts.append(tail)
+    return "".join(parts)
 
 def format_recommendation_result_with_isbn(docs: List[Document]) -> str:
     formatted = []
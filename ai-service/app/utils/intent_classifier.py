@@ -0,0 +1,223 @@
+"""
+intent_classifier.py
+LLM 의도 분류 앞단의 로컬 분류기 (문자 n-gram 로지스틱 회귀)
+
+"한강 작가 알려줘", "우울할 때 읽을 책 추천"처럼 의도가 뻔한 질문은 OpenAI 호출 없이 info/recommendation을 정함.
+확신도(두 의도 중 큰 쪽 확률)가 임계값보다 낮거나, 이전 대화를 가리키는 후속 질문이면 None을 반환해 LLM에 맡김.
+
+- 모델은 n-gram → 가중치 JSON 파일 하나 (python -m scripts.train_intent_classifier로 기록된 턴에서 학습)
+- USE_LOCAL_INTENT를 켰을 때만 사용 (기본값은 꺼짐)
+- info/recommendation 외의 의도(clarification, order_check 등)는 확률 0.5를 목표로 학습해 로컬에서 확신하지 않도록 함
+- 외부 패키지 없이 순수 파이썬으로 학습/추론 (질문 하나당 n-gram 수십 개의 딕셔너리 조회)
+"""
+import json
+import math
+import os
+import re
+import threading
+from typing import Dict, Iterable, Optional, Sequence, Set, Tuple
+
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "intent_classifier.json")
+
+# 학습 대상 의도 (앞쪽이 확률 0, 뒤쪽이 확률 1)
+INTENT_LABELS = ("info", "recommendation")
+
+# 이전 대화가 있을 때 이 표현이 들어 있으면 앞 턴의 의도를 이어받는 후속 질문일 수 있으므로 LLM에 맡김
+FOLLOW_UP_MARKERS = ("그 ", "그의", "그녀", "그중", "그 중", "그거", "그건", "그 책", "이 책", "이거", "다른", "또 ", "더 ")
+
+# LLM 프롬프트에 넣는 "대화 없음" 표시 (main_agent._pre_routing_inputs)
+NO_HISTORY = "이전 대화가 없습니다."
+
+_SPACES = re.compile(r"\s+")
+
+
+def _sigmoid(z: float) -> float:
+    if z >= 0:
+        return 1.0 / (1.0 + math.exp(-z))
+    e = math.exp(z)
+    return e / (1.0 + e)
+
+
+class LocalIntentClassifier:
+    """문자 n-gram 이진 로지스틱 회귀 의도 분류기.
+
+    Args:
+        weights (dict): n-gram → 가중치 (없는 n-gram은 0)
+        bias (float): 절편
+        ngram_range (tuple): 사용할 n-gram 길이 (최소, 최대)
+    """
+
+    def __init__(self, weights: Dict[str, float], bias: float = 0.0, ngram_range: Tuple[int, int] = (1, 3)):
+        self.weights = weights
+        self.bias = bias
+        self.ngram_range = tuple(ngram_range)
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """소문자 + 공백 정리, 앞뒤에 공백을 붙여 단어 경계도 n-gram에 들어가게 함"""
+        return f" {_SPACES.sub(' ', text.lower()).strip()} "
+
+    def features(self, text: str) -> Set[str]:
+        """질문의 문자 n-gram 집합 (공백만으로 된 n-gram 제외)"""
+        text = self.normalize(text)
+        low, high = self.ngram_range
+        grams = set()
+        for n in range(low, high + 1):
+            for i in range(len(text) - n + 1):
+                gram = text[i:i + n]
+                if gram.strip():
+                    grams.add(gram)
+        return grams
+
+    def _score(self, grams: Set[str]) -> float:
+        if not grams:
+            return self.bias
+        # 길이가 다른 질문도 점수 규모가 비슷하도록 L2 정규화한 이진 특성 사용
+        scale = 1.0 / math.sqrt(len(grams))
+        weights = self.weights
+        return self.bias + scale * sum(weights.get(gram, 0.0) for gram in grams)
+
+    def probability(self, text: str) -> float:
+        """recommendation일 확률 (info일 확률은 1 - p)"""
+        return _sigmoid(self._score(self.features(text)))
+
+    def predict(self, text: str, threshold: float) -> Tuple[Optional[str], float]:
+        """(의도, 확신도). 확신도가 threshold보다 낮으면 의도는 None."""
+        p = self.probability(text)
+        label, confidence = (INTENT_LABELS[1], p) if p >= 0.5 else (INTENT_LABELS[0], 1.0 - p)
+        return (label if confidence >= threshold else None), confidence
+
+    @classmethod
+    def train(cls, samples: Iterable[Tuple[str, str]], ngram_range: Tuple[int, int] = (1, 3),
+              epochs: int = 300, learning_rate: float = 2.0, l2: float = 1e-3,
+              min_weight: float = 1e-3) -> "LocalIntentClassifier":
+        """(질문, 의도) 목록으로 학습 (전체 배치 경사 하강).
+
+        info는 0, recommendation은 1, 그 밖의 의도는 0.5를 목표 확률로 삼음.
+        절댓값이 min_weight보다 작은 가중치는 모델 파일 크기를 줄이려고 버림.
+        """
+        model = cls({}, 0.0, ngram_range)
+        rows = []
+        for text, intent in samples:
+            target = {INTENT_LABELS[0]: 0.0, INTENT_LABELS[1]: 1.0}.get(intent, 0.5)
+            grams = model.features(text)
+            if grams:
+                rows.append((grams, 1.0 / math.sqrt(len(grams)), target))
+        if not rows:
+            raise ValueError("학습할 질문이 없습니다.")
+
+        weights: Dict[str, float] = {}
+        bias = 0.0
+        for _ in range(epochs):
+            grad: Dict[str, float] = {}
+            grad_bias = 0.0
+            for grams, scale, target in rows:
+                z = bias + scale * sum(weights.get(gram, 0.0) for gram in grams)
+                error = _sigmoid(z) - target
+                grad_bias += error
+                for gram in grams:
+                    grad[gram] = grad.get(gram, 0.0) + error * scale
+            step = learning_rate / len(rows)
+            for gram, g in grad.items():
+                w = weights.get(gram, 0.0)
+                weights[gram] = w - step * (g + l2 * len(rows) * w)
+            bias -= step * grad_bias
+
+        model.weights = {gram: round(w, 4) for gram, w in weights.items() if abs(w) >= min_weight}
+        model.bias = round(bias, 4)
+        return model
+
+    def to_dict(self) -> Dict:
+        return {
+            "labels": list(INTENT_LABELS),
+            "ngram_range": list(self.ngram_range),
+            "bias": self.bias,
+            "weights": dict(sorted(self.weights.items())),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LocalIntentClassifier":
+        if tuple(data.get("labels", INTENT_LABELS)) != INTENT_LABELS:
+            raise ValueError(f"지원하지 않는 의도 레이블입니다: {data.get('labels')}")
+        return cls(data["weights"], data.get("bias", 0.0), tuple(data.get("ngram_range", (1, 3))))
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+            f.write("\n")
+
+    @classmethod
+    def load(cls, path: str) -> "LocalIntentClassifier":
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def is_follow_up(user_input: str, conversation_history: str = "") -> bool:
+    """이전 대화가 있고, 질문이 앞 턴을 가리키는 표현을 담고 있는지"""
+    history = (conversation_history or "").strip()
+    if not history or history == NO_HISTORY:
+        return False
+    text = LocalIntentClassifier.normalize(user_input)
+    return any(marker in text for marker in FOLLOW_UP_MARKERS)
+
+
+_classifier: Optional[LocalIntentClassifier] = None
+_classifier_loaded = False
+_classifier_lock = threading.Lock()
+
+
+def get_local_intent_classifier() -> Optional[LocalIntentClassifier]:
+    """설정된 모델 파일을 처음 쓸 때 한 번 불러옴 (꺼져 있거나 파일이 없으면 None)"""
+    global _classifier, _classifier_loaded
+    if _classifier_loaded:
+        return _classifier
+    with _classifier_lock:
+        if not _classifier_loaded:
+            from app.config.settings import USE_LOCAL_INTENT, LOCAL_INTENT_MODEL_PATH
+            if USE_LOCAL_INTENT:
+                path = LOCAL_INTENT_MODEL_PATH or DEFAULT_MODEL_PATH
+                try:
+                    _classifier = LocalIntentClassifier.load(path)
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"[INTENT] 로컬 의도 분류기를 불러오지 못해 LLM만 사용합니다: {e}")
+            _classifier_loaded = True
+    return _classifier
+
+
+def classify_intent_locally(user_input: str, conversation_history: str = "") -> Optional[str]:
+    """로컬 분류기가 확신하는 의도, 아니면 None (LLM으로 분류)"""
+    classifier = get_local_intent_classifier()
+    if classifier is None or is_follow_up(user_input, conversation_history):
+        return None
+    from app.config.settings import LOCAL_INTENT_THRESHOLD
+    intent, confidence = classifier.predict(user_input, LOCAL_INTENT_THRESHOLD)
+    if intent is not None:
+        print(f"[INTENT] 로컬 분류: {intent} ({confidence:.3f})")
+    return intent
+
+
+_turn_log_lock = threading.Lock()
+
+
+def log_intent_turn(user_input: str, intent: str, path: str):
+    """LLM이 분류한 턴을 JSONL로 남김 (로컬 분류기 재학습 데이터)"""
+    line = json.dumps({"user_input": user_input, "intent": intent}, ensure_ascii=False)
+    try:
+        with _turn_log_lock, open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    except OSError as e:
+        print(f"[INTENT] 의도 분류 기록 실패: {e}")
+
+
+def read_intent_turns(paths: Sequence[str]) -> Iterable[Tuple[str, str]]:
+    """JSONL 파일들에서 (질문, 의도)를 읽음 (user_input/intent가 없는 줄은 건너뜀)"""
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                text, intent = record.get("user_input"), record.get("intent")
+                if text and intent:
+                    yield text, str(intent).strip().lower()
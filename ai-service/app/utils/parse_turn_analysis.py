@@ -0,0 +1,39 @@
+"""
+parse_turn_analysis.py
+**통합 분석 결과(JSON 문자열)**를 query / intent / wiki_intent로 분리하는 함수
+"""
+import json
+from app.utils.parse_keywords import parse_keywords
+from app.utils.parse_intent import parse_intent
+
+# query 쪽으로 넘기지 않는 필드
+_ROUTING_FIELDS = ("intent", "wiki_intent")
+
+
+def parse_turn_analysis(output) -> dict:
+    """
+    통합 분석 응답을 기존 파서(parse_keywords, parse_intent)로 나누어 처리.
+    파싱에 실패하면 빈 query와 'clarification' 의도를 반환.
+    """
+    if hasattr(output, "content"):
+        output = output.content
+
+    try:
+        parsed = json.loads(output)
+        if not isinstance(parsed, dict):
+            raise ValueError("Parsed result is not a dict")
+    except (json.JSONDecodeError, TypeError, ValueError):
+        return {
+            "query": parse_keywords(""),
+            "intent": "clarification",
+            "wiki_intent": None
+        }
+
+    query_fields = {k: v for k, v in parsed.items() if k not in _ROUTING_FIELDS}
+    wiki_intent = parsed.get("wiki_intent")
+
+    return {
+        "query": parse_keywords(json.dumps(query_fields, ensure_ascii=False)),
+        "intent": parse_intent(parsed.get("intent") or "clarification"),
+        "wiki_intent": wiki_intent if isinstance(wiki_intent, dict) else None
+    }
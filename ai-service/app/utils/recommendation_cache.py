@@ -0,0 +1,181 @@
+"""
+recommendation_cache.py
+추천 도구 응답 캐시 (정규화된 조건 키 + 선택적 임베딩 유사도 조회)
+
+같은 (감정, 장르, 작가, 키워드) 조합의 추천 요청은 검색과 LLM 호출 없이 캐시된 응답을 반환.
+유사도 임계값을 주면 키가 다른 요청도 질의 임베딩이 충분히 가까우면 같은 응답을 재사용하고,
+version_fn이 돌려주는 컬렉션 버전이 바뀌면 캐시 전체를 비움.
+"""
+import asyncio
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable, List, Optional, Tuple
+
+from .ttl_cache import TTLCache
+
+
+def _normalize(value) -> str:
+    return " ".join(str(value or "").split()).lower()
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class RecommendationCache:
+    """추천 응답용 LRU+TTL 캐시.
+
+    Args:
+        maxsize (int): 최대 항목 수
+        ttl (float | None): 항목 만료 시간(초)
+        embeddings: embed_query/aembed_query를 가진 임베딩 객체. None이면 유사도 조회를 하지 않음
+        similarity_threshold (float | None): 유사도 조회에 쓰는 코사인 유사도 하한
+        version_fn (Callable | None): 컬렉션 버전(문서 수 등)을 반환하는 함수
+        version_check_interval (float): version_fn을 다시 호출하기까지의 최소 간격(초)
+        enabled (bool): False면 조회는 항상 None, 저장은 무시
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: Optional[float] = 3600.0, embeddings=None,
+                 similarity_threshold: Optional[float] = None,
+                 version_fn: Optional[Callable[[], Hashable]] = None,
+                 version_check_interval: float = 30.0, enabled: bool = True):
+        self.enabled = enabled
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._vectors = OrderedDict()  # key -> 질의 임베딩 (유사도 조회용)
+        self._pending_vectors = TTLCache(maxsize=256, ttl=60.0)  # 조회 때 계산한 임베딩을 저장 때 재사용
+        self.embeddings = embeddings if similarity_threshold else None
+        self.similarity_threshold = similarity_threshold
+        self.version_fn = version_fn
+        self.version_check_interval = version_check_interval
+        self._version = None
+        self._version_checked_at = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(tool: str, emotion: str = "", genre: str = "", author: str = "",
+                 keywords: Iterable = ()) -> Tuple:
+        """도구 이름과 정규화된 (감정, 장르, 작가, 키워드) 조합으로 캐시 키 생성."""
+        normalized_keywords = tuple(sorted({_normalize(k) for k in (keywords or []) if _normalize(k)}))
+        return (tool, _normalize(emotion), _normalize(genre), _normalize(author), normalized_keywords)
+
+    # ---------- 조회 / 저장 ----------
+
+    def get(self, key: Tuple, query_text: str = "") -> Optional[str]:
+        """키로 조회하고, 없으면 질의 임베딩 유사도로 조회. 둘 다 없으면 None."""
+        if not self.enabled:
+            return None
+        self._sync_version()
+        value = self._cache.get(key)
+        if value is not None or not self._semantic_enabled(query_text):
+            return value
+        vector = self._pending_vectors.get(query_text)
+        if vector is None:
+            vector = self.embeddings.embed_query(query_text)
+            self._pending_vectors.set(query_text, vector)
+        return self._semantic_lookup(key, vector)
+
+    async def aget(self, key: Tuple, query_text: str = "") -> Optional[str]:
+        """get의 비동기 버전 (임베딩 호출이 이벤트 루프를 막지 않음)."""
+        if not self.enabled:
+            return None
+        await asyncio.to_thread(self._sync_version)
+        value = self._cache.get(key)
+        if value is not None or not self._semantic_enabled(query_text):
+            return value
+        vector = self._pending_vectors.get(query_text)
+        if vector is None:
+            vector = await self.embeddings.aembed_query(query_text)
+            self._pending_vectors.set(query_text, vector)
+        return self._semantic_lookup(key, vector)
+
+    def set(self, key: Tuple, value: str, query_text: str = ""):
+        """응답 저장. 유사도 조회가 켜져 있으면 질의 임베딩도 함께 보관."""
+        if not self.enabled:
+            return
+        self._cache.set(key, value)
+        if not self._semantic_enabled(query_text):
+            return
+        vector = self._pending_vectors.pop(query_text)
+        if vector is None:
+            vector = self.embeddings.embed_query(query_text)
+        self._store_vector(key, vector)
+
+    async def aset(self, key: Tuple, value: str, query_text: str = ""):
+        """set의 비동기 버전."""
+        if not self.enabled:
+            return
+        self._cache.set(key, value)
+        if not self._semantic_enabled(query_text):
+            return
+        vector = self._pending_vectors.pop(query_text)
+        if vector is None:
+            vector = await self.embeddings.aembed_query(query_text)
+        self._store_vector(key, vector)
+
+    def invalidate(self):
+        """캐시 전체 비우기 (벡터 컬렉션이 바뀌었을 때)."""
+        with self._lock:
+            self._vectors.clear()
+        self._cache.clear()
+        self._pending_vectors.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    # ---------- 내부 ----------
+
+    def _semantic_enabled(self, query_text: str) -> bool:
+        return self.embeddings is not None and bool(query_text)
+
+    def _semantic_lookup(self, key: Tuple, vector: List[float]) -> Optional[str]:
+        """같은 도구로 저장된 항목 중 유사도가 가장 높은 응답을 반환 (임계값 미만이면 None)."""
+        with self._lock:
+            candidates = [(k, v) for k, v in self._vectors.items() if k[0] == key[0]]
+
+        best_key, best_score = None, self.similarity_threshold
+        for cached_key, cached_vector in candidates:
+            score = _cosine_similarity(vector, cached_vector)
+            if score >= best_score:
+                best_key, best_score = cached_key, score
+        if best_key is None:
+            return None
+
+        value = self._cache.get(best_key)
+        if value is None:
+            # 만료되었거나 LRU로 밀려난 항목의 임베딩 정리
+            with self._lock:
+                self._vectors.pop(best_key, None)
+        return value
+
+    def _store_vector(self, key: Tuple, vector: List[float]):
+        with self._lock:
+            self._vectors[key] = vector
+            self._vectors.move_to_end(key)
+            # 응답 캐시에서 빠진 항목의 임베딩은 함께 제거
+            while len(self._vectors) > self._cache.maxsize:
+                self._vectors.popitem(last=False)
+
+    def _sync_version(self):
+        """컬렉션 버전이 바뀌었으면 캐시를 비움 (version_check_interval마다 한 번만 확인)."""
+        if self.version_fn is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if self._version_checked_at is not None and now - self._version_checked_at < self.version_check_interval:
+                return
+            self._version_checked_at = now
+        try:
+            version = self.version_fn()
+        except Exception as e:
+            print(f"[WARN] 추천 캐시 버전 확인 실패: {e}")
+            return
+        with self._lock:
+            changed = self._version is not None and version != self._version
+            self._version = version
+        if changed:
+            print("[DEBUG] 벡터 컬렉션 변경 감지 → 추천 캐시 초기화")
+            self.invalidate()
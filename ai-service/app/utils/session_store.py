@@ -0,0 +1,150 @@
+"""
+session_store.py
+채팅 세션 저장소 추상화 (인메모리 LRU+TTL / Redis)
+
+세션은 저장 전에 compact_session으로 필요한 필드만 남기고 직렬화하므로
+여러 uvicorn 워커가 같은 Redis를 공유해도 메모리 사용량이 제한됨.
+"""
+import json
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from .ttl_cache import TTLCache
+
+# Redis는 선택 의존성 (REDIS 백엔드를 쓸 때만 필요)
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    aioredis = None
+    REDIS_AVAILABLE = False
+
+# 위키 컨텍스트에서 저장하지 않는 키 (세션 최상위에 이미 있거나 일회성 신호)
+_TRANSIENT_WIKI_KEYS = ("conversation_history", "reset_conversation")
+
+
+def new_session() -> Dict[str, Any]:
+    """빈 세션 상태 생성."""
+    return {
+        "conversation_history": [],
+        "current_agent": None,
+        "wiki_context": {}
+    }
+
+
+def compact_session(session: Dict[str, Any], max_history: int = 20) -> Dict[str, Any]:
+    """저장에 필요한 필드만 남긴 세션 사본을 반환.
+
+    - conversation_history: 최근 max_history개 메시지만 유지
+    - wiki_context: 대화 기록 사본, 일회성 키, 값이 None인 키 제거
+    """
+    wiki_context = {
+        k: v for k, v in (session.get("wiki_context") or {}).items()
+        if k not in _TRANSIENT_WIKI_KEYS and v is not None
+    }
+    return {
+        "conversation_history": list(session.get("conversation_history") or [])[-max_history:],
+        "current_agent": session.get("current_agent"),
+        "wiki_context": wiki_context
+    }
+
+
+def serialize_session(session: Dict[str, Any], max_history: int = 20) -> bytes:
+    """세션을 압축된 JSON 바이트로 직렬화."""
+    payload = json.dumps(compact_session(session, max_history), ensure_ascii=False, separators=(",", ":"))
+    return zlib.compress(payload.encode("utf-8"))
+
+
+def deserialize_session(data: bytes) -> Dict[str, Any]:
+    """serialize_session의 역변환. 빠진 필드는 기본값으로 채움."""
+    session = new_session()
+    session.update(json.loads(zlib.decompress(data).decode("utf-8")))
+    return session
+
+
+class SessionStore(ABC):
+    """세션 저장소 인터페이스. 모든 메서드는 비동기."""
+
+    @abstractmethod
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """세션 조회. 없거나 만료되었으면 None."""
+
+    @abstractmethod
+    async def set(self, session_id: str, session: Dict[str, Any]):
+        """세션 저장 (만료 시간 갱신)."""
+
+    @abstractmethod
+    async def delete(self, session_id: str):
+        """세션 삭제."""
+
+    async def close(self):
+        """저장소 연결 정리 (필요한 구현만 재정의)."""
+
+
+class InMemorySessionStore(SessionStore):
+    """단일 프로세스용 저장소. 최대 세션 수(LRU)와 TTL로 메모리 사용량을 제한."""
+
+    def __init__(self, maxsize: int = 1000, ttl: float = 3600, max_history: int = 20):
+        self.max_history = max_history
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        data = self._cache.get(session_id)
+        return deserialize_session(data) if data is not None else None
+
+    async def set(self, session_id: str, session: Dict[str, Any]):
+        # Redis 구현과 동일하게 직렬화된 사본을 저장 (호출자의 dict와 공유하지 않음)
+        self._cache.set(session_id, serialize_session(session, self.max_history))
+
+    async def delete(self, session_id: str):
+        self._cache.pop(session_id)
+
+
+class RedisSessionStore(SessionStore):
+    """여러 워커가 공유하는 Redis 저장소. 만료는 Redis 키 TTL로 처리."""
+
+    def __init__(self, url: str = "redis://localhost:6379/0", ttl: float = 3600,
+                 max_history: int = 20, key_prefix: str = "chat:session:", client=None):
+        if client is None:
+            if not REDIS_AVAILABLE:
+                raise ImportError("Redis 세션 저장소를 사용하려면 redis 패키지를 설치하세요. (pip install redis)")
+            client = aioredis.from_url(url)
+        self.client = client
+        self.ttl = int(ttl)
+        self.max_history = max_history
+        self.key_prefix = key_prefix
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.key_prefix}{session_id}"
+
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        data = await self.client.get(self._key(session_id))
+        return deserialize_session(data) if data is not None else None
+
+    async def set(self, session_id: str, session: Dict[str, Any]):
+        await self.client.set(self._key(session_id), serialize_session(session, self.max_history), ex=self.ttl)
+
+    async def delete(self, session_id: str):
+        await self.client.delete(self._key(session_id))
+
+    async def close(self):
+        await self.client.aclose()
+
+
+def create_session_store(backend: str = "memory", ttl: float = 3600, maxsize: int = 1000,
+                         max_history: int = 20, redis_url: str = None) -> SessionStore:
+    """설정값에 맞는 세션 저장소 생성.
+
+    Args:
+        backend (str): 'memory' 또는 'redis'
+        ttl (float): 세션 만료 시간(초)
+        maxsize (int): 인메모리 저장소 최대 세션 수
+        max_history (int): 세션당 보관할 최대 메시지 수
+        redis_url (str): Redis 접속 URL (backend='redis'일 때)
+    """
+    if backend == "redis":
+        return RedisSessionStore(url=redis_url or "redis://localhost:6379/0", ttl=ttl, max_history=max_history)
+    if backend != "memory":
+        raise ValueError(f"지원하지 않는 세션 저장소입니다: {backend}")
+    return InMemorySessionStore(maxsize=maxsize, ttl=ttl, max_history=max_history)
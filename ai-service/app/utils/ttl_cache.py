@@ -0,0 +1,82 @@
+"""
+ttl_cache.py
+크기 제한(LRU) + 만료 시간(TTL)을 가진 스레드 안전 인메모리 캐시
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """LRU 방식으로 크기를 제한하고 항목별 만료 시간을 관리하는 캐시.
+
+    Args:
+        maxsize (int): 최대 항목 수. 초과하면 가장 오래 사용하지 않은 항목부터 제거
+        ttl (float | None): 항목 만료 시간(초). None이면 만료 없음
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        if maxsize <= 0:
+            raise ValueError("maxsize는 1 이상이어야 합니다.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (만료 시각, 값)
+        self._lock = threading.Lock()
+
+    def _expired(self, expires_at: Optional[float], now: float) -> bool:
+        return expires_at is not None and expires_at <= now
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """값 조회. 조회된 항목은 최근 사용으로 갱신 (만료 시각은 유지)."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if self._expired(expires_at, now):
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """값 저장. ttl을 주면 이 항목에만 다른 만료 시간을 적용."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            self._evict()
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """항목을 제거하고 값을 반환 (없거나 만료되었으면 default)."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.pop(key, None)
+        if entry is None or self._expired(entry[0], now):
+            return default
+        return entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def _evict(self):
+        """크기를 넘으면 만료된 항목부터 정리하고, 그래도 넘으면 LRU 순서로 제거 (lock 보유 상태에서 호출)."""
+        if len(self._data) <= self.maxsize:
+            return
+        now = time.monotonic()
+        for key in [k for k, (exp, _) in self._data.items() if self._expired(exp, now)]:
+            del self._data[key]
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        sentinel = object()
+        return self.get(key, sentinel) is not sentinel
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
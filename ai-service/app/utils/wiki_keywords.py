@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+위키피디아 검색 에이전트 - 키워드 분류기
+질문 유형/의도 판별에 쓰는 키워드 목록을 Aho–Corasick 오토마톤 하나로 모아 둔 레지스트리
+
+- 모듈 로드 시 모든 키워드 → 카테고리 오토마톤을 한 번만 만듦
+- scan(query)는 질문을 한 번만 훑어 맞은 카테고리 집합을 반환 (같은 질문은 캐시된 결과를 재사용)
+- 각 판별 함수는 문자열을 다시 훑지 않고 `카테고리 in hits`만 확인
+
+키워드는 모두 한글이라 소문자 변환의 영향을 받지 않으므로, 원문/소문자 중 무엇을 검사하는 함수든
+소문자로 바꾼 질문을 한 번 훑은 결과를 함께 씀.
+"""
+
+from typing import Dict, FrozenSet, Iterable, List
+
+from .ttl_cache import TTLCache
+
+
+class KeywordAutomaton:
+    """키워드 → 카테고리 다중 패턴 매처 (Aho–Corasick).
+
+    실패 링크를 미리 따라가 둔 전이표(DFA)로 만들어, 글자 하나당 딕셔너리 조회 한 번으로 훑음.
+
+    Args:
+        categories (dict): 카테고리 이름 → 키워드 목록. 같은 키워드가 여러 카테고리에 속할 수 있음
+    """
+
+    __slots__ = ('categories', '_delta', '_outputs')
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        self.categories = {name: tuple(keywords) for name, keywords in categories.items()}
+
+        # 1. 트라이
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[set] = [set()]
+        for name, keywords in self.categories.items():
+            for keyword in keywords:
+                if not keyword:
+                    raise ValueError(f"빈 키워드는 쓸 수 없습니다. (카테고리: {name})")
+                node = 0
+                for char in keyword:
+                    if char not in goto[node]:
+                        goto.append({})
+                        outputs.append(set())
+                        goto[node][char] = len(goto) - 1
+                    node = goto[node][char]
+                outputs[node].add(name)
+
+        # 2. 너비 우선으로 실패 링크를 계산하면서 전이표를 채움 (없는 전이는 실패 노드의 전이를 물려받음)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [None] * (len(goto) - 1)
+        fail = [0] * len(goto)  # 루트의 자식은 실패 노드가 루트
+        queue = list(goto[0].values())
+        for node in queue:
+            outputs[node] |= outputs[fail[node]]
+            transitions = dict(delta[fail[node]])
+            for char, child in goto[node].items():
+                fail[child] = delta[fail[node]].get(char, 0)
+                transitions[char] = child
+                queue.append(child)
+            delta[node] = transitions
+
+        self._delta = delta
+        self._outputs = [frozenset(out) for out in outputs]
+
+    def scan(self, text: str) -> FrozenSet[str]:
+        """text에 들어 있는 키워드들의 카테고리 집합."""
+        delta, outputs = self._delta, self._outputs
+        node = 0
+        hits = set()
+        for char in text:
+            node = delta[node].get(char, 0)
+            if outputs[node]:
+                hits |= outputs[node]
+        return frozenset(hits)
+
+
+# ---------------------------------------------------------------------------
+# 카테고리
+# ---------------------------------------------------------------------------
+
+# 답변 프롬프트용 질문 유형 (WikiSearchChain._determine_question_type, 순서대로 우선)
+QT_FAMILY = 'qt_family'
+QT_WORKS = 'qt_works'
+QT_BIRTH = 'qt_birth'
+QT_EDUCATION = 'qt_education'
+
+# 구체적 정보 요청 (WikiSearchChain._extract_specific_info_request)
+INFO_SCHOOL = 'info_school'
+INFO_UNIVERSITY = 'info_university'
+INFO_FATHER = 'info_father'
+INFO_MOTHER = 'info_mother'
+INFO_FAMILY = 'info_family'
+INFO_WORKS = 'info_works'
+INFO_DEATH = 'info_death'
+INFO_BIRTH = 'info_birth'
+INFO_AWARDS = 'info_awards'
+BIRTH_WORD = 'birth_word'
+DEATH_WORD = 'death_word'
+BIRTH_DAY = 'birth_day'
+DEATH_DAY = 'death_day'
+WHEN = 'when'
+
+# 관련 없는 질문 필터 (WikiSearchChain._is_irrelevant_query)
+IRRELEVANT = 'irrelevant'
+BOOK_TOPIC = 'book_topic'
+SHORT_BOOK_TOPIC = 'short_book_topic'
+
+# 대화 맥락을 이어가는 질문 (WikiSearchChain._check_context_priority)
+CONTEXT_FOLLOW_UP = 'context_follow_up'
+
+# 의문사 유형 (WikiPatternMatcher.detect_question_type, 순서대로 우선)
+QUESTION_WORDS = (
+    ('who', 'wh_who'),
+    ('where', 'wh_where'),
+    ('when', 'wh_when'),
+    ('what', 'wh_what'),
+    ('how', 'wh_how'),
+    ('why', 'wh_why'),
+)
+
+# 위키 에이전트 처리 가능 여부 폴백 (WikiSearchAgent._fallback_can_handle_query)
+AGENT_AUTHOR = 'agent_author'
+AGENT_PERSON_QUESTION = 'agent_person_question'
+AGENT_FOREIGN_NAME = 'agent_foreign_name'
+
+KEYWORDS = KeywordAutomaton({
+    QT_FAMILY: ['부모', '아버지', '어머니', '가족', '형제', '자매', '자녀', '딸', '아들', '친척'],
+    QT_WORKS: ['대표작', '작품', '소설', '책'],
+    QT_BIRTH: ['출생', '태어', '언제', '나이'],
+    QT_EDUCATION: ['학력', '대학', '고등학교', '학교'],
+
+    INFO_SCHOOL: ['고등학교', '중학교', '초등학교'],
+    INFO_UNIVERSITY: ['대학', '대학교', '학교', '출신'],
+    INFO_FATHER: ['아버지', '부친'],
+    INFO_MOTHER: ['어머니', '모친'],
+    INFO_FAMILY: ['가족', '부모'],
+    INFO_WORKS: ['대표작품', '대표작', '작품'],
+    INFO_DEATH: ['죽었', '사망', '사혼', '언제 죽', '몇년에 죽', '죽은', '사망일'],
+    INFO_BIRTH: ['출생', '태어', '나이', '출생일'],
+    INFO_AWARDS: ['수상', '상', '받은'],
+    BIRTH_WORD: ['태어', '출생'],
+    DEATH_WORD: ['죽', '사망'],
+    BIRTH_DAY: ['출생일'],
+    DEATH_DAY: ['사망일'],
+    WHEN: ['언제'],
+
+    IRRELEVANT: [
+        '웃긴다', '웃기네', '웃겨', '재밌다', '재밌네', '재미있다',
+        '안녕', '반가워', '고마워', '감사', '미안', '죄송',
+        'ㅋㅋ', 'ㅎㅎ', '하하', '헤헤',
+        '날씨', '뭐해', '어디', '어떻게',
+        '좋다', '나쁘다', '싫다', '좋아해', '싫어해',
+        '밥', '먹어', '마셔', '자자', '졸려',
+        '몰라', '모르겠다', '뭐야', '왜',
+        '너는', '당신은', '넌', '너'
+    ],
+    BOOK_TOPIC: ['쓴', '지은', '작가', '저자', '소설', '작품', '책', '정보'],
+    SHORT_BOOK_TOPIC: ['작가', '책', '소설', '시', '작품'],
+
+    CONTEXT_FOLLOW_UP: [
+        '나이', '대학', '학교', '작품', '대표작', '수상', '언제', '어디',
+        '학력', '졸업', '아버지', '어머니', '가족', '부모', '사망', '죽었',
+        '태어', '그', '그의', '그녀', '아내', '남편', '배우자'
+    ],
+
+    'wh_who': ['누구', '누가', '어떤 사람', '인물'],
+    'wh_where': ['어디', '어느', '장소'],
+    'wh_when': ['언제', '몇년', '시기'],
+    'wh_what': ['뭐', '무엇', '어떤'],
+    'wh_how': ['어떻게', '방법'],
+    'wh_why': ['왜', '이유', '때문'],
+
+    AGENT_AUTHOR: ['작가', '소설가', '시인', '저자', '작품', '알려줘', '정보', '누구'],
+    AGENT_PERSON_QUESTION: ['언제', '어디', '태어', '죽었', '사망', '대학', '학교', '출생'],
+    AGENT_FOREIGN_NAME: ['스틴', '러키', '영하', '오웰', '하루키', '카미'],
+})
+
+# 같은 질문을 여러 판별 함수가 연달아 확인하므로 최근 질문의 결과를 재사용
+_scan_cache = TTLCache(maxsize=512)
+
+
+def scan(query: str) -> FrozenSet[str]:
+    """질문(소문자로 변환)을 한 번 훑어 맞은 카테고리 집합을 반환."""
+    hits = _scan_cache.get(query)
+    if hits is None:
+        hits = KEYWORDS.scan(query.lower())
+        _scan_cache.set(query, hits)
+    return hits
@@ -0,0 +1,104 @@
+"""
+wiki_page_cache.py
+위키피디아 페이지 캐시 (인메모리 LRU+TTL + 선택적 sqlite 디스크 계층)
+
+같은 작가 페이지(한강, 김영하 등)는 세션이 달라도 내용이 같으므로 한 번 받은 페이지를 재사용함.
+디스크 계층은 본문을 zlib으로 압축해 저장하므로 프로세스 재시작/여러 워커 사이에서도 공유됨.
+"없는 페이지" 결과도 더 짧은 TTL로 저장해 같은 오타 검색이 반복되어도 HTTP를 보내지 않음.
+"""
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional
+
+from .ttl_cache import TTLCache
+
+# 없는 페이지를 나타내는 캐시 값
+MISSING = {"missing": True}
+
+
+class SqlitePageStore:
+    """페이지 레코드를 압축해 sqlite 파일에 저장하는 디스크 계층."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages (key TEXT PRIMARY KEY, payload BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT payload, expires_at FROM pages WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        payload, expires_at = row
+        if expires_at <= time.time():
+            with self._lock:
+                self._conn.execute("DELETE FROM pages WHERE key = ?", (key,))
+                self._conn.commit()
+            return None
+        return json.loads(zlib.decompress(payload).decode("utf-8"))
+
+    def set(self, key: str, record: Dict[str, Any], ttl: float):
+        payload = zlib.compress(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (key, payload, expires_at) VALUES (?, ?, ?)",
+                (key, payload, time.time() + ttl)
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class WikiPageCache:
+    """위키피디아 페이지 레코드 캐시.
+
+    레코드는 {"title", "summary", "text", "url"} 딕셔너리이거나, 없는 페이지면 MISSING.
+
+    Args:
+        maxsize (int): 인메모리 계층의 최대 페이지 수 (LRU)
+        ttl (float): 페이지 레코드 유효 시간(초)
+        negative_ttl (float): 없는 페이지 결과의 유효 시간(초)
+        disk_path (str | None): sqlite 파일 경로. None이면 디스크 계층을 쓰지 않음
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 7 * 24 * 3600, negative_ttl: float = 24 * 3600,
+                 disk_path: Optional[str] = None):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._memory = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._disk = SqlitePageStore(disk_path) if disk_path else None
+
+    @staticmethod
+    def make_key(language: str, search_term: str) -> str:
+        """언어 + 공백을 정리한 검색어."""
+        return f"{language}:{' '.join(str(search_term or '').split())}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 레코드 (MISSING 포함). 없으면 None."""
+        record = self._memory.get(key)
+        if record is None and self._disk is not None:
+            record = self._disk.get(key)
+            if record is not None:
+                self._memory.set(key, record, ttl=self._ttl_for(record))
+        return record
+
+    def set(self, key: str, record: Dict[str, Any]):
+        ttl = self._ttl_for(record)
+        self._memory.set(key, record, ttl=ttl)
+        if self._disk is not None:
+            self._disk.set(key, record, ttl)
+
+    def set_missing(self, key: str):
+        self.set(key, MISSING)
+
+    def _ttl_for(self, record: Dict[str, Any]) -> float:
+        return self.negative_ttl if record.get("missing") else self.ttl
@@ -6,9 +6,11 @@
 질문 패턴 인식, 작가명 패턴, 책-작가 패턴 등을 처리하는 유틸리티 함수들
 """
 
-import re
 from typing import List
 
+from . import wiki_patterns as patterns
+from . import wiki_keywords
+
 
 class WikiPatternMatcher:
     """패턴 매칭 관련 유틸리티 클래스"""
@@ -46,16 +48,8 @@ class WikiPatternMatcher:
     @staticmethod
     def is_new_author_query(query: str) -> bool:
         """새로운 작가 검색 쿼리인지 판단."""
-        query_lower = query.lower()
-        
-        # 새로운 작가 검색을 나타내는 패턴들
-        new_author_patterns = [
-            r'[가-힣]{2,4}\s*(?:작가|소설가|시인)',  # "한강 작가"
-            r'[가-힣]{2,4}\s*(?:누구|알려줘)',       # "한강 누구"
-            r'[가-힣]{2,4}\s*(?:정보|소개)',         # "한강 정보"
-        ]
-        
-        return any(re.search(pattern, query_lower) for pattern in new_author_patterns)
+        # "한강 작가", "한강 누구", "한강 정보" 등
+        return patterns.NEW_AUTHOR_QUERY.search(query.lower())
 
     @staticmethod
     def is_book_to_author_pattern(query: str) -> bool:
@@ -68,27 +62,17 @@ class WikiPatternMatcher:
         # 작가 질문 키워드가 있고, 인물명이 명확하지 않은 경우
         has_author_keyword = any(keyword in query_lower for keyword in book_to_author_keywords)
         
-        # 명확한 인물명 패턴이 없는 경우
-        clear_person_patterns = [
-            r'^[가-힣]{2,4}\s*(?:누구|알려줘|정보)',  # "한강 누구"
-            r'^[가-힣]{2,4}\s*작가'                   # "한강 작가"
-        ]
-        
-        has_clear_person = any(re.match(pattern, query_lower) for pattern in clear_person_patterns)
+        # 명확한 인물명 패턴("한강 누구", "한강 작가")이 없는 경우
+        has_clear_person = patterns.CLEAR_PERSON_QUERY.match(query_lower)
         
         return has_author_keyword and not has_clear_person
 
     @staticmethod
     def contains_author_name(query: str) -> bool:
         """쿼리에 작가명이 포함되어 있는지 판단."""
-        # 한글 이름 패턴 (2-4글자)
-        korean_name_pattern = r'[가-힣]{2,4}'
-        
-        # 영어 이름 패턴 (FirstName LastName)
-        english_name_pattern = r'[A-Za-z]+\s+[A-Za-z]+'
-        
-        return bool(re.search(korean_name_pattern, query) or 
-                   re.search(english_name_pattern, query))
+        # 한글 이름 패턴 (2-4글자) 또는 영어 이름 패턴 (FirstName LastName)
+        return bool(patterns.KOREAN_NAME.search(query) or
+                    patterns.ENGLISH_NAME.search(query))
 
     @staticmethod
     def contains_author_info(query: str) -> bool:
@@ -106,11 +90,11 @@ class WikiPatternMatcher:
     @staticmethod
     def generate_search_patterns(author_name: str) -> List[str]:
         """작가명에 대한 다양한 검색 패턴 생성."""
-        patterns = []
+        search_patterns = []
         
         if author_name:
             # 기본 패턴들
-            patterns.extend([
+            search_patterns.extend([
                 f"{author_name} (작가)",
                 f"{author_name} 작가",
                 f"{author_name} 소설가",
@@ -121,17 +105,17 @@ class WikiPatternMatcher:
             # 외국 작가인 경우 추가 패턴
             if any(char.isalpha() and ord(char) > 127 for char in author_name):
                 # 한글 표기가 있는 경우
-                patterns.append(f"{author_name} 한국어")
-                patterns.append(f"{author_name} 번역")
+                search_patterns.append(f"{author_name} 한국어")
+                search_patterns.append(f"{author_name} 번역")
             
             # 띄어쓰기가 있는 이름의 경우
             if ' ' in author_name:
                 # 띄어쓰기 제거 버전
                 no_space_name = author_name.replace(' ', '')
-                patterns.append(no_space_name)
-                patterns.append(f"{no_space_name} 작가")
+                search_patterns.append(no_space_name)
+                search_patterns.append(f"{no_space_name} 작가")
         
-        return patterns
+        return search_patterns
 
     @staticmethod
     def extract_context_keywords(query: str) -> List[str]:
@@ -159,44 +143,17 @@ class WikiPatternMatcher:
     @staticmethod
     def is_clarification_response(query: str) -> bool:
         """명확화 응답인지 판단."""
-        query_lower = query.lower().strip()
-        
-        # 숫자 선택 패턴
-        number_patterns = [
-            r'^\d+번?$',           # "1", "2번"
-            r'^\d+$',              # "1"
-            r'\d+번째',            # "2번째"
-            r'첫\s*번째',          # "첫번째"
-            r'두\s*번째',          # "두번째"
-        ]
-        
-        # 직접 언급 패턴
-        direct_patterns = [
-            r'[가-힣]{2,4}\s*말하는',      # "한강 말하는거야"
-            r'[가-힣]{2,4}\s*맞아',        # "한강 맞아"
-            r'[가-힣]{2,4}\s*이야',        # "한강이야"
-        ]
-        
-        all_patterns = number_patterns + direct_patterns
-        return any(re.search(pattern, query_lower) for pattern in all_patterns)
+        # 숫자 선택("2번", "첫번째") 또는 직접 언급("한강 맞아") 패턴
+        return patterns.CLARIFICATION_REPLY.search(query.lower().strip())
 
     @staticmethod
     def detect_question_type(query: str) -> str:
         """질문 유형 감지."""
-        query_lower = query.lower()
-        
-        # 질문 유형별 키워드 매핑
-        question_types = {
-            'who': ['누구', '누가', '어떤 사람', '인물'],
-            'where': ['어디', '어느', '장소'],
-            'when': ['언제', '몇년', '시기'],
-            'what': ['뭐', '무엇', '어떤'],
-            'how': ['어떻게', '방법'],
-            'why': ['왜', '이유', '때문']
-        }
+        hits = wiki_keywords.scan(query)
         
-        for q_type, keywords in question_types.items():
-            if any(keyword in query_lower for keyword in keywords):
+        # 질문 유형 우선순위: who → where → when → what → how → why
+        for q_type, category in wiki_keywords.QUESTION_WORDS:
+            if category in hits:
                 return q_type
         
         return 'general'
@@ -205,9 +162,9 @@ class WikiPatternMatcher:
     def has_person_name_pattern(query: str) -> bool:
         """인명 패턴이 있는지 확인."""
         # 한글 인명 패턴 (2-4글자)
-        korean_name = re.search(r'[가-힣]{2,4}', query)
+        korean_name = patterns.KOREAN_NAME.search(query)
         
         # 영어 인명 패턴
-        english_name = re.search(r'[A-Z][a-z]+\s+[A-Z][a-z]+', query)
+        english_name = patterns.ENGLISH_FULL_NAME.search(query)
         
         return bool(korean_name or english_name)
\ No newline at end of file
@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+위키피디아 검색 에이전트 - 정규식 패턴 모음
+위키 유틸리티/체인이 쓰는 정규식을 모듈 로드 시 한 번만 컴파일해 두는 레지스트리
+
+- Pattern: 컴파일된 정규식 + 매치에 꼭 필요한 리터럴 목록. 본문에 리터럴이 없으면 정규식을 돌리지 않음
+  (예: "사망" 문구 패턴은 본문에 "사망"이 없으면 부분 문자열 검사 한 번으로 끝남)
+- PatternList: 우선순위 순서로 시도하는 패턴 목록 (기존 for 루프와 결과가 같음)
+- AnyPattern: "하나라도 맞는지"만 보는 패턴 목록을 하나의 정규식으로 합친 것
+
+순서가 결과에 영향을 주는 목록(먼저 맞는 패턴이 이기는 경우)은 합치면 가장 왼쪽 매치가 이기게 되어
+결과가 달라지므로 PatternList로 두고, 참/거짓만 보는 목록만 AnyPattern으로 합침.
+"""
+
+import re
+from typing import Iterator, List, Optional, Tuple
+
+# 필요 리터럴 추출은 re의 내부 파서에 의존하므로, 모든 레지스트리 패턴이 실제 위키 페이지에서 re와 같은 결과를
+# 내는지 tests/unit/scripts/test_regex_benchmark.py에서 확인함 (파이썬 버전을 올리면 이 테스트부터 확인)
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover
+    import sre_parse as _sre_parse
+
+_REPEATS = tuple(
+    op for op in (getattr(_sre_parse, name, None) for name in ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT'))
+    if op is not None
+)
+
+
+def required_literals(pattern: str, flags: int = 0) -> Tuple[Tuple[str, ...], ...]:
+    """정규식이 매치하려면 본문에 있어야 하는 리터럴 조건들 (긴 것부터).
+
+    조건 하나는 후보 리터럴 튜플이고 그중 하나만 있으면 됨 ("저자|지은이" → ('저자', '지은이')).
+    리터럴이 아닌 선택지가 섞인 선택(|), 0회 이상 반복, 전후방 탐색 안의 리터럴은 없어도 매치될 수 있으므로 제외함.
+    대소문자 무시 구간에서는 대소문자 구분이 없는 문자(한글, 숫자, 기호 등)만 리터럴로 봄.
+    해석할 수 없는 패턴은 빈 튜플 (항상 정규식을 실행).
+    """
+    try:
+        parsed = _sre_parse.parse(pattern, flags)
+    except Exception:
+        return ()
+    literals = []
+    _collect_literals(parsed, literals, bool((flags | parsed.state.flags) & re.IGNORECASE))
+    return tuple(sorted(set(literals), key=lambda alternatives: min(map(len, alternatives)), reverse=True))
+
+
+def _caseless(char: str) -> bool:
+    return char.lower() == char == char.upper()
+
+
+def _literal_text(items, ignorecase: bool) -> Optional[str]:
+    """리터럴 문자로만 이루어진 시퀀스면 그 문자열, 아니면 None."""
+    chars = []
+    for op, av in items:
+        if op is not _sre_parse.LITERAL or (ignorecase and not _caseless(chr(av))):
+            return None
+        chars.append(chr(av))
+    return ''.join(chars) or None
+
+
+def _collect_literals(items, out: List[Tuple[str, ...]], ignorecase: bool):
+    run = []
+
+    def flush():
+        if run:
+            out.append((''.join(run),))
+            run.clear()
+
+    for op, av in items:
+        if op is _sre_parse.LITERAL and (not ignorecase or _caseless(chr(av))):
+            run.append(chr(av))
+            continue
+        flush()
+        if op is _sre_parse.SUBPATTERN:
+            _, add_flags, del_flags, sub = av
+            sub_ignorecase = (ignorecase or bool(add_flags & re.IGNORECASE)) and not del_flags & re.IGNORECASE
+            _collect_literals(sub, out, sub_ignorecase)
+        elif op in _REPEATS and av[0] >= 1:
+            _collect_literals(av[2], out, ignorecase)
+        elif op is _sre_parse.BRANCH:
+            alternatives = [_literal_text(branch, ignorecase) for branch in av[1]]
+            if all(alternatives):
+                out.append(tuple(alternatives))
+    flush()
+
+
+def _satisfied(literals: Tuple[Tuple[str, ...], ...], text: str) -> bool:
+    return all(any(literal in text for literal in alternatives) for alternatives in literals)
+
+
+class Pattern:
+    """컴파일된 정규식. 필요한 리터럴이 본문에 없으면 정규식을 실행하지 않고 바로 '매치 없음'을 반환."""
+
+    __slots__ = ('regex', 'literals')
+
+    def __init__(self, pattern: str, flags: int = 0):
+        self.regex = re.compile(pattern, flags)
+        self.literals = required_literals(pattern, flags)
+
+    @property
+    def pattern(self) -> str:
+        return self.regex.pattern
+
+    def possible(self, text: str) -> bool:
+        return _satisfied(self.literals, text)
+
+    def search(self, text: str) -> Optional[re.Match]:
+        return self.regex.search(text) if self.possible(text) else None
+
+    def match(self, text: str) -> Optional[re.Match]:
+        return self.regex.match(text) if self.possible(text) else None
+
+    def findall(self, text: str) -> list:
+        return self.regex.findall(text) if self.possible(text) else []
+
+    def sub(self, repl, text: str, count: int = 0) -> str:
+        return self.regex.sub(repl, text, count) if self.possible(text) else text
+
+
+class PatternList:
+    """우선순위 순서로 시도하는 패턴 목록."""
+
+    __slots__ = ('patterns',)
+
+    def __init__(self, *patterns, flags: int = 0):
+        self.patterns = tuple(p if isinstance(p, Pattern) else Pattern(p, flags) for p in patterns)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PatternList(*self.patterns[index])
+        return self.patterns[index]
+
+    def __iter__(self) -> Iterator[Pattern]:
+        return iter(self.patterns)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def searches(self, text: str) -> Iterator[re.Match]:
+        """패턴 순서대로 각 패턴의 첫 매치 (매치가 없는 패턴은 건너뜀)."""
+        for pattern in self.patterns:
+            found = pattern.search(text)
+            if found:
+                yield found
+
+    def first_search(self, text: str) -> Optional[re.Match]:
+        return next(self.searches(text), None)
+
+    def first_match(self, text: str) -> Optional[re.Match]:
+        """문자열 처음부터 맞는 첫 패턴의 매치."""
+        for pattern in self.patterns:
+            found = pattern.match(text)
+            if found:
+                return found
+        return None
+
+    def first_findall(self, text: str) -> list:
+        """findall 결과가 비어 있지 않은 첫 패턴의 결과."""
+        for pattern in self.patterns:
+            found = pattern.findall(text)
+            if found:
+                return found
+        return []
+
+    def findall(self, text: str) -> list:
+        """모든 패턴의 findall 결과를 패턴 순서대로 이어 붙인 목록."""
+        results = []
+        for pattern in self.patterns:
+            results.extend(pattern.findall(text))
+        return results
+
+
+class AnyPattern:
+    """여러 패턴 중 하나라도 맞는지를 하나로 합친 정규식 한 번으로 확인.
+
+    any(re.search(p, text) for p in patterns)와 결과가 같음 (match는 문자열 처음에서 같은 비교).
+    """
+
+    __slots__ = ('patterns', 'regex', 'literals')
+
+    def __init__(self, *patterns: str, flags: int = 0):
+        self.patterns = patterns
+        self.regex = re.compile('|'.join(f'(?:{p})' for p in patterns), flags)
+        self.literals = tuple(required_literals(p, flags) for p in patterns)
+
+    def possible(self, text: str) -> bool:
+        """리터럴 조건을 만족하는 패턴이 하나라도 있는지."""
+        return any(_satisfied(literals, text) for literals in self.literals)
+
+    def search(self, text: str) -> bool:
+        return self.possible(text) and self.regex.search(text) is not None
+
+    def match(self, text: str) -> bool:
+        return self.possible(text) and self.regex.match(text) is not None
+
+
+# ---------------------------------------------------------------------------
+# 공통
+# ---------------------------------------------------------------------------
+
+# 괄호와 그 안의 내용 ("한강 (소설가)" → "한강 ")
+PARENTHESIZED = Pattern(r'\([^)]*\)')
+PARENTHESIZED_LAZY = Pattern(r'\(.*?\)')
+
+# 작품명 괄호 《》 「」 『』
+WORK_TITLES = PatternList(
+    r'《([^》]+)》',
+    r'「([^」]+)」',
+    r'『([^』]+)』',
+)
+WORK_TITLE = WORK_TITLES[0]
+
+_OCCUPATIONS = r'(?:대지주|지주|의사|교사|상인|농부|선생|장관|사업가|관리|판사|변호사|목사|신부|스님)'
+
+# ---------------------------------------------------------------------------
+# 정보 추출 (WikiInformationExtractor)
+# ---------------------------------------------------------------------------
+
+UNIVERSITY = PatternList(
+    r'([가-힣]+(?:대학교|대학))\s*(?:졸업|진학|입학|재학)',
+    r'(?:졸업|진학|입학|재학)\s*(?:한|하신|했)\s*([가-힣]+(?:대학교|대학))',
+    r'([가-힣]+(?:대학교|대학))\s*[가-힣]*(?:과|학부)',
+    r'([가-힣]+(?:대학교|대학))\s*[가-힣]*(?:학과)',
+)
+
+BIRTH_DATE = PatternList(
+    r'(\d{4}년\s*\d{1,2}월\s*\d{1,2}일)',
+    r'(\d{4}\.\s*\d{1,2}\.\s*\d{1,2})',
+    r'(\d{4}년\s*[가-힣]+에서\s*태어)',
+)
+
+DEATH_DATE = PatternList(
+    r'~\s*(\d{4}년\s*\d{1,2}월\s*\d{1,2}일)',  # ~ YYYY년 MM월 DD일
+    r'(\d{4}년\s*\d{1,2}월\s*\d{1,2}일[^가-힣]*사망)',
+    r'(\d{4}\.\s*\d{1,2}\.\s*\d{1,2}[^가-힣]*사망)',
+    r'(사망:\s*\d{4}년\s*\d{1,2}월\s*\d{1,2}일)',
+)
+
+SCHOOL = PatternList(
+    r'([가-힣]+(?:고등학교|고교))\s*(?:졸업|재학)',
+    r'(?:졸업|재학).*?([가-힣]+(?:고등학교|고교))',
+    r'([가-힣]+(?:중학교|중학))\s*(?:졸업|재학)',
+    r'([가-힣]+(?:초등학교|국민학교))\s*(?:졸업|재학)',
+)
+
+AWARDS = PatternList(
+    r'([가-힣\s]+(?:상|賞|문학상|대상))\s*(?:수상|받)',
+    r'(?:수상|받).*?([가-힣\s]+(?:상|賞|문학상|대상))',
+)
+
+FATHER = PatternList(
+    r'아버지[는은이가]?\s*([가-힣]+)',
+    r'부친[는은이가]?\s*([가-힣]+)',
+    r'아버지.*?([가-힣]{2,4})\s*(?:씨|님|이다|였다)',
+)
+FATHER_DIRECT = FATHER[:2]  # "아버지는 이름" / "부친은 이름"만
+
+MOTHER = PatternList(
+    r'어머니[는은이가]?\s*([가-힣]+)',
+    r'모친[는은이가]?\s*([가-힣]+)',
+    r'어머니.*?([가-힣]{2,4})\s*(?:씨|님|이다|였다)',
+)
+MOTHER_DIRECT = MOTHER[:2]
+
+_NAME = r'([가-힣A-Za-z\s·\-]{2,20})'
+SPOUSE = PatternList(
+    rf'배우자\s*[는은이가]?\s*{_NAME}',  # "배우자는 홍길동"
+    rf'아내\s*[는은이가]?\s*{_NAME}',    # "아내는 김영희"
+    rf'남편\s*[는은이가]?\s*{_NAME}',    # "남편은 박철수"
+    rf'부인\s*[는은이가]?\s*{_NAME}',    # "부인은 이순희"
+    rf'처\s*[는은이가]?\s*{_NAME}',      # "처는 최명자"
+    rf'와\s*결혼한\s*{_NAME}',           # "와 결혼한 김민수"
+    rf'{_NAME}\s*와\s*결혼',             # "홍길동과 결혼"
+    rf'{_NAME}\s*\(\d{{4}}년\s*~',       # "쓰시마 미치코 (1938년 ~" 형태
+)
+
+# "아버지 A와 어머니 B 사이에서 태어났다" 등 부모를 함께 언급하는 문장 (우선순위 순)
+PARENTS = PatternList(
+    r'아버지\s*([가-힣A-Za-z\s·\-]{2,30}?)\s*(?:와|과)\s*어머니\s*([가-힣A-Za-z\s·\-]{2,30}?)\s*사이에서\s*태어났다',
+    r'아버지\s*([가-힣A-Za-z\s·\-]{2,30}?)\s*(?:와|과)\s*어머니\s*([가-힣A-Za-z\s·\-]{2,30}?)\s*의?\s*아들',
+    r'아버지\s*([가-힣A-Za-z\s·\-]{2,30}?)\s*(?:와|과)\s*어머니\s*([가-힣A-Za-z\s·\-]{2,30}?)\s*의?\s*딸',
+    r'부친\s*([가-힣A-Za-z\s·\-]{2,30}?)\s*(?:와|과)\s*모친\s*([가-힣A-Za-z\s·\-]{2,30}?)',
+    # 일반적인 패턴: "A와 B 사이에서 태어났다" (직업/수식어 포함)
+    _OCCUPATIONS + r'\s+([가-힣A-Za-z\s·\-\(\)]{3,30}?)\s*(?:와|과)\s*([가-힣A-Za-z\s·\-\(\)]{2,20}?)\s*사이에서\s*태어났다',
+)
+OCCUPATION_PREFIX = Pattern(r'^' + _OCCUPATIONS + r'\s*')
+
+CHILD_OF = PatternList(
+    r'(?:소설가|작가|시인)\s+([가-힣A-Za-z\s·\-]{2,15})\s*의\s+(딸|아들)',
+    r'([가-힣A-Za-z\s·\-]{2,15})\s*의\s+(딸|아들)',
+    r'([가-힣A-Za-z\s·\-]{2,15})\s*의\s+(차녀|장녀|차남|장남)',  # 일본식 표현
+)
+
+SIBLING_OF = PatternList(
+    r'([가-힣A-Za-z\s·\-]{2,15})\s*의\s+(동생|형|누나|언니|오빠|여동생|남동생)',
+    r'([가-힣A-Za-z\s·\-]{2,15})(?:과|와)\s*([가-힣A-Za-z\s·\-]{2,15})\s*의\s+(딸|아들|차녀|장녀)',  # "A와 B의 딸" 형태만 허용
+)
+
+WRITER_PREFIX = Pattern(r'^(소설가|작가|시인)\s*')
+ORIGIN_PREFIX = Pattern(r'^(에서|에게서|출신|태어난)\s*')
+
+# "아버지는 이름" / "아버지 이름이다" 형태만 (추측 금지)
+FATHER_EXPLICIT = PatternList(
+    r'아버지는\s+([가-힣A-Za-z·\-]{2,10})(?=\s|$|,|\.)',          # "아버지는 한승원"
+    r'아버지\s+([가-힣A-Za-z·\-]{2,10})(?=이다|였다|입니다|이었다)',  # "아버지 한승원이다"
+    r'부친은\s+([가-힣A-Za-z·\-]{2,10})(?=\s|$|,|\.)',            # "부친은 한승원"
+    r'부친\s+([가-힣A-Za-z·\-]{2,10})(?=이다|였다|입니다|이었다)',    # "부친 한승원이다"
+)
+
+MOTHER_EXPLICIT = PatternList(
+    r'어머니는\s+([가-힣A-Za-z·\-]{2,10})(?=\s|$|,|\.)',                # "어머니는 이름"
+    r'어머니\s+([가-힣A-Za-z·\-]{2,10})(?=이다|였다|입니다|이었다|님|씨)',  # "어머니 이름이다"
+    r'모친은\s+([가-힣A-Za-z·\-]{2,10})(?=\s|$|,|\.)',                  # "모친은 이름"
+    r'모친\s+([가-힣A-Za-z·\-]{2,10})(?=이다|였다|입니다|이었다|님|씨)',    # "모친 이름이다"
+)
+
+# "A와 B에 대해 각각 알려줘" 같은 복합 질문
+COMPOUND_QUERY = PatternList(
+    r'([가-힣A-Za-z\s]{2,10})(?:와|과)\s*([가-힣A-Za-z\s]{2,10})(?:에)?\s*대해\s*(?:각각\s*)?(?:알려|말해|설명)',
+    r'([가-힣A-Za-z\s]{2,10})(?:,|,)\s*([가-힣A-Za-z\s]{2,10})\s*(?:에)?\s*대해\s*(?:각각\s*)?(?:알려|말해|설명)',
+    r'([가-힣A-Za-z\s]{2,10})(?:와|과)\s*([가-힣A-Za-z\s]{2,10})\s*(?:각각\s*)?(?:정보|소개)',
+)
+
+# ---------------------------------------------------------------------------
+# 질문 패턴 (WikiPatternMatcher / WikiTextProcessor)
+# ---------------------------------------------------------------------------
+
+NEW_AUTHOR_QUERY = AnyPattern(
+    r'[가-힣]{2,4}\s*(?:작가|소설가|시인)',  # "한강 작가"
+    r'[가-힣]{2,4}\s*(?:누구|알려줘)',       # "한강 누구"
+    r'[가-힣]{2,4}\s*(?:정보|소개)',         # "한강 정보"
+)
+
+CLEAR_PERSON_QUERY = AnyPattern(
+    r'^[가-힣]{2,4}\s*(?:누구|알려줘|정보)',  # "한강 누구"
+    r'^[가-힣]{2,4}\s*작가',                  # "한강 작가"
+)
+
+KOREAN_NAME = Pattern(r'[가-힣]{2,4}')
+ENGLISH_NAME = Pattern(r'[A-Za-z]+\s+[A-Za-z]+')
+ENGLISH_FULL_NAME = Pattern(r'[A-Z][a-z]+\s+[A-Z][a-z]+')
+
+CLARIFICATION_REPLY = AnyPattern(
+    r'^\d+번?$',           # "1", "2번"
+    r'^\d+$',              # "1"
+    r'\d+번째',            # "2번째"
+    r'첫\s*번째',          # "첫번째"
+    r'두\s*번째',          # "두번째"
+    r'[가-힣]{2,4}\s*말하는',      # "한강 말하는거야"
+    r'[가-힣]{2,4}\s*맞아',        # "한강 맞아"
+    r'[가-힣]{2,4}\s*이야',        # "한강이야"
+)
+
+WHO_QUERY_NAME = PatternList(
+    r'^([가-힣]{2,4})가\s*누구',     # "한강가 누구" - "가" 조사
+    r'^([가-힣]{2,4})이\s*누구',     # "한강이 누구" - "이" 조사
+    r'^([가-힣]{2,4})\s+누구',       # "한강 누구" - 조사 없음
+)
+
+FOREIGN_NAME = PatternList(
+    r'^([A-Za-z]+\s+[A-Za-z]+)',  # "무라카미 하루키"
+    r'^([가-힣]+\s+[가-힣]+)',    # "무라카미 하루키" (한글 표기)
+)
+
+KOREAN_NAME_PREFIX = Pattern(r'^([가-힣]{2,4})')
+
+CLARIFICATION_NUMBER = PatternList(
+    r'^(\d+)번?$',           # "1", "2번"
+    r'^(\d+)$',              # "1"
+    r'(\d+)번째',            # "2번째"
+    r'첫\s*번째',            # "첫번째"
+    r'두\s*번째',            # "두번째"
+    r'세\s*번째',            # "세번째"
+)
+
+CLARIFICATION_DIRECT = PatternList(
+    r'([가-힣]{2,4})\s*말하는',      # "한강 말하는거야"
+    r'([가-힣]{2,4})\s*맞아',        # "한강 맞아"
+    r'([가-힣]{2,4})\s*이야',        # "한강이야"
+    r'([가-힣]{2,4})\s*요',          # "한강요"
+)
+
+CONTEXT_QUESTION_NAME = PatternList(
+    r'^([가-힣]{2,4})(?:은|는|이|가)?\s*(?:어디|언제|몇|어떤)',  # "이말년은 어디"
+    r'^([가-힣]{2,4})\s+(?:대학|고등학교|출생|나이)',        # "이말년 대학"
+)
+
+# ---------------------------------------------------------------------------
+# 위키 검색 체인 (WikiSearchChain)
+# ---------------------------------------------------------------------------
+
+KOREAN_NAME_PHRASE = Pattern(r'([가-힣]{2,5}(?:\s[가-힣]{2,5})*)')
+ENGLISH_NAME_PHRASE = Pattern(r'[A-Za-z]{2,}(?:\s[A-Za-z\.]{1,})*')
+CONTAINS_NAME = Pattern(r'([가-힣]{2,}(\s[가-힣]{2,})*|[A-Za-z]{2,}(\s[A-Za-z\.]{1,})*)')
+
+WHO_IS_QUESTION = Pattern(r'[가-힣A-Za-z\s]+[이은는]\s*(누구|뭔데|누군데|어떤|무엇)')
+
+AUTHOR_IN_QUERY = PatternList(
+    r'([가-힣]{2,5}(?:\s[가-힣]{2,5})*)\s*(?:의|이|가|은|는)?\s*(?:출생|사망|태어|죽었|나이|대학|학교|아버지|어머니|부모|가족)',
+    r'([가-힣]{2,5}(?:\s[가-힣]{2,5})*)\s*작가',
+    r'([가-힣]{2,5}(?:\s[가-힣]{2,5})*)\s*소설가',
+    # 일본 작가
+    r'(다자이\s*오사무|무라카미\s*하루키|요시모토\s*바나나)',
+    r'([가-힣]{2,3}\s+[가-힣]{2,3})',
+)
+
+UNIVERSITY_FALLBACK = PatternList(
+    r'([가-힣]+대학교?)\s*(?:졸업|진학|입학)',
+    r'(?:졸업|진학|입학).*?([가-힣]+대학교?)',
+)
+
+BIRTH_DATE_OR_YEAR = PatternList(
+    r'(\d{4}년\s*\d{1,2}월\s*\d{1,2}일)',
+    r'(\d{4}\.\s*\d{1,2}\.\s*\d{1,2})',
+    r'(\d{4}년)',
+)
+
+DEATH_PHRASES = PatternList(
+    r'~\s*(\d{4}년)',
+    r'(\d{4}년 \d{1,2}월 \d{1,2}일)에 사망',
+    r'사망일은 (\d{4}년 \d{1,2}월 \d{1,2}일)',
+    r'(\d{4}년 \d{1,2}월 \d{1,2}일) 세상을 떠났다',
+    r'(\d{4}년)에 사망',
+)
+
+HIGH_SCHOOL = PatternList(
+    r'([가-힣]+고등학교)\s*(?:졸업|진학|입학)',
+    r'(?:졸업|진학|입학).*?([가-힣]+고등학교)',
+)
+
+AWARD_PHRASES = PatternList(
+    r'([가-힣\s]+(?:상|문학상|예술상|대상))[을를]?\s*(?:수상|받았)',
+    r'(\d{4}년)\s*([가-힣\s]+(?:상|문학상|예술상|대상))',
+)
+
+WORK_PAGE_AUTHOR = PatternList(
+    r'저자[:\s]*([가-힣A-Za-z\s]+)',
+    r'작가[:\s]*([가-힣A-Za-z\s]+)',
+    r'([가-힣A-Za-z\s]+)의\s*\d+년\s*[가-힣]*\s*소설',
+    r'([가-힣A-Za-z\s]+)이\s*집필한',
+    r'([가-힣A-Za-z\s]+)이\s*쓴',
+)
+
+BOOK_TO_AUTHOR_QUERY = AnyPattern(
+    r'.+\s+작가\s*(?:가|는|을|를)?\s*(?:누구|뭐)',
+    r'.+(?:을|를|은)?\s*(?:누가|누구가)\s*(?:쓴|썼)',
+    r'.+(?:을|를)?\s*쓴\s+(?:작가|사람)\s*(?:은|는|가|를)?\s*(?:누구|뭐)',
+    r'.+\s+쓴\s+(?:작가|사람)\s*(?:누구|뭐)',
+    r'.+\s+(?:저자|지은이)\s*(?:가|는|을|를)?\s*(?:누구|뭐)',
+    flags=re.IGNORECASE,
+)
+
+BOOK_TITLE_IN_QUERY = PatternList(
+    r'(.+?)(?:을|를|은)?\s*(?:누가|누구가)\s*(?:쓴|썼)',
+    r'(.+?)(?:을|를)?\s*쓴\s+(?:작가|사람)\s*(?:은|는|가|를)?\s*(?:누구|뭐)',
+    r'(.+?)\s+쓴\s+(?:작가|사람)\s*(?:가|는|을|를)?\s*(?:누구|뭐)',
+    r'(.+?)\s+(?:저자|지은이)\s*(?:가|는|을|를)?\s*(?:누구|뭐)',
+    r'(.+?)\s+작가\s*(?:가|는|을|를)?\s*(?:누구|뭐)',
+    flags=re.IGNORECASE,
+)
+
+TRAILING_PARTICLE = Pattern(r'[은는이가을를의]$')
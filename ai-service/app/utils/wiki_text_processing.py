@@ -6,10 +6,11 @@
 작가명 추출, 텍스트 파싱 등 텍스트 처리 관련 유틸리티 함수들
 """
 
-import re
 import json
 from typing import Optional, List
 
+from . import wiki_patterns as patterns
+
 
 class WikiTextProcessor:
     """텍스트 처리 관련 유틸리티 클래스"""
@@ -59,31 +60,18 @@ JSON 형식으로 응답:
         """폴백용 작가명 추출."""
         
         # 1단계: "X가/이 누구야" 패턴 우선 처리 - 조사를 명확히 분리
-        who_patterns = [
-            r'^([가-힣]{2,4})가\s*누구',     # "한강가 누구" - "가" 조사
-            r'^([가-힣]{2,4})이\s*누구',     # "한강이 누구" - "이" 조사  
-            r'^([가-힣]{2,4})\s+누구',       # "한강 누구" - 조사 없음
-        ]
-        
-        for pattern in who_patterns:
-            match = re.match(pattern, query.strip())
-            if match:
-                return match.group(1)
+        match = patterns.WHO_QUERY_NAME.first_match(query.strip())
+        if match:
+            return match.group(1)
         
         # 2단계: 외국 이름 우선 추출 (띄어쓰기 포함)
-        foreign_patterns = [
-            r'^([A-Za-z]+\s+[A-Za-z]+)',  # "무라카미 하루키"
-            r'^([가-힣]+\s+[가-힣]+)',    # "무라카미 하루키" (한글 표기)
-        ]
-        
-        for pattern in foreign_patterns:
-            match = re.match(pattern, query.strip())
-            if match:
-                return match.group(1).strip()
+        match = patterns.FOREIGN_NAME.first_match(query.strip())
+        if match:
+            return match.group(1).strip()
         
         # 3단계: 한글 이름 (2-4글자) - 질문 단어가 없는 경우만
         if not any(word in query for word in ['누구', '뭐', '어떤', '언제', '어디', '알려줘']):
-            korean_match = re.match(r'^([가-힣]{2,4})', query.strip())
+            korean_match = patterns.KOREAN_NAME_PREFIX.match(query.strip())
             if korean_match:
                 return korean_match.group(1)
         
@@ -113,67 +101,35 @@ JSON 형식으로 응답:
     @staticmethod
     def parse_clarification_response(query: str, context) -> Optional[str]:
         """명확화 응답을 파싱하여 작가명을 추출."""
-        import re
-        
         # 숫자 선택 패턴 (예: "1", "2번", "첫번째")
-        number_patterns = [
-            r'^(\d+)번?$',           # "1", "2번"
-            r'^(\d+)$',              # "1"
-            r'(\d+)번째',            # "2번째"
-            r'첫\s*번째',            # "첫번째"
-            r'두\s*번째',            # "두번째"  
-            r'세\s*번째',            # "세번째"
-        ]
-        
-        for pattern in number_patterns:
-            match = re.search(pattern, query.strip())
-            if match:
-                if '첫' in query:
-                    choice_num = 1
-                elif '두' in query:
-                    choice_num = 2
-                elif '세' in query:
-                    choice_num = 3
-                else:
-                    choice_num = int(match.group(1))
-                
-                # context에서 해당하는 작가명 선택
-                candidates = context.get('clarification_candidates', [])
-                if 1 <= choice_num <= len(candidates):
-                    return candidates[choice_num - 1]
+        for match in patterns.CLARIFICATION_NUMBER.searches(query.strip()):
+            if '첫' in query:
+                choice_num = 1
+            elif '두' in query:
+                choice_num = 2
+            elif '세' in query:
+                choice_num = 3
+            else:
+                choice_num = int(match.group(1))
+            
+            # context에서 해당하는 작가명 선택
+            candidates = context.get('clarification_candidates', [])
+            if 1 <= choice_num <= len(candidates):
+                return candidates[choice_num - 1]
         
         # 직접 작가명 언급 (예: "한강 말하는거야")
-        direct_patterns = [
-            r'([가-힣]{2,4})\s*말하는',      # "한강 말하는거야"
-            r'([가-힣]{2,4})\s*맞아',        # "한강 맞아"
-            r'([가-힣]{2,4})\s*이야',        # "한강이야"
-            r'([가-힣]{2,4})\s*요',          # "한강요"
-        ]
-        
-        for pattern in direct_patterns:
-            match = re.search(pattern, query)
-            if match:
-                return match.group(1)
+        match = patterns.CLARIFICATION_DIRECT.first_search(query)
+        if match:
+            return match.group(1)
         
         return None
 
     @staticmethod
     def extract_author_from_context_question(query: str) -> Optional[str]:
         """컨텍스트 질문에서 작가명을 추출."""
-        import re
-        
         # "이말년은 어디 대학" 같은 패턴
-        context_patterns = [
-            r'^([가-힣]{2,4})(?:은|는|이|가)?\s*(?:어디|언제|몇|어떤)',  # "이말년은 어디"
-            r'^([가-힣]{2,4})\s+(?:대학|고등학교|출생|나이)',        # "이말년 대학"
-        ]
-        
-        for pattern in context_patterns:
-            match = re.match(pattern, query.strip())
-            if match:
-                return match.group(1)
-        
-        return None
+        match = patterns.CONTEXT_QUESTION_NAME.first_match(query.strip())
+        return match.group(1) if match else None
 
     @staticmethod
     def extract_book_title_from_query(query: str) -> str:
@@ -203,12 +159,10 @@ JSON 형식으로 응답:
     @staticmethod
     def _handle_conjunction_in_title(title: str) -> str:
         """책 제목의 접속사 처리."""
-        import re
-        
         # "그리고" 패턴 처리
         if '그리고' in title:
             # "A 그리고 B" -> "A와 B" 또는 "A, B"로 정규화
-            title = re.sub(r'그리고', '와', title)
+            title = title.replace('그리고', '와')
         
         # 기타 접속사 처리
         conjunctions = {
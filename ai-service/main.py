@@ -1,23 +1,22 @@
 from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 from pydantic import BaseModel
 from dotenv import load_dotenv
-import uvicorn
-import sys
-import os
-
-# 경로 설정
-# current_dir = os.path.dirname(os.path.abspath(__file__))
-# agents_dir = os.path.join(current_dir, 'app', 'agents')
-# sys.path.insert(0, agents_dir)
-#
-# from wiki_search_agent import WikiSearchAgent
-current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, os.path.join(current_dir, "app"))
-
-# ✨ main_agent import
-from main_agent.main_agent import run_main_agent
+import asyncio
+import importlib
+import json
+
+# app/ 아래 모듈은 모두 app 패키지 기준 절대 경로로 import (sys.path를 바꾸지 않음)
+# main_agent는 langchain_core(프롬프트/Runnable/도구)를 불러와 import 비용이 크므로 워커 시작 시에는 불러오지 않고
+# warm-up 스레드(또는 그보다 먼저 들어온 첫 요청)에서 불러옴
+from app.config.settings import (
+    SESSION_STORE_BACKEND, SESSION_TTL_SECONDS, SESSION_MAX_SESSIONS, SESSION_MAX_HISTORY, REDIS_URL
+)
+from app.utils.session_store import create_session_store, new_session
+from app.config import llm
+from app.tools.wiki_search_tool import close_http_client
 
 load_dotenv()
 
@@ -45,6 +44,31 @@ app.add_middleware(
 # WikiSearchAgent 초기화
 #wiki_agent = WikiSearchAgent()
 
+# 세션 저장소 (대화 기록, 현재 에이전트, 위키 컨텍스트)
+session_store = create_session_store(
+    backend=SESSION_STORE_BACKEND,
+    ttl=SESSION_TTL_SECONDS,
+    maxsize=SESSION_MAX_SESSIONS,
+    max_history=SESSION_MAX_HISTORY,
+    redis_url=REDIS_URL
+)
+
+@app.on_event("startup")
+async def warm_up_shared_resources():
+    # LLM 클라이언트/벡터스토어/검색 색인은 처음 쓸 때 만들어지므로, 서버는 바로 요청을 받고
+    # 백그라운드 스레드에서 미리 만들어 둠 (진행 상황은 /ready로 확인)
+    app.state.warm_up_task = asyncio.create_task(asyncio.to_thread(_warm_up))
+
+def _warm_up():
+    importlib.import_module("app.main_agent.main_agent")
+    return llm.warm_up()
+
+@app.on_event("shutdown")
+async def close_shared_resources():
+    # 위키피디아 검색용 공유 커넥션 풀 및 세션 저장소 연결 정리
+    close_http_client()
+    await session_store.close()
+
 class ChatRequest(BaseModel):
     message: str
 
@@ -56,62 +80,62 @@ async def root():
 async def health():
     return {"status": "healthy", "message": "AI Service is running"}
 
+@app.get("/ready")
+async def ready():
+    # /health는 프로세스 생존 여부, /ready는 공유 객체 초기화 완료 여부 (미완료면 503)
+    status = llm.readiness()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
+
+def _get_session_id(http_request: Request) -> str:
+    # 세션 ID를 헤더에서 가져오거나 생성
+    session_id = http_request.headers.get("X-Session-ID")
+    if not session_id:
+        import uuid
+        session_id = str(uuid.uuid4())
+    return session_id
+
+async def _run_chat_turn(message: str, session_id: str, on_token=None) -> dict:
+    """한 턴을 처리하고 API 응답 형태의 딕셔너리를 반환 (일반/스트리밍 엔드포인트 공용)"""
+    if message.lower() in ['quit', 'exit', '종료', '나가기']:
+        await session_store.delete(session_id)
+        return {
+            "response": "대화를 종료하고 모든 대화 내역을 삭제했습니다.",
+            "success": True,
+            "session_id": session_id,
+            "clarification_needed": False,
+            "query": {},
+            "intent": "exit"
+        }
+
+    session = await session_store.get(session_id) or new_session()
+    
+    print(f"세션 ID: {session_id}")
+    print(f"세션 전 상태: {session}")
+        
+    from app.main_agent.main_agent import arun_main_agent
+    result = await arun_main_agent(message, session, on_token=on_token)
+    await session_store.set(session_id, session)
+    
+    print(f"세션 후 상태: {session}")
+
+    # ✅ 수정: clarification과 response 둘 다 처리
+    response_text = result.get("response", "") or result.get("message", "")
+    
+    return {
+        "response": response_text,
+        "success": True,
+        "session_id": session_id,  # 세션 ID 반환
+        "clarification_needed": result.get("clarification_needed", False),
+        "query": result.get("query", {}),
+        "intent": result.get("intent", "")
+    }
+
 @app.post("/api/chat")
 async def chat(request: ChatRequest, http_request: Request):
     try:
         # WikiSearchAgent를 통해 처리
         # result = wiki_agent.process(request.message)
-        # 세션 ID를 헤더에서 가져오거나 생성
-        session_id = http_request.headers.get("X-Session-ID")
-        if not session_id:
-            import uuid
-            session_id = str(uuid.uuid4())
-        
-        # 전역 세션 및 에이전트 인스턴스 딕셔너리 생성
-        if not hasattr(chat, 'sessions'):
-            chat.sessions = {}
-        if not hasattr(chat, 'agent_instances'):
-            chat.agent_instances = {}
-        
-        if session_id not in chat.sessions:
-            chat.sessions[session_id] = {
-                "conversation_history": [],
-                "current_agent": None
-            }
-            chat.agent_instances[session_id] = {} # 새 세션을 위한 에이전트 인스턴스 딕셔너리
-        
-        if request.message.lower() in ['quit', 'exit', '종료', '나가기']:
-            if session_id in chat.sessions:
-                del chat.sessions[session_id]
-            if session_id in chat.agent_instances:
-                del chat.agent_instances[session_id]
-            return {
-                "response": "대화를 종료하고 모든 대화 내역을 삭제했습니다.",
-                "success": True,
-                "session_id": session_id,
-                "clarification_needed": False,
-                "query": {},
-                "intent": "exit"
-            }
-        
-        print(f"세션 ID: {session_id}")
-        print(f"세션 전 상태: {chat.sessions[session_id]}")
-            
-        result = run_main_agent(request.message, chat.sessions[session_id], chat.agent_instances[session_id])
-        
-        print(f"세션 후 상태: {chat.sessions[session_id]}")
-
-        # ✅ 수정: clarification과 response 둘 다 처리
-        response_text = result.get("response", "") or result.get("message", "")
-        
-        return {
-            "response": response_text,
-            "success": True,
-            "session_id": session_id,  # 세션 ID 반환
-            "clarification_needed": result.get("clarification_needed", False),
-            "query": result.get("query", {}),
-            "intent": result.get("intent", "")
-        }
+        return await _run_chat_turn(request.message, _get_session_id(http_request))
 
         # 우선 출력 형태를 맞추기 위해서 조건문은 주석처리
         # if result.get('success', True):
@@ -122,5 +146,51 @@ async def chat(request: ChatRequest, http_request: Request):
     except Exception as e:
         return {"response": f"AI 서비스 연결에 실패했습니다: {str(e)}", "success": False}
 
+def _sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+@app.post("/api/chat/stream")
+async def chat_stream(request: ChatRequest, http_request: Request):
+    """SSE 스트리밍 채팅.
+
+    - event: token  data: {"text": "..."}  → LLM 답변 조각 (추천 답변은 ISBN 링크가 줄 단위로 삽입됨)
+    - event: done   data: /api/chat과 같은 응답 → 최종 답변 (클라이언트는 이 값으로 화면을 확정)
+    """
+    session_id = _get_session_id(http_request)
+    loop = asyncio.get_running_loop()
+    events = asyncio.Queue()
+
+    def on_token(text: str):
+        # 위키 체인은 작업 스레드에서 호출하므로 이벤트 루프로 안전하게 전달
+        loop.call_soon_threadsafe(events.put_nowait, ("token", {"text": text}))
+
+    async def run_turn():
+        try:
+            payload = await _run_chat_turn(request.message, session_id, on_token=on_token)
+        except Exception as e:
+            payload = {"response": f"AI 서비스 연결에 실패했습니다: {str(e)}", "success": False, "session_id": session_id}
+        # 작업 스레드에서 예약된 토큰 이벤트 뒤에 오도록 같은 경로로 전달
+        loop.call_soon_threadsafe(events.put_nowait, ("done", payload))
+
+    async def event_stream():
+        task = asyncio.create_task(run_turn())
+        try:
+            while True:
+                event, data = await events.get()
+                yield _sse_event(event, data)
+                if event == "done":
+                    break
+        finally:
+            # 클라이언트가 연결을 끊으면 진행 중인 턴을 취소
+            if not task.done():
+                task.cancel()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "X-Session-ID": session_id}
+    )
+
 if __name__ == "__main__":
+    import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=False)
\ No newline at end of file
@@ -0,0 +1,106 @@
+"""
+import_profile.py
+서버 모듈(main)의 import 시간을 `python -X importtime`으로 측정하고 예산을 넘는지 확인하는 벤치마크
+
+- 새 인터프리터에서 import만 실행하므로 uvicorn 워커 하나가 뜰 때 드는 import 비용과 같음
+- 누적 시간 상위 모듈을 보고서로 출력 (--report로 원본 importtime 로그 저장)
+- 예산(--budget-ms)을 넘거나, 첫 요청 전까지 미뤄야 하는 무거운 모듈이 import되면 종료 코드 1
+
+실행 방법 (ai-service 디렉터리에서 모듈로 실행해야 app 패키지를 찾음):
+    cd ai-service
+    python -m scripts.import_profile
+    python -m scripts.import_profile --budget-ms 1500 --top 30 --report /tmp/importtime.log
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+SERVICE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# import 시점에 불러오면 안 되는 모듈 (LLM/벡터스토어를 처음 만들 때 불러옴)
+DEFERRED_MODULES = (
+    "langchain_openai",
+    "langchain_chroma",
+    "chromadb",
+    "openai",
+    "langchain_community",
+    "sentence_transformers",
+    "torch",
+    "humanfriendly",
+    # 에이전트/체인/프롬프트 (warm-up 스레드에서 main_agent와 함께 불러옴)
+    "langchain_core.prompts",
+    "app.main_agent.main_agent",
+)
+
+# 로컬 측정값은 약 0.5초 (fastapi가 절반). 디스크 캐시가 비었거나 느린 CI 머신에서도 통과하도록 약 3배 여유를 둠
+DEFAULT_BUDGET_MS = 1500.0
+
+# "import time:      self [us] |  cumulative | imported package"
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_importtime(log: str) -> List[Tuple[str, float, float, int]]:
+    """importtime 로그 → (모듈, self ms, 누적 ms, 깊이) 목록."""
+    entries = []
+    for line in log.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((module, int(self_us) / 1000, int(cumulative_us) / 1000, (len(indent) - 1) // 2))
+    return entries
+
+
+def profile(module: str = "main") -> Tuple[float, Dict[str, float], List[Tuple[str, float, float, int]], str]:
+    """새 인터프리터에서 module을 import하고 (전체 ms, 최상위 모듈별 누적 ms, 전체 항목, 원본 로그)를 반환."""
+    env = dict(os.environ)
+    # API 키가 없어도 import는 성공해야 하므로 키를 지운 상태로 측정
+    env.pop("OPENAI_API_KEY", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SERVICE_ROOT, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        tail = "\n".join(result.stderr.splitlines()[-5:])
+        raise RuntimeError(f"{module} import 실패:\n{tail}")
+    entries = parse_importtime(result.stderr)
+    top_level = {name: cumulative for name, _, cumulative, depth in entries if depth == 0}
+    return sum(top_level.values()), top_level, entries, result.stderr
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="ai-service import 시간 측정")
+    parser.add_argument("--module", default="main", help="측정할 모듈 (기본: main)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="전체 import 시간 예산(ms)")
+    parser.add_argument("--top", type=int, default=20, help="출력할 누적 시간 상위 모듈 수")
+    parser.add_argument("--report", help="원본 importtime 로그를 저장할 경로")
+    args = parser.parse_args(argv)
+
+    total_ms, _, entries, log = profile(args.module)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            f.write(log)
+
+    print(f"📦 {args.module} import: {total_ms:.0f}ms (예산 {args.budget_ms:.0f}ms), 모듈 {len(entries)}개")
+    print(f"{'누적(ms)':>10} {'self(ms)':>10}  모듈")
+    for name, self_ms, cumulative_ms, depth in sorted(entries, key=lambda e: e[2], reverse=True)[:args.top]:
+        print(f"{cumulative_ms:>10.1f} {self_ms:>10.1f}  {'  ' * depth}{name}")
+
+    loaded = {name for name, _, _, _ in entries}
+    deferred = [name for name in DEFERRED_MODULES if name in loaded]
+    ok = True
+    if deferred:
+        print(f"❌ import 시점에 불러온 무거운 모듈: {', '.join(deferred)}")
+        ok = False
+    if total_ms > args.budget_ms:
+        print(f"❌ import 시간 예산 초과: {total_ms:.0f}ms > {args.budget_ms:.0f}ms")
+        ok = False
+    if ok:
+        print("✅ import 예산 통과")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""
+regex_benchmark.py
+위키 유틸리티 정규식 레지스트리(app.utils.wiki_patterns)와 기존 방식(호출마다 re.findall/re.search)을 비교하는 벤치마크
+
+- 레지스트리의 모든 패턴을 같은 본문에 대해 두 방식으로 실행하고 패턴별 µs와 배율을 출력
+- 두 방식의 결과가 하나라도 다르면 종료 코드 1 (리터럴 검사로 건너뛴 패턴이 실제로 매치되는 경우 등)
+- 본문은 --corpus 디렉터리의 *.txt, --cache(또는 WIKI_CACHE_PATH) sqlite 페이지 캐시,
+  없으면 저장소의 위키 페이지 픽스처(tests/fixtures/wiki_pages) 순으로 사용
+
+실행 방법 (ai-service 디렉터리에서 모듈로 실행해야 app 패키지를 찾음):
+    cd ai-service
+    python -m scripts.regex_benchmark
+    python -m scripts.regex_benchmark --corpus ./pages --repeat 20 --top 15
+    python -m scripts.regex_benchmark --cache /var/cache/wiki_pages.sqlite3
+"""
+import argparse
+import glob
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+import zlib
+from typing import Callable, List, Tuple
+
+SERVICE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils import wiki_patterns
+from app.utils.wiki_patterns import AnyPattern, Pattern, PatternList
+
+# 기본 본문: 실제 위키백과 문서를 발췌한 픽스처
+DEFAULT_CORPUS_DIR = os.path.join(SERVICE_ROOT, "tests", "fixtures", "wiki_pages")
+
+
+def _read_texts(corpus_dir: str) -> List[str]:
+    texts = []
+    for path in sorted(glob.glob(os.path.join(corpus_dir, "*.txt"))):
+        with open(path, encoding="utf-8") as f:
+            texts.append(f.read())
+    return texts
+
+
+def load_corpus(corpus_dir: str = None, cache_path: str = None) -> List[str]:
+    """벤치마크 본문 목록. 디렉터리 → 페이지 캐시 → 위키 페이지 픽스처 순으로 먼저 찾은 것을 사용."""
+    if corpus_dir:
+        texts = _read_texts(corpus_dir)
+        if texts:
+            return texts
+    if cache_path and os.path.exists(cache_path):
+        conn = sqlite3.connect(cache_path)
+        try:
+            rows = conn.execute("SELECT payload FROM pages").fetchall()
+        except sqlite3.Error:
+            rows = []
+        finally:
+            conn.close()
+        texts = []
+        for (payload,) in rows:
+            record = json.loads(zlib.decompress(payload).decode("utf-8"))
+            text = record.get("text") or record.get("summary")
+            if text:
+                texts.append(text)
+        if texts:
+            return texts
+    return _read_texts(DEFAULT_CORPUS_DIR)
+
+
+def registry_cases() -> List[Tuple[str, Callable[[str], object], Callable[[str], object]]]:
+    """(이름, 기존 방식, 레지스트리 방식) 목록. 레지스트리 모듈의 모든 패턴을 모음."""
+    cases = []
+    for name, value in sorted(vars(wiki_patterns).items()):
+        if name.startswith("_"):
+            continue
+        if isinstance(value, Pattern):
+            cases.append(_pattern_case(name, value))
+        elif isinstance(value, PatternList):
+            cases.extend(_pattern_case(f"{name}[{i}]", p) for i, p in enumerate(value))
+        elif isinstance(value, AnyPattern):
+            cases.append(_any_case(name, value))
+    return cases
+
+
+def _pattern_case(name: str, pattern: Pattern):
+    source, flags = pattern.pattern, pattern.regex.flags
+    return name, (lambda text: re.findall(source, text, flags)), pattern.findall
+
+
+def _any_case(name: str, pattern: AnyPattern):
+    sources, flags = pattern.patterns, pattern.regex.flags
+    return name, (lambda text: any(re.search(p, text, flags) for p in sources)), pattern.search
+
+
+def _time_us(func: Callable[[str], object], texts: List[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            func(text)
+    return (time.perf_counter() - start) * 1e6 / (repeat * len(texts))
+
+
+def run(texts: List[str], repeat: int = 10) -> List[Tuple[str, float, float, bool]]:
+    """패턴별 (이름, 기존 µs/본문, 레지스트리 µs/본문, 결과 일치 여부)."""
+    rows = []
+    for name, legacy, registry in registry_cases():
+        same = all(legacy(text) == registry(text) for text in texts)
+        rows.append((name, _time_us(legacy, texts, repeat), _time_us(registry, texts, repeat), same))
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="위키 정규식 레지스트리 벤치마크")
+    parser.add_argument("--corpus", help="본문으로 쓸 *.txt 파일이 있는 디렉터리")
+    parser.add_argument("--cache", default=os.getenv("WIKI_CACHE_PATH"), help="위키 페이지 캐시 sqlite 경로")
+    parser.add_argument("--repeat", type=int, default=10, help="본문 목록 반복 횟수")
+    parser.add_argument("--top", type=int, default=20, help="출력할 기존 방식 기준 느린 패턴 수")
+    args = parser.parse_args(argv)
+
+    texts = load_corpus(args.corpus, args.cache)
+    rows = run(texts, args.repeat)
+    legacy_total = sum(row[1] for row in rows)
+    registry_total = sum(row[2] for row in rows)
+
+    print(f"🔎 패턴 {len(rows)}개 × 본문 {len(texts)}개 (평균 {sum(map(len, texts)) // len(texts)}자), 반복 {args.repeat}회")
+    print(f"{'기존(µs)':>10} {'레지스트리(µs)':>14} {'배율':>7}  패턴")
+    for name, legacy_us, registry_us, same in sorted(rows, key=lambda r: r[1], reverse=True)[:args.top]:
+        speedup = legacy_us / registry_us if registry_us else float("inf")
+        print(f"{legacy_us:>10.2f} {registry_us:>14.2f} {speedup:>6.1f}x  {name}{'' if same else '  ❌ 결과 다름'}")
+    print(f"본문 하나당 전체 패턴: 기존 {legacy_total:.1f}µs → 레지스트리 {registry_total:.1f}µs "
+          f"({legacy_total / registry_total:.1f}x)")
+
+    mismatched = [name for name, _, _, same in rows if not same]
+    if mismatched:
+        print(f"❌ 결과가 다른 패턴: {', '.join(mismatched)}")
+        return 1
+    print("✅ 모든 패턴의 결과가 기존 방식과 같음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
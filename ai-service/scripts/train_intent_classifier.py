@@ -0,0 +1,77 @@
+"""
+train_intent_classifier.py
+기록된 턴(JSONL)으로 로컬 의도 분류기(app.utils.intent_classifier)를 학습해 모델 파일로 저장
+
+- 입력: {"user_input": ..., "intent": ...} 한 줄씩 (INTENT_TURN_LOG_PATH 기록 파일, data/intent_seed_turns.jsonl 등)
+- k-겹 교차 검증으로 임계값별 처리 비율(LLM을 건너뛰는 턴)과 그 턴들의 정확도를 출력
+- 로컬에서 처리한 턴의 정확도(기타 의도를 info/recommendation으로 처리하면 오답)가 --min-accuracy보다 낮으면 모델을 저장하지 않고 종료 코드 1
+
+실행 방법 (ai-service 디렉터리에서 모듈로 실행해야 app 패키지를 찾음):
+    cd ai-service
+    python -m scripts.train_intent_classifier
+    python -m scripts.train_intent_classifier --turns data/intent_seed_turns.jsonl /var/log/intent_turns.jsonl --threshold 0.9
+"""
+import argparse
+import os
+import sys
+from typing import List, Sequence, Tuple
+
+SERVICE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils.intent_classifier import (
+    DEFAULT_MODEL_PATH, INTENT_LABELS, LocalIntentClassifier, read_intent_turns
+)
+
+DEFAULT_TURNS = os.path.join(SERVICE_ROOT, "data", "intent_seed_turns.jsonl")
+
+
+def cross_validate(samples: Sequence[Tuple[str, str]], threshold: float, folds: int = 5) -> Tuple[float, float, int]:
+    """(LLM을 건너뛴 턴 비율, 건너뛴 턴의 정확도, 그중 info/recommendation이 아닌 턴 수)"""
+    covered = correct = other_covered = 0
+    for fold in range(folds):
+        train = [s for i, s in enumerate(samples) if i % folds != fold]
+        test = [s for i, s in enumerate(samples) if i % folds == fold]
+        model = LocalIntentClassifier.train(train)
+        for text, intent in test:
+            predicted, _ = model.predict(text, threshold)
+            if predicted is None:
+                continue
+            covered += 1
+            if intent not in INTENT_LABELS:
+                other_covered += 1
+            elif predicted == intent:
+                correct += 1
+    coverage = covered / len(samples)
+    accuracy = correct / covered if covered else 1.0
+    return coverage, accuracy, other_covered
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="로컬 의도 분류기 학습")
+    parser.add_argument("--turns", nargs="+", default=[DEFAULT_TURNS], help="학습할 턴 JSONL 파일")
+    parser.add_argument("--out", default=DEFAULT_MODEL_PATH, help="저장할 모델 파일 경로")
+    parser.add_argument("--threshold", type=float, default=0.9, help="교차 검증에 쓸 확신도 임계값")
+    parser.add_argument("--min-accuracy", type=float, default=0.97, help="저장에 필요한 최소 로컬 정확도")
+    args = parser.parse_args(argv)
+
+    samples: List[Tuple[str, str]] = list(dict.fromkeys(read_intent_turns(args.turns)))
+    counts = {}
+    for _, intent in samples:
+        counts[intent] = counts.get(intent, 0) + 1
+    print(f"📚 턴 {len(samples)}개: " + ", ".join(f"{k} {v}" for k, v in sorted(counts.items())))
+
+    coverage, accuracy, other_covered = cross_validate(samples, args.threshold)
+    print(f"🔎 교차 검증 (임계값 {args.threshold:g}): LLM 건너뜀 {coverage:.1%}, 정확도 {accuracy:.1%}, "
+          f"기타 의도를 로컬 처리 {other_covered}개")
+    if accuracy < args.min_accuracy:
+        print(f"❌ 정확도가 {args.min_accuracy:.0%}보다 낮아 모델을 저장하지 않음")
+        return 1
+
+    model = LocalIntentClassifier.train(samples)
+    model.save(args.out)
+    print(f"✅ n-gram {len(model.weights)}개 모델 저장: {args.out} ({os.path.getsize(args.out) // 1024}KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
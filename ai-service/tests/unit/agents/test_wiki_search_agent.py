@@ -0,0 +1,127 @@
+"""
+wiki_search_agent TDD
+공유 에이전트(get_wiki_agent)로 두 세션을 동시에 처리해도 wiki_context와 스트리밍 토큰이 섞이지 않는지 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/agents/test_wiki_search_agent.py
+    또는
+    python -m pytest tests/unit/agents/test_wiki_search_agent.py -v -s
+"""
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 테스트 대상 import
+from app.agents import wiki_search_agent
+from app.main_agent import intent_router
+
+AUTHORS = ("한강", "김영하")
+
+
+def _wiki_intent(author):
+    return {"intent_type": "author_search", "extracted_keywords": [author], "specific_info_request": None}
+
+
+class FakeStreamingClient:
+    """작가명을 조각내어 스트리밍하는 가짜 OpenAI 클라이언트"""
+
+    def __init__(self):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, model, messages, stream=False, **kwargs):
+        author = next(name for name in AUTHORS if f"작가명: {name}" in messages[-1]["content"])
+        pieces = [f"{author}은 ", "대한민국의 ", f"소설가입니다({author})."]
+        if not stream:
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="".join(pieces)))])
+        return self._stream(pieces)
+
+    def _stream(self, pieces):
+        for piece in pieces:
+            time.sleep(0.01)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+
+
+class FakeSearchTool:
+    """후보 제목마다 작가 문서를 돌려주는 가짜 검색 도구.
+
+    두 세션이 모두 체인에 들어온 뒤(콜백 설정 후) 답변을 만들도록 검색 단계에서 서로를 기다림.
+    """
+
+    def __init__(self, parties=len(AUTHORS)):
+        self.barrier = threading.Barrier(parties, timeout=5)
+
+    def search_pages(self, terms):
+        self.barrier.wait()
+        return _search_results(terms)
+
+
+def _search_results(terms):
+    results = {}
+    for term in terms:
+        author = term.split(" (")[0]
+        results[term] = {
+            "success": True, "title": f"{author} (소설가)", "summary": f"{author}은 대한민국의 소설가이다.",
+            "content": f"{author}은 대한민국의 소설가이다.", "url": f"https://ko.wikipedia.org/wiki/{author}",
+        }
+    return results
+
+
+class TestSharedWikiAgent:
+    """공유 위키 에이전트 세션 격리 테스트"""
+
+    def test_two_sessions_do_not_leak(self):
+        """두 세션을 동시에 처리해도 컨텍스트/토큰이 각 세션에만 반영되는지 테스트"""
+        sessions = {
+            "한강": {"conversation_history": [], "wiki_context": {"current_author": "박경리"}},
+            "김영하": {"conversation_history": [], "wiki_context": {}},
+        }
+        before = {author: dict(session["wiki_context"]) for author, session in sessions.items()}
+        tokens = {author: [] for author in AUTHORS}
+
+        with patch.object(wiki_search_agent, "_shared_agent", None):
+            agent = wiki_search_agent.get_wiki_agent()
+            assert wiki_search_agent.get_wiki_agent() is agent
+            agent.chain.llm_client = FakeStreamingClient()
+            agent.chain.tool = FakeSearchTool()
+
+            async def run():
+                return await asyncio.gather(*(
+                    intent_router.aroute_intent(
+                        "info", {"user_input": f"{author} 작가 알려줘"}, "wiki", sessions[author],
+                        on_token=tokens[author].append, wiki_intent=_wiki_intent(author)
+                    ) for author in AUTHORS
+                ))
+
+            results = dict(zip(AUTHORS, asyncio.run(run())))
+
+            # 스트리밍 없이 이어서 호출해도 이전 세션의 콜백으로 토큰이 흘러가지 않아야 함
+            agent.chain.tool = FakeSearchTool(parties=1)
+            agent.process_with_context("한강 작가 알려줘", {}, precomputed_intent=_wiki_intent("한강"))
+
+        for author, other in (AUTHORS, AUTHORS[::-1]):
+            streamed = "".join(tokens[author])
+            assert streamed.startswith(f"{author}은 대한민국의 소설가입니다({author}).")
+            assert other not in streamed
+            assert results[author]["message"] == streamed
+            assert results[author]["update_context"]["current_author"] == author
+            # 세션에 저장된 컨텍스트는 에이전트가 직접 바꾸지 않음 (갱신은 호출자가 반환값으로 처리)
+            assert sessions[author]["wiki_context"] == before[author]
+        print("✅ 공유 에이전트 세션 격리 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🧪 wiki_search_agent 테스트 시작")
+    print("=" * 60)
+    TestSharedWikiAgent().test_two_sessions_do_not_leak()
+
+    print("\n" + "=" * 60)
+    print("🎉 모든 wiki_search_agent 테스트 통과!")
@@ -0,0 +1,74 @@
+"""
+turn_analysis_chain TDD
+가짜 LLM으로 통합 분석 체인이 JSON 스키마를 넘기고 한 번의 호출 결과를 query / intent / wiki_intent로 나누는지 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/chains/test_turn_analysis_chain.py
+    또는
+    python -m pytest tests/unit/chains/test_turn_analysis_chain.py -v -s
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 테스트 대상 import
+from app.config import llm
+from app.chains.turn_analysis_chain import turn_analysis_chain
+from app.prompts.turn_analysis_prompt import turn_analysis_schema
+
+RESPONSE = {
+    "emotion": None, "genre": None, "author": "한강", "title": None, "publisher": None, "order_id": None,
+    "keywords": ["한강"], "intent": "info",
+    "wiki_intent": {"intent_type": "author_search", "extracted_keywords": ["한강"], "specific_info_request": None},
+}
+
+
+class RecordingChatModel(FakeListChatModel):
+    """호출 인자(프롬프트, response_format)를 기록하는 가짜 LLM"""
+    calls: list = []
+
+    def _call(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls.append({"prompt": messages[0].content, **kwargs})
+        return super()._call(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+
+@pytest.fixture
+def fake_turn_llm(monkeypatch):
+    """turn_analysis_llm을 정해진 JSON을 돌려주는 가짜 LLM으로 교체"""
+    model = RecordingChatModel(responses=[json.dumps(RESPONSE, ensure_ascii=False)], calls=[])
+    monkeypatch.setattr(llm, "_FACTORIES", {"turn_analysis_llm": lambda: model})
+    yield model
+    llm.__dict__.pop("turn_analysis_llm", None)
+
+
+class TestTurnAnalysisChain:
+    """통합 분석 체인 테스트"""
+
+    def test_single_call_with_json_schema(self, fake_turn_llm):
+        """LLM을 한 번만 호출하고 JSON 스키마 응답 형식을 넘기는지 테스트"""
+        result = turn_analysis_chain.invoke({
+            "user_input": "한강 작가 알려줘", "conversation_history": "이전 대화가 없습니다."
+        })
+
+        assert len(fake_turn_llm.calls) == 1
+        call = fake_turn_llm.calls[0]
+        assert call["response_format"] == {"type": "json_schema", "json_schema": turn_analysis_schema}
+        assert "한강 작가 알려줘" in call["prompt"]
+
+        assert result["intent"] == "info"
+        assert result["wiki_intent"] == RESPONSE["wiki_intent"]
+        assert result["query"]["author"] == "한강"
+        assert "wiki_intent" not in result["query"]
+        print("✅ 통합 분석 체인 테스트 통과")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,102 @@
+"""
+config.llm 지연 초기화 TDD
+import 시점에 외부 객체를 만들지 않고, 처음 접근할 때 한 번만 만들며 준비 상태를 보고하는지 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/config/test_lazy_llm.py
+    또는
+    python -m pytest tests/unit/config/test_lazy_llm.py -v -s
+"""
+import pytest
+import sys
+import threading
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.prompts import PromptTemplate
+from langchain_core.runnables import RunnableLambda
+
+# 테스트 대상 import (OPENAI_API_KEY 없이도 import 가능해야 함)
+from app.config import llm
+
+
+@pytest.fixture
+def fake_factories(monkeypatch):
+    """실제 객체 대신 호출 횟수를 세는 가짜 팩토리로 교체"""
+    calls = {"fake_llm": 0, "broken": 0}
+
+    def make_llm():
+        calls["fake_llm"] += 1
+        return FakeListChatModel(responses=["첫 응답", "두 번째 응답"])
+
+    def broken():
+        calls["broken"] += 1
+        raise RuntimeError("연결 실패")
+
+    monkeypatch.setattr(llm, "_FACTORIES", {"fake_llm": make_llm, "broken": broken})
+    monkeypatch.setattr(llm, "_errors", {})
+    monkeypatch.setattr(llm, "_timings", {})
+    yield calls
+    for name in ("fake_llm", "broken"):
+        llm.__dict__.pop(name, None)
+
+
+class TestLazyInitialization:
+    """지연 생성 테스트"""
+
+    def test_import_does_not_create_resources(self):
+        """import만으로는 벡터스토어/LLM이 만들어지지 않는지 테스트"""
+        for name in ("vectorstore", "embedding_model", "recommendation_llm"):
+            assert name not in llm.__dict__
+        print("✅ import 시 미생성 테스트 통과")
+
+    def test_created_once_on_first_access(self, fake_factories):
+        """여러 스레드가 동시에 접근해도 한 번만 만들고 이후에는 같은 객체를 쓰는지 테스트"""
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(llm.fake_llm)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert fake_factories["fake_llm"] == 1
+        assert all(result is results[0] for result in results)
+        assert llm.get("fake_llm") is results[0]
+        with pytest.raises(AttributeError):
+            llm.unknown_resource
+        print("✅ 1회 생성 테스트 통과")
+
+    def test_lazy_llm_in_chain(self, fake_factories):
+        """체인을 조립할 때는 만들지 않고 실행할 때 만드는지 테스트"""
+        chain = PromptTemplate.from_template("{q}") | llm.lazy_llm("fake_llm") | RunnableLambda(lambda m: m.content)
+        assert fake_factories["fake_llm"] == 0
+
+        assert chain.invoke({"q": "안녕"}) == "첫 응답"
+        assert fake_factories["fake_llm"] == 1
+        print("✅ 체인 지연 생성 테스트 통과")
+
+
+class TestReadiness:
+    """warm_up / readiness 테스트"""
+
+    def test_warm_up_reports_each_resource(self, fake_factories):
+        """하나가 실패해도 나머지는 만들고 상태를 이름별로 보고하는지 테스트"""
+        assert llm.readiness()["resources"] == {"fake_llm": "pending", "broken": "pending"}
+
+        resources = llm.warm_up()
+
+        assert resources["fake_llm"] == "ready"
+        assert resources["broken"] == "error: 연결 실패"
+        status = llm.readiness()
+        assert status["ready"] is False
+        assert "fake_llm" in status["timings_ms"]
+        print("✅ 준비 상태 테스트 통과")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
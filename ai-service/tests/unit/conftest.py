@@ -0,0 +1,84 @@
+"""
+단위 테스트 공용 fixture
+색인(retrieval)/색인 빌더(indexing) 테스트가 함께 쓰는 Chroma 테스트 더블
+"""
+import pytest
+
+
+class FakeChroma:
+    """langchain Chroma 테스트 더블.
+
+    rows((id, 메타데이터, 본문) 목록)를 그대로 보관하며 get(ids/include/limit/offset)과 _collection만 흉내냄.
+    테스트에서 rows를 바꾸면 컬렉션 문서 수(버전)도 함께 바뀜.
+    """
+
+    def __init__(self, rows=None):
+        self.rows = [] if rows is None else rows
+        self._collection = FakeCollection(self)
+        self.get_calls = 0
+
+    def get(self, ids=None, include=None, limit=None, offset=0):
+        self.get_calls += 1
+        if ids:
+            rows = [row for row in self.rows if row[0] in ids]
+        else:
+            rows = self.rows[offset:offset + (limit or len(self.rows))]
+        return {
+            "ids": [row[0] for row in rows],
+            "metadatas": [row[1] for row in rows],
+            "documents": [row[2] for row in rows],
+        }
+
+
+class FakeCollection:
+    """chromadb Collection 테스트 더블 (count/get/upsert/delete).
+
+    Args:
+        store (FakeChroma | None): 행을 보관할 벡터스토어. None이면 빈 FakeChroma를 만듦
+        fail_after (int | None): upsert를 이 횟수만큼 성공한 뒤부터 예외 발생 (중단 후 재개 테스트용)
+    """
+
+    def __init__(self, store=None, fail_after=None):
+        self.store = store if store is not None else FakeChroma()
+        self.store._collection = self
+        self.fail_after = fail_after
+        self.calls = 0
+
+    @property
+    def documents(self):
+        """id → 본문"""
+        return {row[0]: row[2] for row in self.store.rows}
+
+    def count(self):
+        return len(self.store.rows)
+
+    def get(self, include=None, limit=None, offset=0):
+        return self.store.get(include=include, limit=limit, offset=offset)
+
+    def upsert(self, ids, embeddings, documents, metadatas):
+        if self.fail_after is not None and self.calls >= self.fail_after:
+            raise RuntimeError("중단")
+        self.calls += 1
+        positions = {row[0]: i for i, row in enumerate(self.store.rows)}
+        for doc_id, document, metadata in zip(ids, documents, metadatas):
+            if doc_id in positions:
+                self.store.rows[positions[doc_id]] = (doc_id, metadata, document)
+            else:
+                positions[doc_id] = len(self.store.rows)
+                self.store.rows.append((doc_id, metadata, document))
+
+    def delete(self, ids):
+        removed = set(ids)
+        self.store.rows[:] = [row for row in self.store.rows if row[0] not in removed]
+
+
+@pytest.fixture
+def fake_chroma():
+    """rows로 FakeChroma를 만드는 팩토리"""
+    return FakeChroma
+
+
+@pytest.fixture
+def fake_collection():
+    """FakeCollection을 만드는 팩토리 (fail_after 지정 가능)"""
+    return FakeCollection
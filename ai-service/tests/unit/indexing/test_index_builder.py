@@ -0,0 +1,216 @@
+"""
+IndexBuilder TDD
+행 → 문서 변환, 배치 임베딩, 429 재시도, 청크 upsert와 체크포인트 재개, 증분 동기화 동작을 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/indexing/test_index_builder.py
+    또는
+    python -m pytest tests/unit/indexing/test_index_builder.py -v -s
+"""
+import pytest
+import sys
+import json
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 테스트 대상 import
+from app.indexing.documents import content_hash, product_document, review_document
+from app.indexing.index_builder import IndexBuilder, IndexBuildConfig
+from app.indexing.manifest import IndexManifest, read_revision
+
+
+PRODUCTS = [
+    {"isbn": f"97800000000{i}", "product_name": f"책 {i}", "author": "한강", "rate": Decimal("4.5"),
+     "brief_description": "짧은 설명", "detail_description": None, "product_keyword": '["소설"]',
+     "emotion_keyword": '["우울"]', "low_category_name": "한국소설", "mid_category_name": "소설",
+     "top_category_name": "국내도서"}
+    for i in range(5)
+]
+REVIEWS = [
+    {"product_review_id": 1, "isbn": PRODUCTS[0]["isbn"], "review_title": "좋아요", "review_content": "위로가 됐어요",
+     "review_emotion_keyword": '["위로"]', "product_name": "책 0"},
+    {"product_review_id": 2, "isbn": PRODUCTS[1]["isbn"], "review_title": None, "review_content": None},
+]
+
+
+class FakeCursor:
+    """fetchmany만 지원하는 서버 측 커서 흉내 (키셋 조건을 직접 적용)"""
+    def __init__(self, db):
+        self.db = db
+        self.rows = []
+
+    def execute(self, query, params=None):
+        if query.startswith("SET"):
+            return
+        self.db.queries.append(params)
+        if "FROM product_review" in query:
+            self.rows = [r for r in self.db.reviews if r["product_review_id"] > params[0]]
+        else:
+            self.rows = [r for r in self.db.products if r["isbn"] > params[0]]
+
+    def fetchmany(self, size):
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+    def close(self):
+        pass
+
+
+class FakeDB:
+    def __init__(self, products=None, reviews=None):
+        self.queries = []
+        self.products = PRODUCTS if products is None else products
+        self.reviews = REVIEWS if reviews is None else reviews
+
+    def __call__(self):
+        return self
+
+    def cursor(self, dictionary=False, buffered=True):
+        assert dictionary and not buffered  # 서버 측 커서로 읽어야 함
+        return FakeCursor(self)
+
+    def close(self):
+        pass
+
+
+class RateLimitError(Exception):
+    """openai.RateLimitError 대체"""
+
+
+class FlakyEmbeddings:
+    """처음 몇 번은 429를 내고 그 뒤에는 텍스트 길이 벡터를 반환하는 가짜 임베딩"""
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.batches = []
+
+    def embed_documents(self, texts):
+        if self.failures:
+            self.failures -= 1
+            raise RateLimitError("429")
+        self.batches.append(len(texts))
+        return [[float(len(t))] for t in texts]
+
+
+class TestDocuments:
+    """행 → 문서 변환 테스트"""
+
+    def test_product_and_review_documents(self):
+        """메타데이터 키/타입 정리와 빈 리뷰 제외 테스트"""
+        doc = product_document(PRODUCTS[0])
+        assert doc.id == "product:978000000000"
+        assert doc.metadata["product_emotion_keywords"] == '["우울"]'
+        assert doc.metadata["rate"] == 4.5 and "detail_description" not in doc.metadata
+        assert "한국소설" in doc.text
+
+        review = review_document(REVIEWS[0])
+        assert review.id == "review:1"
+        assert review.metadata["review_emotion_keywords"] == '["위로"]'
+        assert review.metadata["type"] == "review"
+        assert review_document(REVIEWS[1]) is None
+        print("✅ 문서 변환 테스트 통과")
+
+
+class TestIndexBuilder:
+    """IndexBuilder 파이프라인 테스트"""
+
+    def test_batches_and_retry(self, fake_collection):
+        """배치 크기대로 임베딩하고 429는 재시도하는지 테스트"""
+        embeddings = FlakyEmbeddings(failures=2)
+        collection = fake_collection()
+        sleeps = []
+        builder = IndexBuilder(FakeDB(), embeddings, collection,
+                               IndexBuildConfig(fetch_size=3, embed_batch_size=2, max_concurrency=2),
+                               sleep=sleeps.append)
+
+        stats = builder.run()
+
+        assert stats == {"product": 5, "review": 1}
+        assert collection.count() == 6
+        assert collection.calls == 3  # 상품 3+2, 리뷰 1
+        assert max(embeddings.batches) <= 2
+        assert len(sleeps) == 2
+        print("✅ 배치/재시도 테스트 통과")
+
+    def test_resume_from_checkpoint(self, fake_collection):
+        """중단 후 체크포인트의 마지막 키 다음부터 재개하는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmp:
+            config = IndexBuildConfig(fetch_size=2, checkpoint_path=str(Path(tmp) / "checkpoint.json"))
+            with pytest.raises(RuntimeError):
+                IndexBuilder(FakeDB(), FlakyEmbeddings(), fake_collection(fail_after=1), config).run()
+
+            with open(config.checkpoint_path, encoding="utf-8") as f:
+                assert json.load(f)["product"] == PRODUCTS[1]["isbn"]
+
+            db = FakeDB()
+            collection = fake_collection()
+            stats = IndexBuilder(db, FlakyEmbeddings(), collection, config).run()
+            assert db.queries[0] == (PRODUCTS[1]["isbn"],)
+            assert stats["product"] == 3
+            assert not Path(config.checkpoint_path).exists()  # 완료 후 체크포인트 삭제
+        print("✅ 체크포인트 재개 테스트 통과")
+
+
+class TestIndexSync:
+    """내용 해시 기반 증분 동기화 테스트"""
+
+    def _builder(self, tmp, db, embeddings, collection):
+        config = IndexBuildConfig(fetch_size=2, manifest_path=str(Path(tmp) / "manifest.sqlite3"))
+        return IndexBuilder(db, embeddings, collection, config)
+
+    def test_sync_only_changed_documents(self, fake_collection):
+        """바뀐 문서만 다시 임베딩하고 사라진 문서는 삭제하는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmp:
+            products = [dict(row) for row in PRODUCTS]
+            collection = fake_collection()
+            self._builder(tmp, FakeDB(products), FlakyEmbeddings(), collection).run()
+            manifest_path = str(Path(tmp) / "manifest.sqlite3")
+            revision = read_revision(manifest_path)
+            assert revision == 1
+
+            # 변경 없음 → 임베딩 요청 없음, revision 유지
+            embeddings = FlakyEmbeddings()
+            stats = self._builder(tmp, FakeDB(products), embeddings, collection).sync()
+            assert stats == {"scanned": 6, "upserted": 0, "deleted": 0}
+            assert embeddings.batches == []
+            assert read_revision(manifest_path) == revision
+
+            # 설명 수정 1건 + 신규 1건 + 삭제 1건
+            products[2]["brief_description"] = "카카오 설명으로 갱신"
+            products.append(dict(PRODUCTS[0], isbn="979000000000", product_name="새 책"))
+            del products[4]
+            embeddings = FlakyEmbeddings()
+            stats = self._builder(tmp, FakeDB(products), embeddings, collection).sync()
+
+            assert stats == {"scanned": 6, "upserted": 2, "deleted": 1}
+            assert sum(embeddings.batches) == 2
+            assert "카카오 설명으로 갱신" in collection.documents[f"product:{PRODUCTS[2]['isbn']}"]
+            assert "product:979000000000" in collection.documents
+            assert f"product:{PRODUCTS[4]['isbn']}" not in collection.documents
+            assert read_revision(manifest_path) == revision + 1
+        print("✅ 증분 동기화 테스트 통과")
+
+    def test_bootstrap_manifest_from_collection(self, fake_collection):
+        """매니페스트 없이 만든 컬렉션은 저장된 문서로 해시를 채워 다시 임베딩하지 않는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmp:
+            collection = fake_collection()
+            IndexBuilder(FakeDB(), FlakyEmbeddings(), collection, IndexBuildConfig()).run()
+
+            embeddings = FlakyEmbeddings()
+            stats = self._builder(tmp, FakeDB(), embeddings, collection).sync()
+
+            assert stats["upserted"] == 0 and embeddings.batches == []
+            manifest = IndexManifest(str(Path(tmp) / "manifest.sqlite3"))
+            doc = product_document(PRODUCTS[0])
+            assert manifest.get_many([doc.id]) == {doc.id: content_hash(doc)}
+            manifest.close()
+        print("✅ 매니페스트 초기화 테스트 통과")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
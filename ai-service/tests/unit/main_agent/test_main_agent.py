@@ -0,0 +1,166 @@
+"""
+main_agent 사전 라우팅 TDD
+가짜 체인으로 질의 분석/의도 분류의 병렬·순차 실행과 제한 시간 초과 처리를 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/main_agent/test_main_agent.py
+    또는
+    python -m pytest tests/unit/main_agent/test_main_agent.py -v -s
+"""
+import asyncio
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from langchain_core.runnables import RunnableLambda, RunnableParallel
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 테스트 대상 import
+from app.main_agent import main_agent
+
+DELAY = 0.2
+WIKI_INTENT = {"intent_type": "author_search", "extracted_keywords": ["한강"], "specific_info_request": None}
+
+
+@contextmanager
+def _fake_usage():
+    yield SimpleNamespace(total_tokens=0)
+
+
+def _slow(value, delay=DELAY, finished=None):
+    """delay초 뒤 value를 반환하는 가짜 체인 (끝까지 실행되면 finished에 기록)"""
+    async def run(inputs):
+        await asyncio.sleep(delay)
+        if finished is not None:
+            finished.append(value)
+        return value
+    return RunnableLambda(run)
+
+
+@contextmanager
+def _pre_routing(mode="parallel", timeout=5.0, fused=False, query_delay=DELAY, intent_delay=DELAY, finished=None):
+    query_chain = _slow({"keywords": ["한강"]}, query_delay, finished)
+    intent_chain = _slow("info", intent_delay, finished)
+    fused_chain = _slow({"query": {"keywords": ["한강"]}, "intent": "info", "wiki_intent": WIKI_INTENT}, query_delay, finished)
+    with patch.object(main_agent, "query_analysis_chain", query_chain), \
+         patch.object(main_agent, "intent_classify_chain", intent_chain), \
+         patch.object(main_agent, "pre_routing_chain", RunnableParallel(query=query_chain, intent=intent_chain)), \
+         patch.object(main_agent, "turn_analysis_chain", fused_chain), \
+         patch.object(main_agent, "PRE_ROUTING_MODE", mode), \
+         patch.object(main_agent, "PRE_ROUTING_TIMEOUT", timeout), \
+         patch.object(main_agent, "USE_FUSED_ANALYSIS", fused), \
+         patch.object(main_agent, "_openai_usage", _fake_usage):
+        yield
+
+
+class TestAnalyzeTurn:
+    """analyze_turn / aanalyze_turn 실행 방식 테스트"""
+
+    def test_parallel_runs_chains_concurrently(self):
+        """parallel 모드는 두 체인을 동시에 실행하는지 테스트"""
+        with _pre_routing("parallel"):
+            started = time.perf_counter()
+            query, intent, wiki_intent = main_agent.analyze_turn("한강 작가 알려줘")
+            elapsed = time.perf_counter() - started
+
+        assert query == {"keywords": ["한강"]} and intent == "info" and wiki_intent is None
+        assert elapsed < DELAY * 1.8
+        print("✅ 병렬 실행 테스트 통과")
+
+    def test_sequential_runs_chains_in_order(self):
+        """sequential 모드는 두 체인을 차례로 실행하는지 테스트"""
+        with _pre_routing("sequential"):
+            started = time.perf_counter()
+            query, intent, wiki_intent = asyncio.run(main_agent.aanalyze_turn("한강 작가 알려줘"))
+            elapsed = time.perf_counter() - started
+
+        assert query == {"keywords": ["한강"]} and intent == "info" and wiki_intent is None
+        assert elapsed >= DELAY * 2
+        print("✅ 순차 실행 테스트 통과")
+
+    def test_fused_returns_wiki_intent_separately(self):
+        """통합 분석은 한 번의 호출로 위키 세부 의도까지 구하고 query에는 넣지 않는지 테스트"""
+        with _pre_routing(fused=True):
+            query, intent, wiki_intent = main_agent.analyze_turn("한강 작가 알려줘")
+
+        assert query == {"keywords": ["한강"]} and intent == "info"
+        assert wiki_intent == WIKI_INTENT
+        print("✅ 통합 분석 테스트 통과")
+
+    @pytest.mark.parametrize("mode", ["parallel", "sequential"])
+    def test_timeout_cancels_pending_chains(self, mode):
+        """제한 시간을 넘기면 TimeoutError를 내고 남은 체인은 끝까지 실행되지 않는지 테스트"""
+        finished = []
+        with _pre_routing(mode, timeout=0.1, intent_delay=0.5, finished=finished):
+            with pytest.raises(TimeoutError):
+                main_agent.analyze_turn("한강 작가 알려줘")
+            with pytest.raises(TimeoutError):
+                asyncio.run(main_agent.aanalyze_turn("한강 작가 알려줘"))
+        time.sleep(0.5)
+
+        assert "info" not in finished
+        print(f"✅ 제한 시간 초과 테스트 통과 ({mode})")
+
+
+class TestRunMainAgent:
+    """run_main_agent / arun_main_agent 사전 라우팅 결과 처리 테스트"""
+
+    def test_fused_wiki_intent_goes_to_router_not_query(self):
+        """위키 세부 의도는 라우터에 따로 넘기고 API 응답의 query에는 넣지 않는지 테스트"""
+        routed = {}
+
+        async def fake_aroute_intent(intent, query, current_agent, session, on_token=None, wiki_intent=None):
+            routed.update(query=dict(query), wiki_intent=wiki_intent)
+            return {"message": "한강은 대한민국의 소설가입니다."}
+
+        session = {}
+        with _pre_routing(fused=True), \
+             patch.object(main_agent, "should_switch_agent", return_value=False), \
+             patch.object(main_agent, "aroute_intent", fake_aroute_intent):
+            result = asyncio.run(main_agent.arun_main_agent("한강 작가 알려줘", session))
+
+        assert routed["wiki_intent"] == WIKI_INTENT
+        assert "wiki_intent" not in routed["query"]
+        assert "wiki_intent" not in result["query"]
+        print("✅ 위키 세부 의도 전달 테스트 통과")
+
+    def test_timeout_returns_clarification(self):
+        """사전 라우팅이 제한 시간을 넘기면 오류 대신 다시 질문해 달라는 안내를 반환하는지 테스트"""
+        sync_session, async_session = {}, {}
+        with _pre_routing(timeout=0.05):
+            sync_result = main_agent.run_main_agent("한강 작가 알려줘", sync_session)
+            async_result = asyncio.run(main_agent.arun_main_agent("한강 작가 알려줘", async_session))
+
+        for result, session in ((sync_result, sync_session), (async_result, async_session)):
+            assert result["clarification_needed"] is True
+            assert result["message"] == main_agent.PRE_ROUTING_TIMEOUT_MESSAGE
+            assert session["conversation_history"][-1] == {
+                "role": "assistant", "content": main_agent.PRE_ROUTING_TIMEOUT_MESSAGE
+            }
+        print("✅ 제한 시간 초과 안내 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🧪 main_agent 사전 라우팅 테스트 시작")
+    print("=" * 60)
+    test_analyze = TestAnalyzeTurn()
+    test_analyze.test_parallel_runs_chains_concurrently()
+    test_analyze.test_sequential_runs_chains_in_order()
+    test_analyze.test_fused_returns_wiki_intent_separately()
+    test_analyze.test_timeout_cancels_pending_chains("parallel")
+    test_analyze.test_timeout_cancels_pending_chains("sequential")
+
+    test_run = TestRunMainAgent()
+    test_run.test_fused_wiki_intent_goes_to_router_not_query()
+    test_run.test_timeout_returns_clarification()
+
+    print("\n" + "=" * 60)
+    print("🎉 모든 main_agent 사전 라우팅 테스트 통과!")
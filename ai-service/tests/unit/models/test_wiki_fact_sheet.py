@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+WikiFactSheet 직관적인 TDD 테스트
+인물 정보 카드의 딕셔너리 왕복(세션 컨텍스트 저장)과 페이지 일치 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/models/test_wiki_fact_sheet.py
+    또는
+    python -m pytest tests/unit/models/test_wiki_fact_sheet.py -v -s
+"""
+
+import pytest
+import sys
+import json
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 테스트 대상 모델 import
+from app.models.wiki_fact_sheet import WikiFactSheet
+
+
+class TestWikiFactSheet:
+    """WikiFactSheet 기본 기능 테스트"""
+
+    def test_roundtrip_through_json(self):
+        """JSON으로 저장했다 복원해도 같은 카드인지 테스트"""
+        original = WikiFactSheet(
+            title="한강 (소설가)", url="https://ko.wikipedia.org/wiki/한강_(소설가)",
+            birth="1970년 11월 27일", university="연세대학교",
+            works=["채식주의자", "소년이 온다"], father="한승원",
+            family={'father': "한승원", 'mother': None, 'siblings': [], 'family': [{'relation': 'father', 'name': "한승원"}]}
+        )
+
+        restored = WikiFactSheet.from_dict(json.loads(json.dumps(original.to_dict(), ensure_ascii=False)))
+
+        assert restored == original
+        print("✅ JSON 왕복 테스트 통과")
+
+    def test_from_dict_fills_defaults(self):
+        """빠진 필드와 None 값은 빈 값으로 채우는지 테스트"""
+        sheet = WikiFactSheet.from_dict({'title': "한강", 'death': None})
+
+        assert sheet.death == ""
+        assert sheet.works == []
+        assert sheet.family == {'father': None, 'mother': None, 'siblings': [], 'family': []}
+        print("✅ 기본값 테스트 통과")
+
+    def test_is_for_same_page(self):
+        """같은 페이지(제목+URL)의 검색 결과에서 만든 카드인지 확인하는 테스트"""
+        sheet = WikiFactSheet(title="한강 (소설가)", url="url-a")
+
+        assert sheet.is_for({'title': "한강 (소설가)", 'url': "url-a"})
+        assert not sheet.is_for({'title': "김영하", 'url': "url-b"})
+        print("✅ 페이지 일치 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🧪 WikiFactSheet 테스트 시작")
+    print("=" * 60)
+    test_sheet = TestWikiFactSheet()
+    test_sheet.test_roundtrip_through_json()
+    test_sheet.test_from_dict_fills_defaults()
+    test_sheet.test_is_for_same_page()
+
+    print("\n" + "=" * 60)
+    print("🎉 모든 WikiFactSheet 테스트 통과!")
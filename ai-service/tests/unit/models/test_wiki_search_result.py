@@ -334,6 +334,22 @@ class TestWikiSearchResultRoundtrip:
         assert restored.url == original.url  # None
         print("✅ 에러 결과 직렬화-역직렬화 왕복 테스트 통과")
 
+    def test_sections_roundtrip(self):
+        """섹션 맵이 있는 결과의 왕복 테스트 (섹션이 없으면 딕셔너리에 키를 넣지 않음)"""
+        sections = {'학력': "연세대학교 국어국문학과 졸업", '수상': "2024년 노벨 문학상"}
+        original = WikiSearchResult.create_success(
+            "한강 (소설가)", "한강은 대한민국의 소설가이다.", "...", "https://ko.wikipedia.org/wiki/한강_(소설가)",
+            sections=sections
+        )
+
+        data = original.to_dict()
+        restored = WikiSearchResult.from_dict(data)
+
+        assert data['sections'] == sections
+        assert restored == original
+        assert 'sections' not in WikiSearchResult.create_success("제목", "요약", "내용", "url").to_dict()
+        print("✅ 섹션 맵 왕복 테스트 통과")
+
 
 class TestWikiSearchResultEdgeCases:
     """WikiSearchResult 엣지 케이스 테스트"""
@@ -574,6 +590,7 @@ if __name__ == "__main__":
     test_roundtrip = TestWikiSearchResultRoundtrip()
     test_roundtrip.test_success_result_roundtrip()
     test_roundtrip.test_error_result_roundtrip()
+    test_roundtrip.test_sections_roundtrip()
 
     # 엣지 케이스 테스트
     print("\n🚨 엣지 케이스 테스트")
@@ -600,7 +617,7 @@ if __name__ == "__main__":
     print("  ✅ 기본 결과 생성: 4개 테스트")
     print("  ✅ 메서드 기능: 4개 테스트")
     print("  ✅ 직렬화/역직렬화: 4개 테스트")
-    print("  ✅ 왕복 테스트: 2개 테스트")
+    print("  ✅ 왕복 테스트: 3개 테스트")
     print("  ✅ 엣지 케이스: 4개 테스트")
     print("  ✅ 실제 시나리오: 5개 테스트")
     print("\n📝 pytest로 실행하려면:")
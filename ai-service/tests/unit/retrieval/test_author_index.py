@@ -0,0 +1,107 @@
+"""
+AuthorIndex TDD
+작가 이름 정규화(공백/역할 표기/로마자)와 컬렉션 메타데이터 기반 역색인 동작을 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/retrieval/test_author_index.py
+    또는
+    python -m pytest tests/unit/retrieval/test_author_index.py -v -s
+"""
+import pytest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from langchain_core.documents import Document
+
+# 테스트 대상 import
+from app.retrieval.author_index import (
+    AuthorIndex, normalize_author, split_authors, author_keys, author_filter
+)
+
+
+def _rows():
+    return [
+        ("1", {"isbn": "111", "author": "한강 (지은이)", "product_name": "소년이 온다"}, "소년이 온다 내용"),
+        ("2", {"isbn": "111", "author": "한강 (지은이)", "product_name": "소년이 온다"}, "같은 책의 다른 조각"),
+        ("3", {"isbn": "222", "author": "한 강 지음", "product_name": "채식주의자"}, "채식주의자 내용"),
+        ("4", {"isbn": "333", "author": "김초엽 (지은이), 홍길동 (옮긴이)", "product_name": "지구 끝의 온실"}, "온실 내용"),
+    ]
+
+
+class TestAuthorNormalization:
+    """작가 이름 정규화 테스트"""
+
+    def test_normalize_and_split(self):
+        """역할 표기/공백 제거와 번역가 제외 테스트"""
+        assert normalize_author("한 강 (지은이)") == "한강"
+        assert normalize_author("김초엽 지음") == "김초엽"
+        assert normalize_author("안도현 외") == "안도현"
+        assert split_authors("한강 (지은이), 데버라 스미스 (옮긴이)") == ["한강"]
+        print("✅ 정규화 테스트 통과")
+
+    def test_romanized_keys_match(self):
+        """로마자 표기와 한글 이름이 같은 키를 공유하는지 테스트"""
+        hangul = set(author_keys("김초엽"))
+        assert set(author_keys(normalize_author("Kim Cho-yeop"))) & hangul
+        assert set(author_keys(normalize_author("Han Kang"))) & set(author_keys("한강"))
+        assert set(author_keys(normalize_author("Lee Kkotnim"))) & set(author_keys("이꽃님"))
+        print("✅ 로마자 키 테스트 통과")
+
+
+class TestAuthorIndex:
+    """AuthorIndex 조회 테스트"""
+
+    def test_lookup_dedupes_by_isbn(self, fake_chroma):
+        """공백/역할 표기가 다른 표기도 한 작가로 묶고 ISBN 기준 중복 제거 테스트"""
+        index = AuthorIndex(fake_chroma(_rows()), batch_size=2)
+        docs = index.lookup("한강")
+
+        titles = sorted(doc.metadata["product_name"] for doc in docs)
+        assert titles == ["소년이 온다", "채식주의자"]
+        assert [d.metadata["product_name"] for d in index.lookup("Han Kang")] == [d.metadata["product_name"] for d in docs]
+        assert index.lookup("홍길동") == []  # 번역가는 색인하지 않음
+        assert index.lookup("없는 작가") == []
+        print("✅ 색인 조회 테스트 통과")
+
+    def test_ensure_built_before_first_lookup(self, fake_chroma):
+        """ensure_built로 미리 만들면 조회 때 컬렉션을 다시 읽지 않는지 테스트"""
+        store = fake_chroma(_rows())
+        index = AuthorIndex(store, batch_size=2)
+        index.ensure_built()
+        index.ensure_built()
+        calls = store.get_calls
+
+        assert len(index.lookup("한강")) == 2
+        assert store.get_calls == calls
+        print("✅ 사전 색인 생성 테스트 통과")
+
+    def test_rebuild_when_collection_changes(self, fake_chroma):
+        """컬렉션 문서 수가 바뀌면 이전 색인으로 응답하면서 백그라운드에서 다시 만드는지 테스트"""
+        store = fake_chroma(_rows())
+        index = AuthorIndex(store, version_check_interval=0)
+        assert index.lookup("천선란") == []
+
+        store.rows.append(("5", {"isbn": "444", "author": "천선란"}, "천 개의 파랑"))
+        assert index.lookup("천선란") == []
+        index._rebuild_thread.join(timeout=5)
+        assert len(index.lookup("천선란")) == 1
+        print("✅ 색인 재생성 테스트 통과")
+
+    def test_author_filter(self):
+        """원문 작가 표기로 메타데이터 필터 생성 테스트"""
+        docs = [
+            Document(page_content="", metadata={"author": "한강 (지은이)"}),
+            Document(page_content="", metadata={"author": "한 강 지음"}),
+        ]
+        assert author_filter(docs[:1]) == {"author": "한강 (지은이)"}
+        assert author_filter(docs) == {"$or": [{"author": "한 강 지음"}, {"author": "한강 (지은이)"}]}
+        print("✅ 작가 필터 테스트 통과")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
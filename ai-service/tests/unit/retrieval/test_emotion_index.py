@@ -0,0 +1,97 @@
+"""
+EmotionIndex TDD
+감정 키워드 정규화, 상품/리뷰 점수 합산, 동의어 확장, 저장 파일 재사용을 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/retrieval/test_emotion_index.py
+    또는
+    python -m pytest tests/unit/retrieval/test_emotion_index.py -v -s
+"""
+import pytest
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 테스트 대상 import
+from app.retrieval.emotion_index import EmotionIndex, build_emotion_index, normalize_emotion
+
+
+ROWS = [
+    ("p1", {"isbn": "111", "product_emotion_keywords": '["우울함", "위로"]'}, ""),
+    ("r1", {"isbn": "222", "review_emotion_keywords": '["우울"]'}, ""),
+    ("r2", {"isbn": "222", "review_emotion_keywords": '["우울한"]'}, ""),
+    ("r3", {"isbn": "222", "review_emotion_keywords": '["우울"]'}, ""),
+    ("p3", {"isbn": "333", "product_emotion_keywords": '["슬픔"]'}, ""),
+    ("p4", {"isbn": "444", "product_emotion_keywords": '["행복한", "사랑스러운"]'}, ""),
+]
+
+
+class TestEmotionIndex:
+    """EmotionIndex 테스트"""
+
+    def test_normalize_emotion(self):
+        """어미 제거 정규화 테스트"""
+        assert normalize_emotion("우울함") == "우울"
+        assert normalize_emotion("행복한") == "행복"
+        assert normalize_emotion("사랑스러운") == "사랑"
+        assert normalize_emotion("외로움") == normalize_emotion("외로운")
+        assert normalize_emotion("슬픔") == "슬픔"
+        print("✅ 감정 정규화 테스트 통과")
+
+    def test_scores_aggregate_product_and_reviews(self):
+        """상품 키워드(2점)와 리뷰 키워드(1점씩)가 책 단위로 합산되는지 테스트"""
+        emotions = build_emotion_index(ROWS)["emotions"]
+        assert emotions["우울"] == {"111": 2.0, "222": 3.0}
+        assert emotions["사랑"] == {"444": 2.0}
+        print("✅ 점수 합산 테스트 통과")
+
+    def test_shortlist_with_synonyms(self, fake_chroma):
+        """동의어는 낮은 가중치로 후보에 포함되는지 테스트"""
+        index = EmotionIndex(fake_chroma(ROWS))
+        shortlist = index.shortlist("우울")
+        assert set(shortlist[:2]) == {"111", "222"}  # 111은 "위로" 동의어 점수까지 더해 222와 동점
+        assert shortlist[2] == "333"                  # "슬픔" 동의어로만 포함
+        assert index.shortlist("행복한", limit=1) == ["444"]
+        assert index.shortlist("없는감정") == []
+        print("✅ 후보 추출 테스트 통과")
+
+    def test_saved_index_is_reused(self, fake_chroma):
+        """저장 파일이 컬렉션 버전과 같으면 컬렉션을 다시 읽지 않는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "emotion_index.json")
+            EmotionIndex(fake_chroma(ROWS), path=path).build()
+
+            store = fake_chroma(ROWS)
+            index = EmotionIndex(store, path=path)
+            assert index.shortlist("행복") == ["444"]
+            assert store.get_calls == 0
+
+            store.rows = ROWS[:1]  # 컬렉션 변경 → 재생성
+            changed = EmotionIndex(store, path=path)
+            assert changed.shortlist("행복") == []
+            assert store.get_calls == 1
+        print("✅ 저장 파일 재사용 테스트 통과")
+
+    def test_rebuild_in_background_when_collection_changes(self, fake_chroma):
+        """미리 만든 색인으로 응답하고, 컬렉션이 바뀌면 이전 색인으로 응답하면서 백그라운드에서 다시 만드는지 테스트"""
+        store = fake_chroma(list(ROWS))
+        index = EmotionIndex(store, version_check_interval=0)
+        index.ensure_built()
+        index.ensure_built()
+        assert store.get_calls == 1
+        assert "555" not in index.shortlist("설렘")
+
+        store.rows.append(("p5", {"isbn": "555", "product_emotion_keywords": '["설렘"]'}, ""))
+        assert "555" not in index.shortlist("설렘")
+        index._rebuild_thread.join(timeout=5)
+        assert index.shortlist("설렘")[0] == "555"
+        print("✅ 백그라운드 색인 재생성 테스트 통과")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,183 @@
+"""
+BM25Index / HybridSearcher TDD
+한국어 토큰화, BM25 순위, mmap 저장/불러오기, RRF 융합 동작을 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/retrieval/test_hybrid_search.py
+    또는
+    python -m pytest tests/unit/retrieval/test_hybrid_search.py -v -s
+"""
+import pytest
+import sys
+import asyncio
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from langchain_core.documents import Document
+
+# 테스트 대상 import
+from app.retrieval.lexical_index import BM25Index, tokenize, reciprocal_rank_fusion, load_or_build
+from app.retrieval.hybrid_search import HybridSearcher
+
+
+ROWS = [
+    ("d1", {"isbn": "111", "product_name": "우울할 때 읽는 시", "product_keywords": '["위로", "시집"]'}, "지친 마음을 위로하는 시"),
+    ("d2", {"isbn": "222", "product_name": "우주 과학 입문", "mid_category_name": "과학"}, "블랙홀과 별의 일생"),
+    ("d3", {"isbn": "333", "product_name": "행복한 에세이", "product_emotion_keywords": '["행복", "따뜻함"]'}, "일상의 작은 행복"),
+    ("d4", {"isbn": "111", "product_name": "우울할 때 읽는 시"}, "같은 책의 다른 조각 위로"),
+]
+
+
+class FakeRegistry:
+    """벡터 검색 결과를 고정으로 돌려주는 RetrieverRegistry 대체"""
+    k = 2
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    def search(self, strategy, query, filter=None, k=None):
+        return list(self.docs)
+
+    async def asearch(self, strategy, query, filter=None, k=None):
+        return list(self.docs)
+
+
+class TestBM25Index:
+    """BM25Index 테스트"""
+
+    def test_tokenize_adds_hangul_bigrams(self):
+        """3음절 이상 한글 어절은 bigram도 생성 테스트"""
+        tokens = tokenize("우울한 SF")
+        assert "우울한" in tokens and "우울" in tokens and "sf" in tokens
+        print("✅ 토큰화 테스트 통과")
+
+    def test_search_ranks_keyword_matches(self):
+        """본문/키워드 메타데이터 일치 문서가 상위에 오고 책 단위로 중복 제거 테스트"""
+        index = BM25Index.build(ROWS)
+        books = index.search_books("우울 위로", k=3)
+        print(f"  🔎 BM25 결과: {books}")
+        assert books[0][0] == "111"
+        assert [key for key, _ in books].count("111") == 1
+        assert index.search_books("과학")[0] == ("222", "d2")
+        assert index.search("없는단어") == []
+        print("✅ BM25 순위 테스트 통과")
+
+    def test_save_and_mmap_load(self, fake_chroma):
+        """저장 후 mmap으로 불러와도 같은 결과, 버전이 같으면 재생성하지 않음 테스트"""
+        with tempfile.TemporaryDirectory() as tmp:
+            built = load_or_build(fake_chroma(ROWS), tmp, version=4)
+            loaded = BM25Index.load(tmp)
+            assert loaded.version == 4
+            assert loaded.search("행복") == BM25Index.build(ROWS).search("행복")
+
+            reused = load_or_build(fake_chroma([]), tmp, version=4)  # 빈 컬렉션이어도 저장본 사용
+            assert len(reused) == len(ROWS)
+            rebuilt = load_or_build(fake_chroma([]), tmp, version=0)
+            assert len(rebuilt) == 0
+        print("✅ 저장/불러오기 테스트 통과")
+
+    def test_close_releases_mmap(self, fake_chroma, monkeypatch):
+        """close()가 mmap을 닫고, 버전이 다른 저장본은 다시 저장하기 전에 닫는지 테스트"""
+        closed = []
+        original_close = BM25Index.close
+
+        def recording_close(index):
+            closed.append(index.version)
+            original_close(index)
+
+        monkeypatch.setattr(BM25Index, "close", recording_close)
+        with tempfile.TemporaryDirectory() as tmp:
+            load_or_build(fake_chroma(ROWS), tmp, version=4).close()
+            loaded = BM25Index.load(tmp)
+            mapped = loaded._mmap
+            loaded.close()
+            assert mapped.closed and loaded._mmap is None
+            loaded.close()  # 두 번 닫아도 문제없음
+            BM25Index.build(ROWS).close()  # 메모리 색인은 할 일 없음
+
+            closed.clear()
+            rebuilt = load_or_build(fake_chroma(ROWS[:2]), tmp, version=2)
+            assert closed == [4]  # 이전 버전 저장본을 닫은 뒤 저장
+            assert rebuilt.version == 2 and len(rebuilt) == 2
+            rebuilt.close()
+        print("✅ mmap 닫기 테스트 통과")
+
+
+class TestHybridSearcher:
+    """RRF 융합 테스트"""
+
+    def test_reciprocal_rank_fusion(self):
+        """두 목록 모두에 있는 항목이 가장 높은 점수 테스트"""
+        fused = reciprocal_rank_fusion([["a", "b"], ["b", "c"]], k=60)
+        assert fused[0][0] == "b"
+        print("✅ RRF 테스트 통과")
+
+    def test_fuse_fetches_lexical_only_docs(self, fake_chroma):
+        """BM25에서만 찾은 책도 Chroma에서 가져와 결과에 포함 테스트"""
+        vector_docs = [Document(page_content="별", metadata={"isbn": "222", "product_name": "우주 과학 입문"})]
+        searcher = HybridSearcher(fake_chroma(ROWS), FakeRegistry(vector_docs))
+
+        docs = asyncio.run(searcher.asearch("감정: 우울, 키워드: 위로", lexical_query="우울 위로"))
+        isbns = [doc.metadata["isbn"] for doc in docs]
+        print(f"  📚 융합 결과: {isbns}")
+        assert set(isbns) == {"111", "222"}
+        assert searcher.search("우주", lexical_query="과학", k=1)[0].metadata["isbn"] == "222"
+        print("✅ 하이브리드 융합 테스트 통과")
+
+    def test_rebuild_in_background_when_collection_changes(self, fake_chroma):
+        """미리 만든 색인으로 검색하고, 컬렉션이 바뀌면 이전 색인으로 응답하면서 백그라운드에서 다시 만드는지 테스트"""
+        store = fake_chroma(list(ROWS))
+        searcher = HybridSearcher(store, FakeRegistry([]), version_check_interval=0)
+        searcher.ensure_built()
+        assert searcher._index.version == 4
+        assert searcher._lexical_search("소설") == []
+
+        store.rows.append(("d5", {"isbn": "555", "product_name": "소설 작법"}, "소설 쓰는 법"))
+        assert searcher._lexical_search("소설") == []
+        searcher._rebuild_thread.join(timeout=5)
+        assert searcher._lexical_search("소설") == [("555", "d5")]
+        print("✅ 백그라운드 색인 재생성 테스트 통과")
+
+    def test_rebuild_closes_replaced_index(self, fake_chroma):
+        """백그라운드 재생성으로 교체된 이전 색인의 mmap을 닫는지 테스트"""
+        store = fake_chroma(list(ROWS))
+        with tempfile.TemporaryDirectory() as tmp:
+            searcher = HybridSearcher(store, FakeRegistry([]), index_dir=tmp, version_check_interval=0)
+            searcher.ensure_built()
+            previous = searcher._index
+            assert previous._mmap is not None
+
+            store.rows.append(("d5", {"isbn": "555", "product_name": "소설 작법"}, "소설 쓰는 법"))
+            searcher._lexical_search("소설")
+            searcher._rebuild_thread.join(timeout=5)
+            assert previous._mmap is None
+            assert searcher._lexical_search("소설") == [("555", "d5")]
+            searcher._index.close()
+        print("✅ 교체된 색인 닫기 테스트 통과")
+
+    def test_build_failure_serves_vector_results(self, fake_chroma, monkeypatch):
+        """어휘 색인 생성에 실패해도 준비는 끝나고, 검색은 MMR 결과만으로 응답하는지 테스트"""
+        def fail(*args, **kwargs):
+            raise OSError("색인 디렉터리 읽기 실패")
+
+        monkeypatch.setattr("app.retrieval.hybrid_search.load_or_build", fail)
+        vector_docs = [Document(page_content="별", metadata={"isbn": "222", "product_name": "우주 과학 입문"}),
+                       Document(page_content="시", metadata={"isbn": "111", "product_name": "우울할 때 읽는 시"})]
+        searcher = HybridSearcher(fake_chroma(ROWS), FakeRegistry(vector_docs), version_check_interval=3600)
+        searcher.ensure_built()  # 예외를 올리지 않음 (/ready 통과)
+        assert searcher._index is None
+
+        docs = searcher.search("우울", lexical_query="위로")
+        assert [doc.metadata["isbn"] for doc in docs] == ["222", "111"]
+        docs = asyncio.run(searcher.asearch("우울"))
+        assert [doc.metadata["isbn"] for doc in docs] == ["222", "111"]
+        print("✅ 어휘 색인 생성 실패 시 벡터 검색 응답 테스트 통과")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
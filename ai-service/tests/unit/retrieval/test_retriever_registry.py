@@ -0,0 +1,89 @@
+"""
+RetrieverRegistry TDD
+미리 만든 retriever 재사용, 호출별 filter/k 적용, 전략별 시간 기록을 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/retrieval/test_retriever_registry.py
+    또는
+    python -m pytest tests/unit/retrieval/test_retriever_registry.py -v -s
+"""
+import pytest
+import sys
+import asyncio
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore
+
+# 테스트 대상 import
+from app.retrieval.retriever_registry import RetrieverRegistry, RetrievalStrategy
+
+
+class ScoredInMemoryVectorStore(InMemoryVectorStore):
+    """코사인 유사도를 그대로 관련도 점수로 쓰는 인메모리 벡터스토어 (score threshold 검색용)"""
+    def _select_relevance_score_fn(self):
+        return lambda score: score
+
+
+def _registry():
+    store = ScoredInMemoryVectorStore(DeterministicFakeEmbedding(size=16))
+    store.add_documents([
+        Document(page_content=f"책 {i}", metadata={"author": "한강" if i % 2 else "김초엽"})
+        for i in range(6)
+    ])
+    return RetrieverRegistry(store, k=3, score_threshold=-1.0)
+
+
+class TestRetrieverRegistry:
+    """RetrieverRegistry 동작 테스트"""
+
+    def test_retrievers_are_reused(self):
+        """같은 전략은 같은 retriever 객체를 재사용하는지 테스트"""
+        registry = _registry()
+        assert registry.get_retriever(RetrievalStrategy.MMR) is registry.get_retriever("mmr")
+        print("✅ retriever 재사용 테스트 통과")
+
+    def test_search_with_filter_and_k(self):
+        """호출별 filter/k가 이번 검색에만 적용되는지 테스트"""
+        registry = _registry()
+        only_han = lambda doc: doc.metadata["author"] == "한강"
+
+        filtered = registry.search(RetrievalStrategy.MMR, "책", filter=only_han, k=2)
+        unfiltered = registry.search(RetrievalStrategy.MMR, "책")
+
+        assert len(filtered) == 2
+        assert all(doc.metadata["author"] == "한강" for doc in filtered)
+        assert len(unfiltered) == 3
+        print("✅ filter/k 적용 테스트 통과")
+
+    def test_timings_recorded(self):
+        """전략별 검색 횟수 기록 테스트 (비동기 포함)"""
+        registry = _registry()
+        registry.search(RetrievalStrategy.SIMILARITY_THRESHOLD, "책")
+        asyncio.run(registry.asearch(RetrievalStrategy.SIMILARITY_THRESHOLD, "책"))
+
+        timings = registry.timings()
+        print(f"  ⏱️ 검색 시간: {timings}")
+        assert timings["similarity_score_threshold"]["count"] == 2
+        assert timings["mmr"]["count"] == 0
+        with pytest.raises(ValueError):
+            registry.search("unknown", "책")
+        print("✅ 시간 기록 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🧪 RetrieverRegistry 테스트 시작")
+    print("=" * 60)
+    test_registry = TestRetrieverRegistry()
+    test_registry.test_retrievers_are_reused()
+    test_registry.test_search_with_filter_and_k()
+    test_registry.test_timings_recorded()
+
+    print("\n" + "=" * 60)
+    print("🎉 모든 RetrieverRegistry 테스트 통과!")
@@ -0,0 +1,90 @@
+"""
+VersionedIndex TDD
+작가/어휘/감정 색인이 함께 쓰는 준비·버전 확인·백그라운드 재생성·생성 실패 처리 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/retrieval/test_versioned_index.py
+    또는
+    python -m pytest tests/unit/retrieval/test_versioned_index.py -v -s
+"""
+import pytest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 테스트 대상 import
+from app.retrieval.versioned_index import VersionedIndex
+
+
+class CountingIndex(VersionedIndex):
+    """컬렉션 버전을 그대로 색인으로 쓰고, fail이 켜져 있으면 생성에 실패하는 테스트용 색인"""
+
+    def __init__(self, version=1, **kwargs):
+        self.version = version
+        self.fail = False
+        self.builds = 0
+        super().__init__(None, version_fn=lambda: self.version, **kwargs)
+
+    def _build(self, version):
+        self.builds += 1
+        if self.fail:
+            raise RuntimeError("컬렉션 읽기 실패")
+        return {"version": version}
+
+
+class TestVersionedIndex:
+    """버전 기반 색인 공통 동작 테스트"""
+
+    def test_first_lookup_waits_and_later_lookups_reuse(self):
+        """만든 적이 없으면 첫 조회에서 만들고, 버전이 같으면 다시 만들지 않는지 테스트"""
+        index = CountingIndex(version_check_interval=0)
+        assert index._ensure_index() == {"version": 1}
+        index.ensure_built()
+        assert index._ensure_index() == {"version": 1}
+        assert index.builds == 1
+        print("✅ 첫 생성/재사용 테스트 통과")
+
+    def test_version_change_rebuilds_in_background(self):
+        """버전이 바뀌면 이전 색인으로 응답하면서 백그라운드에서 다시 만드는지 테스트"""
+        index = CountingIndex(version_check_interval=0)
+        index.ensure_built()
+
+        index.version = 2
+        assert index._ensure_index() == {"version": 1}
+        index._rebuild_thread.join(timeout=5)
+        assert index._ensure_index() == {"version": 2}
+        print("✅ 백그라운드 재생성 테스트 통과")
+
+    def test_build_failure_serves_without_index_and_retries(self):
+        """생성에 실패하면 예외 없이 None으로 응답하고, 확인 주기마다 백그라운드에서 다시 시도하는지 테스트"""
+        index = CountingIndex(version_check_interval=0)
+        index.fail = True
+        index.ensure_built()
+        assert index._ensure_index() is None
+        index._rebuild_thread.join(timeout=5)
+        assert index.builds == 2  # 조회를 막지 않고 백그라운드에서 다시 시도
+
+        index.fail = False
+        index._ensure_index()
+        index._rebuild_thread.join(timeout=5)
+        assert index._ensure_index() == {"version": 1}
+        print("✅ 생성 실패 처리 테스트 통과")
+
+    def test_failed_background_rebuild_keeps_previous_index(self):
+        """재생성에 실패하면 이전 색인을 계속 쓰는지 테스트"""
+        index = CountingIndex(version_check_interval=0)
+        index.ensure_built()
+
+        index.version, index.fail = 2, True
+        index._ensure_index()
+        index._rebuild_thread.join(timeout=5)
+        assert index._ensure_index() == {"version": 1}
+        print("✅ 재생성 실패 시 이전 색인 유지 테스트 통과")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,61 @@
+"""
+import_profile TDD
+importtime 로그 파싱과, 서버 import 시 무거운 모듈이 지연 로딩되는지 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/scripts/test_import_profile.py
+    또는
+    python -m pytest tests/unit/scripts/test_import_profile.py -v -s
+"""
+import pytest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 테스트 대상 import
+from scripts.import_profile import parse_importtime, profile, DEFERRED_MODULES
+
+
+LOG = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     app.config.settings
+import time:      2000 |       2120 |   app.config
+import time:       500 |       2620 | main
+"""
+
+
+class TestImportProfile:
+    """import 시간 측정 테스트"""
+
+    def test_parse_importtime(self):
+        """self/누적 시간(ms)과 깊이를 읽는지 테스트"""
+        entries = parse_importtime(LOG)
+        assert entries == [
+            ("app.config.settings", 0.12, 0.12, 2),
+            ("app.config", 2.0, 2.12, 1),
+            ("main", 0.5, 2.62, 0),
+        ]
+        print("✅ importtime 파싱 테스트 통과")
+
+    def test_server_import_defers_heavy_modules(self):
+        """main import 시 LLM/벡터스토어 관련 무거운 모듈을 불러오지 않는지 테스트"""
+        pytest.importorskip("fastapi")
+        pytest.importorskip("langchain_core")
+        try:
+            _, top_level, entries, _ = profile("main")
+        except RuntimeError as e:
+            pytest.skip(f"서버 의존성이 설치되지 않음: {e}")
+
+        loaded = {name for name, _, _, _ in entries}
+        assert "main" in top_level
+        assert not [name for name in DEFERRED_MODULES if name in loaded]
+        print("✅ 지연 로딩 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_profile = TestImportProfile()
+    test_profile.test_parse_importtime()
+    test_profile.test_server_import_defers_heavy_modules()
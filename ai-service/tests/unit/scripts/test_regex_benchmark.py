@@ -0,0 +1,113 @@
+"""
+regex_benchmark TDD
+벤치마크 본문 로딩(디렉터리/페이지 캐시/위키 페이지 픽스처)과, 레지스트리 패턴이 실제 위키 페이지에서
+re를 직접 쓴 결과와 같은지(필요 리터럴 검사로 건너뛴 경우 포함) 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/scripts/test_regex_benchmark.py
+    또는
+    python -m pytest tests/unit/scripts/test_regex_benchmark.py -v -s
+"""
+import pytest
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 테스트 대상 import
+from scripts.regex_benchmark import DEFAULT_CORPUS_DIR, load_corpus, main, run
+from app.utils import wiki_patterns
+from app.utils.wiki_page_cache import WikiPageCache
+from app.utils.wiki_patterns import AnyPattern, Pattern, PatternList
+
+
+def _page_texts():
+    """픽스처 페이지 전체와 페이지의 각 줄 (짧은 본문에서는 필요 리터럴이 없어 정규식을 건너뛰는 경우가 많음)"""
+    pages = load_corpus(corpus_dir=DEFAULT_CORPUS_DIR)
+    lines = [line for page in pages for line in page.splitlines() if line.strip()]
+    return pages + lines
+
+
+def _registry_patterns():
+    """레지스트리 모듈의 모든 Pattern/AnyPattern (PatternList는 항목별로)"""
+    found = []
+    for name, value in sorted(vars(wiki_patterns).items()):
+        if name.startswith("_"):
+            continue
+        if isinstance(value, (Pattern, AnyPattern)):
+            found.append((name, value))
+        elif isinstance(value, PatternList):
+            found.extend((f"{name}[{i}]", p) for i, p in enumerate(value))
+    return found
+
+
+def _span(found):
+    return (found.span(), found.groups()) if found else None
+
+
+class TestRegexBenchmark:
+    """정규식 벤치마크 테스트"""
+
+    def test_load_corpus_sources(self):
+        """디렉터리 → 페이지 캐시 → 내장 예문 순으로 본문을 찾는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmp:
+            (Path(tmp) / "a.txt").write_text("한강은 소설가이다.", encoding="utf-8")
+            assert load_corpus(corpus_dir=tmp) == ["한강은 소설가이다."]
+
+            cache_path = str(Path(tmp) / "pages.sqlite3")
+            cache = WikiPageCache(disk_path=cache_path)
+            cache.set("한강", {'title': "한강", 'summary': "요약", 'text': "본문", 'url': "url"})
+            assert load_corpus(cache_path=cache_path) == ["본문"]
+
+        default = load_corpus()
+        assert len(default) >= 5
+        assert default == load_corpus(corpus_dir=DEFAULT_CORPUS_DIR)
+        print("✅ 본문 로딩 테스트 통과")
+
+    def test_results_match_legacy(self):
+        """모든 패턴의 결과가 기존 방식과 같고 종료 코드가 0인지 테스트"""
+        rows = run(load_corpus(), repeat=1)
+        assert rows
+        assert all(same for _, _, _, same in rows)
+        assert main(["--repeat", "1", "--top", "3"]) == 0
+        print("✅ 결과 동등성 테스트 통과")
+
+
+class TestRegistryMatchesRe:
+    """레지스트리 패턴 ↔ re 직접 호출 비교 (실제 위키 페이지 픽스처)"""
+
+    def test_every_pattern_matches_plain_re(self):
+        """모든 패턴의 search/match/findall/sub 결과가 re와 같은지 테스트"""
+        texts = _page_texts()
+        skipped = 0
+        for name, pattern in _registry_patterns():
+            if isinstance(pattern, AnyPattern):
+                for text in texts:
+                    flags = pattern.regex.flags
+                    assert pattern.search(text) == any(re.search(p, text, flags) for p in pattern.patterns), (name, text)
+                    assert pattern.match(text) == any(re.match(p, text, flags) for p in pattern.patterns), (name, text)
+                    skipped += not pattern.possible(text)
+                continue
+            source, flags = pattern.pattern, pattern.regex.flags
+            for text in texts:
+                assert pattern.findall(text) == re.findall(source, text, flags), (name, text)
+                assert _span(pattern.search(text)) == _span(re.search(source, text, flags)), (name, text)
+                assert _span(pattern.match(text)) == _span(re.match(source, text, flags)), (name, text)
+                assert pattern.sub("", text) == re.sub(source, "", text, flags=flags), (name, text)
+                skipped += not pattern.possible(text)
+
+        # 리터럴 검사로 정규식을 건너뛴 경우도 비교에 포함되었는지
+        assert skipped > 0
+        print(f"✅ 레지스트리 ↔ re 비교 테스트 통과 (본문 {len(texts)}개, 건너뛴 경우 {skipped}개)")
+
+
+if __name__ == "__main__":
+    test_benchmark = TestRegexBenchmark()
+    test_benchmark.test_load_corpus_sources()
+    test_benchmark.test_results_match_legacy()
+    TestRegistryMatchesRe().test_every_pattern_matches_plain_re()
@@ -14,14 +14,17 @@ import sys
 import os
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
+import httpx
 
 # 프로젝트 루트를 Python path에 추가
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 # 테스트 대상 도구 import
-from app.tools.wiki_search_tool import WikipediaSearchTool
+from app.tools import wiki_search_tool
+from app.tools.wiki_search_tool import WikipediaSearchTool, strip_wikitext, pick_sections
 from app.models.wiki_search_result import WikiSearchResult
+from app.utils.wiki_page_cache import WikiPageCache
 
 class TestWikiSearchToolBasics:
     """WikiSearchTool 기본 기능 테스트"""
@@ -509,6 +512,284 @@ class TestWikiSearchToolUsageScenarios:
         print("✅ 정보 부족한 작가 검색 시나리오 테스트 통과")
 
 
+class TestWikiSearchToolCache:
+    """WikiSearchTool 페이지 캐시 테스트"""
+
+    @staticmethod
+    def _mock_wiki(mock_wikipedia, exists=True):
+        mock_page = Mock()
+        mock_page.exists.return_value = exists
+        mock_page.title = "한강 (소설가)"
+        mock_page.summary = "한강은 대한민국의 소설가이다."
+        mock_page.text = "한강은 대한민국의 소설가이다.\n\n== 학력 ==\n연세대학교 졸업"
+        mock_page.fullurl = "https://ko.wikipedia.org/wiki/한강_(소설가)"
+        mock_wiki = Mock()
+        mock_wiki.page.return_value = mock_page
+        mock_wikipedia.return_value = mock_wiki
+        return mock_wiki
+
+    @patch('app.tools.wiki_search_tool.wikipediaapi.Wikipedia')
+    def test_repeat_search_served_from_cache(self, mock_wikipedia):
+        """같은 검색어(공백만 다른 경우 포함)는 다시 요청하지 않는지 테스트"""
+        mock_wiki = self._mock_wiki(mock_wikipedia)
+        tool = WikipediaSearchTool(cache=WikiPageCache())
+
+        first = tool.search_page("한강")
+        second = tool.search_page(" 한강 ")
+
+        assert mock_wiki.page.call_count == 1
+        assert first == second and first['success'] == True
+        print("✅ 반복 검색 캐시 테스트 통과")
+
+    @patch('app.tools.wiki_search_tool.wikipediaapi.Wikipedia')
+    def test_missing_page_is_cached_with_negative_ttl(self, mock_wikipedia):
+        """없는 페이지도 캐시하되 negative_ttl이 지나면 다시 요청하는지 테스트"""
+        mock_wiki = self._mock_wiki(mock_wikipedia, exists=False)
+        tool = WikipediaSearchTool(cache=WikiPageCache(negative_ttl=60))
+
+        assert tool.search_page("없는작가")['success'] == False
+        assert tool.search_page("없는작가")['success'] == False
+        assert mock_wiki.page.call_count == 1
+
+        expired = WikipediaSearchTool(cache=WikiPageCache(negative_ttl=0))
+        expired.search_page("없는작가")
+        expired.search_page("없는작가")
+        assert mock_wiki.page.call_count == 3
+        print("✅ 없는 페이지 캐시 테스트 통과")
+
+    @patch('app.tools.wiki_search_tool.wikipediaapi.Wikipedia')
+    def test_errors_are_not_cached(self, mock_wikipedia):
+        """네트워크 오류는 캐시하지 않고 다음 호출에서 다시 시도하는지 테스트"""
+        mock_wiki = self._mock_wiki(mock_wikipedia)
+        mock_wiki.page.side_effect = [ConnectionError("timeout"), mock_wiki.page.return_value]
+        tool = WikipediaSearchTool(cache=WikiPageCache())
+
+        assert tool.search_page("한강")['success'] == False
+        assert tool.search_page("한강")['success'] == True
+        print("✅ 오류 미캐시 테스트 통과")
+
+    @patch('app.tools.wiki_search_tool.wikipediaapi.Wikipedia')
+    def test_disk_tier_shared_across_instances(self, mock_wikipedia, tmp_path):
+        """디스크 계층은 새 캐시(재시작)에서도 재사용되는지 테스트"""
+        mock_wiki = self._mock_wiki(mock_wikipedia)
+        path = str(tmp_path / "wiki_cache.sqlite3")
+        WikipediaSearchTool(cache=WikiPageCache(disk_path=path)).search_page("한강")
+
+        result = WikipediaSearchTool(cache=WikiPageCache(disk_path=path)).search_page("한강")
+        assert result['success'] == True
+        assert result['title'] == "한강 (소설가)"
+        assert "연세대학교" in result['content']
+        assert mock_wiki.page.call_count == 1
+        print("✅ 디스크 캐시 테스트 통과")
+
+
+class TestWikiSearchToolBatch:
+    """WikiSearchTool 후보 제목 일괄 검색(search_pages) 테스트"""
+
+    @staticmethod
+    def _mock_wiki(mock_wikipedia):
+        def page(title):
+            mock_page = Mock()
+            mock_page.exists.return_value = True
+            mock_page.title = title
+            mock_page.summary = f"{title}은 대한민국의 소설가이다."
+            mock_page.text = mock_page.summary
+            mock_page.fullurl = f"https://ko.wikipedia.org/wiki/{title}"
+            return mock_page
+        mock_wiki = Mock()
+        mock_wiki.page.side_effect = page
+        mock_wikipedia.return_value = mock_wiki
+        return mock_wiki
+
+    @staticmethod
+    def _info_response(request):
+        # "한강 (작가)"는 "한강 (소설가)"로 넘겨주기, "한강 (만화가)"는 없는 문서
+        return httpx.Response(200, json={'query': {
+            'redirects': [{'from': "한강 (작가)", 'to': "한강 (소설가)"}],
+            'pages': [
+                {'title': "한강 (소설가)"},
+                {'title': "한강 (만화가)", 'missing': True},
+                {'title': "한강"},
+            ]
+        }})
+
+    @patch('app.tools.wiki_search_tool.wikipediaapi.Wikipedia')
+    def test_one_existence_query_for_all_candidates(self, mock_wikipedia):
+        """후보 전체를 존재 확인 요청 한 번으로 처리하고 꺼낸 후보의 페이지만 받는지 테스트"""
+        mock_wiki = self._mock_wiki(mock_wikipedia)
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return self._info_response(request)
+
+        candidates = ["한강 (작가)", "한강 (소설가)", "한강 (만화가)", "한강", " 한강 "]
+        with patch('app.tools.wiki_search_tool._get_sync_client',
+                   return_value=httpx.Client(transport=httpx.MockTransport(handler))):
+            results = WikipediaSearchTool(cache=WikiPageCache()).search_pages(candidates)
+
+        assert len(requests) == 1
+        assert requests[0].url.params['titles'] == "한강 (작가)|한강 (소설가)|한강 (만화가)|한강"
+        # 존재 확인만 하고 본문은 아직 받지 않음
+        assert mock_wiki.page.call_count == 0
+
+        # 우선순위가 가장 높은 후보만 꺼내면 그 페이지만 받음
+        assert results["한강 (작가)"]['title'] == "한강 (소설가)"
+        assert [call.args[0] for call in mock_wiki.page.call_args_list] == ["한강 (소설가)"]
+
+        # 넘겨주기 대상이 같은 "한강 (작가)"/"한강 (소설가)"는 한 번만 받고, 없는 문서는 받지 않음
+        assert results["한강 (소설가)"]['success'] == True
+        assert results["한강 (만화가)"]['success'] == False
+        assert mock_wiki.page.call_count == 1
+        assert results[" 한강 "] == results["한강"]
+        assert [call.args[0] for call in mock_wiki.page.call_args_list] == ["한강 (소설가)", "한강"]
+        print("✅ 일괄 존재 확인 테스트 통과")
+
+    @patch('app.tools.wiki_search_tool.wikipediaapi.Wikipedia')
+    def test_cached_candidates_skip_network(self, mock_wikipedia):
+        """이미 확인한 후보(없는 문서 포함)는 다시 요청하지 않는지 테스트"""
+        mock_wiki = self._mock_wiki(mock_wikipedia)
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return self._info_response(request)
+
+        tool = WikipediaSearchTool(cache=WikiPageCache())
+        candidates = ["한강 (작가)", "한강 (만화가)", "한강"]
+        with patch('app.tools.wiki_search_tool._get_sync_client',
+                   return_value=httpx.Client(transport=httpx.MockTransport(handler))):
+            first = tool.search_pages(candidates)
+            first_results = dict(first)
+            second = tool.search_pages(candidates)
+
+        assert len(requests) == 1
+        assert dict(second) == first_results
+        assert mock_wiki.page.call_count == 2
+        print("✅ 일괄 검색 캐시 테스트 통과")
+
+    @patch('app.tools.wiki_search_tool.wikipediaapi.Wikipedia')
+    def test_falls_back_to_single_searches_on_error(self, mock_wikipedia):
+        """존재 확인 요청이 실패하면 후보마다 search_page로 대체하는지 테스트"""
+        mock_wiki = self._mock_wiki(mock_wikipedia)
+
+        def handler(request):
+            return httpx.Response(503)
+
+        with patch('app.tools.wiki_search_tool._get_sync_client',
+                   return_value=httpx.Client(transport=httpx.MockTransport(handler))):
+            results = WikipediaSearchTool().search_pages(["한강 (작가)", "한강"])
+            assert results["한강 (작가)"]['success']
+            assert mock_wiki.page.call_count == 1
+            assert all(result['success'] for result in results.values())
+
+        assert mock_wiki.page.call_count == 2
+        print("✅ 일괄 검색 대체 경로 테스트 통과")
+
+
+class TestWikiSearchToolSections:
+    """WikiSearchTool 섹션 단위 수집(fetch_mode='sections') 테스트"""
+
+    SECTIONS = [
+        {'index': "1", 'number': "1", 'line': "생애"},
+        {'index': "2", 'number': "1.1", 'line': "학력"},
+        {'index': "3", 'number': "2", 'line': "주요 <i>작품</i>"},
+        {'index': "4", 'number': "3", 'line': "가족"},
+        {'index': "5", 'number': "4", 'line': "수상 경력"},
+    ]
+    WIKITEXT = {
+        "1": "1970년 [[광주광역시]]에서 태어났다.<ref>출처</ref>\n=== 학력 ===\n[[연세대학교|연세대]] 졸업",
+        "3": "* 《[[채식주의자]]》 {{lang|en|The Vegetarian}}",
+        "5": "'''2024년''' [[노벨 문학상]]",
+    }
+
+    def _handler(self, requested):
+        def handler(request):
+            params = request.url.params
+            requested.append(dict(params))
+            if params['action'] == 'parse' and params.get('prop') == 'sections':
+                if params['page'] == "없는작가":
+                    return httpx.Response(200, json={'error': {'code': 'missingtitle', 'info': "없음"}})
+                return httpx.Response(200, json={'parse': {'title': "한강 (소설가)", 'sections': self.SECTIONS}})
+            if params['action'] == 'parse':
+                return httpx.Response(200, json={'parse': {'wikitext': self.WIKITEXT[params['section']]}})
+            return httpx.Response(200, json={'query': {'pages': [{
+                'title': "한강 (소설가)",
+                'extract': "한강은 대한민국의 소설가이다.",
+                'fullurl': "https://ko.wikipedia.org/wiki/한강_(소설가)"
+            }]}})
+        return handler
+
+    def test_strip_wikitext(self):
+        """위키텍스트 → 평문 변환 테스트"""
+        text = strip_wikitext(
+            "'''한강'''은 [[광주광역시|광주]]에서<ref name=a/> 태어났다.{{각주|{{중첩}}}} [https://example.com 링크]"
+        )
+        assert text == "한강은 광주에서 태어났다. 링크"
+        print("✅ 위키텍스트 변환 테스트 통과")
+
+    def test_pick_sections_skips_subsections(self):
+        """이미 고른 상위 섹션의 하위 섹션은 따로 받지 않는지 테스트"""
+        picked = pick_sections(self.SECTIONS, ('학력', '생애', '작품', '수상'))
+        assert picked == {
+            '학력': [],
+            '생애': [("1", "생애")],
+            '작품': [("3", "주요 작품")],
+            '수상': [("5", "수상 경력")],
+        }
+        print("✅ 섹션 선택 테스트 통과")
+
+    @patch('app.tools.wiki_search_tool.wikipediaapi.Wikipedia')
+    def test_sections_mode_fetches_only_needed_sections(self, mock_wikipedia):
+        """도입부 + 필요한 섹션만 받고 섹션 맵을 반환하는지 테스트"""
+        requested = []
+        with patch('app.tools.wiki_search_tool._get_sync_client',
+                   return_value=httpx.Client(transport=httpx.MockTransport(self._handler(requested)))):
+            tool = WikipediaSearchTool(fetch_mode='sections', cache=WikiPageCache())
+            result = tool.search_page("한강")
+            again = tool.search_page("한강")
+
+        assert mock_wikipedia.return_value.page.call_count == 0
+        assert len(requested) == 5  # 섹션 목록 + 도입부 + 섹션 3개, 두 번째 검색은 캐시
+        assert sorted(p['section'] for p in requested if 'section' in p) == ["1", "3", "5"]
+        assert result == again
+        assert result['success'] == True
+        assert result['summary'] == "한강은 대한민국의 소설가이다."
+        assert result['sections']['생애'] == "1970년 광주광역시에서 태어났다.\n=== 학력 ===\n연세대 졸업"
+        assert result['sections']['작품'] == "* 《채식주의자》"
+        assert result['sections']['수상'] == "2024년 노벨 문학상"
+        assert "연세대 졸업" in result['content']
+        print("✅ 섹션 단위 수집 테스트 통과")
+
+    @patch('app.tools.wiki_search_tool.wikipediaapi.Wikipedia')
+    def test_sections_mode_missing_page(self, mock_wikipedia):
+        """없는 문서는 실패 결과를 반환하는지 테스트"""
+        requested = []
+        with patch('app.tools.wiki_search_tool._get_sync_client',
+                   return_value=httpx.Client(transport=httpx.MockTransport(self._handler(requested)))):
+            result = WikipediaSearchTool(fetch_mode='sections').search_page("없는작가")
+
+        assert result['success'] == False
+        assert len(requested) == 1
+        print("✅ 섹션 모드 없는 문서 테스트 통과")
+
+    @patch('app.tools.wiki_search_tool.wikipediaapi.Wikipedia')
+    def test_sections_mode_reuses_shared_pool(self, mock_wikipedia):
+        """페이지마다 스레드 풀을 만들지 않고 공유 풀에서 도입부/섹션을 요청하는지 테스트"""
+        requested = []
+        with patch('app.tools.wiki_search_tool._get_sync_client',
+                   return_value=httpx.Client(transport=httpx.MockTransport(self._handler(requested)))), \
+                patch('app.tools.wiki_search_tool.ThreadPoolExecutor',
+                      wraps=wiki_search_tool.ThreadPoolExecutor) as executor_cls:
+            wiki_search_tool.close_http_client()
+            tool = WikipediaSearchTool(fetch_mode='sections')
+            tool.search_page("한강")
+            tool.search_page("한강 (소설가)")
+
+        assert executor_cls.call_count == 1
+        assert len(requested) == 10  # 페이지당 2+N회 (섹션 목록 + 도입부 + 섹션 3개)
+        print("✅ 섹션 요청 공유 풀 테스트 통과")
+
 if __name__ == "__main__":
 
     print("🧪 WikiSearchTool 직관적인 TDD 테스트 시작\n")
@@ -548,6 +829,32 @@ if __name__ == "__main__":
     test_scenarios.test_author_with_education_info_scenario()
     test_scenarios.test_author_with_minimal_info_scenario()
 
+    # 페이지 캐시 테스트
+    print("\n🗄️ 페이지 캐시 테스트")
+    print("=" * 60)
+    test_cache = TestWikiSearchToolCache()
+    test_cache.test_repeat_search_served_from_cache()
+    test_cache.test_missing_page_is_cached_with_negative_ttl()
+    test_cache.test_errors_are_not_cached()
+
+    # 일괄 검색 테스트
+    print("\n📚 후보 제목 일괄 검색 테스트")
+    print("=" * 60)
+    test_batch = TestWikiSearchToolBatch()
+    test_batch.test_one_existence_query_for_all_candidates()
+    test_batch.test_cached_candidates_skip_network()
+    test_batch.test_falls_back_to_single_searches_on_error()
+
+    # 섹션 단위 수집 테스트
+    print("\n🧩 섹션 단위 수집 테스트")
+    print("=" * 60)
+    test_sections = TestWikiSearchToolSections()
+    test_sections.test_strip_wikitext()
+    test_sections.test_pick_sections_skips_subsections()
+    test_sections.test_sections_mode_fetches_only_needed_sections()
+    test_sections.test_sections_mode_missing_page()
+    test_sections.test_sections_mode_reuses_shared_pool()
+
     print("\n" + "=" * 60)
     print("🎉 모든 WikiSearchTool Mock 테스트 통과!")
     print("\n📊 테스트 요약:")
@@ -555,6 +862,9 @@ if __name__ == "__main__":
     print("  ✅ 섹션 추출: 3개 테스트")
     print("  ✅ 엣지 케이스: 3개 테스트")
     print("  ✅ 사용 시나리오: 2개 테스트")
+    print("  ✅ 페이지 캐시: 4개 테스트")
+    print("  ✅ 일괄 검색: 3개 테스트")
+    print("  ✅ 섹션 단위 수집: 4개 테스트")
     print("\n🌐 통합 테스트 (실제 API 호출):")
     print("  ⚠️  네트워크 연결이 필요한 테스트는 별도로 실행:")
     print("    python -m pytest tests/unit/tools/test_wiki_search_tool.py::TestWikiSearchToolIntegration -v -s -m integration")
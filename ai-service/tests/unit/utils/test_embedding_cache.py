@@ -0,0 +1,115 @@
+"""
+CachedEmbeddings TDD
+임베딩 캐시 래퍼가 같은 텍스트를 다시 임베딩하지 않는지, 디스크 계층이 재시작 후에도 유지되는지 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/utils/test_embedding_cache.py
+    또는
+    python -m pytest tests/unit/utils/test_embedding_cache.py -v -s
+"""
+import pytest
+import sys
+import asyncio
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from langchain_core.embeddings import Embeddings
+
+# 테스트 대상 import
+from app.utils.embedding_cache import CachedEmbeddings
+
+
+class CountingEmbeddings(Embeddings):
+    """텍스트 길이로 벡터를 만들고 호출된 텍스트를 기록하는 가짜 임베딩 모델"""
+    def __init__(self):
+        self.embedded = []
+
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return [[float(len(t)), 1.0] for t in texts]
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+
+class TestCachedEmbeddings:
+    """CachedEmbeddings 동작 테스트"""
+
+    def test_query_is_embedded_once(self):
+        """같은 질의는 한 번만 임베딩 테스트"""
+        base = CountingEmbeddings()
+        cached = CachedEmbeddings(base, model_name="fake")
+
+        first = cached.embed_query("한강 작가의 책")
+        second = cached.embed_query("한강 작가의 책")
+
+        assert first == second == [8.0, 1.0]
+        assert base.embedded == ["한강 작가의 책"]
+        print("✅ 질의 캐시 테스트 통과")
+
+    def test_documents_only_embed_missing(self):
+        """문서 묶음에서 캐시에 없는 텍스트만(중복 제거) 임베딩 테스트"""
+        base = CountingEmbeddings()
+        cached = CachedEmbeddings(base, model_name="fake")
+        cached.embed_query("a")
+
+        vectors = cached.embed_documents(["a", "bb", "bb", "ccc"])
+
+        assert vectors == [[1.0, 1.0], [2.0, 1.0], [2.0, 1.0], [3.0, 1.0]]
+        assert base.embedded == ["a", "bb", "ccc"]
+        print("✅ 문서 묶음 캐시 테스트 통과")
+
+    def test_model_name_is_part_of_key(self):
+        """모델 이름이 다르면 캐시를 공유하지 않음 테스트"""
+        base = CountingEmbeddings()
+        a = CachedEmbeddings(base, model_name="model-a")
+        b = CachedEmbeddings(base, model_name="model-b")
+        assert a._key("책") != b._key("책")
+        print("✅ 모델별 키 테스트 통과")
+
+    def test_disk_tier_survives_restart(self):
+        """sqlite 계층은 새 인스턴스에서도 재사용 테스트"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "embeddings.sqlite3")
+            first = CachedEmbeddings(CountingEmbeddings(), model_name="fake", disk_path=path)
+            first.embed_query("김초엽 작가의 책")
+            first._disk.close()
+
+            base = CountingEmbeddings()
+            second = CachedEmbeddings(base, model_name="fake", disk_path=path)
+            assert second.embed_query("김초엽 작가의 책") == [9.0, 1.0]
+            assert base.embedded == []
+            second._disk.close()
+        print("✅ 디스크 계층 테스트 통과")
+
+    def test_async_query(self):
+        """비동기 임베딩도 캐시를 공유하는지 테스트"""
+        base = CountingEmbeddings()
+        cached = CachedEmbeddings(base, model_name="fake")
+
+        async def run():
+            await cached.aembed_query("우울")
+            return await cached.aembed_documents(["우울", "행복"])
+
+        assert asyncio.run(run()) == [[2.0, 1.0], [2.0, 1.0]]
+        assert base.embedded == ["우울", "행복"]
+        print("✅ 비동기 캐시 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🧪 CachedEmbeddings 테스트 시작")
+    print("=" * 60)
+    test_cache = TestCachedEmbeddings()
+    test_cache.test_query_is_embedded_once()
+    test_cache.test_documents_only_embed_missing()
+    test_cache.test_model_name_is_part_of_key()
+    test_cache.test_disk_tier_survives_restart()
+    test_cache.test_async_query()
+
+    print("\n" + "=" * 60)
+    print("🎉 모든 CachedEmbeddings 테스트 통과!")
@@ -0,0 +1,99 @@
+"""
+embedding_provider TDD
+로컬 임베딩 백엔드의 배치 추론/비동기 실행과 모델별 컬렉션 이름을 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/utils/test_embedding_provider.py
+    또는
+    python -m pytest tests/unit/utils/test_embedding_provider.py -v -s
+"""
+import pytest
+import sys
+import asyncio
+import threading
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 테스트 대상 import
+from app.utils.embedding_provider import (
+    LocalEmbeddings, create_embeddings, collection_name_for, DEFAULT_COLLECTION_NAME
+)
+
+
+class FakeSentenceModel:
+    """SentenceTransformer.encode 흉내 (호출 인자와 실행 스레드를 기록)"""
+    def __init__(self):
+        self.calls = []
+        self.threads = []
+
+    def encode(self, texts, batch_size, normalize_embeddings, convert_to_numpy, show_progress_bar):
+        self.calls.append((list(texts), batch_size, normalize_embeddings))
+        self.threads.append(threading.current_thread().name)
+        return [[float(len(t)), 0.5] for t in texts]
+
+
+class TestLocalEmbeddings:
+    """LocalEmbeddings 테스트"""
+
+    def test_documents_are_encoded_in_one_batched_call(self):
+        """여러 문서를 batch_size 옵션과 함께 한 번에 추론하는지 테스트"""
+        model = FakeSentenceModel()
+        embeddings = LocalEmbeddings("fake-ko", batch_size=8, model=model)
+
+        vectors = embeddings.embed_documents(["우울", "위로가 되는 책"])
+
+        assert vectors == [[2.0, 0.5], [8.0, 0.5]]
+        assert model.calls == [(["우울", "위로가 되는 책"], 8, True)]
+        assert embeddings.embed_documents([]) == []
+        assert len(model.calls) == 1
+        print("✅ 배치 추론 테스트 통과")
+
+    def test_async_query_runs_in_worker_thread(self):
+        """비동기 질의 임베딩이 전용 스레드 풀에서 실행되는지 테스트"""
+        model = FakeSentenceModel()
+        embeddings = LocalEmbeddings("fake-ko", model=model)
+
+        vector = asyncio.run(embeddings.aembed_query("설렘"))
+
+        assert vector == [2.0, 0.5]
+        assert model.threads[0].startswith("local-embed")
+        print("✅ 비동기 실행 테스트 통과")
+
+
+class TestProviderSelection:
+    """백엔드 선택과 컬렉션 이름 테스트"""
+
+    def test_collection_name_per_model(self):
+        """기존 모델은 기존 컬렉션, 다른 모델은 모델별 컬렉션을 쓰는지 테스트"""
+        assert collection_name_for("openai", "text-embedding-ada-002") == DEFAULT_COLLECTION_NAME
+        local = collection_name_for("local", "jhgan/ko-sroberta-multitask")
+        assert local == "bookstore_collection_local_jhgan_ko_sroberta_multitask"
+        assert local != collection_name_for("openai", "text-embedding-3-small")
+        assert len(collection_name_for("local", "x" * 100)) <= 63
+        print("✅ 컬렉션 이름 테스트 통과")
+
+    def test_unknown_provider(self):
+        """알 수 없는 백엔드와 모델 이름 없는 로컬 백엔드는 오류인지 테스트"""
+        with pytest.raises(ValueError):
+            create_embeddings("unknown")
+        with pytest.raises(ValueError):
+            create_embeddings("local", None)
+        print("✅ 백엔드 검증 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🧪 embedding_provider 테스트 시작")
+    print("=" * 60)
+    test_local = TestLocalEmbeddings()
+    test_local.test_documents_are_encoded_in_one_batched_call()
+    test_local.test_async_query_runs_in_worker_thread()
+    test_provider = TestProviderSelection()
+    test_provider.test_collection_name_per_model()
+    test_provider.test_unknown_provider()
+
+    print("\n" + "=" * 60)
+    print("🎉 모든 embedding_provider 테스트 통과!")
@@ -0,0 +1,94 @@
+"""
+formatters (LinkInjector / combine_response_with_links) TDD
+스트리밍 조각 단위로 넣어도 일괄 처리와 같은 결과(링크 삽입)가 나오는지 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/utils/test_formatters.py
+    또는
+    python -m pytest tests/unit/utils/test_formatters.py -v -s
+"""
+import pytest
+import sys
+import asyncio
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from langchain_core.documents import Document
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+# 테스트 대상 import
+from app.utils.formatters import LinkInjector, combine_response_with_links, agenerate_with_links
+
+DOCS = [
+    Document(page_content="내용 A", metadata={"isbn": "111", "product_name": "책 A"}),
+    Document(page_content="내용 B", metadata={"isbn": "222", "product_name": "책 B"}),
+]
+LLM_RESPONSE = "\n\n요청에 맞는 책을 골랐어요.\n1. 책 A\n따뜻한 이야기\n\n2. 책 B\n  \n3. 책 C\n즐거운 독서 되세요!\n\n"
+EXPECTED = (
+    "요청에 맞는 책을 골랐어요.\n"
+    "1. 책 A\n🔗 http://localhost:8080/product/detail?isbn=111\n따뜻한 이야기\n\n"
+    "2. 책 B\n🔗 http://localhost:8080/product/detail?isbn=222\n  \n"
+    "3. 책 C\n즐거운 독서 되세요!"
+)
+
+
+def _feed_in_chunks(text: str, size: int) -> str:
+    injector = LinkInjector([
+        "🔗 http://localhost:8080/product/detail?isbn=111",
+        "🔗 http://localhost:8080/product/detail?isbn=222",
+    ])
+    output = "".join(injector.feed(text[i:i + size]) for i in range(0, len(text), size))
+    return output + injector.flush()
+
+
+class TestLinkInjector:
+    """LinkInjector 줄 단위 링크 삽입 테스트"""
+
+    def test_combine_response_with_links(self):
+        """일괄 처리 결과 테스트"""
+        result = combine_response_with_links(LLM_RESPONSE, DOCS)
+        print(f"  🔗 결과:\n{result}")
+        assert result == EXPECTED
+        print("✅ 일괄 링크 삽입 테스트 통과")
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+    def test_streaming_matches_combined(self, size):
+        """조각 크기와 무관하게 일괄 처리와 같은 결과 테스트"""
+        assert _feed_in_chunks(LLM_RESPONSE, size) == EXPECTED
+        print(f"✅ 조각 크기 {size} 스트리밍 테스트 통과")
+
+    def test_link_emitted_when_line_completes(self):
+        """번호 줄이 끝나는 시점에 링크가 나오는지 테스트"""
+        injector = LinkInjector(["🔗 link-1"])
+        assert injector.feed("1. 책") == ""
+        assert injector.feed(" A\n다음") == "1. 책 A\n🔗 link-1"
+        assert injector.flush() == "\n다음"
+        print("✅ 줄 완성 시점 링크 삽입 테스트 통과")
+
+    def test_agenerate_with_links_streams_tokens(self):
+        """agenerate_with_links 스트리밍 콜백 테스트"""
+        tokens = []
+        llm = FakeListChatModel(responses=["1. 책 A\n좋아요"])
+
+        result = asyncio.run(agenerate_with_links(llm, "prompt", DOCS, on_token=tokens.append))
+        print(f"  📡 전달된 조각: {tokens}")
+
+        assert "".join(tokens) == result
+        assert result == "1. 책 A\n🔗 http://localhost:8080/product/detail?isbn=111\n좋아요"
+        print("✅ 스트리밍 생성 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🧪 formatters 테스트 시작")
+    print("=" * 60)
+    test = TestLinkInjector()
+    test.test_combine_response_with_links()
+    for size in [1, 2, 3, 7, 1000]:
+        test.test_streaming_matches_combined(size)
+    test.test_link_emitted_when_line_completes()
+    test.test_agenerate_with_links_streams_tokens()
+    print("\n🎉 모든 formatters 테스트 통과!")
@@ -0,0 +1,163 @@
+"""
+intent_classifier TDD
+로컬 의도 분류기 학습/저장, 확신도 임계값, 후속 질문 처리, LLM 의도 분류 체인 앞단 연결 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/utils/test_intent_classifier.py
+    또는
+    python -m pytest tests/unit/utils/test_intent_classifier.py -v -s
+"""
+import asyncio
+import importlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from langchain_core.runnables import RunnableLambda
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 테스트 대상 import
+from app.utils import intent_classifier
+from app.utils.intent_classifier import DEFAULT_MODEL_PATH, LocalIntentClassifier, is_follow_up
+
+# app.chains가 같은 이름의 체인 객체를 다시 내보내므로 모듈은 importlib로 가져옴
+chain_module = importlib.import_module("app.chains.intent_classify_chain")
+
+SAMPLES = [
+    ("한강 작가 알려줘", "info"), ("김영하는 누구야?", "info"), ("박경리 언제 태어났어?", "info"),
+    ("우울할 때 읽을 책 추천", "recommendation"), ("소설 추천해줘", "recommendation"),
+    ("힐링 에세이 추천해줘", "recommendation"), ("안녕하세요", "clarification"),
+]
+
+
+class TestLocalIntentClassifier:
+    """로컬 의도 분류기 테스트"""
+
+    def test_train_separates_intents(self):
+        """학습한 질문의 info/recommendation을 구분하는지 테스트"""
+        model = LocalIntentClassifier.train(SAMPLES)
+
+        assert model.probability("한강 작가 알려줘") < 0.5
+        assert model.probability("우울할 때 읽을 책 추천") > 0.5
+        assert abs(model.probability("안녕하세요") - 0.5) < 0.2
+        print("✅ 의도 구분 테스트 통과")
+
+    def test_threshold_defers_to_llm(self):
+        """확신도가 임계값보다 낮으면 의도를 정하지 않는지 테스트"""
+        model = LocalIntentClassifier.train(SAMPLES)
+
+        intent, confidence = model.predict("안녕하세요", threshold=0.9)
+        assert intent is None and confidence < 0.9
+        assert model.predict("한강 작가 알려줘", threshold=0.5)[0] == "info"
+        print("✅ 임계값 테스트 통과")
+
+    def test_save_and_load(self):
+        """모델 파일로 저장했다 불러와도 같은 확률을 내는지 테스트"""
+        model = LocalIntentClassifier.train(SAMPLES)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "model.json")
+            model.save(path)
+            loaded = LocalIntentClassifier.load(path)
+
+        assert loaded.probability("소설 추천해줘") == model.probability("소설 추천해줘")
+        print("✅ 저장/불러오기 테스트 통과")
+
+    def test_follow_up_only_with_history(self):
+        """이전 대화가 있을 때만 후속 질문으로 보는지 테스트"""
+        assert is_follow_up("그의 가족 관계는?", "user: 한강 작가 알려줘\n")
+        assert not is_follow_up("그의 가족 관계는?", "이전 대화가 없습니다.")
+        assert not is_follow_up("한강 작가 알려줘", "user: 책 추천해줘\n")
+        print("✅ 후속 질문 테스트 통과")
+
+    def test_shipped_model_handles_obvious_turns(self):
+        """기본 모델 파일이 뻔한 질문을 임계값 이상으로 분류하는지 테스트"""
+        model = LocalIntentClassifier.load(DEFAULT_MODEL_PATH)
+
+        assert model.predict("한강 작가 알려줘", 0.9)[0] == "info"
+        assert model.predict("우울할 때 읽을 책 추천", 0.9)[0] == "recommendation"
+        assert model.predict("안녕하세요", 0.9)[0] is None
+        print("✅ 기본 모델 테스트 통과")
+
+
+class TestIntentClassifyChain:
+    """intent_classify_chain 앞단 연결 테스트"""
+
+    def setup_method(self):
+        self.llm_calls = []
+        self.fake_llm_chain = RunnableLambda(lambda inputs: self.llm_calls.append(inputs) or "clarification")
+        self.model = LocalIntentClassifier.train(SAMPLES)
+
+    def _inputs(self, user_input, history="이전 대화가 없습니다."):
+        return {"user_input": user_input, "conversation_history": history}
+
+    def test_confident_turn_skips_llm(self):
+        """확신하는 질문은 LLM 체인을 호출하지 않는지 테스트"""
+        with patch.object(chain_module, "llm_intent_classify_chain", self.fake_llm_chain), \
+             patch.object(intent_classifier, "get_local_intent_classifier", return_value=self.model), \
+             patch("app.config.settings.LOCAL_INTENT_THRESHOLD", 0.9):
+            assert chain_module.intent_classify_chain.invoke(self._inputs("한강 작가 알려줘")) == "info"
+            assert asyncio.run(chain_module.intent_classify_chain.ainvoke(self._inputs("소설 추천해줘"))) == "recommendation"
+
+        assert self.llm_calls == []
+        print("✅ LLM 건너뛰기 테스트 통과")
+
+    def test_unsure_turn_uses_llm_and_logs(self):
+        """확신하지 못하거나 후속 질문이면 LLM 결과를 쓰고 턴을 기록하는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = os.path.join(tmp, "turns.jsonl")
+            with patch.object(chain_module, "llm_intent_classify_chain", self.fake_llm_chain), \
+                 patch.object(chain_module, "INTENT_TURN_LOG_PATH", log_path), \
+                 patch.object(intent_classifier, "get_local_intent_classifier", return_value=self.model), \
+                 patch("app.config.settings.LOCAL_INTENT_THRESHOLD", 0.9):
+                assert chain_module.intent_classify_chain.invoke(self._inputs("안녕하세요")) == "clarification"
+                assert chain_module.intent_classify_chain.invoke(
+                    self._inputs("그 작가 다른 책 추천해줘", "user: 한강 작가 알려줘\n")) == "clarification"
+
+            with open(log_path, encoding="utf-8") as f:
+                logged = [json.loads(line) for line in f]
+
+        assert len(self.llm_calls) == 2
+        assert logged[0] == {"user_input": "안녕하세요", "intent": "clarification"}
+        print("✅ LLM 위임/기록 테스트 통과")
+
+    def test_disabled_classifier_always_uses_llm(self):
+        """USE_LOCAL_INTENT가 꺼져 있으면(기본값) 모델을 불러오지 않고 항상 LLM으로 분류하는지 테스트"""
+        with patch.object(chain_module, "llm_intent_classify_chain", self.fake_llm_chain), \
+             patch.object(intent_classifier, "_classifier", None), \
+             patch.object(intent_classifier, "_classifier_loaded", False), \
+             patch.object(LocalIntentClassifier, "load") as mock_load, \
+             patch("app.config.settings.USE_LOCAL_INTENT", False):
+            assert chain_module.intent_classify_chain.invoke(self._inputs("한강 작가 알려줘")) == "clarification"
+
+        assert mock_load.call_count == 0
+        assert len(self.llm_calls) == 1
+        print("✅ 로컬 분류기 끔 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🧪 intent_classifier 테스트 시작")
+    print("=" * 60)
+    test_classifier = TestLocalIntentClassifier()
+    test_classifier.test_train_separates_intents()
+    test_classifier.test_threshold_defers_to_llm()
+    test_classifier.test_save_and_load()
+    test_classifier.test_follow_up_only_with_history()
+    test_classifier.test_shipped_model_handles_obvious_turns()
+
+    test_chain = TestIntentClassifyChain()
+    test_chain.setup_method()
+    test_chain.test_confident_turn_skips_llm()
+    test_chain.setup_method()
+    test_chain.test_unsure_turn_uses_llm_and_logs()
+    test_chain.setup_method()
+    test_chain.test_disabled_classifier_always_uses_llm()
+
+    print("\n" + "=" * 60)
+    print("🎉 모든 intent_classifier 테스트 통과!")
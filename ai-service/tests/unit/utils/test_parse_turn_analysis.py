@@ -0,0 +1,78 @@
+"""
+parse_turn_analysis TDD
+통합 분석 응답(JSON)을 query / intent / wiki_intent로 나누는지 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/utils/test_parse_turn_analysis.py
+    또는
+    python -m pytest tests/unit/utils/test_parse_turn_analysis.py -v -s
+"""
+import json
+import sys
+from pathlib import Path
+
+from langchain_core.messages import AIMessage
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 테스트 대상 import
+from app.utils.parse_turn_analysis import parse_turn_analysis
+
+WIKI_INTENT = {"intent_type": "author_search", "extracted_keywords": ["한강"], "specific_info_request": "birth"}
+
+
+def _response(**overrides):
+    fields = {
+        "emotion": None, "genre": None, "author": "한강", "title": None, "publisher": None, "order_id": None,
+        "keywords": ["한강"], "intent": "info", "wiki_intent": WIKI_INTENT,
+    }
+    fields.update(overrides)
+    return AIMessage(content=json.dumps(fields, ensure_ascii=False))
+
+
+class TestParseTurnAnalysis:
+    """통합 분석 응답 파싱 테스트"""
+
+    def test_splits_routing_fields_from_query(self):
+        """intent/wiki_intent는 query에서 빼고 따로 반환하는지 테스트"""
+        result = parse_turn_analysis(_response())
+
+        assert result["intent"] == "info"
+        assert result["wiki_intent"] == WIKI_INTENT
+        assert result["query"]["author"] == "한강"
+        assert result["query"]["keywords"] == ["한강"]
+        assert "intent" not in result["query"] and "wiki_intent" not in result["query"]
+        print("✅ 필드 분리 테스트 통과")
+
+    def test_normalizes_intent_and_wiki_intent(self):
+        """의도는 소문자로 정리하고 객체가 아닌 wiki_intent는 버리는지 테스트"""
+        result = parse_turn_analysis(_response(intent=" Recommendation ", wiki_intent=None))
+        assert result["intent"] == "recommendation"
+        assert result["wiki_intent"] is None
+
+        assert parse_turn_analysis(_response(wiki_intent="author_search"))["wiki_intent"] is None
+        print("✅ 의도 정리 테스트 통과")
+
+    def test_invalid_json_falls_back_to_clarification(self):
+        """JSON이 아니면 빈 query와 clarification 의도를 반환하는지 테스트"""
+        for output in ("분석 결과: info", "[1, 2]", None):
+            result = parse_turn_analysis(output)
+            assert result["intent"] == "clarification"
+            assert result["wiki_intent"] is None
+            assert result["query"]["keywords"] == []
+        print("✅ 파싱 실패 처리 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🧪 parse_turn_analysis 테스트 시작")
+    print("=" * 60)
+    test_parse = TestParseTurnAnalysis()
+    test_parse.test_splits_routing_fields_from_query()
+    test_parse.test_normalizes_intent_and_wiki_intent()
+    test_parse.test_invalid_json_falls_back_to_clarification()
+
+    print("\n" + "=" * 60)
+    print("🎉 모든 parse_turn_analysis 테스트 통과!")
@@ -0,0 +1,132 @@
+"""
+RecommendationCache TDD
+추천 응답 캐시의 키 정규화, 유사도 조회, 컬렉션 변경 시 무효화 동작을 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/utils/test_recommendation_cache.py
+    또는
+    python -m pytest tests/unit/utils/test_recommendation_cache.py -v -s
+"""
+import pytest
+import sys
+import asyncio
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 테스트 대상 import
+from app.utils.recommendation_cache import RecommendationCache
+
+
+class FakeEmbeddings:
+    """embed_query/aembed_query만 흉내내는 테스트 더블 (미리 정한 벡터 반환)"""
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.calls = 0
+
+    def embed_query(self, text):
+        self.calls += 1
+        return self.vectors[text]
+
+    async def aembed_query(self, text):
+        return self.embed_query(text)
+
+
+class TestRecommendationCacheKey:
+    """캐시 키 정규화 테스트"""
+
+    def test_make_key_normalizes(self):
+        """대소문자/공백/키워드 순서가 달라도 같은 키 생성 테스트"""
+        a = RecommendationCache.make_key("hybrid", emotion=" 우울 ", genre="에세이", keywords=["위로", "Hope "])
+        b = RecommendationCache.make_key("hybrid", emotion="우울", genre="에세이", keywords=["hope", "위로", ""])
+        c = RecommendationCache.make_key("emotion", emotion="우울")
+
+        assert a == b
+        assert a != c
+        print("✅ 키 정규화 테스트 통과")
+
+
+class TestRecommendationCache:
+    """RecommendationCache 조회/저장 테스트"""
+
+    def test_exact_hit_skips_embedding(self):
+        """정확히 같은 키는 임베딩 호출 없이 조회 테스트"""
+        embeddings = FakeEmbeddings({"우울할 때 읽을 책": [1.0, 0.0]})
+        cache = RecommendationCache(maxsize=10, embeddings=embeddings, similarity_threshold=0.9)
+        key = RecommendationCache.make_key("emotion", emotion="우울")
+
+        assert cache.get(key, "우울할 때 읽을 책") is None
+        cache.set(key, "추천 결과", "우울할 때 읽을 책")
+        assert embeddings.calls == 1  # 조회 때 계산한 임베딩을 저장에 재사용
+
+        assert cache.get(key, "우울할 때 읽을 책") == "추천 결과"
+        assert embeddings.calls == 1
+        print("✅ 정확 일치 조회 테스트 통과")
+
+    def test_semantic_fallback(self):
+        """유사한 질의는 임계값 이상일 때만 재사용 테스트"""
+        embeddings = FakeEmbeddings({
+            "우울할 때 읽을 책": [1.0, 0.0],
+            "기분이 가라앉을 때 볼 책": [0.95, 0.1],
+            "신나는 모험 이야기": [0.0, 1.0],
+        })
+        cache = RecommendationCache(maxsize=10, embeddings=embeddings, similarity_threshold=0.9)
+        cache.set(RecommendationCache.make_key("emotion", emotion="우울"), "우울 추천", "우울할 때 읽을 책")
+
+        near = RecommendationCache.make_key("emotion", emotion="슬픔")
+        far = RecommendationCache.make_key("emotion", emotion="신남")
+        other_tool = RecommendationCache.make_key("genre", genre="에세이")
+
+        assert cache.get(near, "기분이 가라앉을 때 볼 책") == "우울 추천"
+        assert cache.get(far, "신나는 모험 이야기") is None
+        assert cache.get(other_tool, "기분이 가라앉을 때 볼 책") is None  # 다른 도구의 응답은 재사용하지 않음
+        print("✅ 유사도 조회 테스트 통과")
+
+    def test_invalidate_on_version_change(self):
+        """컬렉션 버전이 바뀌면 캐시가 비워지는지 테스트"""
+        version = {"count": 100}
+        cache = RecommendationCache(maxsize=10, version_fn=lambda: version["count"], version_check_interval=0)
+        key = RecommendationCache.make_key("genre", genre="소설")
+
+        cache.set(key, "소설 추천")
+        assert cache.get(key) == "소설 추천"
+
+        version["count"] = 120
+        assert cache.get(key) is None
+        assert len(cache) == 0
+        print("✅ 버전 변경 무효화 테스트 통과")
+
+    def test_disabled_and_async(self):
+        """비활성화 시 무시, 비동기 조회/저장 테스트"""
+        key = RecommendationCache.make_key("author", author="한강")
+
+        disabled = RecommendationCache(maxsize=10, enabled=False)
+        disabled.set(key, "추천")
+        assert disabled.get(key) is None
+
+        async def run():
+            cache = RecommendationCache(maxsize=10)
+            await cache.aset(key, "한강 추천")
+            return await cache.aget(key)
+
+        assert asyncio.run(run()) == "한강 추천"
+        print("✅ 비활성화/비동기 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🧪 RecommendationCache 테스트 시작")
+    print("=" * 60)
+    test_key = TestRecommendationCacheKey()
+    test_key.test_make_key_normalizes()
+
+    test_cache = TestRecommendationCache()
+    test_cache.test_exact_hit_skips_embedding()
+    test_cache.test_semantic_fallback()
+    test_cache.test_invalidate_on_version_change()
+    test_cache.test_disabled_and_async()
+
+    print("\n" + "=" * 60)
+    print("🎉 모든 RecommendationCache 테스트 통과!")
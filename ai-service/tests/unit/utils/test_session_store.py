@@ -0,0 +1,214 @@
+"""
+SessionStore / TTLCache TDD
+세션 저장소의 만료, LRU 제거, 직렬화(compact) 동작을 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/utils/test_session_store.py
+    또는
+    python -m pytest tests/unit/utils/test_session_store.py -v -s
+"""
+import pytest
+import sys
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 테스트 대상 import
+from app.utils.ttl_cache import TTLCache
+from app.utils.session_store import (
+    InMemorySessionStore, RedisSessionStore, compact_session,
+    serialize_session, deserialize_session, create_session_store, new_session
+)
+
+
+class FakeClock:
+    """time.monotonic 대체용 가짜 시계"""
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRedis:
+    """redis.asyncio 클라이언트의 get/set/delete만 흉내내는 테스트 더블"""
+    def __init__(self):
+        self.data = {}
+        self.expires = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.expires[key] = ex
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def aclose(self):
+        pass
+
+
+def _sample_session():
+    session = new_session()
+    session["conversation_history"] = [
+        {"role": "user", "content": f"질문 {i}"} for i in range(30)
+    ]
+    session["current_agent"] = "wiki"
+    session["wiki_context"] = {
+        "current_author": "한강",
+        "last_search_result": {"success": True, "title": "한강 (소설가)"},
+        "waiting_for_clarification": False,
+        "conversation_history": session["conversation_history"],
+        "reset_conversation": True,
+        "compound_query": None
+    }
+    return session
+
+
+class TestTTLCache:
+    """TTLCache 기본 동작 테스트"""
+
+    def test_lru_eviction(self):
+        """최대 크기 초과 시 가장 오래 사용하지 않은 항목 제거 테스트"""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # a를 최근 사용으로 갱신
+        cache.set("c", 3)
+
+        print(f"  📦 남은 항목 수: {len(cache)}")
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.get("c") == 3
+        print("✅ LRU 제거 테스트 통과")
+
+    def test_ttl_expiry(self):
+        """TTL 만료 테스트"""
+        clock = FakeClock()
+        with patch("app.utils.ttl_cache.time.monotonic", clock):
+            cache = TTLCache(maxsize=10, ttl=60)
+            cache.set("session", {"x": 1})
+            clock.now += 59
+            assert cache.get("session") == {"x": 1}
+            clock.now += 2
+            assert cache.get("session") is None
+            assert len(cache) == 0
+        print("✅ TTL 만료 테스트 통과")
+
+    def test_pop_and_invalid_size(self):
+        """pop 및 잘못된 크기 설정 테스트"""
+        cache = TTLCache(maxsize=1)
+        cache.set("k", "v")
+        assert cache.pop("k") == "v"
+        assert cache.pop("k", "없음") == "없음"
+        with pytest.raises(ValueError):
+            TTLCache(maxsize=0)
+        print("✅ pop/크기 검증 테스트 통과")
+
+
+class TestSessionSerialization:
+    """세션 compact/직렬화 테스트"""
+
+    def test_compact_session(self):
+        """불필요한 필드 제거 및 대화 기록 제한 테스트"""
+        compacted = compact_session(_sample_session(), max_history=5)
+        print(f"  🗜️ compact 결과 키: {list(compacted['wiki_context'].keys())}")
+
+        assert len(compacted["conversation_history"]) == 5
+        assert compacted["conversation_history"][-1]["content"] == "질문 29"
+        assert compacted["current_agent"] == "wiki"
+        assert "conversation_history" not in compacted["wiki_context"]
+        assert "reset_conversation" not in compacted["wiki_context"]
+        assert "compound_query" not in compacted["wiki_context"]
+        assert compacted["wiki_context"]["current_author"] == "한강"
+        print("✅ compact 테스트 통과")
+
+    def test_round_trip(self):
+        """직렬화 → 역직렬화 왕복 테스트"""
+        data = serialize_session(_sample_session(), max_history=10)
+        restored = deserialize_session(data)
+        print(f"  📏 직렬화 크기: {len(data)} bytes")
+
+        assert isinstance(data, bytes)
+        assert len(restored["conversation_history"]) == 10
+        assert restored["wiki_context"]["last_search_result"]["title"] == "한강 (소설가)"
+        print("✅ 직렬화 왕복 테스트 통과")
+
+
+class TestSessionStores:
+    """InMemorySessionStore / RedisSessionStore 테스트"""
+
+    def test_in_memory_store(self):
+        """인메모리 저장소 저장/조회/삭제 및 사본 저장 테스트"""
+        async def run():
+            store = InMemorySessionStore(maxsize=2, ttl=60, max_history=3)
+            session = _sample_session()
+            await store.set("s1", session)
+            session["current_agent"] = "recommend"  # 저장 이후 변경은 반영되지 않아야 함
+
+            loaded = await store.get("s1")
+            assert loaded["current_agent"] == "wiki"
+            assert len(loaded["conversation_history"]) == 3
+
+            await store.set("s2", new_session())
+            await store.set("s3", new_session())
+            assert await store.get("s1") is None  # LRU로 제거됨
+
+            await store.delete("s2")
+            assert await store.get("s2") is None
+
+        asyncio.run(run())
+        print("✅ 인메모리 저장소 테스트 통과")
+
+    def test_redis_store_with_fake_client(self):
+        """Redis 저장소 키/TTL 설정 테스트 (가짜 클라이언트 주입)"""
+        async def run():
+            client = FakeRedis()
+            store = RedisSessionStore(ttl=120, client=client)
+            await store.set("abc", _sample_session())
+
+            assert "chat:session:abc" in client.data
+            assert client.expires["chat:session:abc"] == 120
+            loaded = await store.get("abc")
+            assert loaded["wiki_context"]["current_author"] == "한강"
+
+            await store.delete("abc")
+            assert await store.get("abc") is None
+
+        asyncio.run(run())
+        print("✅ Redis 저장소 테스트 통과")
+
+    def test_create_session_store(self):
+        """팩토리 함수 테스트"""
+        assert isinstance(create_session_store("memory"), InMemorySessionStore)
+        with pytest.raises(ValueError):
+            create_session_store("unknown")
+        print("✅ 저장소 팩토리 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🧪 SessionStore 테스트 시작")
+    print("=" * 60)
+    test_cache = TestTTLCache()
+    test_cache.test_lru_eviction()
+    test_cache.test_ttl_expiry()
+    test_cache.test_pop_and_invalid_size()
+
+    test_serialization = TestSessionSerialization()
+    test_serialization.test_compact_session()
+    test_serialization.test_round_trip()
+
+    test_stores = TestSessionStores()
+    test_stores.test_in_memory_store()
+    test_stores.test_redis_store_with_fake_client()
+    test_stores.test_create_session_store()
+
+    print("\n" + "=" * 60)
+    print("🎉 모든 SessionStore 테스트 통과!")
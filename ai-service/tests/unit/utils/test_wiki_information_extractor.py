@@ -15,6 +15,8 @@ from pathlib import Path
 from unittest.mock import Mock, MagicMock
 import json
 import time
+import io
+from contextlib import redirect_stdout
 
 # 프로젝트 루트를 Python path에 추가
 project_root = Path(__file__).parent.parent.parent.parent
@@ -806,6 +808,125 @@ class TestWikiInformationExtractorIntegration:
 
         print("✅ 정보 간 일관성 테스트 통과")
 
+class TestWikiInformationExtractorFactSheet:
+    """인물 정보 카드(WikiFactSheet) 한 번에 추출 테스트"""
+
+    CONTENT = """
+    한강은 1970년 11월 27일 광주광역시에서 태어났다.
+    아버지는 소설가 한승원이다.
+    풍문여자고등학교 졸업 후 연세대학교 국어국문학과를 졸업했다.
+    주요 작품으로는 《채식주의자》, 《소년이 온다》, 《흰》 등이 있다.
+    """
+
+    def test_fact_sheet_with_single_llm_call(self):
+        """LLM을 한 번만 호출하고, 비어 있는 필드는 정규식으로 채우는지 테스트"""
+        mock_llm_client = Mock()
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = json.dumps({
+            "birth_date": "1970년 11월 27일",
+            "birth_place": "광주광역시",
+            "university": "연세대학교",
+            "works": ["채식주의자", "소년이 온다"],
+            "awards": [],
+            "father": "한승원",
+            "mother": None
+        }, ensure_ascii=False)
+        mock_llm_client.chat.completions.create.return_value = mock_response
+
+        sheet = WikiInformationExtractor.extract_fact_sheet(self.CONTENT, mock_llm_client, title="한강", url="url")
+
+        print(f"  📊 정보 카드: {sheet.to_dict()}")
+        assert mock_llm_client.chat.completions.create.call_count == 1
+        assert sheet.birth == "1970년 11월 27일 광주광역시"
+        assert sheet.university == "연세대학교"
+        assert sheet.works == ["채식주의자", "소년이 온다"]
+        assert sheet.school == "풍문여자고등학교"  # LLM이 비워 둔 필드는 정규식 폴백
+        assert sheet.family['father'] == "한승원"
+        assert sheet.is_for({'title': "한강", 'url': "url"})
+        print("✅ LLM 1회 정보 카드 추출 테스트 통과")
+
+    def test_fact_sheet_without_llm_matches_find_functions(self):
+        """LLM이 없으면 각 find_* 함수의 정규식 결과와 같은지 테스트"""
+        sheet = WikiInformationExtractor.extract_fact_sheet(self.CONTENT)
+
+        assert sheet.birth == WikiInformationExtractor.find_birth_info(self.CONTENT)
+        assert sheet.university == WikiInformationExtractor.find_university_info(self.CONTENT)
+        assert sheet.works == WikiInformationExtractor.find_works_info(self.CONTENT)
+        assert sheet.father == WikiInformationExtractor.find_father_info(self.CONTENT)
+        assert sheet.family == WikiInformationExtractor.find_enhanced_family_info(self.CONTENT)
+        print("✅ 정규식 정보 카드 추출 테스트 통과")
+
+    def test_fact_sheet_llm_error_falls_back(self):
+        """LLM 오류 시 경고를 남기고 정규식 결과로 채우는지 테스트"""
+        mock_llm_client = Mock()
+        mock_llm_client.chat.completions.create.side_effect = Exception("API Error")
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            sheet = WikiInformationExtractor.extract_fact_sheet(self.CONTENT, mock_llm_client)
+
+        assert mock_llm_client.chat.completions.create.call_count == 1
+        assert sheet.works == ["채식주의자", "소년이 온다"]  # 한 글자 제목은 폴백에서 제외
+        assert "[WARN]" in output.getvalue() and "API Error" in output.getvalue()
+        print("✅ LLM 오류 폴백 테스트 통과")
+
+
+class TestWikiInformationExtractorBatchedLLM:
+    """페이지당 LLM 한 번 호출(JSON 스키마) + 결과 캐시 테스트"""
+
+    CONTENT = "한강은 1970년 11월 27일 광주광역시에서 태어났다. 연세대학교 국어국문학과를 졸업했다. 아버지는 한승원이다."
+
+    def _mock_llm_client(self):
+        mock_llm_client = Mock()
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = json.dumps({
+            "birth_date": "1970년 11월 27일", "birth_place": "광주광역시", "death_date": None,
+            "university": "연세대학교", "school": None, "works": ["채식주의자"],
+            "awards": ["2016년 맨부커 인터내셔널상"], "father": "한승원", "mother": None
+        }, ensure_ascii=False)
+        mock_llm_client.chat.completions.create.return_value = mock_response
+        return mock_llm_client
+
+    def test_all_fields_share_one_completion(self):
+        """여러 find_* 함수를 불러도 같은 페이지면 LLM을 한 번만 호출하는지 테스트"""
+        mock_llm_client = self._mock_llm_client()
+
+        university = WikiInformationExtractor.find_university_info(self.CONTENT, mock_llm_client)
+        birth = WikiInformationExtractor.find_birth_info(self.CONTENT, mock_llm_client)
+        works = WikiInformationExtractor.find_works_info(self.CONTENT, mock_llm_client)
+        awards = WikiInformationExtractor.find_awards_info(self.CONTENT, mock_llm_client)
+        family = WikiInformationExtractor.find_enhanced_family_info(self.CONTENT, mock_llm_client)
+
+        print(f"  🤖 LLM 호출 횟수: {mock_llm_client.chat.completions.create.call_count}")
+        assert mock_llm_client.chat.completions.create.call_count == 1
+        assert university == "연세대학교"
+        assert birth == "1970년 11월 27일 광주광역시"
+        assert works == ["채식주의자"]
+        assert awards == ["2016년 맨부커 인터내셔널상"]
+        assert family['father'] == "한승원"
+
+        kwargs = mock_llm_client.chat.completions.create.call_args.kwargs
+        assert kwargs['response_format']['type'] == "json_schema"
+        assert kwargs['response_format']['json_schema']['strict'] == True
+        print("✅ 페이지당 LLM 1회 호출 테스트 통과")
+
+    def test_other_page_and_failures_are_not_shared(self):
+        """다른 페이지는 새로 호출하고, 실패한 호출은 캐시하지 않는지 테스트"""
+        mock_llm_client = self._mock_llm_client()
+        WikiInformationExtractor.find_university_info(self.CONTENT, mock_llm_client)
+        WikiInformationExtractor.find_university_info("김영하는 연세대학교 경영학과를 졸업했다.", mock_llm_client)
+        assert mock_llm_client.chat.completions.create.call_count == 2
+
+        failing_client = Mock()
+        failing_client.chat.completions.create.side_effect = Exception("API Error")
+        for _ in range(2):
+            assert WikiInformationExtractor.find_university_info(self.CONTENT, failing_client) == "연세대학교"
+        assert failing_client.chat.completions.create.call_count == 2
+        print("✅ 페이지별 캐시/실패 미캐시 테스트 통과")
+
+
 if __name__ == "__main__":
     start_time = time.time()
 
@@ -893,6 +1014,24 @@ if __name__ == "__main__":
     print()
     test_integration.test_cross_information_consistency()
 
+    # 정보 카드 테스트
+    print("\n🗂️ 정보 카드 테스트 - 페이지당 한 번 추출")
+    print("=" * 60)
+    test_fact_sheet = TestWikiInformationExtractorFactSheet()
+    test_fact_sheet.test_fact_sheet_with_single_llm_call()
+    print()
+    test_fact_sheet.test_fact_sheet_without_llm_matches_find_functions()
+    print()
+    test_fact_sheet.test_fact_sheet_llm_error_falls_back()
+
+    # LLM 일괄 추출 테스트
+    print("\n📦 LLM 일괄 추출 테스트 - 페이지당 한 번 호출")
+    print("=" * 60)
+    test_batched = TestWikiInformationExtractorBatchedLLM()
+    test_batched.test_all_fields_share_one_completion()
+    print()
+    test_batched.test_other_page_and_failures_are_not_shared()
+
     print("\n" + "=" * 60)
     print("🎉 모든 WikiInformationExtractor 테스트 통과!")
     print("\n📊 테스트 요약:")
@@ -904,6 +1043,8 @@ if __name__ == "__main__":
     print("  ✅ 엣지 케이스: 4개 테스트")
     print("  ✅ 성능 테스트: 2개 테스트")
     print("  ✅ 통합 테스트: 2개 테스트")
+    print("  ✅ 정보 카드: 3개 테스트")
+    print("  ✅ LLM 일괄 추출: 2개 테스트")
     print("\n📝 pytest로 실행하려면:")
     print("    cd ai-service")
     print("    python -m pytest tests/unit/utils/test_wiki_information_extractor.py -v -s")
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+wiki_keywords TDD
+Aho–Corasick 키워드 오토마톤이 키워드별 `in` 검사와 같은 카테고리를 찾는지, 질문 판별 함수들이 그 결과를 쓰는지 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/utils/test_wiki_keywords.py
+    또는
+    python -m pytest tests/unit/utils/test_wiki_keywords.py -v -s
+"""
+import pytest
+import random
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 테스트 대상 import
+from app.utils import wiki_keywords
+from app.utils.wiki_keywords import KeywordAutomaton, KEYWORDS
+from app.utils.wiki_pattern_matcher import WikiPatternMatcher
+
+
+def brute_force(categories, text):
+    """카테고리마다 any(keyword in text)로 확인한 기준 결과"""
+    return frozenset(name for name, words in categories.items() if any(word in text for word in words))
+
+
+class TestKeywordAutomaton:
+    """키워드 오토마톤 테스트"""
+
+    def test_overlapping_keywords(self):
+        """겹치거나 다른 키워드 안에 들어 있는 키워드도 모두 찾는지 테스트"""
+        automaton = KeywordAutomaton({'a': ['he', 'she', 'hers'], 'b': ['his', 'e']})
+        assert automaton.scan("ushers") == {'a', 'b'}
+        assert automaton.scan("hi") == frozenset()
+        assert automaton.scan("his") == {'b'}
+        print("✅ 겹치는 키워드 테스트 통과")
+
+    def test_registry_matches_brute_force(self):
+        """레지스트리 오토마톤이 모든 카테고리에서 in 검사와 같은 결과를 내는지 테스트"""
+        alphabet = sorted({char for words in KEYWORDS.categories.values() for word in words for char in word})
+        alphabet += list("ab ?")
+        rng = random.Random(0)
+        for _ in range(3000):
+            text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+            assert KEYWORDS.scan(text) == brute_force(KEYWORDS.categories, text), text
+        print("✅ 무작위 문자열 동등성 테스트 통과")
+
+    def test_empty_keyword_rejected(self):
+        """빈 키워드는 거부하는지 테스트"""
+        with pytest.raises(ValueError):
+            KeywordAutomaton({'a': ['']})
+        print("✅ 빈 키워드 거부 테스트 통과")
+
+    def test_scan_lowercases_and_caches(self):
+        """scan이 소문자로 훑고 같은 질문의 결과를 재사용하는지 테스트"""
+        hits = wiki_keywords.scan("한강 작가 언제 태어났어?")
+        assert wiki_keywords.scan("한강 작가 언제 태어났어?") is hits
+        assert {wiki_keywords.AGENT_AUTHOR, wiki_keywords.BIRTH_WORD, wiki_keywords.WHEN} <= hits
+        print("✅ scan 캐시 테스트 통과")
+
+
+class TestKeywordClassifiers:
+    """키워드 결과를 쓰는 판별 함수 테스트"""
+
+    def test_detect_question_type_priority(self):
+        """의문사 유형이 who → where → when 순서로 우선하는지 테스트"""
+        assert WikiPatternMatcher.detect_question_type("누구야 어디 살아") == 'who'
+        assert WikiPatternMatcher.detect_question_type("어디서 언제 태어났어") == 'where'
+        assert WikiPatternMatcher.detect_question_type("몇년에 나왔어") == 'when'
+        assert WikiPatternMatcher.detect_question_type("한강") == 'general'
+        print("✅ 의문사 유형 우선순위 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🧪 wiki_keywords 테스트 시작")
+    print("=" * 60)
+    test_automaton = TestKeywordAutomaton()
+    test_automaton.test_overlapping_keywords()
+    test_automaton.test_registry_matches_brute_force()
+    test_automaton.test_empty_keyword_rejected()
+    test_automaton.test_scan_lowercases_and_caches()
+
+    test_classifiers = TestKeywordClassifiers()
+    test_classifiers.test_detect_question_type_priority()
+
+    print("\n" + "=" * 60)
+    print("🎉 모든 wiki_keywords 테스트 통과!")
@@ -0,0 +1,147 @@
+"""
+wiki_patterns TDD
+정규식 레지스트리의 리터럴 검사가 결과를 바꾸지 않는지, 패턴 목록이 기존 for 루프와 같은 결과를 내는지 확인
+
+실행 방법:
+    cd ai-service
+    python tests/unit/utils/test_wiki_patterns.py
+    또는
+    python -m pytest tests/unit/utils/test_wiki_patterns.py -v -s
+"""
+import pytest
+import re
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 테스트 대상 import
+from app.utils import wiki_patterns as patterns
+from app.utils.wiki_patterns import AnyPattern, Pattern, PatternList, required_literals
+
+
+TEXTS = [
+    "한강(1970년 11월 27일 ~ )은 대한민국의 소설가이다. 연세대학교 국어국문학과를 졸업하였다. 아버지는 소설가 한승원이다.",
+    "다자이 오사무(1909년 6월 19일 ~ 1948년 6월 13일)는 일본의 소설가이다. 1948년 6월 13일에 사망하였다.",
+    "채식주의자 쓴 작가 누구야",
+    "소년이 온다를 누가 썼어?",
+    "Haruki Murakami 작가 알려줘",
+    "",
+]
+
+
+class TestRequiredLiterals:
+    """필수 리터럴 추출 테스트"""
+
+    def test_literal_runs(self):
+        """연속 리터럴과 1회 이상 반복 안의 리터럴을 모으는지 테스트"""
+        assert required_literals(r'(\d{4}년)에 사망') == (('에 사망',), ('년',))
+        assert required_literals(r'(?:사망)+') == (('사망',),)
+        print("✅ 리터럴 추출 테스트 통과")
+
+    def test_optional_parts_are_skipped(self):
+        """없어도 매치될 수 있는 부분은 조건에서 빠지는지 테스트"""
+        assert required_literals(r'(?:아버지)?\s*한승원') == (('한승원',),)
+        assert required_literals(r'(?=작가)\w+') == ()
+        assert required_literals(r'저자|\d+') == ()
+        print("✅ 선택적 부분 제외 테스트 통과")
+
+    def test_literal_alternation(self):
+        """리터럴로만 된 선택지는 '하나만 있으면 되는' 조건이 되는지 테스트"""
+        assert required_literals(r'(?:저자|지은이)\s*(?:누구|뭐)') == (('저자', '지은이'), ('누구', '뭐'))
+        print("✅ 선택지 조건 테스트 통과")
+
+    def test_ignorecase_keeps_only_caseless_literals(self):
+        """대소문자 무시 패턴에서는 한글처럼 대소문자가 없는 문자만 리터럴로 쓰는지 테스트"""
+        assert required_literals(r'Kafka 작가', re.IGNORECASE) == ((' 작가',),)
+        assert required_literals(r'(?i)abc') == ()
+        assert required_literals(r'(?i:abc)def') == (('def',),)
+        print("✅ 대소문자 무시 테스트 통과")
+
+
+class TestPatternEquivalence:
+    """리터럴 검사를 거쳐도 re 모듈 호출과 결과가 같은지 테스트"""
+
+    def test_registry_matches_plain_re(self):
+        """레지스트리의 모든 패턴이 re.findall/re.search와 같은 결과를 내는지 테스트"""
+        checked = 0
+        for name, value in vars(patterns).items():
+            if isinstance(value, Pattern):
+                pattern_list = [value]
+            elif isinstance(value, PatternList):
+                pattern_list = list(value)
+            else:
+                continue
+            for pattern in pattern_list:
+                for text in TEXTS:
+                    expected = re.findall(pattern.pattern, text, pattern.regex.flags)
+                    assert pattern.findall(text) == expected, name
+                    assert bool(pattern.search(text)) == bool(expected), name
+                checked += 1
+        assert checked > 50
+        print(f"✅ 패턴 {checked}개 동등성 테스트 통과")
+
+    def test_any_pattern_equals_any_search(self):
+        """AnyPattern이 any(re.search(...))와 같은지 테스트"""
+        for name, value in vars(patterns).items():
+            if not isinstance(value, AnyPattern):
+                continue
+            for text in TEXTS:
+                expected = any(re.search(p, text, value.regex.flags) for p in value.patterns)
+                assert value.search(text) == expected, name
+                expected = any(re.match(p, text, value.regex.flags) for p in value.patterns)
+                assert value.match(text) == expected, name
+        print("✅ AnyPattern 동등성 테스트 통과")
+
+    def test_sub_without_literal_returns_text(self):
+        """리터럴이 없으면 sub가 원문을 그대로 반환하는지 테스트"""
+        pattern = Pattern(r'\(.*?\)')
+        assert pattern.sub('', "한강") == "한강"
+        assert pattern.sub('', "한강 (소설가)") == "한강 "
+        print("✅ sub 테스트 통과")
+
+
+class TestPatternList:
+    """우선순위 패턴 목록 테스트"""
+
+    def test_first_search_keeps_priority(self):
+        """문자열에서 더 뒤에 있어도 목록 앞쪽 패턴이 이기는지 테스트"""
+        pattern_list = PatternList(r'(\d{4})년에 사망', r'(\d{4})년')
+        text = "1909년 출생, 1948년에 사망"
+        assert pattern_list.first_search(text).group(1) == "1948"
+        assert pattern_list.first_findall(text) == ["1948"]
+        assert pattern_list.findall(text) == ["1948", "1909", "1948"]
+        assert [m.group(1) for m in pattern_list.searches(text)] == ["1948", "1909"]
+        print("✅ 우선순위 테스트 통과")
+
+    def test_first_match_and_slice(self):
+        """first_match와 슬라이스가 동작하는지 테스트"""
+        pattern_list = PatternList(r'작가 (\w+)', r'(\w+) 작가')
+        assert pattern_list.first_match("한강 작가").group(1) == "한강"
+        assert pattern_list[:1].first_match("한강 작가") is None
+        assert len(pattern_list[:1]) == 1
+        print("✅ first_match/슬라이스 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🧪 wiki_patterns 테스트 시작")
+    print("=" * 60)
+    test_literals = TestRequiredLiterals()
+    test_literals.test_literal_runs()
+    test_literals.test_optional_parts_are_skipped()
+    test_literals.test_literal_alternation()
+    test_literals.test_ignorecase_keeps_only_caseless_literals()
+
+    test_equivalence = TestPatternEquivalence()
+    test_equivalence.test_registry_matches_plain_re()
+    test_equivalence.test_any_pattern_equals_any_search()
+    test_equivalence.test_sub_without_literal_returns_text()
+
+    test_list = TestPatternList()
+    test_list.test_first_search_keeps_priority()
+    test_list.test_first_match_and_slice()
+
+    print("\n" + "=" * 60)
+    print("🎉 모든 wiki_patterns 테스트 통과!")